@@ -1,24 +1,119 @@
 #!/usr/bin/env python3
 """ML Siege - Main entry point."""
 
-import pygame
-from src.game import Game
+import argparse
 
+from src.core.startup import startup  # First, so the timeline starts at launch
 
-def main():
+with startup.phase("Imports"):
+    import pygame
+    from src.game import Game
+    from src.core.perf_monitor import perf
+    from src.core.replay import InputRecording
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="ML Siege")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run the simulation without a window, rendering or audio")
+    parser.add_argument("--ticks", type=int, default=3600,
+                        help="Fixed steps to simulate in headless mode (default: 3600 = 1 minute)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Dungeon seed for a reproducible run")
+    parser.add_argument("--perf-export", metavar="PATH", default=None,
+                        help="Log slow frames and export timing histograms to PATH (.json or .csv)")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="Record seed and input to PATH for --replay")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="Replay a recorded session headlessly at full speed")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="Print a timeline of each init phase after the first frame")
+    return parser.parse_args(argv)
+
+
+def run_headless(ticks: int, seed=None):
+    """Fast-forward the simulation and print a run report."""
+    game = Game(headless=True)
+    print_report(game.run_headless(ticks, seed=seed))
+
+
+def run_replay(path: str):
+    """Replay a recorded session and print a run report."""
+    game = Game(headless=True)
+    report = game.run_replay(InputRecording.load(path))
+    print_report(report)
+    print(f"  checksum={report['checksum']} "
+          f"{'DIVERGED from recording' if report['diverged'] else 'matches recording'}")
+
+
+def print_report(report: dict):
+    """Print a headless run report."""
+    print(f"Simulated {report['ticks']} ticks ({report['sim_seconds']:.1f}s game time) "
+          f"in {report['wall_seconds']:.2f}s")
+    print(f"  {report['ticks_per_sec']:.0f} ticks/sec ({report['speedup']:.1f}x real time)")
+    print(f"  seed={report['seed']} level={report['dungeon_level']} "
+          f"kills={report['enemies_killed']} wipes={report['party_wipes']} "
+          f"entities={report['entities']}")
+    print(f"  {report['skipped_runs']} processor runs skipped by tick rates")
+    for name, stats in report["pools"].items():
+        print(f"  pool {name}: {stats['hit_rate']:.0%} reused of {stats['spawns']} spawns, "
+              f"{stats.get('allocations_avoided_per_sec', 0):.0f} allocations avoided/sec")
+    cache = report["path_cache"]
+    print(f"  path cache: {cache['hit_rate']:.0%} of {cache['lookups']} lookups "
+          f"({cache['hits']} exact, {cache['subpath_hits']} subpath), {cache['evictions']} evicted")
+    fields = report["flow_fields"]
+    print(f"  flow fields: {fields['builds']} builds for {fields['lookups']} chase steps")
+    requests = report["path_requests"]
+    print(f"  path requests: {requests['completed']} served ({requests['expired']} never collected), "
+          f"queue depth max {requests['max_depth']}, "
+          f"latency mean {requests['mean_latency']:.1f} / max {requests['max_latency']} ticks")
+
+
+def main(argv=None):
     """Initialize and run the game."""
+    args = parse_args(argv)
+
+    if args.perf_export:
+        perf.log_slow_frames = True
+        perf.export_path = args.perf_export
+
+    if args.replay:
+        run_replay(args.replay)
+        if args.perf_export:
+            perf.export(args.perf_export)
+        return
+
+    if args.headless:
+        run_headless(args.ticks, seed=args.seed)
+        if args.perf_export:
+            perf.export(args.perf_export)
+        return
+
     # Initialize pygame
-    pygame.init()
-    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
-    
+    with startup.phase("pygame init"):
+        pygame.init()
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
+
     # Create and run game
-    game = Game()
-    
+    with startup.phase("Game"):
+        game = Game()
+    game.startup_report = args.startup_report
+    if args.record:
+        game.recording = InputRecording()
+
     try:
-        game.run()
+        game.run(seed=args.seed)
     except KeyboardInterrupt:
         pass
     finally:
+        if args.perf_export:
+            perf.export(args.perf_export)
+        if game.profiler.running:
+            print(f"Profile saved: {game.profiler.stop()}")
+        if args.record:
+            game.recording.finish(game.step_count)
+            game.recording.save(args.record)
         pygame.quit()
 
 
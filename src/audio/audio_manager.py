@@ -3,7 +3,8 @@
 import pygame
 import os
 import tempfile
-from typing import Dict, Optional
+import threading
+from typing import Dict, List, Optional
 
 from ..core.events import EventBus, Event, EventType
 from .sound_generator import SoundGenerator
@@ -33,6 +34,8 @@ class AudioManager:
         self.current_music: Optional[str] = None
         self.music_sounds: Dict[str, pygame.mixer.Sound] = {}  # name -> Sound object (preloaded)
         self.music_channel: Optional[pygame.mixer.Channel] = None  # Dedicated channel for music
+        self._music_thread: Optional[threading.Thread] = None  # Generates music in the background
+        self._pending_music: Optional[tuple] = None  # play_music() args waiting for generation
         
         # Generators
         self.sound_gen = SoundGenerator()
@@ -44,7 +47,7 @@ class AudioManager:
     def _subscribe_events(self):
         """Subscribe to game events for audio triggers."""
         # Combat events
-        self.event_bus.subscribe(EventType.DAMAGE_DEALT, self._on_damage)
+        self.event_bus.subscribe_batch(EventType.DAMAGE_DEALT, self._on_damage)
         self.event_bus.subscribe(EventType.ENTITY_DIED, self._on_death)
         
         # Magic events
@@ -72,10 +75,21 @@ class AudioManager:
             print("Pre-generated sounds not found, generating...")
             self._generate_sounds()
         
-        # Try to load pre-generated music, otherwise generate
+        # Try to load pre-generated music, otherwise generate it in the
+        # background - the game starts silent and music fades in when ready
         if not self._load_music_from_files():
-            print("Pre-generated music not found, generating...")
-            self._generate_music()
+            print("Pre-generated music not found, generating in background...")
+            self.music_channel = pygame.mixer.Channel(7)
+            self._music_thread = threading.Thread(
+                target=self._generate_music, name="MusicGenerator", daemon=True
+            )
+            self._music_thread.start()
+    
+    def update(self):
+        """Start music that was requested before it finished generating."""
+        if self._pending_music and self._pending_music[0] in self.music_sounds:
+            pending, self._pending_music = self._pending_music, None
+            self.play_music(*pending)
     
     def _load_sounds_from_files(self) -> bool:
         """Try to load pre-generated sound effects from files."""
@@ -257,9 +271,8 @@ class AudioManager:
         self.music_gen.save_as_wav(menu_samples, menu_path)
         self.music_sounds["menu_music"] = pygame.mixer.Sound(menu_path)
         
-        # Reserve a channel for music
-        self.music_channel = pygame.mixer.Channel(7)
-        
+        from ..core.startup import startup
+        startup.mark("Music generated (background)")
         print(f"Generated {len(self.music_sounds)} music tracks")
     
     def play_sound(self, sound_name: str, volume_mult: float = 1.0):
@@ -281,9 +294,14 @@ class AudioManager:
         if self.music_muted:
             return
         
+        generating = self._music_thread is not None and self._music_thread.is_alive()
         if music_name not in self.music_sounds:
-            print(f"Music not found: {music_name}")
+            if generating:
+                self._pending_music = (music_name, loop, fade_ms)  # update() plays it when ready
+            else:
+                print(f"Music not found: {music_name}")
             return
+        self._pending_music = None
         
         if self.current_music == music_name:
             return  # Already playing
@@ -307,6 +325,7 @@ class AudioManager:
         if self.music_channel:
             self.music_channel.fadeout(fade_ms)
         self.current_music = None
+        self._pending_music = None
     
     def pause_music(self):
         """Pause background music."""
@@ -346,21 +365,31 @@ class AudioManager:
     # EVENT HANDLERS
     # =========================================================================
     
-    def _on_damage(self, event: Event):
-        """Handle damage event - play hit sounds."""
+    def _on_damage(self, events: List[Event]):
+        """Handle a frame's damage events - play each hit sound once.
+        
+        A whirlwind hitting ten enemies plays one hit, not ten stacked copies.
+        """
+        sounds = []
+        for event in events:
+            sound_name = self._hit_sound(event)
+            if sound_name not in sounds:
+                sounds.append(sound_name)
+        
+        for sound_name in sounds:
+            self.play_sound(sound_name)
+    
+    def _hit_sound(self, event: Event) -> str:
+        """Pick the hit sound for one damage event."""
         damage_type = event.data.get("damage_type", "physical")
         is_crit = event.data.get("is_crit", False)
         weapon_type = event.data.get("weapon_type", "melee")
         
         if is_crit:
-            self.play_sound("hit_crit")
-        elif damage_type == "physical":
-            if weapon_type == "ranged":
-                self.play_sound("arrow_hit")
-            else:
-                self.play_sound("hit_melee")
-        else:
-            self.play_sound("hit_spell")
+            return "hit_crit"
+        if damage_type == "physical":
+            return "arrow_hit" if weapon_type == "ranged" else "hit_melee"
+        return "hit_spell"
     
     def _on_death(self, event: Event):
         """Handle death event."""
@@ -5,6 +5,8 @@ import numpy as np
 import math
 from typing import List, Tuple
 
+from .sound_generator import lowpass_filter
+
 
 def generate_music_buffer(samples: np.ndarray, sample_rate: int = 44100) -> bytes:
     """Convert numpy array to bytes for pygame music."""
@@ -59,11 +61,7 @@ class MusicGenerator:
     
     def _lowpass(self, samples: np.ndarray, cutoff: float = 0.1) -> np.ndarray:
         """Simple lowpass filter."""
-        filtered = np.zeros_like(samples)
-        filtered[0] = samples[0]
-        for i in range(1, len(samples)):
-            filtered[i] = cutoff * samples[i] + (1 - cutoff) * filtered[i-1]
-        return filtered
+        return lowpass_filter(samples, cutoff)
     
     def _pad_sound(self, freq: float, duration: float, 
                    harmonics: List[Tuple[float, float]] = None) -> np.ndarray:
@@ -12,7 +12,26 @@ from enum import Enum, auto
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 FPS = 60
-FIXED_TIMESTEP = 1.0 / 60.0
+# Simulation steps per second. May be lower than FPS - the renderer
+# interpolates positions between steps so motion stays smooth.
+SIMULATION_RATE = 60
+FIXED_TIMESTEP = 1.0 / SIMULATION_RATE
+
+# Simulation budget - keeps frame rate stable when steps get expensive
+MAX_FRAME_TIME = 0.25        # Longest frame the accumulator accepts (seconds)
+MAX_CATCHUP_STEPS = 8        # Most fixed steps run in one frame (below ~7fps the game slows)
+SIM_BUDGET_MS = 12.0         # Frame time the simulation may spend catching up
+SIM_DEGRADE_ENABLED = True   # Throttle low-priority processors under load
+SIM_DEGRADE_STEP_MS = 6.0    # Average step cost that triggers throttling
+SIM_DEGRADE_INTERVAL = 4     # Throttled processors run every Nth step
+
+# Processor tick rates - fixed steps between runs (they get the summed dt)
+REGEN_TICK_INTERVAL = 6          # 10 regen ticks per second
+PROGRESSION_TICK_INTERVAL = 15   # Level-ups show within a quarter second
+
+# Recycle projectile, effect and damage number entities instead of deleting them
+ENTITY_POOLING_ENABLED = True
+ENTITY_POOL_MAX_PARKED = 512     # Parked entities kept per pool (extra ones are deleted)
 
 # Isometric tile dimensions
 TILE_WIDTH = 64
@@ -274,6 +293,14 @@ FORMATION_OFFSETS = {
     3: (0.0, 1.5),      # Third ally
 }
 
+# =============================================================================
+# AUTOPILOT (headless runs)
+# =============================================================================
+
+AUTOPILOT_DECISION_INTERVAL = 0.25  # Seconds between decisions
+AUTOPILOT_ENGAGE_RANGE = 6.0        # Attack enemies within this range
+AUTOPILOT_ARRIVE_DISTANCE = 1.5     # Close enough to a room center
+
 # =============================================================================
 # REGENERATION
 # =============================================================================
@@ -306,6 +333,17 @@ ROOM_MAX_COUNT = 20
 ENEMY_BASE_COUNT = 15
 ENEMY_COUNT_PER_LEVEL = 8
 
+# Pathfinding
+PATH_CACHE_SIZE = 256  # Routes kept per map (least recently used dropped first)
+PATH_ENGINE = "astar"  # Flat search engine: "astar" or "jps" (same path costs)
+FLOW_FIELD_INTERVAL = 0.2   # Seconds before a moving target's flow field is rebuilt
+FLOW_FIELD_RADIUS = 32      # Tiles a flow field reaches from its target
+FLOW_FIELD_LOOKAHEAD = 4    # Flow steps a chaser looks ahead for a straight line
+ROOM_GRAPH_MIN_DISTANCE = 24  # Tiles apart before a route goes through the room graph
+ROOM_GRAPH_SECTOR = 16        # Corridor networks are split into squares this size
+PATH_REQUEST_BUDGET = 400     # Tiles queued path searches may expand per tick
+PATH_RESULT_TTL = 60          # Ticks a finished path waits for its unit to collect it
+
 # =============================================================================
 # DEBUG FLAGS
 # =============================================================================
@@ -319,3 +357,7 @@ DEBUG_INSTANT_KILL = False
 DEBUG_UNLOCK_ALL_SPELLS = False
 DEBUG_INFINITE_MANA = False
 
+# Sampling profiler (F10 toggles it in game)
+PROFILER_SAMPLE_INTERVAL = 0.005  # Seconds between stack samples (200Hz)
+PROFILER_OUTPUT_DIR = "profiles"  # Collapsed-stack .folded files go here
+
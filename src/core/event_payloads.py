@@ -0,0 +1,70 @@
+"""Typed event payloads for high-volume events.
+
+DAMAGE_DEALT, STATUS_TICK, PROJECTILE_HIT and SPELL_HIT fire many times
+per step in a big fight, so they carry a slotted payload instead of a
+fresh dict:
+
+    bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(attacker, target, 12)))
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict
+
+
+class Payload:
+    """Base for typed event payloads.
+    
+    High-volume events carry a slotted payload instead of a fresh dict.
+    Payloads still answer dict-style reads so existing handlers that do
+    event.data.get("amount") keep working unchanged.
+    """
+    __slots__ = ()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class DamageDealt(Payload):
+    """DAMAGE_DEALT payload."""
+    attacker: int
+    target: int
+    amount: int
+    damage_type: str = "physical"
+    is_crit: bool = False
+
+
+@dataclass(slots=True)
+class StatusTick(Payload):
+    """STATUS_TICK payload."""
+    entity: int
+    effect_type: str
+    damage: int = 0
+
+
+@dataclass(slots=True)
+class ProjectileHit(Payload):
+    """PROJECTILE_HIT payload."""
+    projectile: int
+    target: int
+
+
+@dataclass(slots=True)
+class SpellHit(Payload):
+    """SPELL_HIT payload."""
+    caster: int
+    spell: str
+    target: int
+    damage: int = 0
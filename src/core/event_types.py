@@ -0,0 +1,123 @@
+"""Event types - every event the game emits, with its payload fields.
+
+Kept apart from the bus (events.py) so the catalog can grow without
+the dispatcher growing with it. events.py imports EventType, so
+`from ..core.events import EventType` works as before.
+"""
+
+from enum import Enum, auto
+
+
+class EventType(Enum):
+    """All event types in the game.
+    
+    See docs for payload schemas:
+    - DAMAGE_DEALT: DamageDealt payload (attacker, target, amount, damage_type, is_crit)
+    - ENTITY_DIED: entity, killer, death_type
+    - SPELL_CAST: caster, spell, target, mana_cost
+    - etc.
+    """
+    
+    # =========================================================================
+    # COMBAT
+    # =========================================================================
+    DAMAGE_DEALT = auto()       # DamageDealt: attacker, target, amount, damage_type, is_crit
+    ENTITY_DIED = auto()        # entity, killer, death_type
+    ENTITY_DOWNED = auto()      # entity (party member downed, can be revived)
+    ENTITY_REVIVED = auto()     # entity, reviver, health_percent
+    ATTACK_STARTED = auto()     # attacker, target, weapon
+    COMBAT_STARTED = auto()     # party, enemies (entered combat)
+    COMBAT_ENDED = auto()       # duration, enemies_killed
+    
+    # =========================================================================
+    # MAGIC
+    # =========================================================================
+    SPELL_CAST = auto()         # caster, spell, target, mana_cost
+    SPELL_CAST_REQUESTED = auto() # caster, slot, target_id, target_x, target_y
+    SPELL_HIT = auto()          # SpellHit: caster, spell, target, damage
+    PROJECTILE_CREATED = auto() # projectile, source, target
+    PROJECTILE_HIT = auto()     # ProjectileHit: projectile, target
+    HEALTH_RESTORED = auto()    # healer, target, amount
+    
+    # =========================================================================
+    # PROGRESSION
+    # =========================================================================
+    SKILL_XP_GAINED = auto()    # character, skill, amount, source
+    SKILL_LEVEL_UP = auto()     # character, skill, new_level, stat_bonuses
+    CHARACTER_LEVEL_UP = auto() # character, new_level, old_level
+    LEVEL_UP = auto()           # entity, skill, new_level (alias for processors)
+    SPELL_UNLOCKED = auto()     # character, spell, skill, skill_level
+    
+    # =========================================================================
+    # ITEMS
+    # =========================================================================
+    ITEM_PICKED_UP = auto()     # character, item, source
+    ITEM_DROPPED = auto()       # character, item, position
+    ITEM_EQUIPPED = auto()      # character, item, slot, previous_item
+    ITEM_UNEQUIPPED = auto()    # character, item, slot
+    ITEM_USED = auto()          # character, item, effect_type, effect_value
+    ITEM_TRANSFERRED = auto()   # item, from_character, to_character
+    GOLD_CHANGED = auto()       # character, amount, new_total, reason
+    
+    # =========================================================================
+    # WORLD
+    # =========================================================================
+    LEVEL_CHANGED = auto()      # new_level, old_level, direction
+    DUNGEON_GENERATED = auto()  # level, width, height, room_count, enemy_count
+    STAIRS_USED = auto()        # position, direction
+    TOWN_ENTERED = auto()       # from_level
+    TOWN_LEFT = auto()          # target_level
+    
+    # =========================================================================
+    # TRADING
+    # =========================================================================
+    TRADE_STARTED = auto()      # merchant, character
+    TRADE_COMPLETED = auto()    # merchant, items_bought, items_sold, gold_spent
+    ITEM_BOUGHT = auto()        # character, item, price
+    ITEM_SOLD = auto()          # character, item, price
+    
+    # =========================================================================
+    # UI
+    # =========================================================================
+    NOTIFICATION = auto()       # message, type
+    MENU_OPENED = auto()        # menu_type
+    MENU_CLOSED = auto()        # menu_type
+    INVENTORY_OPENED = auto()   # character
+    INVENTORY_CLOSED = auto()
+    CHARACTER_SELECTED = auto() # character, previous
+    CAMERA_ZOOMED = auto()      # direction
+    
+    # =========================================================================
+    # STATUS EFFECTS
+    # =========================================================================
+    STATUS_APPLIED = auto()     # entity, effect_type, duration, source
+    STATUS_EXPIRED = auto()     # entity, effect_type
+    STATUS_TICK = auto()        # StatusTick: entity, effect_type, damage
+    
+    # =========================================================================
+    # MOVEMENT
+    # =========================================================================
+    PATH_CALCULATED = auto()    # entity, start, end, path_length
+    ENTITY_STUCK = auto()       # entity, position, target
+    ENTITY_TELEPORTED = auto()  # entity, from_position, to_position, reason
+    
+    # =========================================================================
+    # GAME FLOW
+    # =========================================================================
+    GAME_STARTED = auto()       # new_game, loaded_save
+    GAME_PAUSED = auto()
+    GAME_RESUMED = auto()
+    GAME_SAVE_REQUESTED = auto() # slot (F5 quick save)
+    GAME_LOAD_REQUESTED = auto() # slot (F9 quick load)
+    GAME_SAVED = auto()         # slot, timestamp, playtime
+    GAME_LOADED = auto()        # slot, level
+    AUTOSAVE_TRIGGERED = auto()
+    PARTY_WIPED = auto()        # level, gold_lost
+    PARTY_RESPAWNED = auto()    # position, gold_before, gold_after
+    GAME_OVER = auto()          # reason
+    PROFILER_TOGGLED = auto()   # (F10 starts/stops the sampling profiler)
+    
+    # =========================================================================
+    # ACTION BAR
+    # =========================================================================
+    ACTION_BAR_USED = auto()    # slot
@@ -4,130 +4,19 @@ Systems emit events, other systems subscribe to react.
 This keeps systems isolated from each other.
 """
 
-from enum import Enum, auto
-from typing import Callable, Dict, List, Any
+from collections import deque
+from typing import Callable, Deque, Dict, List, Any, Union
 from dataclasses import dataclass, field
 
+from .event_payloads import Payload
+from .event_types import EventType
 
-class EventType(Enum):
-    """All event types in the game.
-    
-    See docs for payload schemas:
-    - DAMAGE_DEALT: source, target, amount, damage_type, is_critical, overkill
-    - ENTITY_DIED: entity, killer, death_type
-    - SPELL_CAST: caster, spell, target, mana_cost
-    - etc.
-    """
-    
-    # =========================================================================
-    # COMBAT
-    # =========================================================================
-    DAMAGE_DEALT = auto()       # source, target, amount, damage_type, is_critical
-    ENTITY_DIED = auto()        # entity, killer, death_type
-    ENTITY_DOWNED = auto()      # entity (party member downed, can be revived)
-    ENTITY_REVIVED = auto()     # entity, reviver, health_percent
-    ATTACK_STARTED = auto()     # attacker, target, weapon
-    COMBAT_STARTED = auto()     # party, enemies (entered combat)
-    COMBAT_ENDED = auto()       # duration, enemies_killed
-    
-    # =========================================================================
-    # MAGIC
-    # =========================================================================
-    SPELL_CAST = auto()         # caster, spell, target, mana_cost
-    SPELL_CAST_REQUESTED = auto() # caster, slot, target_id, target_x, target_y
-    SPELL_HIT = auto()          # caster, spell, target, damage, effects
-    PROJECTILE_CREATED = auto() # projectile, source, target
-    PROJECTILE_HIT = auto()     # projectile, hit_entity, position
-    HEALTH_RESTORED = auto()    # healer, target, amount
-    
-    # =========================================================================
-    # PROGRESSION
-    # =========================================================================
-    SKILL_XP_GAINED = auto()    # character, skill, amount, source
-    SKILL_LEVEL_UP = auto()     # character, skill, new_level, stat_bonuses
-    CHARACTER_LEVEL_UP = auto() # character, new_level, old_level
-    LEVEL_UP = auto()           # entity, skill, new_level (alias for processors)
-    SPELL_UNLOCKED = auto()     # character, spell, skill, skill_level
-    
-    # =========================================================================
-    # ITEMS
-    # =========================================================================
-    ITEM_PICKED_UP = auto()     # character, item, source
-    ITEM_DROPPED = auto()       # character, item, position
-    ITEM_EQUIPPED = auto()      # character, item, slot, previous_item
-    ITEM_UNEQUIPPED = auto()    # character, item, slot
-    ITEM_USED = auto()          # character, item, effect_type, effect_value
-    ITEM_TRANSFERRED = auto()   # item, from_character, to_character
-    GOLD_CHANGED = auto()       # character, amount, new_total, reason
-    
-    # =========================================================================
-    # WORLD
-    # =========================================================================
-    LEVEL_CHANGED = auto()      # new_level, old_level, direction
-    DUNGEON_GENERATED = auto()  # level, width, height, room_count, enemy_count
-    STAIRS_USED = auto()        # position, direction
-    TOWN_ENTERED = auto()       # from_level
-    TOWN_LEFT = auto()          # target_level
-    
-    # =========================================================================
-    # TRADING
-    # =========================================================================
-    TRADE_STARTED = auto()      # merchant, character
-    TRADE_COMPLETED = auto()    # merchant, items_bought, items_sold, gold_spent
-    ITEM_BOUGHT = auto()        # character, item, price
-    ITEM_SOLD = auto()          # character, item, price
-    
-    # =========================================================================
-    # UI
-    # =========================================================================
-    NOTIFICATION = auto()       # message, type
-    MENU_OPENED = auto()        # menu_type
-    MENU_CLOSED = auto()        # menu_type
-    INVENTORY_OPENED = auto()   # character
-    INVENTORY_CLOSED = auto()
-    CHARACTER_SELECTED = auto() # character, previous
-    CAMERA_ZOOMED = auto()      # direction
-    
-    # =========================================================================
-    # STATUS EFFECTS
-    # =========================================================================
-    STATUS_APPLIED = auto()     # entity, effect_type, duration, source
-    STATUS_EXPIRED = auto()     # entity, effect_type
-    STATUS_TICK = auto()        # entity, effect_type, damage
-    
-    # =========================================================================
-    # MOVEMENT
-    # =========================================================================
-    PATH_CALCULATED = auto()    # entity, start, end, path_length
-    ENTITY_STUCK = auto()       # entity, position, target
-    ENTITY_TELEPORTED = auto()  # entity, from_position, to_position, reason
-    
-    # =========================================================================
-    # GAME FLOW
-    # =========================================================================
-    GAME_STARTED = auto()       # new_game, loaded_save
-    GAME_PAUSED = auto()
-    GAME_RESUMED = auto()
-    GAME_SAVE_REQUESTED = auto() # slot (F5 quick save)
-    GAME_LOAD_REQUESTED = auto() # slot (F9 quick load)
-    GAME_SAVED = auto()         # slot, timestamp, playtime
-    GAME_LOADED = auto()        # slot, level
-    AUTOSAVE_TRIGGERED = auto()
-    PARTY_WIPED = auto()        # level, gold_lost
-    PARTY_RESPAWNED = auto()    # position, gold_before, gold_after
-    GAME_OVER = auto()          # reason
-    
-    # =========================================================================
-    # ACTION BAR
-    # =========================================================================
-    ACTION_BAR_USED = auto()    # slot
 
-
-@dataclass
+@dataclass(slots=True)
 class Event:
-    """An event with type and data payload."""
+    """An event with type and data payload (dict or typed Payload)."""
     type: EventType
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Union[Dict[str, Any], Payload] = field(default_factory=dict)
 
 
 class EventBus:
@@ -142,13 +31,25 @@ class EventBus:
         # Emit events (queued for processing)
         bus.emit(EventType.ENTITY_DIED, entity_id=42, killer_id=1)
         
+        # High-volume events use a typed payload
+        bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(attacker, target, 12)))
+        
+        # Or receive every event of a type once per process() as a list
+        bus.subscribe_batch(EventType.DAMAGE_DEALT, my_batch_handler)
+        
         # Process all queued events (call once per frame)
         bus.process()
     """
     
     def __init__(self):
         self._subscribers: Dict[EventType, List[Callable]] = {}
-        self._queue: List[Event] = []
+        self._labels: Dict[EventType, List[str]] = {}  # perf labels, parallel to _subscribers
+        self._queue: Deque[Event] = deque()
+        
+        # Batch subscribers get all events of a type once per process()
+        self._batch_subscribers: Dict[EventType, List[Callable]] = {}
+        self._batch_labels: Dict[EventType, List[str]] = {}
+        self._pending_batches: Dict[EventType, List[Event]] = {}  # only types with batch subscribers
     
     def subscribe(self, event_type: EventType, callback: Callable[[Dict[str, Any]], None]):
         """Subscribe to an event type.
@@ -160,12 +61,48 @@ class EventBus:
         """
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
+            self._labels[event_type] = []
         self._subscribers[event_type].append(callback)
+        # Build the perf label once here, not per dispatch
+        name = getattr(callback, "__name__", type(callback).__name__)
+        self._labels[event_type].append(f"Event:{event_type.name}:{name}")
     
     def unsubscribe(self, event_type: EventType, callback: Callable):
         """Unsubscribe from an event type."""
         if event_type in self._subscribers:
-            self._subscribers[event_type].remove(callback)
+            index = self._subscribers[event_type].index(callback)
+            del self._subscribers[event_type][index]
+            del self._labels[event_type][index]
+    
+    def subscribe_batch(self, event_type: EventType, callback: Callable[[List[Event]], None]):
+        """Subscribe to every event of a type, delivered as one list.
+        
+        The callback runs once per process() call that saw at least one
+        event of this type, after the queue is drained, so handlers can
+        aggregate (e.g. one hit sound for ten hits in the same frame).
+        
+        Args:
+            event_type: The type of event to listen for
+            callback: Function receiving the list of events, in emit order
+        """
+        if event_type not in self._batch_subscribers:
+            self._batch_subscribers[event_type] = []
+            self._batch_labels[event_type] = []
+            self._pending_batches[event_type] = []
+        self._batch_subscribers[event_type].append(callback)
+        name = getattr(callback, "__name__", type(callback).__name__)
+        self._batch_labels[event_type].append(f"Batch:{event_type.name}:{name}")
+    
+    def unsubscribe_batch(self, event_type: EventType, callback: Callable):
+        """Remove a batch subscriber."""
+        if event_type in self._batch_subscribers:
+            index = self._batch_subscribers[event_type].index(callback)
+            del self._batch_subscribers[event_type][index]
+            del self._batch_labels[event_type][index]
+            if not self._batch_subscribers[event_type]:
+                del self._batch_subscribers[event_type]
+                del self._batch_labels[event_type]
+                del self._pending_batches[event_type]
     
     def emit(self, event_or_type, **data):
         """Emit an event (queued for processing).
@@ -183,29 +120,106 @@ class EventBus:
         """Process all queued events.
         
         Call this once per frame after all systems have updated.
+        Handlers are only timed while perf monitoring is enabled - the
+        untraced path does no per-callback work beyond the call itself.
         """
         from .perf_monitor import perf
         
-        while self._queue:
-            event = self._queue.pop(0)
-            if event.type in self._subscribers:
-                for callback in self._subscribers[event.type]:
-                    # Time each handler
-                    handler_name = f"Event:{event.type.name}:{callback.__name__}"
-                    perf.mark(handler_name)
+        while True:
+            if perf.enabled:
+                self._process_traced(perf)
+                flushed = self._flush_batches_traced(perf)
+            else:
+                self._drain()
+                flushed = self._flush_batches()
+            
+            # Batch handlers may emit more events - keep going until quiet
+            if not flushed or not self._queue:
+                return
+    
+    def _drain(self):
+        """Dispatch every queued event to its per-event subscribers."""
+        queue = self._queue
+        subscribers = self._subscribers
+        pending = self._pending_batches
+        while queue:
+            event = queue.popleft()
+            callbacks = subscribers.get(event.type)
+            if callbacks:
+                for callback in callbacks:
+                    callback(event)
+            batch = pending.get(event.type)
+            if batch is not None:
+                batch.append(event)
+    
+    def _process_traced(self, perf):
+        """Dispatch every queued event, timing each handler."""
+        queue = self._queue
+        subscribers = self._subscribers
+        pending = self._pending_batches
+        while queue:
+            event = queue.popleft()
+            callbacks = subscribers.get(event.type)
+            if callbacks:
+                for callback, label in zip(callbacks, self._labels[event.type]):
+                    perf.mark(label)
                     callback(event)
-                    perf.measure(handler_name)
+                    perf.measure(label)
+            batch = pending.get(event.type)
+            if batch is not None:
+                batch.append(event)
+    
+    def _flush_batches(self) -> bool:
+        """Hand collected events to batch subscribers. Returns True if any ran."""
+        flushed = False
+        for event_type, batch in list(self._pending_batches.items()):
+            if not batch:
+                continue
+            events = batch[:]
+            batch.clear()
+            flushed = True
+            for callback in self._batch_subscribers[event_type]:
+                callback(events)
+        return flushed
+    
+    def _flush_batches_traced(self, perf) -> bool:
+        """Hand collected events to batch subscribers, timing each one."""
+        flushed = False
+        for event_type, batch in list(self._pending_batches.items()):
+            if not batch:
+                continue
+            events = batch[:]
+            batch.clear()
+            flushed = True
+            for callback, label in zip(self._batch_subscribers[event_type],
+                                       self._batch_labels[event_type]):
+                perf.mark(label)
+                callback(events)
+                perf.measure(label)
+        return flushed
     
     def clear(self):
         """Clear all queued events without processing."""
         self._queue.clear()
+        for batch in self._pending_batches.values():
+            batch.clear()
     
     def clear_subscribers(self, event_type: EventType = None):
         """Clear all subscribers for an event type, or all subscribers if type is None."""
         if event_type is None:
             self._subscribers.clear()
-        elif event_type in self._subscribers:
+            self._labels.clear()
+            self._batch_subscribers.clear()
+            self._batch_labels.clear()
+            self._pending_batches.clear()
+            return
+        if event_type in self._subscribers:
             self._subscribers[event_type].clear()
+            self._labels[event_type].clear()
+        if event_type in self._batch_subscribers:
+            del self._batch_subscribers[event_type]
+            del self._batch_labels[event_type]
+            del self._pending_batches[event_type]
 
 
 # Global event bus instance
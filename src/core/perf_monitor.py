@@ -2,11 +2,43 @@
 
 This is a passive monitor that just measures time. It doesn't wrap or
 modify any processors - just records timestamps and logs slow frames.
+
+Every measured section also feeds a rolling histogram (p50/p95/p99/max)
+so steady-state costs are visible, not just outliers. Sections follow
+the mark()/measure() names used across the codebase:
+- Processors: class name ("MovementProcessor")
+- Event handlers: "Event:<TYPE>:<handler>"
+- Renderer layers: "Render:<Layer>"
+- Whole frames: "Frame"
+
+Counters (count()) track how often something happened rather than how
+long it took, e.g. "Skipped:RegenProcessor" for processor runs the
+scheduler skipped.
+
+The global monitor samples from startup, so tests and tools can query
+stats() at any time. Writing slow frames to the log file and console
+(log_slow_frames) and periodic export (export_path) are opt-in; main.py
+turns both on for --perf-export. Setting enabled to False skips all
+timing, including per-handler event tracing.
 """
 
+import csv
+import json
 import time
 from pathlib import Path
 from collections import deque
+from typing import Dict, List, Optional
+
+
+FRAME_SECTION = "Frame"
+
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sample list."""
+    if not sorted_samples:
+        return 0.0
+    rank = int(round(pct / 100 * (len(sorted_samples) - 1)))
+    return sorted_samples[rank]
 
 
 class PerfMonitor:
@@ -14,20 +46,32 @@ class PerfMonitor:
     
     SLOW_FRAME_MS = 100      # 100ms = 10fps
     VERY_SLOW_FRAME_MS = 500  # 500ms = 2fps
+    HISTOGRAM_SAMPLES = 1000  # Rolling window per section
+    EXPORT_EVERY_FRAMES = 600  # Periodic export interval (10s at 60fps)
     
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, log_path: str = "perf_log.txt",
+                 log_slow_frames: bool = True):
         self.enabled = enabled
-        self.log_path = Path("perf_log.txt")
+        self.log_path = Path(log_path)
+        self.log_slow_frames = log_slow_frames  # Slow frames go to log_path and the console
+        
+        # Periodic export target (.json or .csv) - None disables it
+        self.export_path: Optional[Path] = None
         
         self._frame_start = 0.0
         self._marks = {}  # name -> start time
-        self._durations = {}  # name -> duration in ms
+        self._durations = {}  # name -> total ms this frame
         
         self._frame_times = deque(maxlen=60)
         self._slow_count = 0
         self._total_frames = 0
         
-        if self.enabled:
+        # Rolling histograms: name -> recent samples in ms
+        self._samples: Dict[str, deque] = {}
+        self._calls: Dict[str, int] = {}  # name -> lifetime sample count
+        self._counts: Dict[str, int] = {}  # name -> counter value
+        
+        if self.enabled and self.log_slow_frames:
             with open(self.log_path, 'w') as f:
                 f.write(f"=== Perf Log - {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n\n")
     
@@ -49,7 +93,9 @@ class PerfMonitor:
         if not self.enabled:
             return
         if name in self._marks:
-            self._durations[name] = (time.perf_counter() - self._marks[name]) * 1000
+            ms = (time.perf_counter() - self._marks[name]) * 1000
+            self._durations[name] = self._durations.get(name, 0.0) + ms
+            self._record(name, ms)
     
     def frame_end(self):
         """Call at very end of frame. Logs if slow."""
@@ -59,10 +105,111 @@ class PerfMonitor:
         frame_ms = (time.perf_counter() - self._frame_start) * 1000
         self._frame_times.append(frame_ms)
         self._total_frames += 1
+        self._record(FRAME_SECTION, frame_ms)
         
         if frame_ms >= self.SLOW_FRAME_MS:
             self._slow_count += 1
-            self._log_slow(frame_ms)
+            if self.log_slow_frames:
+                self._log_slow(frame_ms)
+        
+        if self.export_path and self._total_frames % self.EXPORT_EVERY_FRAMES == 0:
+            self.export(self.export_path)
+    
+    def record(self, name: str, ms: float):
+        """Add an externally measured value (ms) to a section's histogram."""
+        if not self.enabled:
+            return
+        self._record(name, ms)
+    
+    def count(self, name: str, n: int = 1):
+        """Add n to a named counter."""
+        if not self.enabled:
+            return
+        self._counts[name] = self._counts.get(name, 0) + n
+    
+    def _record(self, name: str, ms: float):
+        """Add a sample to a section's rolling histogram."""
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.HISTOGRAM_SAMPLES)
+            self._calls[name] = 0
+        samples.append(ms)
+        self._calls[name] += 1
+    
+    # =========================================================================
+    # QUERY API
+    # =========================================================================
+    
+    def sections(self) -> List[str]:
+        """Names of all sections measured so far."""
+        return sorted(self._samples)
+    
+    def stats(self, name: str) -> Optional[dict]:
+        """Histogram summary for one section over the rolling window.
+        
+        Returns:
+            Dict with calls, samples, mean, p50, p95, p99 and max (ms),
+            or None if the section was never measured
+        """
+        samples = self._samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return {
+            "calls": self._calls[name],
+            "samples": len(ordered),
+            "mean": sum(ordered) / len(ordered),
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+            "max": ordered[-1],
+        }
+    
+    def all_stats(self) -> Dict[str, dict]:
+        """Histogram summaries for every section, keyed by name."""
+        return {name: self.stats(name) for name in self.sections()}
+    
+    def counters(self) -> Dict[str, int]:
+        """All counters, keyed by name."""
+        return dict(sorted(self._counts.items()))
+    
+    def reset(self):
+        """Drop all histogram samples and frame counters."""
+        self._samples.clear()
+        self._calls.clear()
+        self._counts.clear()
+        self._durations.clear()
+        self._frame_times.clear()
+        self._slow_count = 0
+        self._total_frames = 0
+    
+    def export(self, path) -> Path:
+        """Write all section stats and counters to a .json or .csv file.
+        
+        In CSV, counters are rows with only section and calls filled in.
+        """
+        path = Path(path)
+        all_stats = self.all_stats()
+        
+        if path.suffix == ".csv":
+            fields = ["section", "calls", "samples", "mean", "p50", "p95", "p99", "max"]
+            with open(path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                for name, section in all_stats.items():
+                    writer.writerow({"section": name, **section})
+                for name, value in self.counters().items():
+                    writer.writerow({"section": name, "calls": value})
+        else:
+            with open(path, 'w') as f:
+                json.dump({
+                    "frames": self._total_frames,
+                    "slow_frames": self._slow_count,
+                    "sections": all_stats,
+                    "counters": self.counters(),
+                }, f, indent=2)
+        
+        return path
     
     def _log_slow(self, frame_ms: float):
         """Log a slow frame."""
@@ -84,5 +231,5 @@ class PerfMonitor:
         print(f"[{severity}] {frame_ms:.0f}ms - {top}")
 
 
-# Global instance - disabled to prevent console spam
-perf = PerfMonitor(enabled=False)
+# Global instance - always sampling; slow-frame logging off to prevent console spam
+perf = PerfMonitor(log_slow_frames=False)
@@ -0,0 +1,123 @@
+"""Sampling profiler - which lines burn time during a real fight.
+
+PerfMonitor times whole sections (a processor, a render layer). This
+samples the main thread's stack from a background thread at a fixed
+interval instead, so hot lines inside MagicProcessor or the Renderer
+show up without instrumenting them. Sampling costs one stack walk per
+interval and nothing while stopped.
+
+Profiles are written in Brendan Gregg's collapsed-stack format, one
+line per unique stack ("outer;inner;leaf count"), ready for
+flamegraph.pl or speedscope. File names carry the dungeon level and
+entity count from when sampling started.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from .constants import PROFILER_SAMPLE_INTERVAL, PROFILER_OUTPUT_DIR
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _frame_label(code, lineno: int) -> str:
+    """One collapsed-stack frame: function (project-relative file:line)."""
+    filename = code.co_filename
+    if filename.startswith(_ROOT):
+        filename = os.path.relpath(filename, _ROOT)
+    return f"{code.co_name} ({filename}:{lineno})".replace(";", ":")
+
+
+class SamplingProfiler:
+    """Samples one thread's stack at a fixed interval while running."""
+    
+    def __init__(self, interval: float = PROFILER_SAMPLE_INTERVAL,
+                 output_dir: str = PROFILER_OUTPUT_DIR):
+        self.interval = interval
+        self.output_dir = Path(output_dir)
+        
+        self._stacks = Counter()  # collapsed stack -> sample count
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._target_id = None
+        self._tags = ""
+        self.samples = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+    
+    def start(self, dungeon_level: int = 0, entity_count: int = 0):
+        """Start sampling the calling thread.
+        
+        Args:
+            dungeon_level: Tag for the output file name
+            entity_count: Tag for the output file name
+        """
+        if self.running:
+            return
+        self._stacks.clear()
+        self.samples = 0
+        self._tags = f"L{dungeon_level}_E{entity_count}"
+        self._target_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> Optional[Path]:
+        """Stop sampling and write the profile.
+        
+        Returns:
+            Path of the collapsed-stack file, or None if nothing was sampled
+        """
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        
+        if not self._stacks:
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"profile_{self._tags}_{time.strftime('%Y%m%d-%H%M%S')}.folded"
+        self.write(path)
+        return path
+    
+    def toggle(self, dungeon_level: int = 0, entity_count: int = 0) -> Optional[Path]:
+        """Start if stopped, otherwise stop and return the written file."""
+        if self.running:
+            return self.stop()
+        self.start(dungeon_level, entity_count)
+        return None
+    
+    def write(self, path) -> Path:
+        """Write the collected stacks in collapsed format (hottest first)."""
+        path = Path(path)
+        with open(path, 'w') as f:
+            for stack, count in self._stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+    
+    def _run(self):
+        """Sampling loop (background thread)."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            if frame is None:
+                continue
+            self._sample(frame)
+    
+    def _sample(self, frame):
+        """Collapse one stack (root first) and count it."""
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+        labels.reverse()
+        self._stacks[";".join(labels)] += 1
+        self.samples += 1
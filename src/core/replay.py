@@ -0,0 +1,169 @@
+"""Input recording and replay - reproduce a session step for step.
+
+A recording holds everything needed to run the same simulation again:
+- the dungeon seed and the global random state at the first step
+- the camera screen size (mouse positions are screen coordinates)
+- every input event the InputProcessor consumed, stamped with the
+  fixed step it arrived before
+- the camera view at steps that turned a click into a world position
+- throttle interval changes made by the simulation budget
+
+Game.run_replay() feeds the log back headlessly at full speed, so the
+same heavy fight can be timed across builds. A checksum of the world at
+the end of the recording is compared after replay to catch divergence.
+
+Only what InputProcessor sees is recorded. Menus, HUD clicks, action bar
+use, town visits and loading a save are not replayed; a session that
+uses them will be reported as diverged.
+"""
+
+import json
+import random
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import esper
+import pygame
+
+
+# Recording file format version (bump when the layout changes)
+REPLAY_FORMAT_VERSION = 1
+
+# Event types InputProcessor handles, and the attributes it reads from each
+RECORDED_EVENTS = {
+    "KEYDOWN": (pygame.KEYDOWN, ("key",)),
+    "KEYUP": (pygame.KEYUP, ("key",)),
+    "MOUSEMOTION": (pygame.MOUSEMOTION, ("pos",)),
+    "MOUSEBUTTONDOWN": (pygame.MOUSEBUTTONDOWN, ("button", "pos")),
+    "MOUSEBUTTONUP": (pygame.MOUSEBUTTONUP, ("button", "pos")),
+    "MOUSEWHEEL": (pygame.MOUSEWHEEL, ("y",)),
+}
+_EVENT_NAMES = {event_type: name for name, (event_type, _) in RECORDED_EVENTS.items()}
+
+
+def world_checksum() -> int:
+    """CRC of every positioned entity's position and health.
+    
+    Cheap enough to run once at the end of a session. Positions are
+    rounded so harmless float noise in the last digits doesn't count.
+    """
+    from ..ecs.components import Position, Health
+    
+    state = []
+    for ent, (pos,) in sorted(esper.get_components(Position), key=lambda item: item[0]):
+        health = esper.try_component(ent, Health)
+        state.append((ent, round(pos.x, 4), round(pos.y, 4), health.current if health else None))
+    return zlib.crc32(repr(state).encode())
+
+
+class InputRecording:
+    """One recorded session: seed, random state and stamped inputs."""
+    
+    def __init__(self):
+        self.seed: Optional[int] = None
+        self.screen_size: Tuple[int, int] = (0, 0)
+        self.random_state = None
+        self.ticks = 0  # Fixed steps the session ran
+        self.checksum: Optional[int] = None  # world_checksum() at the end
+        
+        # step -> [(event name, attributes, camera view)]
+        self.inputs: Dict[int, List[Tuple[str, dict, Tuple[float, float]]]] = {}
+        self.views: Dict[int, Tuple[float, float]] = {}  # step -> camera view
+        self.intervals: Dict[int, int] = {}  # step -> throttle interval from then on
+        self._interval = 1
+    
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+    
+    def begin(self, seed: int, screen_size: Tuple[int, int]):
+        """Start (or restart) recording at step 0 of a new game."""
+        self.__init__()
+        self.seed = seed
+        self.screen_size = tuple(screen_size)
+        self.random_state = random.getstate()
+    
+    def record_event(self, step: int, event: pygame.event.Event, view: Tuple[float, float]):
+        """Record an input event consumed before `step` runs."""
+        name = _EVENT_NAMES.get(event.type)
+        if name is None:
+            return
+        _, attrs = RECORDED_EVENTS[name]
+        data = {attr: getattr(event, attr) for attr in attrs}
+        self.inputs.setdefault(step, []).append((name, data, tuple(view)))
+    
+    def record_view(self, step: int, view: Tuple[float, float]):
+        """Record the camera view a step converts clicks with."""
+        self.views[step] = tuple(view)
+    
+    def record_interval(self, step: int, interval: int):
+        """Record the throttle interval in effect from `step` on."""
+        if interval != self._interval:
+            self.intervals[step] = interval
+            self._interval = interval
+    
+    def finish(self, ticks: int):
+        """Close the recording after the last step."""
+        self.ticks = ticks
+        self.checksum = world_checksum()
+    
+    # =========================================================================
+    # PLAYBACK
+    # =========================================================================
+    
+    def events_at(self, step: int) -> List[Tuple[pygame.event.Event, Tuple[float, float]]]:
+        """Input events to deliver before `step`, with their camera view."""
+        return [
+            (pygame.event.Event(RECORDED_EVENTS[name][0], data), view)
+            for name, data, view in self.inputs.get(step, ())
+        ]
+    
+    # =========================================================================
+    # SAVE / LOAD
+    # =========================================================================
+    
+    def save(self, path) -> Path:
+        """Write the recording as JSON."""
+        path = Path(path)
+        version, internal, gauss = self.random_state
+        with open(path, 'w') as f:
+            json.dump({
+                "version": REPLAY_FORMAT_VERSION,
+                "seed": self.seed,
+                "screen_size": list(self.screen_size),
+                "random_state": [version, list(internal), gauss],
+                "ticks": self.ticks,
+                "checksum": self.checksum,
+                "inputs": [
+                    [step, name, data, list(view)]
+                    for step in sorted(self.inputs)
+                    for name, data, view in self.inputs[step]
+                ],
+                "views": [[step, *view] for step, view in sorted(self.views.items())],
+                "intervals": sorted(self.intervals.items()),
+            }, f)
+        return path
+    
+    @classmethod
+    def load(cls, path) -> "InputRecording":
+        """Read a recording written by save()."""
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version {data.get('version')} in {path}")
+        
+        recording = cls()
+        recording.seed = data["seed"]
+        recording.screen_size = tuple(data["screen_size"])
+        version, internal, gauss = data["random_state"]
+        recording.random_state = (version, tuple(internal), gauss)
+        recording.ticks = data["ticks"]
+        recording.checksum = data["checksum"]
+        for step, name, event_data, view in data["inputs"]:
+            if "pos" in event_data:
+                event_data["pos"] = tuple(event_data["pos"])
+            recording.inputs.setdefault(step, []).append((name, event_data, tuple(view)))
+        recording.views = {step: (x, y) for step, x, y in data["views"]}
+        recording.intervals = {step: interval for step, interval in data["intervals"]}
+        return recording
@@ -0,0 +1,95 @@
+"""Simulation budget - spiral-of-death protection for the fixed timestep loop.
+
+When steps get slow, running every owed step makes the next frame owe
+even more. The budget measures average step cost and limits how many
+steps one frame may run. Time it can't catch up is dropped (the game
+briefly runs slower than real time) and counted, instead of stalling.
+Under sustained load it also flags the simulation as degraded so
+low-priority processors can run less often.
+"""
+
+from .constants import (
+    FIXED_TIMESTEP, MAX_CATCHUP_STEPS, SIM_BUDGET_MS,
+    SIM_DEGRADE_ENABLED, SIM_DEGRADE_STEP_MS
+)
+
+
+# Smoothing for the average step cost (higher = reacts faster)
+STEP_COST_SMOOTHING = 0.1
+
+
+class SimulationBudget:
+    """Decides how many fixed steps each frame runs."""
+    
+    def __init__(
+        self,
+        timestep: float = FIXED_TIMESTEP,
+        max_steps: int = MAX_CATCHUP_STEPS,
+        budget_ms: float = SIM_BUDGET_MS,
+        degrade_enabled: bool = SIM_DEGRADE_ENABLED,
+        degrade_step_ms: float = SIM_DEGRADE_STEP_MS
+    ):
+        self.timestep = timestep
+        self.max_steps = max_steps
+        self.budget_ms = budget_ms
+        self.degrade_enabled = degrade_enabled
+        self.degrade_step_ms = degrade_step_ms
+        
+        self.step_ms = 0.0  # Smoothed cost of one step
+        self.degraded = False
+        
+        # Metrics
+        self.steps_run = 0
+        self.dropped_seconds = 0.0
+        self.dropped_frames = 0  # Frames that had to drop time
+    
+    def steps_for(self, accumulator: float) -> int:
+        """Number of steps to run this frame for the owed time."""
+        owed = int(accumulator / self.timestep)
+        allowed = self.max_steps
+        if self.step_ms > 0:
+            allowed = max(1, min(allowed, int(self.budget_ms / self.step_ms)))
+        return min(owed, allowed)
+    
+    def record_step(self, seconds: float):
+        """Record the wall time one step took."""
+        ms = seconds * 1000
+        if self.step_ms == 0:
+            self.step_ms = ms
+        else:
+            self.step_ms += (ms - self.step_ms) * STEP_COST_SMOOTHING
+        self.steps_run += 1
+        self._update_degraded()
+    
+    def drop_backlog(self, accumulator: float) -> float:
+        """Drop whole steps that are still owed after this frame's steps.
+        
+        Returns:
+            The accumulator to carry into the next frame (less than one step)
+        """
+        if accumulator < self.timestep:
+            return accumulator
+        
+        remainder = accumulator % self.timestep
+        self.dropped_seconds += accumulator - remainder
+        self.dropped_frames += 1
+        return remainder
+    
+    def _update_degraded(self):
+        """Enter degraded mode above the threshold, leave well below it."""
+        if not self.degrade_enabled:
+            self.degraded = False
+        elif self.degraded:
+            self.degraded = self.step_ms > self.degrade_step_ms * 0.5
+        else:
+            self.degraded = self.step_ms > self.degrade_step_ms
+    
+    def stats(self) -> dict:
+        """Current budget metrics."""
+        return {
+            "step_ms": self.step_ms,
+            "steps_run": self.steps_run,
+            "dropped_seconds": self.dropped_seconds,
+            "dropped_frames": self.dropped_frames,
+            "degraded": self.degraded,
+        }
@@ -0,0 +1,67 @@
+"""Startup timeline - how long each init phase takes before the first frame.
+
+Phases are timed with a context manager and can nest:
+
+    with startup.phase("Renderer"):
+        with startup.phase("Sprites"):
+            sprites.load_all()
+    
+    startup.mark("First frame")
+
+report() lists every phase with its start offset and duration, indented
+by nesting depth. Times are measured from when this module is first
+imported (main.py imports it before anything heavy).
+"""
+
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+
+class StartupTimeline:
+    """Records named init phases relative to process startup."""
+    
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.entries: List[dict] = []  # name, depth, start, end (seconds since origin)
+        self._depth = 0
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as one phase."""
+        entry = {"name": name, "depth": self._depth, "start": self._now(), "end": None}
+        self.entries.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry["end"] = self._now()
+    
+    def mark(self, name: str):
+        """Record a point in time (zero-length phase)."""
+        now = self._now()
+        self.entries.append({"name": name, "depth": self._depth, "start": now, "end": now})
+    
+    def elapsed(self, name: str) -> Optional[float]:
+        """Seconds from startup to the end of the named phase or mark."""
+        for entry in self.entries:
+            if entry["name"] == name and entry["end"] is not None:
+                return entry["end"]
+        return None
+    
+    def report(self) -> str:
+        """Timeline as text, one line per phase in start order."""
+        lines = [f"{'start':>8} {'took':>8}  phase (ms)"]
+        for entry in self.entries:
+            took = "" if entry["end"] is None else f"{(entry['end'] - entry['start']) * 1000:8.1f}"
+            indent = "  " * entry["depth"]
+            lines.append(f"{entry['start'] * 1000:8.1f} {took:>8}  {indent}{entry['name']}")
+        return "\n".join(lines)
+    
+    def _now(self) -> float:
+        return time.perf_counter() - self.origin
+
+
+# Global instance - started when first imported
+startup = StartupTimeline()
@@ -3,5 +3,6 @@
 from . import components
 from . import processors
 from . import factories
+from . import queries
 
-__all__ = ['components', 'processors', 'factories']
+__all__ = ['components', 'processors', 'factories', 'queries']
@@ -46,7 +46,7 @@ from .rendering import (
 # Tags
 from .tags import (
     PlayerControlled, Selected, PartyMember, Enemy, Ally,
-    Loot, Interactable, ToRemove
+    Loot, Interactable, ToRemove, Pooled
 )
 
 # Items
@@ -78,7 +78,7 @@ __all__ = [
     'HealthBar', 'DamageNumber', 'VisualEffect',
     # Tags
     'PlayerControlled', 'Selected', 'PartyMember', 'Enemy', 'Ally',
-    'Loot', 'Interactable', 'ToRemove',
+    'Loot', 'Interactable', 'ToRemove', 'Pooled',
     # Items
     'ItemDrop', 'DroppedItem', 'GoldDrop', 'PickupRadius',
 ]
@@ -6,7 +6,7 @@ from typing import Tuple, Optional, List
 from ...core.constants import AIState
 
 
-@dataclass
+@dataclass(slots=True)
 class AIController:
     """AI state and behavior."""
     state: AIState = AIState.IDLE
@@ -24,19 +24,19 @@ class AIController:
     stuck_timer: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AggroRange:
     """Range at which entity will aggro."""
     range: float = 6.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LeashRange:
     """Range before entity returns home."""
     range: float = 15.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AllyAI:
     """Marker for ally AI (follows player, helps in combat)."""
     leader_id: int = -1  # Entity to follow
@@ -46,7 +46,7 @@ class AllyAI:
     spell_ready_timers: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyAI:
     """Marker for enemy AI (patrols, attacks player)."""
     enemy_type: str = "skeleton"
@@ -56,7 +56,7 @@ class EnemyAI:
     patrol_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PatrolPath:
     """Patrol waypoints for enemies."""
     points: List[Tuple[float, float]] = field(default_factory=list)
@@ -65,7 +65,7 @@ class PatrolPath:
     wait_time: float = 2.0  # Time to wait at each point
 
 
-@dataclass
+@dataclass(slots=True)
 class Summon:
     """Marker for summoned creatures."""
     summoner_id: int = -1
@@ -7,7 +7,7 @@ from enum import Enum, auto
 from ...core.constants import DamageType
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatStats:
     """Base combat statistics."""
     damage: int = 10
@@ -16,7 +16,7 @@ class CombatStats:
     attack_range: float = 1.5  # Tiles
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatTarget:
     """Current combat target (entity ID)."""
     target_id: int = -1
@@ -26,7 +26,7 @@ class CombatTarget:
         return self.target_id >= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackCooldown:
     """Time until next attack is ready."""
     remaining: float = 0.0
@@ -36,13 +36,13 @@ class AttackCooldown:
         return self.remaining <= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackIntent:
     """Intent to attack a target (set by input/AI)."""
     target_id: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class Weapon:
     """Equipped weapon stats."""
     item_id: str = ""
@@ -58,7 +58,7 @@ class Weapon:
     poison_damage: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Resistances:
     """Damage resistances (-1.0 to 1.0)."""
     fire: float = 0.0
@@ -68,7 +68,7 @@ class Resistances:
     holy: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class InCombat:
     """Marker for entities currently in combat."""
     timer: float = 0.0  # Time since last combat action
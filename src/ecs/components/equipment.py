@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Equipment:
     """Equipped items by slot."""
     slots: Dict[str, Optional[str]] = field(default_factory=lambda: {
@@ -36,7 +36,7 @@ class Equipment:
         return item
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """A single inventory item."""
     item_id: str
@@ -45,7 +45,7 @@ class InventoryItem:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     """Character inventory."""
     items: List[InventoryItem] = field(default_factory=list)
@@ -82,7 +82,7 @@ class Inventory:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Gold:
     """Gold currency."""
     amount: int = 0
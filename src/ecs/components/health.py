@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Health:
     """Entity health points."""
     current: int = 100
@@ -20,7 +20,7 @@ class Health:
         return self.current / self.maximum
 
 
-@dataclass
+@dataclass(slots=True)
 class Mana:
     """Entity mana points for spellcasting."""
     current: int = 100
@@ -33,7 +33,7 @@ class Mana:
         return self.current / self.maximum
 
 
-@dataclass
+@dataclass(slots=True)
 class Regeneration:
     """Health and mana regeneration rates."""
     health_per_second: float = 0.0
@@ -41,13 +41,13 @@ class Regeneration:
     in_combat: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Downed:
     """Marker for downed (but revivable) party members."""
     timer: float = 0.0  # Time spent downed
 
 
-@dataclass
+@dataclass(slots=True)
 class Dead:
     """Marker for permanently dead entities (enemies)."""
     timer: float = 0.0  # Time since death, for corpse removal
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemDrop:
     """An item on the ground (by item_id)."""
     item_id: str = ""
@@ -12,7 +12,7 @@ class ItemDrop:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DroppedItem:
     """An item entity dropped on the ground."""
     item: Any = None  # The actual item data
@@ -21,13 +21,13 @@ class DroppedItem:
     rarity: int = 0  # For glow color
 
 
-@dataclass 
+@dataclass(slots=True)
 class GoldDrop:
     """Gold on the ground."""
     amount: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PickupRadius:
     """Radius for auto-pickup."""
     radius: float = 1.0
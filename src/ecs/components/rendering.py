@@ -21,7 +21,7 @@ class AnimationState(Enum):
     CHANNEL = auto()    # Channeling a spell (Lyra)
 
 
-@dataclass
+@dataclass(slots=True)
 class Sprite:
     """Sprite rendering info."""
     sprite_set: str = "hero"  # Which sprite set to use
@@ -32,7 +32,7 @@ class Sprite:
     layer: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Animation:
     """Animation state."""
     state: AnimationState = AnimationState.IDLE
@@ -43,21 +43,21 @@ class Animation:
     frame_duration: float = 0.10 # Faster animations (Was 0.15)
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderOffset:
     """Offset for rendering (centering, etc.)."""
     x: int = 0
     y: int = -16  # Offset up to center on tile
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthBar:
     """Marker to render health bar above entity."""
     show: bool = True
     offset_y: int = -40
 
 
-@dataclass
+@dataclass(slots=True)
 class DamageNumber:
     """Floating damage number."""
     value: int = 0
@@ -68,7 +68,7 @@ class DamageNumber:
     rise_speed: float = 120.0  # Much faster rise
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualEffect:
     """A visual effect (spell impact, etc.)."""
     effect_type: str = ""  # fire_explosion, ice_shatter, etc.
@@ -79,7 +79,7 @@ class VisualEffect:
     frame: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LightningBolt:
     """A lightning bolt visual connecting two points."""
     start_x: float = 0.0
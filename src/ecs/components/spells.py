@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SpellBook:
     """Known spells and cooldowns."""
     known_spells: List[str] = field(default_factory=list)  # Ordered list of spell IDs
@@ -33,7 +33,7 @@ class SpellBook:
             self.cooldowns[spell_id] = max(0.0, self.cooldowns[spell_id] - dt)
 
 
-@dataclass
+@dataclass(slots=True)
 class CastIntent:
     """Intent to cast a spell (set by input/AI)."""
     spell_id: str = ""
@@ -42,7 +42,7 @@ class CastIntent:
     target_y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Casting:
     """Currently casting a spell."""
     spell_id: str = ""
@@ -52,7 +52,7 @@ class Casting:
     cast_time: float = 0.0  # Time until spell fires
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalCooldown:
     """Global cooldown - prevents spamming abilities too fast."""
     remaining: float = 0.0  # Time until next ability can be used
@@ -62,7 +62,7 @@ class GlobalCooldown:
         return self.remaining <= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """A spell projectile in flight."""
     spell_id: str = ""
@@ -73,9 +73,10 @@ class Projectile:
     speed: float = 12.0
     damage: int = 0
     damage_type: str = "fire"
+    lifetime: float = 5.0  # Seconds before the projectile fizzles
 
 
-@dataclass
+@dataclass(slots=True)
 class AreaEffect:
     """An area effect on the ground."""
     spell_id: str = ""
@@ -88,7 +89,7 @@ class AreaEffect:
     damage_type: str = "fire"
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusEffect:
     """A status effect on an entity."""
     effect_type: str = ""  # slow, burn, poison, frozen, regen
@@ -101,7 +102,7 @@ class StatusEffect:
     heal_per_second: float = 0.0
 
 
-@dataclass 
+@dataclass(slots=True)
 class StatusEffects:
     """Collection of active status effects."""
     effects: List[StatusEffect] = field(default_factory=list)
@@ -127,7 +128,7 @@ class StatusEffects:
         return mult
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveAbility:
     """An ongoing multi-hit or channeled ability."""
     spell_id: str = ""
@@ -139,7 +140,7 @@ class ActiveAbility:
     total_duration: float = 0.0  # For animation tracking
 
 
-@dataclass
+@dataclass(slots=True)
 class LeapingAbility:
     """Tracks an in-progress leap attack."""
     spell_id: str = ""
@@ -158,7 +159,7 @@ class LeapingAbility:
     has_landed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DelayedSpellEffect:
     """Delay effect application (e.g. for heavy animations)."""
     spell_id: str = ""
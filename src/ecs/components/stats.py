@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Attributes:
     """Primary attributes (STR/DEX/INT)."""
     strength: int = 10
@@ -12,7 +12,7 @@ class Attributes:
     intelligence: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillLevels:
     """Skill levels for the 4 skills."""
     melee: int = 0
@@ -27,7 +27,7 @@ class SkillLevels:
         return self.melee + self.ranged + self.combat_magic + self.nature_magic
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillXP:
     """XP progress for each skill."""
     melee: int = 0
@@ -43,19 +43,19 @@ class SkillXP:
         setattr(self, skill_name, current + amount)
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterLevel:
     """Character level (derived from skills)."""
     level: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterClass:
     """Character class type."""
     class_name: str = "warrior"  # warrior, mage, ranger, cleric
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterName:
     """Display name for character."""
     name: str = "Unknown"
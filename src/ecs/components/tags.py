@@ -3,49 +3,55 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerControlled:
     """This entity is controlled by the player."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Selected:
     """This entity is currently selected by the player."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyMember:
     """This entity is a party member (player or ally)."""
     party_index: int = 0  # 0 = leader, 1+ = allies
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     """This entity is hostile."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Ally:
     """This entity is friendly (AI-controlled party member)."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Loot:
     """This entity is lootable (item on ground)."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Interactable:
     """This entity can be interacted with."""
     interaction_type: str = ""  # "stairs", "shrine", "chest"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToRemove:
     """Mark entity for removal at end of frame."""
     pass
+
+
+@dataclass(slots=True)
+class Pooled:
+    """Released to an entity pool instead of deleted (see ecs/entity_pool.py)."""
+    pool: str = ""
@@ -13,39 +13,39 @@ class Direction(IntEnum):
     UP = 3     # Facing away (north)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """World position in tile coordinates."""
     x: float = 0.0
     y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Velocity:
     """Movement velocity in tiles per second."""
     dx: float = 0.0
     dy: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Facing:
     """Direction the entity is facing."""
     direction: Direction = Direction.DOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class Speed:
     """Movement speed in tiles per second."""
     value: float = 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionRadius:
     """Collision circle radius for entity."""
     radius: float = 0.4
 
 
-@dataclass
+@dataclass(slots=True)
 class Path:
     """Pathfinding path to follow."""
     waypoints: List[Tuple[float, float]] = field(default_factory=list)
@@ -62,21 +62,21 @@ class Path:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveIntent:
     """Requested movement direction (from input or AI)."""
     dx: float = 0.0
     dy: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetPosition:
     """Target position to move towards (click-to-move)."""
     x: float = 0.0
     y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Knockback:
     """Forced movement impulse (knockback)."""
     target_x: float = 0.0
@@ -0,0 +1,243 @@
+"""Entity pools - recycle short-lived entities instead of deleting them.
+
+Spell spam creates projectiles, visual effects and damage numbers every
+step. Each one gets a new entity ID, a component dict and fresh
+component objects, which esper and the query views index and which
+CleanupProcessor tears down again a moment later.
+
+A pool parks released entities instead. A parked entity is taken out of
+esper's database and every query view (as far as the game can tell it
+was deleted) but keeps its ID, dict and component objects. spawn()
+re-initializes those objects in place and puts the entity back:
+
+    ent = pool.spawn((x, y), (12, True))  # Position(x, y), DamageNumber(12, True)
+
+Each argument holds the positional constructor arguments for one
+component of the pool's archetype, in order, and the rest of the fields
+get their defaults - a recycled component is indistinguishable from a
+newly constructed one. Pooled entities carry a Pooled tag naming
+their pool; CleanupProcessor releases them when they are marked ToRemove,
+so their lifetimes don't change.
+
+Parked IDs belong to the esper database they were created in. When the
+database is cleared or the world switched, esper replaces its ID
+counter; the pool notices and drops its parked entities rather than
+reusing IDs the new database will hand out again.
+
+State kept elsewhere per entity ID must be dropped when an entity is
+parked, or its next life inherits it. Each pool calls its on_release
+with every entity it parks; the game sets it to the render
+interpolator's forget(), so a recycled damage number doesn't slide from
+where its previous life ended.
+
+esper has no public API for detaching an entity without deleting it,
+so spawn()/release() work on its module-level database (_entities,
+_components, _dead_entities, _entity_count). requirements.txt pins the
+esper minor version this was written against, and test_entity_pool.py
+fails if that layout changes.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import esper
+
+from . import queries
+from .components import Pooled
+from ..core.constants import ENTITY_POOLING_ENABLED, ENTITY_POOL_MAX_PARKED
+from ..core.perf_monitor import perf
+
+
+class EntityPool:
+    """Recycles entities of one archetype (a fixed set of component types)."""
+    
+    def __init__(self, name: str, *component_types: type,
+                 max_parked: int = ENTITY_POOL_MAX_PARKED,
+                 on_release: Optional[Callable[[int], None]] = None):
+        self.name = name
+        self.component_types = component_types
+        self.max_parked = max_parked
+        self.enabled = ENTITY_POOLING_ENABLED
+        self.on_release = on_release  # Called with each parked entity
+        self._parked: List[Tuple[int, dict]] = []  # (ent, component dict)
+        self._archetype = frozenset(component_types + (Pooled,))
+        self._counter = esper._entity_count  # ID counter the parked IDs came from
+        self._views = []  # Query views touching the archetype
+        self._views_generation = -1
+        self._reused_label = f"Pool:{name}:reused"
+        self._created_label = f"Pool:{name}:created"
+        
+        # Metrics
+        self.reused = 0    # Spawns served from parked entities
+        self.created = 0   # Spawns that created a new entity
+        self.released = 0  # Entities parked
+        
+        pools[name] = self
+    
+    def __len__(self) -> int:
+        """Parked entities ready for reuse."""
+        return len(self._parked)
+    
+    def spawn(self, *fields: tuple) -> int:
+        """Create an entity of this archetype, reusing a parked one if any.
+        
+        Args:
+            fields: Constructor arguments for each component type, in order
+        
+        Returns:
+            Entity ID
+        """
+        if self._counter is not esper._entity_count:
+            self._forget_parked()
+        
+        if not self._parked:
+            self.created += 1
+            perf.count(self._created_label)
+            return esper.create_entity(
+                *[ct(*args) for ct, args in zip(self.component_types, fields)],
+                Pooled(pool=self.name)
+            )
+        
+        ent, entity_comps = self._parked.pop()
+        for ct, args in zip(self.component_types, fields):
+            component = entity_comps.get(ct)
+            if component is None:
+                # Removed while the entity was alive - give it a new one
+                entity_comps[ct] = ct(*args)
+            else:
+                component.__init__(*args)
+        
+        esper._entities[ent] = entity_comps
+        components = esper._components
+        for ct in entity_comps:
+            comp_set = components.get(ct)
+            if comp_set is None:
+                comp_set = components[ct] = set()
+            comp_set.add(ent)
+        esper.clear_cache()
+        for view in self._archetype_views():
+            view._update(ent, entity_comps)
+        
+        self.reused += 1
+        perf.count(self._reused_label)
+        return ent
+    
+    def release(self, ent: int):
+        """Park an entity for reuse (it stops existing right away).
+        
+        Extra components added while it was alive (ToRemove, ...) are
+        dropped. Falls back to a normal delete when pooling is disabled
+        or the pool is full.
+        """
+        if self._counter is not esper._entity_count:
+            self._forget_parked()
+        
+        entity_comps = esper._entities.get(ent)
+        if entity_comps is None:
+            return
+        if not self.enabled or len(self._parked) >= self.max_parked:
+            esper.delete_entity(ent)
+            return
+        
+        # Same as esper.delete_entity(immediate=True), minus dropping the dict
+        del esper._entities[ent]
+        esper._dead_entities.discard(ent)
+        components = esper._components
+        for ct in entity_comps:
+            comp_set = components[ct]
+            comp_set.discard(ent)
+            if not comp_set:
+                del components[ct]
+        esper.clear_cache()
+        
+        for view in self._archetype_views():
+            view._discard(ent)
+        archetype = self._archetype
+        extras = [ct for ct in entity_comps if ct not in archetype]
+        if extras:
+            # Usually just ToRemove - drop it and leave any views it's part of
+            for view in queries.views_touching(extras):
+                view._discard(ent)
+            for ct in extras:
+                del entity_comps[ct]
+        
+        self._parked.append((ent, entity_comps))
+        self.released += 1
+        if self.on_release is not None:
+            self.on_release(ent)
+    
+    @property
+    def allocations_avoided(self) -> int:
+        """Component objects and dicts not allocated thanks to reuse."""
+        return self.reused * (len(self.component_types) + 1)
+    
+    def stats(self) -> dict:
+        """Spawn counts, hit rate and parked entities."""
+        spawns = self.reused + self.created
+        return {
+            "spawns": spawns,
+            "reused": self.reused,
+            "created": self.created,
+            "hit_rate": self.reused / spawns if spawns else 0.0,
+            "allocations_avoided": self.allocations_avoided,
+            "parked": len(self._parked),
+        }
+    
+    def reset_stats(self):
+        """Zero the spawn counters (parked entities stay)."""
+        self.reused = 0
+        self.created = 0
+        self.released = 0
+    
+    def _archetype_views(self) -> list:
+        """Query views an entity of this archetype is a member of (cached).
+        
+        Only views whose every type is in the archetype - a damage number
+        never joins (Position, Enemy), so it's never offered to it.
+        """
+        if self._views_generation != queries.generation:
+            self._views = [
+                view for view in queries.views_touching(self._archetype)
+                if self._archetype.issuperset(view.types)
+            ]
+            self._views_generation = queries.generation
+        return self._views
+    
+    def _forget_parked(self):
+        """The database changed under us - parked IDs may be handed out again."""
+        self._parked.clear()
+        self._counter = esper._entity_count
+
+
+# Every pool by name (Pooled.pool refers to these)
+pools: Dict[str, EntityPool] = {}
+
+
+def release(ent: int) -> bool:
+    """Release a Pooled entity to its pool.
+    
+    Returns:
+        False if the entity isn't pooled (the caller should delete it)
+    """
+    pooled = esper.try_component(ent, Pooled)
+    if pooled is None:
+        return False
+    pools[pooled.pool].release(ent)
+    return True
+
+
+def pool_stats(seconds: float = 0.0) -> Dict[str, dict]:
+    """Stats for every pool that has spawned anything.
+    
+    Args:
+        seconds: Simulated time the counts cover, for per-second rates
+    """
+    result = {}
+    for name, pool in pools.items():
+        stats = pool.stats()
+        if not stats["spawns"]:
+            continue
+        if seconds > 0:
+            stats["reused_per_sec"] = pool.reused / seconds
+            stats["allocations_avoided_per_sec"] = pool.allocations_avoided / seconds
+        result[name] = stats
+    return result
@@ -3,6 +3,10 @@
 from .characters import create_character, create_party
 from .enemies import create_enemy, create_enemies_for_level
 from .items import create_item_drop, create_gold_drop, roll_loot_drops
+from .effects import (
+    create_damage_number, create_visual_effect, create_lightning_bolt,
+    create_area_effect, create_projectile
+)
 
 __all__ = [
     'create_character',
@@ -12,4 +16,9 @@ __all__ = [
     'create_item_drop',
     'create_gold_drop',
     'roll_loot_drops',
+    'create_damage_number',
+    'create_visual_effect',
+    'create_lightning_bolt',
+    'create_area_effect',
+    'create_projectile',
 ]
@@ -0,0 +1,72 @@
+"""Transient effect factories - pooled projectiles, effects and damage numbers.
+
+These entities live for a fraction of a second to a few seconds and are
+created in bursts, so they come from entity pools (see ecs/entity_pool.py)
+instead of esper.create_entity(). Arguments go to the component
+constructors in field order; fields not listed keep their defaults.
+"""
+
+from ..components import (
+    Position, Velocity, CollisionRadius,
+    DamageNumber, VisualEffect, LightningBolt,
+    Projectile, AreaEffect
+)
+from ..entity_pool import EntityPool
+
+
+damage_numbers = EntityPool("damage_number", Position, DamageNumber)
+visual_effects = EntityPool("visual_effect", Position, VisualEffect)
+lightning_bolts = EntityPool("lightning_bolt", LightningBolt)
+area_effects = EntityPool("area_effect", Position, AreaEffect)
+projectiles = EntityPool(
+    "projectile", Position, Velocity, Projectile, CollisionRadius, VisualEffect
+)
+
+
+def create_damage_number(x: float, y: float, value: int, is_crit: bool = False,
+                         is_heal: bool = False, is_player_damage: bool = False) -> int:
+    """Floating damage (or heal) number at a world position."""
+    return damage_numbers.spawn((x, y), (value, is_crit, is_heal, is_player_damage))
+
+
+def create_visual_effect(x: float, y: float, effect_type: str, timer: float = 0.5,
+                         duration: float = 0.5, radius: float = 0.0, color: tuple = None) -> int:
+    """Spell impact, cast flash or other timed visual at a world position."""
+    return visual_effects.spawn((x, y), (effect_type, timer, duration, radius, color))
+
+
+def create_lightning_bolt(start_x: float, start_y: float, end_x: float, end_y: float,
+                          timer: float = 0.4, segments: list = None) -> int:
+    """Jagged bolt between two points (chain lightning)."""
+    return lightning_bolts.spawn((start_x, start_y, end_x, end_y, timer, segments))
+
+
+def create_area_effect(x: float, y: float, spell_id: str, caster_id: int, radius: float,
+                       duration: float, tick_interval: float, damage_per_tick: int,
+                       damage_type: str) -> int:
+    """Persistent ground effect that damages every tick_interval seconds."""
+    return area_effects.spawn(
+        (x, y),
+        (spell_id, caster_id, radius, duration, tick_interval, tick_interval,
+         damage_per_tick, damage_type)
+    )
+
+
+def create_projectile(x: float, y: float, dx: float, dy: float, spell_id: str,
+                      caster_id: int, target_id: int, target_x: float, target_y: float,
+                      speed: float, damage: int, damage_type: str,
+                      radius: float = 0.3) -> int:
+    """Spell projectile in flight.
+    
+    Args:
+        x, y: Start position
+        dx, dy: Velocity in tiles per second
+        radius: Collision radius
+    """
+    return projectiles.spawn(
+        (x, y),
+        (dx, dy),
+        (spell_id, caster_id, target_id, target_x, target_y, speed, damage, damage_type),
+        (radius,),
+        (f"projectile_{damage_type}",)
+    )
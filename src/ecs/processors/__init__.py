@@ -13,6 +13,9 @@ from .save_load_processor import SaveLoadProcessor
 from .world_processor import WorldProcessor, DroppedItemProcessor
 from .regen_processor import RegenProcessor
 from .position_validator import PositionValidator
+from .autopilot_processor import AutopilotProcessor
+from .throttled_processor import ThrottledProcessor
+from .scheduler import ProcessorScheduler
 
 __all__ = [
     'InputProcessor',
@@ -29,4 +32,7 @@ __all__ = [
     'DroppedItemProcessor',
     'RegenProcessor',
     'PositionValidator',
+    'AutopilotProcessor',
+    'ThrottledProcessor',
+    'ProcessorScheduler',
 ]
@@ -12,13 +12,18 @@ from ..components import (
     Position, Velocity, Speed, MoveIntent, Path,
     Health, Mana, CombatStats, CombatTarget, AttackIntent,
     AIController, EnemyAI, AllyAI, AggroRange, LeashRange,
-    PartyMember, Enemy, Ally, PlayerControlled, Selected, Downed, Dead,
+    PartyMember, Enemy, Ally, PlayerControlled, Selected,
     SpellBook, Casting, CastIntent, GlobalCooldown, StatusEffects
 )
+from ..queries import query
+from ..tag_index import tag_index, DEAD, INACTIVE
 from ...core.events import EventBus, Event, EventType
 from ...core.constants import AIState
 from ...core.formulas import distance
+from ...world.flow_field import FlowFields
+from ...world.path_requests import PathRequests
 from ...world.pathfinding import Pathfinder
+from ...world.map_context import MapContext
 
 
 # Constants
@@ -36,22 +41,40 @@ ALLY_HEAL_THRESHOLD = 0.5    # Heal allies below 50% health
 class AIProcessor(esper.Processor):
     """Processes AI decisions for enemies and allies."""
     
-    def __init__(self, event_bus: EventBus, pathfinder=None, dungeon=None):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
-        self.pathfinder = pathfinder
-        self.dungeon = dungeon
+        self.map_context = map_context or MapContext()
+        self.clock = 0.0  # Seconds of AI time, for flow field ages
     
-    def set_pathfinder(self, pathfinder):
-        self.pathfinder = pathfinder
+    @property
+    def dungeon(self):
+        """Active map for line-of-sight and movement checks."""
+        return self.map_context.active
     
-    def set_dungeon(self, dungeon):
-        self.dungeon = dungeon
+    @property
+    def pathfinder(self) -> Optional[Pathfinder]:
+        """Pathfinder for the active map (cached per map)."""
+        return self.map_context.pathfinder
+    
+    @property
+    def flow_fields(self) -> Optional[FlowFields]:
+        """Flow fields toward chase targets on the active map."""
+        return self.map_context.flow_fields
+    
+    @property
+    def path_requests(self) -> Optional[PathRequests]:
+        """Time-sliced path requests on the active map."""
+        return self.map_context.path_requests
     
     def process(self, dt: float):
         """Process AI decisions each frame."""
         from ...core.perf_monitor import perf
         perf.mark("AIProcessor")
         
+        self.clock += dt
+        path_requests = self.path_requests
+        if path_requests:
+            path_requests.update()  # Finish what fits in this tick's budget
         self._process_enemy_ai(dt)
         self._process_ally_ai(dt)
         
@@ -63,10 +86,11 @@ class AIProcessor(esper.Processor):
     
     def _process_enemy_ai(self, dt: float):
         """Simple enemy AI: idle -> chase -> attack -> return."""
-        for ent, (pos, ai, enemy_ai) in esper.get_components(
+        tags = tag_index.flags
+        for ent, (pos, ai, enemy_ai) in query(
             Position, AIController, EnemyAI
         ):
-            if esper.has_component(ent, Dead):
+            if tags.get(ent, 0) & DEAD:
                 continue
             
             # Check if stunned
@@ -146,8 +170,8 @@ class AIProcessor(esper.Processor):
                 if target_dist <= attack_range:
                     ai.state = AIState.ATTACK
                 else:
-                    # Chase - use pathfinding only for minor obstacles (player is visible)
-                    self._move_toward_entity(ent, pos, ai.target_id)
+                    # Chase - follow the target's flow field (shared by every chaser)
+                    self._chase(ent, pos, ai.target_id, target_pos)
             
             elif ai.state == AIState.ATTACK:
                 if not self._is_valid_target(ai.target_id):
@@ -204,7 +228,7 @@ class AIProcessor(esper.Processor):
         # If no selected leader, find any player-controlled entity
         if leader_id < 0:
             for ent, (pctrl, pos) in esper.get_components(PlayerControlled, Position):
-                if not esper.has_component(ent, Downed) and not esper.has_component(ent, Dead):
+                if not tag_index.has_any(ent, INACTIVE):
                     leader_id = ent
                     leader_pos = pos
                     break
@@ -213,7 +237,8 @@ class AIProcessor(esper.Processor):
             return
         
         # Process each ally
-        for ent, (pos, ai, ally_ai) in esper.get_components(
+        tags = tag_index.flags
+        for ent, (pos, ai, ally_ai) in query(
             Position, AIController, AllyAI
         ):
             # Skip if this IS the leader
@@ -221,7 +246,7 @@ class AIProcessor(esper.Processor):
                 continue
             
             # Skip downed/dead
-            if esper.has_component(ent, Downed) or esper.has_component(ent, Dead):
+            if tags.get(ent, 0) & INACTIVE:
                 self._stop_moving(ent)
                 continue
             
@@ -401,9 +426,10 @@ class AIProcessor(esper.Processor):
     
     def _find_ally_needing_heal(self, pos: Position) -> Optional[int]:
         """Find an ally that needs healing."""
-        for ent, (ally_pos, _, health) in esper.get_components(Position, PartyMember, Health):
+        tags = tag_index.flags
+        for ent, (ally_pos, _, health) in query(Position, PartyMember, Health):
             # Skip dead or downed allies - can't heal them
-            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+            if tags.get(ent, 0) & INACTIVE:
                 continue
             
             # Check if low health
@@ -495,8 +521,9 @@ class AIProcessor(esper.Processor):
         nearest = None
         nearest_dist = float('inf')
         
-        for ent, (member_pos, _) in esper.get_components(Position, PartyMember):
-            if esper.has_component(ent, Downed) or esper.has_component(ent, Dead):
+        tags = tag_index.flags
+        for ent, (member_pos, _) in query(Position, PartyMember):
+            if tags.get(ent, 0) & INACTIVE:
                 continue
             
             # Check line of sight - can't target through walls
@@ -515,8 +542,9 @@ class AIProcessor(esper.Processor):
         nearest = None
         nearest_dist = float('inf')
         
-        for ent, (enemy_pos, _) in esper.get_components(Position, Enemy):
-            if esper.has_component(ent, Dead):
+        tags = tag_index.flags
+        for ent, (enemy_pos, _) in query(Position, Enemy):
+            if tags.get(ent, 0) & DEAD:
                 continue
             
             # Check line of sight if we have a dungeon
@@ -536,11 +564,7 @@ class AIProcessor(esper.Processor):
             return False
         if not esper.entity_exists(target_id):
             return False
-        if esper.has_component(target_id, Dead):
-            return False
-        if esper.has_component(target_id, Downed):
-            return False
-        return True
+        return not tag_index.has_any(target_id, INACTIVE)
     
     def _get_attack_range(self, ent: int) -> float:
         """Get entity's attack range."""
@@ -558,6 +582,24 @@ class AIProcessor(esper.Processor):
         target_pos = esper.component_for_entity(target_id, Position)
         self._move_toward_point(ent, pos, target_pos.x, target_pos.y, speed_mult)
     
+    def _chase(self, ent: int, pos: Position, target_id: int, target_pos: Position):
+        """Set movement toward a chase target along its flow field.
+        
+        Falls back to direct movement and pathfinding when the chaser is
+        outside the field (or there's no map).
+        """
+        flow_fields = self.flow_fields
+        if flow_fields and distance(pos.x, pos.y, target_pos.x, target_pos.y) >= 1.5:
+            step = flow_fields.next_step(
+                target_id, target_pos.x, target_pos.y, pos.x, pos.y, self.clock
+            )
+            if step is not None:
+                self._move_direct(ent, pos, step[0], step[1])
+                if esper.has_component(ent, Path):
+                    esper.remove_component(ent, Path)
+                return
+        self._move_toward_point(ent, pos, target_pos.x, target_pos.y)
+    
     def _move_toward_point(self, ent: int, pos: Position, tx: float, ty: float, speed_mult: float = 1.0):
         """Set movement toward a point, using simple pathfinding only for minor obstacles."""
         dist = distance(pos.x, pos.y, tx, ty)
@@ -589,13 +631,16 @@ class AIProcessor(esper.Processor):
             self._move_direct(ent, pos, tx, ty, speed_mult)
             if esper.has_component(ent, Path):
                 esper.remove_component(ent, Path)
+            if self.path_requests:
+                self.path_requests.cancel(ent)
             return
         
-        # There's an obstacle - use pathfinding if available
-        if self.pathfinder and self.dungeon:
-            waypoints = self.pathfinder.find_path(pos.x, pos.y, tx, ty, max_iterations=200)
-            
-            if waypoints and len(waypoints) > 1:
+        # There's an obstacle - request a path (served on a later tick)
+        path_requests = self.path_requests
+        if path_requests and self.dungeon:
+            waypoints = path_requests.result(ent)
+            if waypoints and len(waypoints) > 1 and \
+                    distance(waypoints[-1][0], waypoints[-1][1], tx, ty) < 1.5:
                 if esper.has_component(ent, Path):
                     path = esper.component_for_entity(ent, Path)
                     path.waypoints = waypoints
@@ -603,8 +648,10 @@ class AIProcessor(esper.Processor):
                 else:
                     esper.add_component(ent, Path(waypoints=waypoints, current_index=0))
                 return
+            if waypoints is None:
+                path_requests.submit(ent, pos.x, pos.y, tx, ty)
         
-        # No path found or no pathfinder - try direct movement anyway
+        # Path pending, not found or no map - keep heading straight for it
         self._move_direct(ent, pos, tx, ty, speed_mult)
     
     def _move_direct(self, ent: int, pos: Position, tx: float, ty: float, speed_mult: float = 1.0):
@@ -8,6 +8,7 @@ from ..components import (
 )
 from ..components.rendering import DamageNumber, VisualEffect, LightningBolt
 from ..components.tags import ToRemove
+from ..entity_pool import release
 
 
 class AnimationProcessor(esper.Processor):
@@ -133,7 +134,7 @@ class AnimationProcessor(esper.Processor):
             pos.y -= dmg.rise_speed * dt * 0.01
             
             if dmg.timer <= 0:
-                esper.add_component(ent, ToRemove())
+                self._expire(ent)
     
     def _update_visual_effects(self, dt: float):
         """Update visual effects."""
@@ -141,11 +142,16 @@ class AnimationProcessor(esper.Processor):
             effect.timer -= dt
             
             if effect.timer <= 0:
-                esper.add_component(ent, ToRemove())
+                self._expire(ent)
         
         # Update lightning bolts
         for ent, (bolt,) in esper.get_components(LightningBolt):
             bolt.timer -= dt
             
             if bolt.timer <= 0:
-                esper.add_component(ent, ToRemove())
+                self._expire(ent)
+    
+    def _expire(self, ent: int):
+        """Remove a finished effect - pooled ones go straight back to their pool."""
+        if not release(ent):
+            esper.add_component(ent, ToRemove())
@@ -0,0 +1,153 @@
+"""Autopilot processor - drives the party leader when nobody is at the keyboard.
+
+Used by headless runs so soak tests exercise the same movement, combat and
+room-activation paths a player would:
+- Fight the nearest visible enemy
+- Otherwise walk room to room in generation order
+- Take the stairs down once every room has been visited
+"""
+
+import esper
+from typing import Optional, Tuple
+
+from ..components import (
+    Position, Path, TargetPosition, AttackIntent, CombatStats,
+    Enemy, PlayerControlled, Selected, Downed, Dead
+)
+from ..queries import query
+from ...core.constants import (
+    AUTOPILOT_DECISION_INTERVAL, AUTOPILOT_ENGAGE_RANGE, AUTOPILOT_ARRIVE_DISTANCE
+)
+from ...core.events import EventBus
+from ...core.formulas import distance
+from ...world.map_context import MapContext
+
+
+class AutopilotProcessor(esper.Processor):
+    """Makes decisions for the selected party member in headless runs."""
+    
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None,
+                 world_processor=None):
+        self.event_bus = event_bus
+        self.map_context = map_context or MapContext()
+        self.world_processor = world_processor
+        self.dungeon = None  # Dungeon the room tour belongs to
+        self.room_index = 0
+        self.decision_timer = 0.0
+    
+    @property
+    def pathfinder(self):
+        """Pathfinder for the current dungeon (shared with the AI)."""
+        return self.map_context.pathfinder
+    
+    def _sync_dungeon(self):
+        """Restart the room tour when the dungeon changes."""
+        dungeon = self.map_context.dungeon
+        if dungeon is not self.dungeon:
+            self.dungeon = dungeon
+            self.room_index = 0
+            self.decision_timer = 0.0
+    
+    def process(self, dt: float):
+        """Decide what the leader does next."""
+        from ...core.perf_monitor import perf
+        perf.mark("AutopilotProcessor")
+        
+        self._sync_dungeon()
+        self.decision_timer -= dt
+        if (self.decision_timer <= 0 and not self.map_context.in_town
+                and self.dungeon and self.dungeon.rooms):
+            self.decision_timer = AUTOPILOT_DECISION_INTERVAL
+            self._drive_leader()
+        
+        perf.measure("AutopilotProcessor")
+    
+    def _drive_leader(self):
+        """Fight or explore with the selected party member."""
+        for ent, (pos, _, _) in query(Position, PlayerControlled, Selected):
+            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+                return
+            
+            target = self._find_target(pos)
+            if target is not None:
+                self._engage(ent, pos, target)
+            else:
+                self._explore(ent, pos)
+            return
+    
+    def _find_target(self, pos: Position) -> Optional[int]:
+        """Find the nearest living enemy the leader can see."""
+        nearest = None
+        nearest_dist = AUTOPILOT_ENGAGE_RANGE
+        
+        for ent, (enemy_pos, _) in query(Position, Enemy):
+            if esper.has_component(ent, Dead):
+                continue
+            
+            dist = distance(pos.x, pos.y, enemy_pos.x, enemy_pos.y)
+            if dist >= nearest_dist:
+                continue
+            if not self.dungeon.has_line_of_sight(pos.x, pos.y, enemy_pos.x, enemy_pos.y):
+                continue
+            
+            nearest = ent
+            nearest_dist = dist
+        
+        return nearest
+    
+    def _engage(self, ent: int, pos: Position, target: int):
+        """Attack the target, closing the distance first if needed."""
+        esper.add_component(ent, AttackIntent(target_id=target))
+        
+        if esper.has_component(ent, Path):
+            esper.remove_component(ent, Path)
+        
+        attack_range = 1.5
+        if esper.has_component(ent, CombatStats):
+            attack_range = esper.component_for_entity(ent, CombatStats).attack_range
+        
+        target_pos = esper.component_for_entity(target, Position)
+        if distance(pos.x, pos.y, target_pos.x, target_pos.y) > attack_range:
+            esper.add_component(ent, TargetPosition(x=target_pos.x, y=target_pos.y))
+        elif esper.has_component(ent, TargetPosition):
+            esper.remove_component(ent, TargetPosition)
+    
+    def _explore(self, ent: int, pos: Position):
+        """Walk to the next unvisited room, then to the stairs."""
+        if esper.has_component(ent, TargetPosition):
+            esper.remove_component(ent, TargetPosition)
+        
+        goal = self._current_goal()
+        on_stairs = self.room_index >= len(self.dungeon.rooms)
+        arrive = 0.5 if on_stairs else AUTOPILOT_ARRIVE_DISTANCE
+        
+        if distance(pos.x, pos.y, goal[0], goal[1]) <= arrive:
+            if on_stairs:
+                if self.world_processor:
+                    self.world_processor.request_use_stairs()
+                return
+            self.room_index += 1
+            if esper.has_component(ent, Path):
+                esper.remove_component(ent, Path)
+            goal = self._current_goal()
+        
+        if esper.has_component(ent, Path) and esper.component_for_entity(ent, Path).has_path:
+            return
+        
+        waypoints = self.pathfinder.find_path(pos.x, pos.y, goal[0], goal[1])
+        if waypoints:
+            esper.add_component(ent, Path(waypoints=waypoints))
+        else:
+            # Unreachable - move on rather than stand still
+            self.room_index = (self.room_index + 1) % (len(self.dungeon.rooms) + 1)
+    
+    def _current_goal(self) -> Tuple[float, float]:
+        """Center of the room being visited, or the stairs down."""
+        if self.room_index < len(self.dungeon.rooms):
+            cx, cy = self.dungeon.rooms[self.room_index].center
+        elif self.dungeon.stairs_down:
+            cx, cy = self.dungeon.stairs_down
+        else:
+            self.room_index = 0
+            cx, cy = self.dungeon.rooms[0].center
+        return (cx + 0.5, cy + 0.5)
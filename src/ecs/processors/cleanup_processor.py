@@ -4,6 +4,7 @@ import esper
 
 from ..components.tags import ToRemove, Enemy
 from ..components.health import Dead
+from ..entity_pool import release
 
 
 # Time to wait before removing dead enemy corpses (seconds)
@@ -13,12 +14,17 @@ CORPSE_DESPAWN_TIME = 15.0
 class CleanupProcessor(esper.Processor):
     """Removes entities marked with ToRemove component.
     
-    Also handles corpse cleanup after death animations.
-    Should run LAST in the processor order.
+    Also handles corpse cleanup after death animations. Pooled entities
+    (projectiles, effects, damage numbers) go back to their pool instead.
+    Should run LAST in the processor order, every step - a projectile
+    marked ToRemove keeps colliding until it is deleted.
     """
     
     def process(self, dt: float):
         """Remove all entities marked for removal."""
+        from ...core.perf_monitor import perf
+        perf.mark("CleanupProcessor")
+        
         to_delete = []
         
         # Remove entities explicitly marked for removal
@@ -32,5 +38,7 @@ class CleanupProcessor(esper.Processor):
                 to_delete.append(ent)
         
         for ent in to_delete:
-            if esper.entity_exists(ent):
+            if esper.entity_exists(ent) and not release(ent):
                 esper.delete_entity(ent)
+        
+        perf.measure("CleanupProcessor")
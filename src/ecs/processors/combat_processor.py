@@ -10,14 +10,18 @@ from ..components import (
     PlayerControlled, PartyMember, Enemy, Ally,
     Attributes, SkillLevels, SkillXP
 )
-from ..components.rendering import DamageNumber
+from ..factories.effects import create_damage_number
+from ..queries import query
+from ..tag_index import tag_index, DEAD, DOWNED, ENEMY, PARTY_MEMBER, INACTIVE
 from ...core.events import EventBus, Event, EventType
+from ...core.event_payloads import DamageDealt
 from ...core.formulas import (
     calculate_physical_damage, calculate_elemental_damage,
     distance, in_range,
     XP_MELEE_HIT, XP_RANGED_HIT, XP_KILL_BONUS
 )
 from ...core.constants import ATTACK_RANGE_MELEE
+from ...world.map_context import MapContext
 
 
 class CombatProcessor(esper.Processor):
@@ -26,14 +30,15 @@ class CombatProcessor(esper.Processor):
     This is THE combat update path. Everyone uses this.
     """
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
-        self.dungeon = None
+        self.map_context = map_context or MapContext()
         self.wipe_cooldown = 0.0  # Prevent multiple wipe events
     
-    def set_dungeon(self, dungeon):
-        """Set dungeon reference for line-of-sight checks."""
-        self.dungeon = dungeon
+    @property
+    def dungeon(self):
+        """Active map for line-of-sight checks."""
+        return self.map_context.active
     
     def process(self, dt: float):
         """Process combat each frame."""
@@ -81,11 +86,12 @@ class CombatProcessor(esper.Processor):
     
     def _process_attacks(self, dt: float):
         """Process attack intents and execute attacks."""
+        tags = tag_index.flags
         for ent, (pos, stats, cooldown, intent) in esper.get_components(
             Position, CombatStats, AttackCooldown, AttackIntent
         ):
             # Dead/downed entities can't attack
-            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+            if tags.get(ent, 0) & INACTIVE:
                 esper.remove_component(ent, AttackIntent)
                 continue
             
@@ -99,21 +105,22 @@ class CombatProcessor(esper.Processor):
                 continue
             
             # FACTION CHECK: Can't attack your own team!
-            attacker_is_party = esper.has_component(ent, PartyMember)
-            target_is_party = esper.has_component(target_id, PartyMember)
+            target_tags = tags.get(target_id, 0)
+            attacker_is_party = bool(tags.get(ent, 0) & PARTY_MEMBER)
+            target_is_party = bool(target_tags & PARTY_MEMBER)
             if attacker_is_party == target_is_party:
                 # Same faction - clear intent and skip
                 esper.remove_component(ent, AttackIntent)
                 continue
             
             # Check if target is dead/downed
-            if esper.has_component(target_id, Dead):
+            if target_tags & DEAD:
                 esper.remove_component(ent, AttackIntent)
                 continue
             
-            if esper.has_component(target_id, Downed):
+            if target_tags & DOWNED:
                 # Can't attack downed allies
-                if not esper.has_component(target_id, Enemy):
+                if not target_tags & ENEMY:
                     esper.remove_component(ent, AttackIntent)
                     continue
             
@@ -240,9 +247,9 @@ class CombatProcessor(esper.Processor):
         if esper.has_component(target, Position):
             target_pos = esper.component_for_entity(target, Position)
             is_player_dmg = esper.has_component(target, PartyMember)
-            esper.create_entity(
-                Position(x=target_pos.x, y=target_pos.y - 0.5),
-                DamageNumber(value=total_damage, is_crit=is_crit, is_player_damage=is_player_dmg)
+            create_damage_number(
+                target_pos.x, target_pos.y - 0.5,
+                value=total_damage, is_crit=is_crit, is_player_damage=is_player_dmg
             )
         
         # Award XP
@@ -254,13 +261,13 @@ class CombatProcessor(esper.Processor):
             skill_xp.add(skill_name, xp_amount)
         
         # Emit event
-        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-            "attacker": attacker,
-            "target": target,
-            "amount": total_damage,
-            "is_crit": is_crit,
-            "damage_type": "physical"
-        }))
+        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+            attacker=attacker,
+            target=target,
+            amount=total_damage,
+            is_crit=is_crit,
+            damage_type="physical"
+        )))
     
     def _enter_combat(self, entity: int):
         """Put entity into combat state."""
@@ -275,16 +282,16 @@ class CombatProcessor(esper.Processor):
     
     def _check_deaths(self):
         """Check for and handle deaths."""
+        tags = tag_index.flags
         for ent, (health,) in esper.get_components(Health):
             if health.current <= 0:
                 # Skip if already dead/downed
-                if esper.has_component(ent, Dead):
-                    continue
-                if esper.has_component(ent, Downed):
+                flags = tags.get(ent, 0)
+                if flags & INACTIVE:
                     continue
                 
                 # Party member -> downed (can be revived)
-                if esper.has_component(ent, PartyMember):
+                if flags & PARTY_MEMBER:
                     esper.add_component(ent, Downed(timer=0.0))
                     
                     # Set animation
@@ -300,7 +307,7 @@ class CombatProcessor(esper.Processor):
                     self._check_party_wipe()
                 
                 # Enemy -> dead (drop loot, give XP)
-                elif esper.has_component(ent, Enemy):
+                elif flags & ENEMY:
                     esper.add_component(ent, Dead())
                     
                     if esper.has_component(ent, Animation):
@@ -328,7 +335,6 @@ class CombatProcessor(esper.Processor):
     def _check_revives(self):
         """Revive downed party members when out of combat."""
         from ..components import Position
-        from ...core.formulas import distance
         
         # Check if any party member is still up
         any_alive = False
@@ -342,12 +348,13 @@ class CombatProcessor(esper.Processor):
         
         # Check if any enemies are nearby (within aggro range)
         enemies_nearby = False
-        for party_ent, (party_pos, _) in esper.get_components(Position, PartyMember):
+        tags = tag_index.flags
+        for party_ent, (party_pos, _) in query(Position, PartyMember):
             if esper.has_component(party_ent, Downed):
                 continue
             
-            for enemy_ent, (enemy_pos, _) in esper.get_components(Position, Enemy):
-                if esper.has_component(enemy_ent, Dead):
+            for enemy_ent, (enemy_pos, _) in query(Position, Enemy):
+                if tags.get(enemy_ent, 0) & DEAD:
                     continue
                 dist = distance(party_pos.x, party_pos.y, enemy_pos.x, enemy_pos.y)
                 if dist < 10.0:  # Enemies within 10 tiles = in combat
@@ -2,14 +2,17 @@
 
 import pygame
 import esper
+from typing import Optional
 
 from ..components import (
     Position, MoveIntent, TargetPosition, AttackIntent, CastIntent,
     PlayerControlled, Selected, Facing, Direction, PartyMember, SpellBook,
     Enemy, Dead, Downed, Health
 )
+from ..queries import query
 from ...core.events import EventBus, Event, EventType
 from ...core.formulas import distance
+from ...world.map_context import MapContext
 
 
 # Spell key bindings per party member (party_index -> key list)
@@ -28,8 +31,9 @@ class InputProcessor(esper.Processor):
     read those intents.
     """
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
+        self.map_context = map_context or MapContext()
         
         # Input state
         self.keys_held = set()
@@ -45,13 +49,11 @@ class InputProcessor(esper.Processor):
         
         # World processor reference (set by game) for stairs
         self.world_processor = None
-        
-        # Dungeon reference for LOS checks
-        self.dungeon = None
     
-    def set_dungeon(self, dungeon):
-        """Set dungeon reference for LOS checks."""
-        self.dungeon = dungeon
+    @property
+    def dungeon(self):
+        """Active map for LOS checks."""
+        return self.map_context.active
     
     def handle_event(self, event: pygame.event.Event):
         """Called from game loop to process pygame events."""
@@ -127,6 +129,8 @@ class InputProcessor(esper.Processor):
             self.event_bus.emit(Event(EventType.GAME_SAVE_REQUESTED))
         elif key == pygame.K_F9:
             self.event_bus.emit(Event(EventType.GAME_LOAD_REQUESTED))
+        elif key == pygame.K_F10:
+            self.event_bus.emit(Event(EventType.PROFILER_TOGGLED))
         # Action bar keys (1-8) - use from action bar, not party select
         elif key >= pygame.K_1 and key <= pygame.K_8:
             # This is handled by party member select above for 1-3
@@ -197,7 +201,7 @@ class InputProcessor(esper.Processor):
     def _attack_nearest_enemy(self):
         """Attack the nearest enemy to the selected character."""
         # Find selected character
-        for ent, (pos, _, _) in esper.get_components(Position, PlayerControlled, Selected):
+        for ent, (pos, _, _) in query(Position, PlayerControlled, Selected):
             nearest_enemy = self._find_nearest_enemy(pos)
             if nearest_enemy >= 0:
                 if esper.has_component(ent, AttackIntent):
@@ -212,7 +216,7 @@ class InputProcessor(esper.Processor):
         nearest = -1
         nearest_dist = 15.0  # Max targeting range
         
-        for ent, (pos, _) in esper.get_components(Position, Enemy):
+        for ent, (pos, _) in query(Position, Enemy):
             # Skip dead enemies
             if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
                 continue
@@ -242,7 +246,7 @@ class InputProcessor(esper.Processor):
         
         on_stairs = False
         if self.world_processor and self.world_processor.dungeon:
-            for ent, (pos, _, _) in esper.get_components(Position, PlayerControlled, Selected):
+            for ent, (pos, _, _) in query(Position, PlayerControlled, Selected):
                 tile_x = int(pos.x)
                 tile_y = int(pos.y)
                 tile = self.world_processor.dungeon.get_tile(tile_x, tile_y)
@@ -260,7 +264,7 @@ class InputProcessor(esper.Processor):
         from ..components import DroppedItem, Inventory as InventoryComp
         
         # Find selected character
-        for ent, (pos, _, _) in esper.get_components(Position, PlayerControlled, Selected):
+        for ent, (pos, _, _) in query(Position, PlayerControlled, Selected):
             pickup_radius = 2.0
             
             # Find nearby dropped items
@@ -327,7 +331,7 @@ class InputProcessor(esper.Processor):
         
         # Get the currently selected player's position for LOS check
         player_pos = None
-        for ent, (pos, _, _) in esper.get_components(Position, PlayerControlled, Selected):
+        for ent, (pos, _, _) in query(Position, PlayerControlled, Selected):
             player_pos = pos
             break
         
@@ -365,8 +369,11 @@ class InputProcessor(esper.Processor):
     
     def process(self, dt: float):
         """Process input each frame."""
+        from ...core.perf_monitor import perf
+        perf.mark("InputProcessor")
+        
         # Get player-controlled entities
-        for ent, (pos, _, selected) in esper.get_components(Position, PlayerControlled, Selected):
+        for ent, (pos, _, selected) in query(Position, PlayerControlled, Selected):
             # Arrow keys for movement
             dx, dy = 0.0, 0.0
             
@@ -427,3 +434,5 @@ class InputProcessor(esper.Processor):
         
         # Clear single-frame inputs
         self.mouse_clicked = [False, False, False]
+        
+        perf.measure("InputProcessor")
@@ -8,6 +8,7 @@ from ..components import (
 )
 from ..components.ai import EnemyAI
 from ..components.tags import ToRemove
+from ..queries import query
 from ..factories.items import roll_loot_drops
 from ...core.events import EventBus, Event, EventType
 from ...core.formulas import distance
@@ -51,12 +52,15 @@ class LootProcessor(esper.Processor):
     
     def process(self, dt: float):
         """Process loot pickup."""
+        from ...core.perf_monitor import perf
+        perf.mark("LootProcessor")
+        
         # Get all party member positions
         party_positions = []
         party_inventories = []
         party_gold = []
         
-        for ent, (pos, member) in esper.get_components(Position, PartyMember):
+        for ent, (pos, member) in query(Position, PartyMember):
             inv = None
             gold_comp = None
             if esper.has_component(ent, Inventory):
@@ -111,3 +115,5 @@ class LootProcessor(esper.Processor):
                             }))
                     
                     break  # Only one party member picks up
+        
+        perf.measure("LootProcessor")
@@ -10,19 +10,25 @@ from ..components import (
     StatusEffect, StatusEffects, ActiveAbility, LeapingAbility, DelayedSpellEffect,
     GlobalCooldown, CharacterName, Knockback,
     Attributes, SkillLevels, SkillXP,
-    Animation, AnimationState, VisualEffect, RenderOffset,
+    Animation, AnimationState, RenderOffset,
     PartyMember, Enemy, Downed, Dead,
-    CollisionRadius, Resistances
+    Resistances
 )
-from ..components.rendering import DamageNumber
 from ..components.tags import ToRemove
+from ..factories.effects import (
+    create_damage_number, create_visual_effect, create_lightning_bolt,
+    create_area_effect, create_projectile
+)
+from ..queries import query
 from ...core.events import EventBus, Event, EventType
+from ...core.event_payloads import DamageDealt, ProjectileHit
 from ...core.constants import TileType
 from ...core.formulas import (
     calculate_spell_damage, calculate_heal_amount, calculate_elemental_damage,
     distance, XP_SPELL_HIT, XP_HEAL_CAST
 )
 from ...data.loader import data_loader
+from ...world.map_context import MapContext
 
 
 class MagicProcessor(esper.Processor):
@@ -45,9 +51,9 @@ class MagicProcessor(esper.Processor):
     # Default GCD for spells without animation_duration
     DEFAULT_GCD = 0.5
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
-        self.dungeon = None
+        self.map_context = map_context or MapContext()
         
         # Subscribe to cast requests
         event_bus.subscribe(EventType.SPELL_CAST_REQUESTED, self._on_cast_requested)
@@ -57,9 +63,10 @@ class MagicProcessor(esper.Processor):
         anim_name = spell_data.get('animation', '')
         return self.ANIMATION_MAP.get(anim_name, default)
     
-    def set_dungeon(self, dungeon):
-        """Set dungeon reference for line-of-sight checks."""
-        self.dungeon = dungeon
+    @property
+    def dungeon(self):
+        """Active map for line-of-sight checks."""
+        return self.map_context.active
     
     def _on_cast_requested(self, event: Event):
         """Handle spell cast request from input."""
@@ -173,7 +180,7 @@ class MagicProcessor(esper.Processor):
                 # Deal damage to all enemies in radius
                 is_caster_party = esper.has_component(ent, PartyMember)
                 
-                for target_ent, (target_pos, health) in esper.get_components(Position, Health):
+                for target_ent, (target_pos, health) in query(Position, Health):
                     if target_ent == ent:
                         continue
                     
@@ -199,17 +206,17 @@ class MagicProcessor(esper.Processor):
                     
                     # Create damage number (red if hitting party member)
                     is_player_dmg = esper.has_component(target_ent, PartyMember)
-                    esper.create_entity(
-                        Position(x=target_pos.x, y=target_pos.y - 0.5),
-                        DamageNumber(value=ability.damage_per_hit, is_player_damage=is_player_dmg)
+                    create_damage_number(
+                        target_pos.x, target_pos.y - 0.5,
+                        value=ability.damage_per_hit, is_player_damage=is_player_dmg
                     )
                     
-                    self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-                        "attacker": ent,
-                        "target": target_ent,
-                        "amount": ability.damage_per_hit,
-                        "damage_type": "physical"
-                    }))
+                    self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+                        attacker=ent,
+                        target=target_ent,
+                        amount=ability.damage_per_hit,
+                        damage_type="physical"
+                    )))
             
             # Ability finished?
             if ability.hits_remaining <= 0 or ability.total_duration <= 0:
@@ -312,9 +319,9 @@ class MagicProcessor(esper.Processor):
                         if esper.has_component(leap.target_id, Position):
                             tpos = esper.component_for_entity(leap.target_id, Position)
                             is_player_dmg = esper.has_component(leap.target_id, PartyMember)
-                            esper.create_entity(
-                                Position(x=tpos.x, y=tpos.y - 0.5),
-                                DamageNumber(value=leap.damage, is_player_damage=is_player_dmg)
+                            create_damage_number(
+                                tpos.x, tpos.y - 0.5,
+                                value=leap.damage, is_player_damage=is_player_dmg
                             )
                         
                         # Stun
@@ -330,12 +337,12 @@ class MagicProcessor(esper.Processor):
                             else:
                                 esper.add_component(leap.target_id, StatusEffects(effects=[stun_effect]))
                         
-                        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-                            "attacker": ent,
-                            "target": leap.target_id,
-                            "amount": leap.damage,
-                            "damage_type": "physical"
-                        }))
+                        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+                            attacker=ent,
+                            target=leap.target_id,
+                            amount=leap.damage,
+                            damage_type="physical"
+                        )))
                 
                 # AoE damage + stun on impact
                 if leap.aoe_radius > 0 and leap.aoe_damage > 0:
@@ -357,7 +364,7 @@ class MagicProcessor(esper.Processor):
         nearest = -1
         nearest_dist = max_range + 1
         
-        for ent, (pos, health) in esper.get_components(Position, Health):
+        for ent, (pos, health) in query(Position, Health):
             if ent == caster:
                 continue
             
@@ -391,7 +398,7 @@ class MagicProcessor(esper.Processor):
         lowest_health_ent = caster
         lowest_health_pct = 1.0
         
-        for ent, (pos, health) in esper.get_components(Position, Health):
+        for ent, (pos, health) in query(Position, Health):
             # Skip dead/downed
             if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
                 continue
@@ -657,10 +664,7 @@ class MagicProcessor(esper.Processor):
         else:
             effect_type = f"cast_{damage_type}"
         
-        esper.create_entity(
-            Position(x=caster_pos.x, y=caster_pos.y - 0.3),
-            VisualEffect(effect_type=effect_type, timer=0.4)
-        )
+        create_visual_effect(caster_pos.x, caster_pos.y - 0.3, effect_type=effect_type, timer=0.4)
         
         self.event_bus.emit(Event(EventType.SPELL_CAST, {
             "caster": caster,
@@ -697,21 +701,17 @@ class MagicProcessor(esper.Processor):
         dy = ty - caster_pos.y
         dist = max(0.1, distance(caster_pos.x, caster_pos.y, tx, ty))
         
-        esper.create_entity(
-            Position(x=caster_pos.x, y=caster_pos.y),
-            Velocity(dx=(dx / dist) * speed, dy=(dy / dist) * speed),
-            Projectile(
-                spell_id=spell_id,
-                caster_id=caster,
-                target_id=intent.target_id,
-                target_x=tx,
-                target_y=ty,
-                speed=speed,
-                damage=scaled_damage,
-                damage_type=damage_type
-            ),
-            CollisionRadius(radius=0.3),
-            VisualEffect(effect_type=f"projectile_{damage_type}")
+        create_projectile(
+            caster_pos.x, caster_pos.y,
+            (dx / dist) * speed, (dy / dist) * speed,
+            spell_id=spell_id,
+            caster_id=caster,
+            target_id=intent.target_id,
+            target_x=tx,
+            target_y=ty,
+            speed=speed,
+            damage=scaled_damage,
+            damage_type=damage_type
         )
         
         self.event_bus.emit(Event(EventType.PROJECTILE_CREATED, {
@@ -748,10 +748,7 @@ class MagicProcessor(esper.Processor):
             # Create heal number
             if esper.has_component(target_id, Position):
                 pos = esper.component_for_entity(target_id, Position)
-                esper.create_entity(
-                    Position(x=pos.x, y=pos.y - 0.5),
-                    DamageNumber(value=scaled_heal, is_heal=True)
-                )
+                create_damage_number(pos.x, pos.y - 0.5, value=scaled_heal, is_heal=True)
             
             self.event_bus.emit(Event(EventType.HEALTH_RESTORED, {
                 "healer": caster,
@@ -794,10 +791,7 @@ class MagicProcessor(esper.Processor):
                 # Create heal number
                 if esper.has_component(ent, Position):
                     pos = esper.component_for_entity(ent, Position)
-                    esper.create_entity(
-                        Position(x=pos.x, y=pos.y - 0.5),
-                        DamageNumber(value=actual_heal, is_heal=True)
-                    )
+                    create_damage_number(pos.x, pos.y - 0.5, value=actual_heal, is_heal=True)
                 
                 self.event_bus.emit(Event(EventType.HEALTH_RESTORED, {
                     "healer": caster,
@@ -843,15 +837,13 @@ class MagicProcessor(esper.Processor):
             vis_duration = duration
         
         # Create visual effect entity (always runs)
-        esper.create_entity(
-            Position(x=tx, y=ty),
-            VisualEffect(
-                effect_type=vis_type, 
-                timer=vis_duration,
-                duration=vis_duration,
-                radius=radius,
-                color=vis_color
-            )
+        create_visual_effect(
+            tx, ty,
+            effect_type=vis_type,
+            timer=vis_duration,
+            duration=vis_duration,
+            radius=radius,
+            color=vis_color
         )
         
         # Create persistent effect if has duration
@@ -859,18 +851,15 @@ class MagicProcessor(esper.Processor):
             tick_damage = spell_data.get("tick_damage", damage // 2)
             tick_interval = spell_data.get("tick_interval", 0.5)
             
-            esper.create_entity(
-                Position(x=tx, y=ty),
-                AreaEffect(
-                    spell_id=spell_id,
-                    caster_id=caster,
-                    radius=radius,
-                    duration=duration,
-                    tick_interval=tick_interval,
-                    next_tick=tick_interval,
-                    damage_per_tick=tick_damage,
-                    damage_type=damage_type
-                )
+            create_area_effect(
+                tx, ty,
+                spell_id=spell_id,
+                caster_id=caster,
+                radius=radius,
+                duration=duration,
+                tick_interval=tick_interval,
+                damage_per_tick=tick_damage,
+                damage_type=damage_type
             )
     
     def _apply_aoe_damage(self, caster: int, cx: float, cy: float, radius: float,
@@ -878,7 +867,7 @@ class MagicProcessor(esper.Processor):
         """Apply damage to all valid targets in area."""
         is_caster_party = esper.has_component(caster, PartyMember)
         
-        for ent, (pos, health) in esper.get_components(Position, Health):
+        for ent, (pos, health) in query(Position, Health):
             if ent == caster:
                 continue
             
@@ -905,8 +894,6 @@ class MagicProcessor(esper.Processor):
     def _apply_chain_effect(self, caster: int, spell_data: dict, intent):
         """Apply chain lightning effect with visual bolts."""
         import random
-        from ..components.rendering import LightningBolt
-        
         targets = spell_data.get("chain_count", spell_data.get("targets", 3))
         damage = spell_data.get("damage", 25)
         chain_range = spell_data.get("chain_range", 5.0)
@@ -938,13 +925,11 @@ class MagicProcessor(esper.Processor):
                 prev_x, prev_y, target_pos.x, target_pos.y, 
                 num_segments=8, jitter=0.3
             )
-            esper.create_entity(
-                LightningBolt(
-                    start_x=prev_x, start_y=prev_y,
-                    end_x=target_pos.x, end_y=target_pos.y,
-                    timer=0.4,
-                    segments=bolt_segments
-                )
+            create_lightning_bolt(
+                start_x=prev_x, start_y=prev_y,
+                end_x=target_pos.x, end_y=target_pos.y,
+                timer=0.4,
+                segments=bolt_segments
             )
             
             # Apply damage
@@ -960,7 +945,7 @@ class MagicProcessor(esper.Processor):
             next_target = -1
             next_dist = float('inf')
             
-            for ent, (pos, health) in esper.get_components(Position, Health):
+            for ent, (pos, health) in query(Position, Health):
                 if ent in hit_entities:
                     continue
                 
@@ -1079,7 +1064,7 @@ class MagicProcessor(esper.Processor):
                 
                 # Remove the delayed effect entity
                 esper.delete_entity(ent)
-
+    
     def _apply_melee_ability(self, caster: int, spell_data: dict, intent, skip_animation: bool = False):
         """Apply a melee ability with damage multiplier."""
         # Check for delay (e.g. heavy strike animation windup)
@@ -1103,7 +1088,7 @@ class MagicProcessor(esper.Processor):
                 anim.frame = 0
             
             return
-
+        
         target_id = intent.target_id
         if target_id < 0 or not esper.entity_exists(target_id):
             return
@@ -1242,9 +1227,9 @@ class MagicProcessor(esper.Processor):
         if esper.has_component(target_id, Position):
             pos = esper.component_for_entity(target_id, Position)
             is_player_dmg = esper.has_component(target_id, PartyMember)
-            esper.create_entity(
-                Position(x=pos.x, y=pos.y - 0.5),
-                DamageNumber(value=final_damage, is_player_damage=is_player_dmg)
+            create_damage_number(
+                pos.x, pos.y - 0.5,
+                value=final_damage, is_player_damage=is_player_dmg
             )
         
         # Apply stun/stagger effect if specified
@@ -1285,9 +1270,9 @@ class MagicProcessor(esper.Processor):
                 health = esper.component_for_entity(target_id, Health)
                 health.current = max(0, health.current - wall_slam_dmg)
                 # Extra damage number for wall slam
-                esper.create_entity(
-                    Position(x=target_pos.x, y=target_pos.y - 0.8),
-                    DamageNumber(value=wall_slam_dmg, is_player_damage=False)
+                create_damage_number(
+                    target_pos.x, target_pos.y - 0.8,
+                    value=wall_slam_dmg, is_player_damage=False
                 )
         
         # Apply AoE on impact at ORIGINAL position (before primary target was knocked back)
@@ -1310,12 +1295,12 @@ class MagicProcessor(esper.Processor):
             anim.state = self._get_animation_state(spell_data, AnimationState.ATTACK)
             anim.frame = 0
         
-        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-            "attacker": caster,
-            "target": target_id,
-            "amount": final_damage,
-            "damage_type": "physical"
-        }))
+        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+            attacker=caster,
+            target=target_id,
+            amount=final_damage,
+            damage_type="physical"
+        )))
     
     def _apply_melee_aoe(self, caster: int, spell_data: dict, intent, caster_pos):
         """Apply a melee AoE attack (like whirlwind)."""
@@ -1378,7 +1363,7 @@ class MagicProcessor(esper.Processor):
         is_caster_party = esper.has_component(caster, PartyMember)
         
         # Hit all enemies in radius
-        for ent, (pos, health) in esper.get_components(Position, Health):
+        for ent, (pos, health) in query(Position, Health):
             if ent == caster:
                 continue
             
@@ -1404,17 +1389,17 @@ class MagicProcessor(esper.Processor):
             
             # Create damage number (red if hitting party member)
             is_player_dmg = esper.has_component(ent, PartyMember)
-            esper.create_entity(
-                Position(x=pos.x, y=pos.y - 0.5),
-                DamageNumber(value=final_damage, is_player_damage=is_player_dmg)
+            create_damage_number(
+                pos.x, pos.y - 0.5,
+                value=final_damage, is_player_damage=is_player_dmg
             )
             
-            self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-                "attacker": caster,
-                "target": ent,
-                "amount": final_damage,
-                "damage_type": "physical"
-            }))
+            self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+                attacker=caster,
+                target=ent,
+                amount=final_damage,
+                damage_type="physical"
+            )))
         
         # Animation - use spell-specific animation
         if esper.has_component(caster, Animation):
@@ -1431,7 +1416,7 @@ class MagicProcessor(esper.Processor):
         
         is_caster_party = esper.has_component(caster, PartyMember)
         
-        for ent, (pos, health) in esper.get_components(Position, Health):
+        for ent, (pos, health) in query(Position, Health):
             if ent == caster or ent in exclude:
                 continue
             
@@ -1476,35 +1461,35 @@ class MagicProcessor(esper.Processor):
             
             # Create damage number (red if hitting party member)
             is_player_dmg = esper.has_component(ent, PartyMember)
-            esper.create_entity(
-                Position(x=pos.x, y=pos.y - 0.5),
-                DamageNumber(value=total_damage, is_player_damage=is_player_dmg)
+            create_damage_number(
+                pos.x, pos.y - 0.5,
+                value=total_damage, is_player_damage=is_player_dmg
             )
             
-            self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-                "attacker": caster,
-                "target": ent,
-                "amount": total_damage,
-                "damage_type": "physical"
-            }))
+            self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+                attacker=caster,
+                target=ent,
+                amount=total_damage,
+                damage_type="physical"
+            )))
     
     def _is_position_safe(self, x: float, y: float) -> bool:
         """Check if a position AND its corners are walkable."""
         if not self.dungeon:
             return True
-            
+        
         # Check center
         if not self.dungeon.is_walkable(int(x), int(y)):
             return False
-            
+        
         # Check corners (radius 0.3)
         r = 0.3
         for dx, dy in [(-r, -r), (r, -r), (-r, r), (r, r)]:
             if not self.dungeon.is_walkable(int(x + dx), int(y + dy)):
                 return False
-                
+        
         return True
-
+    
     def _apply_knockback(self, target_id: int, target_pos, origin_x: float, origin_y: float, 
                          knockback_dist: float) -> bool:
         """Apply knockback to a target, pushing them away from origin.
@@ -1557,7 +1542,7 @@ class MagicProcessor(esper.Processor):
                         final_x = slide_x
                         final_y = slide_y
                         continue
-
+                    
                     # Check Y movement only
                     slide_x = final_x # Keep old X
                     slide_y = test_y
@@ -1566,7 +1551,7 @@ class MagicProcessor(esper.Processor):
                         final_x = slide_x
                         final_y = slide_y
                         continue
-                        
+                    
                     break
                 
                 # Update position
@@ -1621,7 +1606,7 @@ class MagicProcessor(esper.Processor):
         is_caster_party = esper.has_component(caster, PartyMember)
         
         # Hit all enemies in cone
-        for ent, (pos, health) in esper.get_components(Position, Health):
+        for ent, (pos, health) in query(Position, Health):
             if ent == caster:
                 continue
             
@@ -1657,24 +1642,24 @@ class MagicProcessor(esper.Processor):
             
             # Create damage number (red if hitting party member)
             is_player_dmg = esper.has_component(ent, PartyMember)
-            esper.create_entity(
-                Position(x=pos.x, y=pos.y - 0.5),
-                DamageNumber(value=final_damage, is_player_damage=is_player_dmg)
+            create_damage_number(
+                pos.x, pos.y - 0.5,
+                value=final_damage, is_player_damage=is_player_dmg
             )
             
-            self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-                "attacker": caster,
-                "target": ent,
-                "amount": final_damage,
-                "damage_type": "physical"
-            }))
+            self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+                attacker=caster,
+                target=ent,
+                amount=final_damage,
+                damage_type="physical"
+            )))
         
         # Animation - use spell-specific animation
         if esper.has_component(caster, Animation):
             anim = esper.component_for_entity(caster, Animation)
             anim.state = self._get_animation_state(spell_data, AnimationState.ATTACK)
             anim.frame = 0
-
+    
     def _apply_projectile_damage(self, caster: int, target: int, damage: int, damage_type: str):
         """Apply projectile damage to a target (damage already scaled at creation)."""
         # Skip if caster and target are same faction (no friendly fire)
@@ -1707,17 +1692,17 @@ class MagicProcessor(esper.Processor):
         if esper.has_component(target, Position):
             pos = esper.component_for_entity(target, Position)
             is_player_dmg = esper.has_component(target, PartyMember)
-            esper.create_entity(
-                Position(x=pos.x, y=pos.y - 0.5),
-                DamageNumber(value=final_damage, is_player_damage=is_player_dmg)
+            create_damage_number(
+                pos.x, pos.y - 0.5,
+                value=final_damage, is_player_damage=is_player_dmg
             )
         
-        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-            "attacker": caster,
-            "target": target,
-            "amount": final_damage,
-            "damage_type": damage_type
-        }))
+        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+            attacker=caster,
+            target=target,
+            amount=final_damage,
+            damage_type=damage_type
+        )))
     
     def _apply_spell_damage(self, caster: int, target: int, spell_data: dict):
         """Apply spell damage to a target (for non-projectile spells that need scaling)."""
@@ -1778,17 +1763,17 @@ class MagicProcessor(esper.Processor):
         if esper.has_component(target, Position):
             pos = esper.component_for_entity(target, Position)
             is_player_dmg = esper.has_component(target, PartyMember)
-            esper.create_entity(
-                Position(x=pos.x, y=pos.y - 0.5),
-                DamageNumber(value=final_damage, is_player_damage=is_player_dmg)
+            create_damage_number(
+                pos.x, pos.y - 0.5,
+                value=final_damage, is_player_damage=is_player_dmg
             )
         
-        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, {
-            "attacker": caster,
-            "target": target,
-            "amount": final_damage,
-            "damage_type": damage_type
-        }))
+        self.event_bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(
+            attacker=caster,
+            target=target,
+            amount=final_damage,
+            damage_type=damage_type
+        )))
         
         # Apply status effect if present
         effect_data = spell_data.get("effect", {})
@@ -1851,15 +1836,15 @@ class MagicProcessor(esper.Processor):
                     self._apply_projectile_damage(proj.caster_id, proj.target_id, proj.damage, proj.damage_type)
                     
                     # Create hit effect
-                    esper.create_entity(
-                        Position(x=pos.x, y=pos.y),
-                        VisualEffect(effect_type=f"hit_{proj.damage_type}", timer=0.3)
+                    create_visual_effect(
+                        pos.x, pos.y,
+                        effect_type=f"hit_{proj.damage_type}", timer=0.3
                     )
                     
-                    self.event_bus.emit(Event(EventType.PROJECTILE_HIT, {
-                        "projectile": ent,
-                        "target": proj.target_id
-                    }))
+                    self.event_bus.emit(Event(EventType.PROJECTILE_HIT, ProjectileHit(
+                        projectile=ent,
+                        target=proj.target_id
+                    )))
                     
                     esper.add_component(ent, ToRemove())
                     continue
@@ -1870,9 +1855,9 @@ class MagicProcessor(esper.Processor):
                     # Use pre-calculated damage from projectile (already scaled at creation)
                     self._apply_projectile_damage(proj.caster_id, hit_entity, proj.damage, proj.damage_type)
                     
-                    esper.create_entity(
-                        Position(x=pos.x, y=pos.y),
-                        VisualEffect(effect_type=f"hit_{proj.damage_type}", timer=0.3)
+                    create_visual_effect(
+                        pos.x, pos.y,
+                        effect_type=f"hit_{proj.damage_type}", timer=0.3
                     )
                     
                     esper.add_component(ent, ToRemove())
@@ -1881,15 +1866,15 @@ class MagicProcessor(esper.Processor):
                 # Check if reached destination
                 dist = distance(pos.x, pos.y, proj.target_x, proj.target_y)
                 if dist < 0.5:
-                    esper.create_entity(
-                        Position(x=pos.x, y=pos.y),
-                        VisualEffect(effect_type=f"impact_{proj.damage_type}", timer=0.4)
+                    create_visual_effect(
+                        pos.x, pos.y,
+                        effect_type=f"impact_{proj.damage_type}", timer=0.4
                     )
                     esper.add_component(ent, ToRemove())
                     continue
             
             # Timeout - destroy projectile if it's been flying too long
-            proj.lifetime = getattr(proj, 'lifetime', 5.0) - dt
+            proj.lifetime -= dt
             if proj.lifetime <= 0:
                 esper.add_component(ent, ToRemove())
     
@@ -1899,13 +1884,13 @@ class MagicProcessor(esper.Processor):
         
         # If caster is player, we can hit enemies
         if caster_is_player:
-            for enemy_ent, (enemy_pos, _) in esper.get_components(Position, Enemy):
+            for enemy_ent, (enemy_pos, _) in query(Position, Enemy):
                 dist = distance(proj_pos.x, proj_pos.y, enemy_pos.x, enemy_pos.y)
                 if dist < hit_radius:
                     return enemy_ent
         else:
             # Enemy projectile can hit players
-            for player_ent, (player_pos, _) in esper.get_components(Position, PartyMember):
+            for player_ent, (player_pos, _) in query(Position, PartyMember):
                 dist = distance(proj_pos.x, proj_pos.y, player_pos.x, player_pos.y)
                 if dist < hit_radius:
                     return player_ent
@@ -12,11 +12,14 @@ from typing import Optional, List, Tuple
 
 from ..components import (
     Position, Velocity, Speed, MoveIntent, TargetPosition, Path,
-    CollisionRadius, Facing, Direction, StatusEffects, Dead, Downed,
-    PlayerControlled, Selected, PartyMember, Enemy, Projectile, Knockback
+    CollisionRadius, Facing, Direction, StatusEffects,
+    PlayerControlled, Selected, PartyMember, Enemy, Knockback
 )
+from ..queries import query
+from ..tag_index import tag_index, INACTIVE, KNOCKBACK, PROJECTILE
 from ...core.events import EventBus, Event, EventType
 from ...core.formulas import distance
+from ...world.map_context import MapContext
 
 
 class MovementProcessor(esper.Processor):
@@ -28,13 +31,14 @@ class MovementProcessor(esper.Processor):
     - No entity-to-entity pushing (causes problems)
     """
     
-    def __init__(self, event_bus: EventBus, dungeon=None):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
-        self.dungeon = dungeon
+        self.map_context = map_context or MapContext()
     
-    def set_dungeon(self, dungeon):
-        """Set the dungeon reference for collision detection."""
-        self.dungeon = dungeon
+    @property
+    def dungeon(self):
+        """Active map for collision detection."""
+        return self.map_context.active
     
     def process(self, dt: float):
         """Process movement for all entities."""
@@ -86,11 +90,12 @@ class MovementProcessor(esper.Processor):
     
     def _process_move_intents(self, dt: float):
         """Convert MoveIntent to Velocity."""
+        tags = tag_index.flags
         for ent, (pos, intent, speed) in esper.get_components(
             Position, MoveIntent, Speed
         ):
             # Dead/downed don't move
-            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+            if tags.get(ent, 0) & INACTIVE:
                 continue
             
             # Get slow multiplier from status effects
@@ -121,10 +126,11 @@ class MovementProcessor(esper.Processor):
     
     def _process_path_following(self, dt: float):
         """Follow path waypoints."""
+        tags = tag_index.flags
         for ent, (pos, path, speed) in esper.get_components(
             Position, Path, Speed
         ):
-            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+            if tags.get(ent, 0) & INACTIVE:
                 continue
             
             if not path.has_path:
@@ -163,10 +169,11 @@ class MovementProcessor(esper.Processor):
     
     def _process_target_positions(self, dt: float):
         """Move toward target position (click-to-move)."""
+        tags = tag_index.flags
         for ent, (pos, target, speed) in esper.get_components(
             Position, TargetPosition, Speed
         ):
-            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+            if tags.get(ent, 0) & INACTIVE:
                 esper.remove_component(ent, TargetPosition)
                 continue
             
@@ -203,15 +210,12 @@ class MovementProcessor(esper.Processor):
     
     def _apply_velocities(self, dt: float):
         """Apply velocities to positions with tile collision."""
-        for ent, (pos, vel) in esper.get_components(Position, Velocity):
-            # Knockback overrides normal movement
-            if esper.has_component(ent, Knockback):
-                vel.dx = 0
-                vel.dy = 0
-                continue
-
-            # Dead entities don't move
-            if esper.has_component(ent, Dead) or esper.has_component(ent, Downed):
+        tags = tag_index.flags
+        for ent, (pos, vel) in query(Position, Velocity):
+            flags = tags.get(ent, 0)
+            
+            # Knockback overrides normal movement; dead entities don't move
+            if flags & (KNOCKBACK | INACTIVE):
                 vel.dx = 0
                 vel.dy = 0
                 continue
@@ -220,7 +224,7 @@ class MovementProcessor(esper.Processor):
                 continue
             
             # Projectiles fly freely - no ground collision (handled by MagicProcessor)
-            if esper.has_component(ent, Projectile):
+            if flags & PROJECTILE:
                 pos.x += vel.dx * dt
                 pos.y += vel.dy * dt
                 continue
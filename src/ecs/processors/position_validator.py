@@ -9,11 +9,12 @@ prevents soft-locks and off-map glitches.
 """
 
 import esper
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..components import Position, PartyMember, Enemy, Dead, ToRemove, Projectile, AreaEffect
 from ..components.rendering import VisualEffect
 from ...core.events import EventBus, Event, EventType
+from ...world.map_context import MapContext
 
 
 class PositionValidator(esper.Processor):
@@ -22,15 +23,16 @@ class PositionValidator(esper.Processor):
     Run this LAST in the processor chain to catch any position bugs.
     """
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
-        self.dungeon = None
+        self.map_context = map_context or MapContext()
         self._last_valid_positions = {}  # ent -> (x, y)
+        self._validated_map = None  # Map the remembered positions belong to
     
-    def set_dungeon(self, dungeon):
-        """Set dungeon reference for validation."""
-        self.dungeon = dungeon
-        self._last_valid_positions.clear()
+    @property
+    def dungeon(self):
+        """Active map for validation."""
+        return self.map_context.active
     
     def process(self, dt: float):
         """Validate all positions and fix any that are invalid."""
@@ -41,6 +43,11 @@ class PositionValidator(esper.Processor):
             perf.measure("PositionValidator")
             return
         
+        # Remembered positions are only valid on the map they came from
+        if self.dungeon is not self._validated_map:
+            self._validated_map = self.dungeon
+            self._last_valid_positions.clear()
+        
         for ent, (pos,) in esper.get_components(Position):
             # Skip dead entities - they might be in walls for death animation
             if esper.has_component(ent, Dead):
@@ -7,6 +7,7 @@ from ..components import (
     Health, Mana, PartyMember
 )
 from ...core.events import EventBus, Event, EventType
+from ...core.constants import PROGRESSION_TICK_INTERVAL
 from ...core.formulas import (
     xp_for_skill_level, calculate_character_level, SKILL_STAT_BONUSES
 )
@@ -15,13 +16,20 @@ from ...core.formulas import (
 class ProgressionProcessor(esper.Processor):
     """Processes XP gain and skill level-ups."""
     
+    tick_interval = PROGRESSION_TICK_INTERVAL
+    
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
     
     def process(self, dt: float):
         """Check for level-ups each frame."""
+        from ...core.perf_monitor import perf
+        perf.mark("ProgressionProcessor")
+        
         for ent, (skills, xp) in esper.get_components(SkillLevels, SkillXP):
             self._check_skill_levelups(ent, skills, xp)
+        
+        perf.measure("ProgressionProcessor")
     
     def _check_skill_levelups(self, ent: int, skills: SkillLevels, xp: SkillXP):
         """Check and process skill level-ups."""
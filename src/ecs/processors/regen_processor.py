@@ -4,6 +4,7 @@ import esper
 
 from ..components import Health, Mana, Regeneration, Downed, Dead, PartyMember
 from ...core.events import EventBus, Event, EventType
+from ...core.constants import REGEN_TICK_INTERVAL
 
 
 class RegenProcessor(esper.Processor):
@@ -14,12 +15,17 @@ class RegenProcessor(esper.Processor):
     - Downed/dead entities don't regenerate
     """
     
+    tick_interval = REGEN_TICK_INTERVAL  # Regen is rate * dt, so bigger ticks heal the same
+    
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.combat_cooldown: float = 0.0  # Time since last combat action
     
     def process(self, dt: float):
         """Process regeneration each frame."""
+        from ...core.perf_monitor import perf
+        perf.mark("RegenProcessor")
+        
         # Check if any party member is in combat
         in_combat = self._check_combat_status()
         
@@ -49,6 +55,8 @@ class RegenProcessor(esper.Processor):
                         health.maximum,
                         health.current + regen.health_per_second * dt
                     )
+        
+        perf.measure("RegenProcessor")
     
     def _check_combat_status(self) -> bool:
         """Check if party is in combat (enemies nearby with aggro)."""
@@ -21,6 +21,10 @@ SAVE_FILE = "game.json"
 class SaveLoadProcessor(esper.Processor):
     """Handles saving and loading game state."""
     
+    # Event-driven - only runs on the step after a save/load request
+    tick_interval = None
+    wake_events = (EventType.GAME_SAVE_REQUESTED, EventType.GAME_LOAD_REQUESTED)
+    
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.pending_save = False
@@ -47,6 +51,9 @@ class SaveLoadProcessor(esper.Processor):
     
     def process(self, dt: float):
         """Process pending save/load."""
+        from ...core.perf_monitor import perf
+        perf.mark("SaveLoadProcessor")
+        
         if self.pending_save:
             self._do_save()
             self.pending_save = False
@@ -54,6 +61,8 @@ class SaveLoadProcessor(esper.Processor):
         if self.pending_load:
             self._do_load()
             self.pending_load = False
+        
+        perf.measure("SaveLoadProcessor")
     
     def _do_save(self):
         """Perform save operation."""
@@ -0,0 +1,87 @@
+"""Processor scheduler - runs each processor at its declared tick rate.
+
+Processors that rarely have work don't need to run every fixed step.
+A processor declares how often it runs with two class attributes:
+
+    tick_interval = 6      # run every 6th step with the summed dt
+    tick_interval = None   # event-driven: only run when woken
+    wake_events = (EventType.GAME_SAVE_REQUESTED,)  # wake on these events
+
+Processors without declarations run every step and are added to esper
+unwrapped. Everything else is wrapped in a ThrottledProcessor, so esper
+still runs them in priority order.
+"""
+
+from typing import Dict, List
+
+import esper
+
+from ...core.events import EventBus
+from .throttled_processor import ThrottledProcessor
+
+
+class ProcessorScheduler:
+    """Adds processors to esper according to their declared tick rates."""
+    
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.scheduled: List[ThrottledProcessor] = []
+        self._wakes = []  # (event_type, callback) to unsubscribe on clear()
+    
+    def add(self, processor: esper.Processor, priority: int = 0,
+            throttle: bool = False) -> esper.Processor:
+        """Add a processor to esper at its declared tick rate.
+        
+        Args:
+            processor: Processor to schedule
+            priority: esper priority (higher runs first)
+            throttle: Wrap it even at one tick per step, so the simulation
+                      budget can slow it down while degraded
+        
+        Returns:
+            What esper runs - the processor itself or its ThrottledProcessor
+        """
+        tick_interval = getattr(processor, "tick_interval", 1)
+        wake_events = getattr(processor, "wake_events", ())
+        
+        if tick_interval == 1 and not wake_events and not throttle:
+            esper.add_processor(processor, priority=priority)
+            return processor
+        
+        scheduled = ThrottledProcessor(
+            processor,
+            tick_interval=tick_interval or 1,
+            event_driven=tick_interval is None
+        )
+        for event_type in wake_events:
+            self.event_bus.subscribe(event_type, scheduled.wake)
+            self._wakes.append((event_type, scheduled.wake))
+        esper.add_processor(scheduled, priority=priority)
+        self.scheduled.append(scheduled)
+        return scheduled
+    
+    def clear(self):
+        """Forget all scheduled processors and their wake subscriptions.
+        
+        Does not remove them from esper - the caller clears esper's
+        processors before rebuilding them.
+        """
+        for event_type, callback in self._wakes:
+            self.event_bus.unsubscribe(event_type, callback)
+        self._wakes.clear()
+        self.scheduled.clear()
+    
+    def skipped_runs(self) -> int:
+        """Processor runs skipped so far across all scheduled processors."""
+        return sum(scheduled.skips for scheduled in self.scheduled)
+    
+    def stats(self) -> Dict[str, dict]:
+        """Runs and skips per scheduled processor, keyed by class name."""
+        return {
+            scheduled.name: {
+                "tick_interval": None if scheduled.event_driven else scheduled.tick_interval,
+                "runs": scheduled.runs,
+                "skips": scheduled.skips,
+            }
+            for scheduled in self.scheduled
+        }
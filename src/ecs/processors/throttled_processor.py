@@ -0,0 +1,64 @@
+"""Throttled processor - runs a wrapped processor every Nth step.
+
+Used for processors that declare a slower tick rate, processors that
+only run when an event wakes them, and low-priority work (regen,
+progression, loot pickup) when the simulation is over budget. The
+skipped steps' time is not lost: the wrapped processor gets the
+accumulated dt when it does run.
+"""
+
+import esper
+
+from ...core.perf_monitor import perf
+
+
+class ThrottledProcessor(esper.Processor):
+    """Wraps a processor and runs it every `interval` steps.
+    
+    The wrapped processor runs every max(interval, tick_interval) steps.
+    `tick_interval` is the processor's own declared rate; `interval` is
+    raised by the simulation budget while degraded. An event-driven
+    processor ignores both and only runs on the step after wake().
+    """
+    
+    def __init__(
+        self,
+        processor: esper.Processor,
+        interval: int = 1,
+        tick_interval: int = 1,
+        event_driven: bool = False
+    ):
+        self.processor = processor
+        self.interval = interval
+        self.tick_interval = tick_interval
+        self.event_driven = event_driven
+        self.name = type(processor).__name__
+        self._skip_label = f"Skipped:{self.name}"
+        self._steps = 0
+        self._pending_dt = 0.0
+        self._woken = False
+        
+        # Metrics
+        self.runs = 0
+        self.skips = 0
+    
+    def wake(self, event=None):
+        """Run the wrapped processor on the next step (event callback)."""
+        self._woken = True
+    
+    def process(self, dt: float):
+        """Accumulate dt and run the wrapped processor when due."""
+        self._pending_dt += dt
+        self._steps += 1
+        if not self._woken:
+            if self.event_driven or self._steps < max(self.interval, self.tick_interval):
+                self.skips += 1
+                perf.count(self._skip_label)
+                return
+        
+        pending_dt = self._pending_dt
+        self._steps = 0
+        self._pending_dt = 0.0
+        self._woken = False
+        self.runs += 1
+        self.processor.process(pending_dt)
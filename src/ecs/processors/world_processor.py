@@ -2,10 +2,13 @@
 
 import esper
 import random
+from typing import Optional
 
 from ..components import Position, PartyMember, PlayerControlled, Selected, Dead
+from ..queries import query
 from ...core.events import EventBus, Event, EventType
 from ...core.constants import TileType
+from ...world.map_context import MapContext
 
 
 class WorldProcessor(esper.Processor):
@@ -14,9 +17,9 @@ class WorldProcessor(esper.Processor):
     Also handles room-based enemy spawning.
     """
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, map_context: Optional[MapContext] = None):
         self.event_bus = event_bus
-        self.dungeon = None
+        self.map_context = map_context or MapContext()
         self.dungeon_level = 1
         self.use_stairs_requested = False  # Set by input when E is pressed
         
@@ -26,9 +29,12 @@ class WorldProcessor(esper.Processor):
         # Room activation check throttle
         self.room_check_timer = 0.0
     
-    def set_dungeon(self, dungeon):
-        """Set the dungeon reference."""
-        self.dungeon = dungeon
+    @property
+    def dungeon(self):
+        """Current dungeon, or None in town (no stairs or enemy spawning there)."""
+        if self.map_context.in_town:
+            return None
+        return self.map_context.dungeon
     
     def set_dungeon_level(self, level: int):
         """Set current dungeon level for enemy scaling."""
@@ -40,23 +46,28 @@ class WorldProcessor(esper.Processor):
     
     def process(self, dt: float):
         """Check for stairs and room activations."""
-        if not self.dungeon:
-            return
-        
-        # Update cooldown
-        if self.stairs_cooldown > 0:
-            self.stairs_cooldown -= dt
-        
-        # Check room activation every 0.2 seconds
-        self.room_check_timer += dt
-        if self.room_check_timer >= 0.2:
-            self.room_check_timer = 0.0
-            self._check_room_activation()
+        from ...core.perf_monitor import perf
+        perf.mark("WorldProcessor")
         
-        # Only check stairs if player pressed E
-        if not self.use_stairs_requested:
-            return
+        if self.dungeon:
+            # Update cooldown
+            if self.stairs_cooldown > 0:
+                self.stairs_cooldown -= dt
+            
+            # Check room activation every 0.2 seconds
+            self.room_check_timer += dt
+            if self.room_check_timer >= 0.2:
+                self.room_check_timer = 0.0
+                self._check_room_activation()
+            
+            # Only check stairs if player pressed E
+            if self.use_stairs_requested:
+                self._check_stairs()
         
+        perf.measure("WorldProcessor")
+    
+    def _check_stairs(self):
+        """Use the stairs under the selected party member, if any."""
         self.use_stairs_requested = False
         
         # Don't allow if cooldown active
@@ -87,7 +98,7 @@ class WorldProcessor(esper.Processor):
     
     def _check_room_activation(self):
         """Check if any party member entered a new room and spawn enemies."""
-        for ent, (pos, _) in esper.get_components(Position, PartyMember):
+        for ent, (pos, _) in query(Position, PartyMember):
             if esper.has_component(ent, Dead):
                 continue
             
@@ -167,6 +178,9 @@ class DroppedItemProcessor(esper.Processor):
     
     def process(self, dt: float):
         """Update dropped items."""
+        from ...core.perf_monitor import perf
+        perf.mark("DroppedItemProcessor")
+        
         from ..components import DroppedItem, Inventory as InventoryComp
         from ...core.formulas import distance
         
@@ -187,7 +201,7 @@ class DroppedItemProcessor(esper.Processor):
             
             # Check for auto-pickup (gold only)
             if hasattr(dropped, 'is_gold') and dropped.is_gold:
-                for player_ent, (player_pos, _) in esper.get_components(Position, PartyMember):
+                for player_ent, (player_pos, _) in query(Position, PartyMember):
                     dist = distance(pos.x, pos.y, player_pos.x, player_pos.y)
                     if dist < 1.5:  # Auto-pickup range
                         # Pickup gold
@@ -208,4 +222,6 @@ class DroppedItemProcessor(esper.Processor):
         for ent in items_to_remove:
             if esper.entity_exists(ent):
                 esper.delete_entity(ent)
+        
+        perf.measure("DroppedItemProcessor")
 
@@ -0,0 +1,293 @@
+"""Cached component queries - incrementally maintained entity sets.
+
+esper caches get_components() results, but any component added or removed
+anywhere clears the whole cache. Intents, paths and damage numbers churn
+every step, so in practice every hot query rebuilds its entity
+intersection each time it's called.
+
+query(*types) keeps one QueryView per component signature instead. Each
+view is updated as components of *its* types are added or removed, so
+iterating (Position, PartyMember) costs nothing extra while TargetPosition
+comes and goes. Results have the same shape as esper.get_components():
+
+    for ent, (pos, member) in query(Position, PartyMember):
+        ...
+
+Views are kept up to date by hooking esper's module-level add/remove/
+delete functions. Importing this module changes nothing: the game calls
+install() during setup (tests and benchmarks do it in a fixture), and
+until then query() falls back to esper.get_components(). The hooks
+replace the attributes on the esper module, so only calls made through
+it (esper.add_component(...)) are seen - a name bound earlier with
+`from esper import add_component` bypasses them and leaves views stale.
+Every write path in the game goes through the module.
+
+Other caches keyed by entity (e.g. the tag index) can watch() a view to
+hear about entities joining and leaving it; they are only kept in sync
+while the hooks are installed, and check installed() to fall back to
+esper otherwise. Watchers survive
+uninstall(): install() rebuilds every view and replays the difference.
+"""
+
+import esper
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class QueryView:
+    """Entities that have every component type in a signature."""
+    
+    __slots__ = ("types", "_members", "_result", "_watchers")
+    
+    def __init__(self, types: Tuple[type, ...]):
+        self.types = types
+        self._members: Dict[int, Tuple[Any, ...]] = {}  # ent -> components
+        self._result = None  # Materialized list, None when stale
+        self._watchers: List[Tuple[Callable, Callable]] = []
+        self.rebuild()
+    
+    def __len__(self) -> int:
+        return len(self._members)
+    
+    def rebuild(self):
+        """Recompute membership from the esper database."""
+        old = self._members
+        self._members = dict(esper._get_components(*self.types))
+        self._result = None
+        for on_add, on_remove in self._watchers:
+            for ent, components in old.items():
+                on_remove(ent, components)
+            for ent, components in self._members.items():
+                on_add(ent, components)
+    
+    def watch(self, on_add: Callable, on_remove: Callable):
+        """Call on_add/on_remove(ent, components) as membership changes.
+        
+        A replaced component counts as a remove followed by an add.
+        on_add is called right away for current members.
+        """
+        self._watchers.append((on_add, on_remove))
+        for ent, components in self._members.items():
+            on_add(ent, components)
+    
+    def unwatch(self, on_add: Callable, on_remove: Callable):
+        """Stop notifying a watcher (it gets no removes for current members)."""
+        self._watchers.remove((on_add, on_remove))
+    
+    def entities(self) -> List[Tuple[int, Tuple[Any, ...]]]:
+        """Current (entity, components) pairs.
+        
+        The list is rebuilt only after membership changes, and never
+        mutated once handed out, so adding or removing components while
+        iterating it is safe (same as esper.get_components).
+        """
+        if self._result is None:
+            self._result = list(self._members.items())
+        return self._result
+    
+    def _update(self, ent: int, entity_comps: dict):
+        """Entity gained (or replaced) a component of one of our types."""
+        types = self.types
+        for ct in types:
+            if ct not in entity_comps:
+                return
+        components = tuple(entity_comps[ct] for ct in types)
+        old = self._members.get(ent)
+        self._members[ent] = components
+        self._result = None
+        if self._watchers:
+            for on_add, on_remove in self._watchers:
+                if old is not None:
+                    on_remove(ent, old)
+                on_add(ent, components)
+    
+    def _discard(self, ent: int):
+        """Entity lost a component of one of our types."""
+        old = self._members.pop(ent, None)
+        if old is not None:
+            self._result = None
+            for _, on_remove in self._watchers:
+                on_remove(ent, old)
+
+
+# =============================================================================
+# VIEW REGISTRY
+# =============================================================================
+
+_views: Dict[Tuple[type, ...], QueryView] = {}
+_views_by_type: Dict[type, List[QueryView]] = {}
+generation = 0  # Bumped whenever views are added or dropped
+
+
+def register(*component_types: type) -> QueryView:
+    """Get the view for a signature, creating it on first use."""
+    global generation
+    view = _views.get(component_types)
+    if view is None:
+        view = _views[component_types] = QueryView(component_types)
+        for ct in set(component_types):
+            _views_by_type.setdefault(ct, []).append(view)
+        generation += 1
+    return view
+
+
+def views_touching(component_types) -> List[QueryView]:
+    """Views that include any of the given types, each listed once.
+    
+    Callers may cache the result until `generation` changes.
+    """
+    result = []
+    for ct in component_types:
+        for view in _views_by_type.get(ct, ()):
+            if view not in result:
+                result.append(view)
+    return result
+
+
+def query(*component_types: type) -> List[Tuple[int, Tuple[Any, ...]]]:
+    """Drop-in for esper.get_components() backed by a cached view."""
+    view = _views.get(component_types)
+    if view is None:
+        if not _originals:
+            # Hooks not installed - views would go stale
+            return esper.get_components(*component_types)
+        view = register(*component_types)
+    return view.entities()
+
+
+def clear_views():
+    """Forget unwatched views (they re-register on next query)."""
+    global generation
+    generation += 1
+    for types, view in list(_views.items()):
+        if view._watchers:
+            continue
+        del _views[types]
+        for ct in set(types):
+            _views_by_type[ct].remove(view)
+            if not _views_by_type[ct]:
+                del _views_by_type[ct]
+
+
+def _rebuild_all():
+    for view in _views.values():
+        view.rebuild()
+
+
+def _entity_removed(ent: int, component_types):
+    """Drop an entity from every view touching its component types."""
+    seen = set()
+    for ct in component_types:
+        for view in _views_by_type.get(ct, ()):
+            if id(view) not in seen:
+                seen.add(id(view))
+                view._discard(ent)
+
+
+# =============================================================================
+# ESPER HOOKS
+# =============================================================================
+
+_originals: Dict[str, Any] = {}
+
+
+def _create_entity(*components):
+    ent = _originals["create_entity"](*components)
+    if _views_by_type:
+        entity_comps = esper._entities[ent]
+        for ct in entity_comps:
+            for view in _views_by_type.get(ct, ()):
+                view._update(ent, entity_comps)
+    return ent
+
+
+def _add_component(entity, component_instance, type_alias=None):
+    _originals["add_component"](entity, component_instance, type_alias)
+    views = _views_by_type.get(type_alias or type(component_instance))
+    if views:
+        entity_comps = esper._entities[entity]
+        for view in views:
+            view._update(entity, entity_comps)
+
+
+def _remove_component(entity, component_type):
+    component = _originals["remove_component"](entity, component_type)
+    for view in _views_by_type.get(component_type, ()):
+        view._discard(entity)
+    return component
+
+
+def _try_remove_component(entity, component_type):
+    component = _originals["try_remove_component"](entity, component_type)
+    for view in _views_by_type.get(component_type, ()):
+        view._discard(entity)
+    return component
+
+
+def _delete_entity(entity, immediate=False):
+    if immediate:
+        component_types = list(esper._entities[entity])
+        _originals["delete_entity"](entity, immediate=True)
+        _entity_removed(entity, component_types)
+    else:
+        # Still visible to queries until the next clear_dead_entities()
+        _originals["delete_entity"](entity)
+
+
+def _clear_dead_entities():
+    if esper._dead_entities and _views_by_type:
+        dead = [(ent, list(esper._entities[ent])) for ent in esper._dead_entities]
+        _originals["clear_dead_entities"]()
+        for ent, component_types in dead:
+            _entity_removed(ent, component_types)
+    else:
+        _originals["clear_dead_entities"]()
+
+
+def _clear_database():
+    _originals["clear_database"]()
+    _rebuild_all()
+
+
+def _switch_world(name):
+    _originals["switch_world"](name)
+    _rebuild_all()
+
+
+_HOOKS = {
+    "create_entity": _create_entity,
+    "add_component": _add_component,
+    "remove_component": _remove_component,
+    "try_remove_component": _try_remove_component,
+    "delete_entity": _delete_entity,
+    "clear_dead_entities": _clear_dead_entities,
+    "clear_database": _clear_database,
+    "switch_world": _switch_world,
+}
+
+
+def install():
+    """Route esper's write functions through the view hooks (idempotent)."""
+    if _originals:
+        return
+    for name, hook in _HOOKS.items():
+        _originals[name] = getattr(esper, name)
+        setattr(esper, name, hook)
+    _rebuild_all()
+
+
+def installed() -> bool:
+    """True while esper's write functions are hooked."""
+    return bool(_originals)
+
+
+def uninstall():
+    """Restore esper's original functions (views stop updating).
+    
+    Watched views are kept, so their watchers catch up when install()
+    rebuilds them.
+    """
+    for name, original in _originals.items():
+        setattr(esper, name, original)
+    _originals.clear()
+    clear_views()
+
@@ -0,0 +1,122 @@
+"""Tag index - one integer of flag bits per entity for hot membership checks.
+
+Hot loops ask the same questions about every entity every step: is it
+Dead? Downed? an Enemy? a Projectile? Each esper.has_component() is a
+function call and two dict lookups, and most loops ask two or three of
+them. The index keeps a bitset per entity for a fixed set of tag-like
+components instead, so one dict lookup answers all of them:
+
+    flags = tag_index.flags
+    for ent, (pos, vel) in ...:
+        if flags.get(ent, 0) & INACTIVE:   # Dead or Downed
+            continue
+
+Bits are kept in sync by watching the single-type query views, so every
+add/remove/delete path that updates queries updates the index too, in
+the same call. A deleted entity keeps its bits until esper actually
+drops it (clear_dead_entities), same as has_component().
+
+The views only follow esper once queries.install() has hooked it. Until
+then (or after uninstall()) `flags` is rebuilt from esper on each access,
+so callers that don't install get correct answers, just not fast ones.
+"""
+
+import esper
+from typing import Dict, List
+
+from . import queries
+from .components import (
+    Dead, Downed, Enemy, PartyMember, Knockback, Projectile, DroppedItem, GoldDrop
+)
+
+
+class TagIndex:
+    """Per-entity flag bits for a fixed set of component types."""
+    
+    def __init__(self, tags: tuple):
+        self.tags = tags
+        self._bits: Dict[type, int] = {tag: 1 << i for i, tag in enumerate(tags)}
+        self._flags: Dict[int, int] = {}  # ent -> bits (entities with no bits are absent)
+        for tag, bit in self._bits.items():
+            queries.register(tag).watch(self._adder(bit), self._remover(bit))
+    
+    @property
+    def flags(self) -> Dict[int, int]:
+        """Entity -> flag bits; read it once per loop, not per entity."""
+        if queries.installed():
+            return self._flags
+        return self._scan()
+    
+    def bit(self, tag: type) -> int:
+        """Flag bit of an indexed tag."""
+        return self._bits[tag]
+    
+    def mask(self, *tags: type) -> int:
+        """Combined flag bits of several indexed tags."""
+        result = 0
+        for tag in tags:
+            result |= self._bits[tag]
+        return result
+    
+    def has_tag(self, ent: int, tag: type) -> bool:
+        """Same as esper.has_component(ent, tag) for an indexed tag."""
+        if queries.installed():
+            return bool(self._flags.get(ent, 0) & self._bits[tag])
+        return esper.has_component(ent, tag)
+    
+    def has_any(self, ent: int, mask: int) -> bool:
+        """True if the entity has at least one tag in the mask."""
+        if queries.installed():
+            return bool(self._flags.get(ent, 0) & mask)
+        return any(
+            bit & mask and esper.has_component(ent, tag)
+            for tag, bit in self._bits.items()
+        )
+    
+    def entities_with_tags(self, mask: int, exclude: int = 0) -> List[int]:
+        """Entities that have every tag in mask and none in exclude."""
+        return [
+            ent for ent, bits in self.flags.items()
+            if bits & mask == mask and not bits & exclude
+        ]
+    
+    def _scan(self) -> Dict[int, int]:
+        """Flag bits read straight from esper (hooks not installed)."""
+        flags: Dict[int, int] = {}
+        for tag, bit in self._bits.items():
+            for ent, _ in esper.get_component(tag):
+                flags[ent] = flags.get(ent, 0) | bit
+        return flags
+    
+    def _adder(self, bit: int):
+        flags = self._flags
+        
+        def on_add(ent: int, components):
+            flags[ent] = flags.get(ent, 0) | bit
+        return on_add
+    
+    def _remover(self, bit: int):
+        flags = self._flags
+        
+        def on_remove(ent: int, components):
+            bits = flags.get(ent, 0) & ~bit
+            if bits:
+                flags[ent] = bits
+            else:
+                flags.pop(ent, None)
+        return on_remove
+
+
+# Global index - exact once queries.install() runs, scans esper until then
+tag_index = TagIndex((Dead, Downed, Enemy, PartyMember, Knockback, Projectile, DroppedItem, GoldDrop))
+
+DEAD = tag_index.bit(Dead)
+DOWNED = tag_index.bit(Downed)
+ENEMY = tag_index.bit(Enemy)
+PARTY_MEMBER = tag_index.bit(PartyMember)
+KNOCKBACK = tag_index.bit(Knockback)
+PROJECTILE = tag_index.bit(Projectile)
+DROPPED_ITEM = tag_index.bit(DroppedItem)
+GOLD_DROP = tag_index.bit(GoldDrop)
+
+INACTIVE = DEAD | DOWNED  # Can't move, attack or be targeted
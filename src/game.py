@@ -1,25 +1,35 @@
 """Main game class - orchestrates the game loop and systems."""
 
 import pygame
+import random
 import time
 import esper
+from typing import Callable, Optional
 
 from .core.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FIXED_TIMESTEP, GameState
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FIXED_TIMESTEP, GameState,
+    MAX_FRAME_TIME, SIM_DEGRADE_INTERVAL
 )
 from .core.events import EventBus, Event, EventType
+from .core.sim_budget import SimulationBudget
+from .core.replay import InputRecording, world_checksum
+from .core.profiler import SamplingProfiler
+from .core.startup import startup
 
 from .ecs.processors import (
     InputProcessor, MovementProcessor, CombatProcessor,
     AIProcessor, MagicProcessor, AnimationProcessor,
     ProgressionProcessor, LootProcessor, CleanupProcessor,
-    SaveLoadProcessor, WorldProcessor, DroppedItemProcessor
+    SaveLoadProcessor, WorldProcessor, DroppedItemProcessor,
+    AutopilotProcessor, ProcessorScheduler
 )
 from .ecs.factories import create_party, create_enemies_for_level
 from .ecs.components import PartyMember, Position, Selected, Downed, CharacterName
+from .ecs import entity_pool, queries
+from .ecs.entity_pool import pool_stats
 
-from .world import Dungeon, Pathfinder
-from .rendering import Camera, Renderer
+from .world import Dungeon, MapContext
+from .rendering import Camera, Renderer, PositionInterpolator
 from .ui import (
     HUD, InventoryUI, SkillTreeUI, ActionBar, Minimap,
     NotificationManager, PauseOverlay, GameOverOverlay
@@ -31,20 +41,34 @@ from .audio import AudioManager
 class Game:
     """Main game class - ties everything together."""
     
-    def __init__(self):
-        # Auto-detect monitor size and use 85% of it
-        display_info = pygame.display.Info()
-        monitor_w, monitor_h = display_info.current_w, display_info.current_h
-        
-        # Use 85% of monitor - works for any resolution
-        win_w = int(monitor_w * 0.85)
-        win_h = int(monitor_h * 0.85)
-        
-        self.screen = pygame.display.set_mode((win_w, win_h), pygame.RESIZABLE)
-        pygame.display.set_caption("ML Siege")
-        
-        # Get actual screen size for camera/UI
-        screen_width, screen_height = self.screen.get_size()
+    def __init__(self, headless: bool = False):
+        """Create the game.
+        
+        Args:
+            headless: Run the simulation only - no window, no rendering,
+                      no UI and no audio. Use run_headless() to drive it.
+        """
+        self.headless = headless
+        
+        if headless:
+            self.screen = None
+            screen_width, screen_height = SCREEN_WIDTH, SCREEN_HEIGHT
+        else:
+            # Auto-detect monitor size and use 85% of it
+            display_info = pygame.display.Info()
+            monitor_w, monitor_h = display_info.current_w, display_info.current_h
+            
+            # Use 85% of monitor - works for any resolution
+            win_w = int(monitor_w * 0.85)
+            win_h = int(monitor_h * 0.85)
+            
+            with startup.phase("Window"):
+                self.screen = pygame.display.set_mode((win_w, win_h), pygame.RESIZABLE)
+                pygame.display.set_caption("ML Siege")
+                self._show_loading("Loading...")
+            
+            # Get actual screen size for camera/UI
+            screen_width, screen_height = self.screen.get_size()
         
         self.clock = pygame.time.Clock()
         self.running = True
@@ -54,43 +78,46 @@ class Game:
         self.accumulator = 0.0
         self.previous_time = time.time()
         self.time_scale = 1.0  # Allow speed adjustment
+        self.step_count = 0  # Fixed steps simulated since the game started
+        self.sim_budget = SimulationBudget()
+        self.recording: Optional[InputRecording] = None  # Set to record input for replay
+        self.replaying = False  # True while run_replay() drives the input
+        self.profiler = SamplingProfiler()  # F10 toggles it
+        self.startup_report = False  # Print the startup timeline after the first frame
         
         # Core systems
+        queries.install()  # Query views, tag index and pools follow esper writes
         self.event_bus = EventBus()
+        self.scheduler = ProcessorScheduler(self.event_bus)  # Runs processors at their tick rates
         
         # World
         self.dungeon = Dungeon(80, 80)
-        self.pathfinder = None
+        self.map_context = MapContext(self.dungeon)  # Shared by processors that need the map
         
-        # Rendering
+        # Camera is pure math - the simulation centers it even when headless
         self.camera = Camera(screen_width, screen_height)
-        self.renderer = Renderer(self.screen, self.camera)
         
-        # UI Systems
-        self.hud = HUD(self.screen, self.event_bus)
-        self.inventory_ui = InventoryUI(self.screen)
-        self.skill_tree_ui = SkillTreeUI(self.screen)
-        self.action_bar = ActionBar(self.screen, self.event_bus)
-        self.minimap = Minimap(self.screen)
-        self.notifications = NotificationManager(self.screen)
-        self.pause_overlay = PauseOverlay(self.screen)
-        self.game_over_overlay = GameOverOverlay(self.screen)
-        
-        # Scenes
-        self.town_scene = TownScene(self.screen, self.event_bus)
-        
-        # Set up overlay callbacks
-        self._setup_overlay_callbacks()
-        
-        # Audio - generate all sounds and music
-        self.audio = AudioManager(self.event_bus)
-        self.audio.initialize()
-        
-        # Start dungeon ambient music
-        self.audio.play_music("dungeon_ambient")
+        if headless:
+            self.interpolator = None
+            for pool in entity_pool.pools.values():
+                pool.on_release = None
+            self.renderer = None
+            self.hud = None
+            self.inventory_ui = None
+            self.skill_tree_ui = None
+            self.action_bar = None
+            self.minimap = None
+            self.notifications = None
+            self.pause_overlay = None
+            self.game_over_overlay = None
+            self.town_scene = None
+            self.audio = None
+        else:
+            self._setup_presentation()
         
         # Processors
-        self._setup_processors()
+        with startup.phase("Processors"):
+            self._setup_processors()
         
         # Subscribe to events
         self._setup_event_handlers()
@@ -103,6 +130,54 @@ class Game:
         
         # FPS tracking
         self.fps = 0.0
+        
+        # Headless run counters
+        self.enemies_killed = 0
+        self.party_wipes = 0
+    
+    def _setup_presentation(self):
+        """Create renderer, UI, scenes and audio (skipped when headless)."""
+        # Rendering - positions are blended between fixed steps
+        self.interpolator = PositionInterpolator()
+        for pool in entity_pool.pools.values():
+            pool.on_release = self.interpolator.forget  # Recycled IDs don't slide
+        with startup.phase("Renderer"):
+            self.renderer = Renderer(self.screen, self.camera, self.interpolator)
+        
+        # UI Systems
+        with startup.phase("UI"):
+            self.hud = HUD(self.screen, self.event_bus)
+            self.inventory_ui = InventoryUI(self.screen)
+            self.skill_tree_ui = SkillTreeUI(self.screen)
+            self.action_bar = ActionBar(self.screen, self.event_bus)
+            self.minimap = Minimap(self.screen)
+            self.notifications = NotificationManager(self.screen)
+            self.pause_overlay = PauseOverlay(self.screen)
+            self.game_over_overlay = GameOverOverlay(self.screen)
+            
+            # Scenes
+            self.town_scene = TownScene(self.screen, self.event_bus)
+            
+            # Set up overlay callbacks
+            self._setup_overlay_callbacks()
+        
+        # Audio - sounds load now, missing music generates in the background
+        self._show_loading("Loading audio...")
+        with startup.phase("Audio"):
+            self.audio = AudioManager(self.event_bus)
+            self.audio.initialize()
+        
+        # Start dungeon ambient music (fades in once generated)
+        self.audio.play_music("dungeon_ambient")
+    
+    def _show_loading(self, text: str):
+        """Draw a loading screen while init work blocks the first frame."""
+        self.screen.fill((15, 12, 10))
+        font = pygame.font.Font(None, 48)
+        label = font.render(text, True, (200, 180, 140))
+        self.screen.blit(label, label.get_rect(center=self.screen.get_rect().center))
+        pygame.display.flip()
+        pygame.event.pump()  # Keep the window responsive
     
     def _setup_overlay_callbacks(self):
         """Set up callbacks for overlay menus."""
@@ -126,57 +201,104 @@ class Game:
         self.event_bus.clear_subscribers(EventType.SPELL_CAST_REQUESTED)
         
         # Create processors
-        self.input_processor = InputProcessor(self.event_bus)
-        self.ai_processor = AIProcessor(self.event_bus)
-        self.movement_processor = MovementProcessor(self.event_bus, self.dungeon)
-        self.combat_processor = CombatProcessor(self.event_bus)
-        self.magic_processor = MagicProcessor(self.event_bus)
+        self.input_processor = InputProcessor(self.event_bus, self.map_context)
+        self.ai_processor = AIProcessor(self.event_bus, self.map_context)
+        self.movement_processor = MovementProcessor(self.event_bus, self.map_context)
+        self.combat_processor = CombatProcessor(self.event_bus, self.map_context)
+        self.magic_processor = MagicProcessor(self.event_bus, self.map_context)
         self.animation_processor = AnimationProcessor()
         self.progression_processor = ProgressionProcessor(self.event_bus)
         self.loot_processor = LootProcessor(self.event_bus)
         self.cleanup_processor = CleanupProcessor()
         self.save_load_processor = SaveLoadProcessor(self.event_bus)
-        self.world_processor = WorldProcessor(self.event_bus)
+        self.world_processor = WorldProcessor(self.event_bus, self.map_context)
         self.dropped_item_processor = DroppedItemProcessor(self.event_bus)
         self.regen_processor = RegenProcessor(self.event_bus)
-        self.position_validator = PositionValidator(self.event_bus)
-        
-        # Add in order (priority - higher runs first)
-        esper.add_processor(self.input_processor, priority=100)
-        esper.add_processor(self.ai_processor, priority=90)
-        esper.add_processor(self.movement_processor, priority=80)
-        esper.add_processor(self.combat_processor, priority=70)
-        esper.add_processor(self.magic_processor, priority=60)
-        esper.add_processor(self.world_processor, priority=55)  # After magic, before animation
-        esper.add_processor(self.regen_processor, priority=52)  # Before animation
-        esper.add_processor(self.animation_processor, priority=50)
-        esper.add_processor(self.progression_processor, priority=40)
-        esper.add_processor(self.loot_processor, priority=30)
-        esper.add_processor(self.dropped_item_processor, priority=25)
-        esper.add_processor(self.save_load_processor, priority=20)
-        esper.add_processor(self.position_validator, priority=5)  # Validate before cleanup
-        esper.add_processor(self.cleanup_processor, priority=0)  # Always last
+        self.position_validator = PositionValidator(self.event_bus, self.map_context)
+        
+        # Add in order (priority - higher runs first). The scheduler runs
+        # each at its declared tick rate; throttle=True marks low-priority
+        # processors that run every Nth step when over budget.
+        scheduler = self.scheduler
+        scheduler.clear()
+        scheduler.add(self.input_processor, priority=100)
+        scheduler.add(self.ai_processor, priority=90)
+        scheduler.add(self.movement_processor, priority=80)
+        scheduler.add(self.combat_processor, priority=70)
+        scheduler.add(self.magic_processor, priority=60)
+        scheduler.add(self.world_processor, priority=55)  # After magic, before animation
+        regen = scheduler.add(self.regen_processor, priority=52, throttle=True)  # Before animation
+        scheduler.add(self.animation_processor, priority=50)
+        progression = scheduler.add(self.progression_processor, priority=40, throttle=True)
+        loot = scheduler.add(self.loot_processor, priority=30, throttle=True)
+        scheduler.add(self.dropped_item_processor, priority=25)
+        scheduler.add(self.save_load_processor, priority=20)  # Event-driven
+        scheduler.add(self.position_validator, priority=5)  # Validate before cleanup
+        scheduler.add(self.cleanup_processor, priority=0)  # Always last
+        self.throttled_processors = [regen, progression, loot]
+        
+        # Nobody at the keyboard when headless - autopilot decides for the leader
+        # (replays bring their own recorded input instead)
+        self.autopilot_processor = None
+        if self.headless and not self.replaying:
+            self.autopilot_processor = AutopilotProcessor(
+                self.event_bus, self.map_context, self.world_processor
+            )
+            scheduler.add(self.autopilot_processor, priority=95)  # After input, before AI
         
         # Give input processor references to other processors
         self.input_processor.camera = self.camera
         self.input_processor.save_load_processor = self.save_load_processor
         self.input_processor.world_processor = self.world_processor
-        
+    
     
     def _setup_event_handlers(self):
         """Subscribe to game events."""
-        self.event_bus.subscribe(EventType.GAME_PAUSED, self._on_pause)
         self.event_bus.subscribe(EventType.PARTY_WIPED, self._on_party_wipe)
+        self.event_bus.subscribe(EventType.STAIRS_USED, self._on_stairs_used)
+        self.event_bus.subscribe(EventType.GAME_LOADED, self._on_game_loaded)
+        
+        # These change the simulation (selection, click mapping) - replays need them
         self.event_bus.subscribe(EventType.CAMERA_ZOOMED, self._on_camera_zoom)
+        self.event_bus.subscribe(EventType.CHARACTER_SELECTED, self._on_character_selected)
+        
+        # Replays can toggle the profiler too, to profile a recorded fight
+        self.event_bus.subscribe(EventType.PROFILER_TOGGLED, self._on_profiler_toggled)
+        
+        if self.headless:
+            self.event_bus.subscribe(EventType.ENTITY_DIED, self._on_entity_died)
+            return
+        
+        self.event_bus.subscribe(EventType.GAME_PAUSED, self._on_pause)
         self.event_bus.subscribe(EventType.NOTIFICATION, self._on_notification)
         self.event_bus.subscribe(EventType.MENU_OPENED, self._on_menu_opened)
         self.event_bus.subscribe(EventType.ACTION_BAR_USED, self._on_action_bar_used)
         self.event_bus.subscribe(EventType.LEVEL_UP, self._on_level_up)
-        self.event_bus.subscribe(EventType.STAIRS_USED, self._on_stairs_used)
         self.event_bus.subscribe(EventType.TOWN_ENTERED, self._on_town_entered)
         self.event_bus.subscribe(EventType.TOWN_LEFT, self._on_town_left)
-        self.event_bus.subscribe(EventType.GAME_LOADED, self._on_game_loaded)
-        self.event_bus.subscribe(EventType.CHARACTER_SELECTED, self._on_character_selected)
+    
+    def _notify(self, text: str, color: tuple):
+        """Show an on-screen notification (no-op when headless)."""
+        if self.notifications:
+            self.notifications.add(text, color)
+    
+    def _reset_presentation(self):
+        """Point minimap, fog of war and render interpolation at the current dungeon."""
+        if self.headless:
+            return
+        self.minimap.set_dungeon(self.dungeon)
+        self.renderer.set_explored_tiles(self.minimap.explored)
+        self.interpolator.clear()
+    
+    def _snapshot_for_interpolation(self):
+        """Capture positions before a fixed step so rendering can blend."""
+        if self.interpolator:
+            self.interpolator.snapshot()
+            self.camera.snapshot()
+    
+    def _on_entity_died(self, event):
+        """Count kills for the headless run report."""
+        self.enemies_killed += 1
     
     def _on_pause(self, event):
         """Handle pause event."""
@@ -247,9 +369,19 @@ class Game:
                 pos = esper.component_for_entity(self.party_entities[0], Position)
                 self.camera.center_on(pos.x, pos.y)
         
+        self.party_wipes += 1
+        
         # Show notification
-        self.notifications.add(f"You died! Lost {gold_lost} gold.", (255, 100, 100))
-        self.notifications.add("Respawned at entrance. Try an easier level?", (255, 255, 150))
+        self._notify(f"You died! Lost {gold_lost} gold.", (255, 100, 100))
+        self._notify("Respawned at entrance. Try an easier level?", (255, 255, 150))
+    
+    def _on_profiler_toggled(self, event):
+        """Start or stop the sampling profiler."""
+        path = self.profiler.toggle(self.current_level, len(esper._entities))
+        if self.profiler.running:
+            self._notify("Profiler started (F10 to stop)", (200, 200, 255))
+        elif path:
+            self._notify(f"Profile saved: {path}", (200, 200, 255))
     
     def _on_camera_zoom(self, event):
         """Handle camera zoom."""
@@ -260,7 +392,7 @@ class Game:
         """Handle notification event."""
         text = event.data.get("text", "")
         color = event.data.get("color", (255, 255, 255))
-        self.notifications.add(text, color)
+        self._notify(text, color)
     
     def _on_menu_opened(self, event):
         """Handle menu open events."""
@@ -297,7 +429,7 @@ class Game:
         """Handle level up event."""
         skill = event.data.get("skill", "")
         new_level = event.data.get("new_level", 1)
-        self.notifications.add(
+        self._notify(
             f"{skill.title()} Level {new_level}!",
             (255, 255, 100)
         )
@@ -356,7 +488,7 @@ class Game:
             if esper.has_component(new_ent, Downed):
                 status = " (Downed)"
             
-            self.notifications.add(f"Controlling {name}{status}", (150, 200, 255))
+            self._notify(f"Controlling {name}{status}", (150, 200, 255))
             
             # Center camera on new character
             if esper.has_component(new_ent, Position):
@@ -395,6 +527,8 @@ class Game:
         self.minimap.fog_of_war_enabled = False
         self.minimap.set_dungeon(self.town_scene.town_map)
         self.renderer.fog_enabled = False
+        self.map_context.enter_town(self.town_scene.town_map)
+        self.interpolator.clear()
     
     def _on_town_left(self, event):
         """Handle leaving town - restore positions, don't regenerate."""
@@ -404,20 +538,17 @@ class Game:
         self.renderer.fog_enabled = True
         self.renderer.set_explored_tiles(self.minimap.explored)
         
-        # IMPORTANT: Set dungeon references BEFORE restoring positions
+        # IMPORTANT: Switch maps BEFORE restoring positions
         # Otherwise PositionValidator might see dungeon positions as invalid
         # when checked against town_map
-        self.movement_processor.set_dungeon(self.dungeon)
-        self.input_processor.set_dungeon(self.dungeon)
-        self.position_validator.set_dungeon(self.dungeon)
-        self.ai_processor.set_dungeon(self.dungeon)
-        self.combat_processor.set_dungeon(self.dungeon)
-        self.magic_processor.set_dungeon(self.dungeon)
+        self.map_context.leave_town()
         
         # Now restore positions (they'll be valid against dungeon)
         self.town_scene.hide()  # This calls _restore_positions()
         self.state = GameState.PLAYING
         
+        self.interpolator.clear()
+        
         # Center camera on restored position
         for ent, (member, pos) in esper.get_components(PartyMember, Position):
             if member.party_index == 0:
@@ -437,8 +568,11 @@ class Game:
         )
         from .ecs.factories import create_enemies_for_level
         
-        # If in town, exit town first
-        if self.state == GameState.TOWN:
+        # If in town, exit town first (same order as _on_town_left - map before positions)
+        if self.state == GameState.TOWN and self.town_scene:
+            self.minimap.fog_of_war_enabled = True
+            self.renderer.fog_enabled = True
+            self.map_context.leave_town()
             self.town_scene.hide()
         
         dungeon_level = event.data.get("dungeon_level", 1)
@@ -463,20 +597,10 @@ class Game:
             seed=dungeon_seed
         )
         
-        self.pathfinder = Pathfinder(self.dungeon)
-        
-        # Update processors with new dungeon
-        self.movement_processor.set_dungeon(self.dungeon)
-        self.combat_processor.set_dungeon(self.dungeon)
-        self.magic_processor.set_dungeon(self.dungeon)
-        self.input_processor.set_dungeon(self.dungeon)
-        self.position_validator.set_dungeon(self.dungeon)
-        self.ai_processor.set_pathfinder(self.pathfinder)
-        self.ai_processor.set_dungeon(self.dungeon)
-        self.world_processor.set_dungeon(self.dungeon)
+        # Processors read the map from the shared context
+        self.map_context.set_dungeon(self.dungeon)
         self.loot_processor.dungeon_level = self.current_level
-        self.minimap.set_dungeon(self.dungeon)
-        self.renderer.set_explored_tiles(self.minimap.explored)
+        self._reset_presentation()
         self.world_processor.set_dungeon_level(self.current_level)
         
         # Enemies will spawn via room activation when player enters rooms
@@ -618,22 +742,12 @@ class Game:
             max_rooms=12 + self.current_level * 2
         )
         
-        self.pathfinder = Pathfinder(self.dungeon)
-        
-        # Update processors
-        self.movement_processor.set_dungeon(self.dungeon)
-        self.combat_processor.set_dungeon(self.dungeon)
-        self.magic_processor.set_dungeon(self.dungeon)
-        self.input_processor.set_dungeon(self.dungeon)
-        self.position_validator.set_dungeon(self.dungeon)
-        self.ai_processor.set_pathfinder(self.pathfinder)
-        self.ai_processor.set_dungeon(self.dungeon)
-        self.world_processor.set_dungeon(self.dungeon)
+        # Processors read the map from the shared context
+        self.map_context.set_dungeon(self.dungeon)
         self.loot_processor.dungeon_level = self.current_level
         
         # Update minimap and fog of war
-        self.minimap.set_dungeon(self.dungeon)
-        self.renderer.set_explored_tiles(self.minimap.explored)
+        self._reset_presentation()
         
         # Update save processor with dungeon info
         self.save_load_processor.set_dungeon_info(self.current_level, self.dungeon.seed)
@@ -658,11 +772,16 @@ class Game:
             "new_level": self.current_level
         }))
         
-        self.notifications.add(f"Dungeon Level {self.current_level}", (255, 220, 150))
+        self._notify(f"Dungeon Level {self.current_level}", (255, 220, 150))
     
-    def start_new_game(self):
-        """Start a new game."""
+    def start_new_game(self, seed: Optional[int] = None):
+        """Start a new game.
+        
+        Args:
+            seed: Optional dungeon seed for a reproducible run
+        """
         self.current_level = 1
+        self.step_count = 0
         
         # Clear esper database (entities only - processors stay!)
         esper.clear_database()
@@ -674,23 +793,14 @@ class Game:
         self._setup_processors()
         
         # Generate dungeon
-        self.dungeon.generate(min_rooms=8, max_rooms=12)
-        self.pathfinder = Pathfinder(self.dungeon)
-        
-        # Update processors with dungeon reference
-        self.movement_processor.set_dungeon(self.dungeon)
-        self.combat_processor.set_dungeon(self.dungeon)
-        self.magic_processor.set_dungeon(self.dungeon)
-        self.input_processor.set_dungeon(self.dungeon)
-        self.position_validator.set_dungeon(self.dungeon)
-        self.ai_processor.set_pathfinder(self.pathfinder)
-        self.ai_processor.set_dungeon(self.dungeon)
-        self.world_processor.set_dungeon(self.dungeon)
+        self.dungeon.generate(min_rooms=8, max_rooms=12, seed=seed)
+        
+        # Processors read the map from the shared context
+        self.map_context.set_dungeon(self.dungeon)
         self.loot_processor.dungeon_level = self.current_level
         
         # Update minimap and fog of war
-        self.minimap.set_dungeon(self.dungeon)
-        self.renderer.set_explored_tiles(self.minimap.explored)
+        self._reset_presentation()
         
         # Update save processor with dungeon info
         self.save_load_processor.set_dungeon_info(self.current_level, self.dungeon.seed)
@@ -708,22 +818,31 @@ class Game:
         self.camera.center_on(spawn_x, spawn_y)
         
         # Add notification
-        self.notifications.add("Entering the dungeon...", (200, 180, 255))
+        self._notify("Entering the dungeon...", (200, 180, 255))
         
         self.state = GameState.PLAYING
+        
+        if self.recording:
+            self.recording.begin(self.dungeon.seed, (self.camera.screen_width, self.camera.screen_height))
     
-    def run(self):
-        """Main game loop."""
+    def run(self, seed: Optional[int] = None):
+        """Main game loop.
+        
+        Args:
+            seed: Optional dungeon seed for the first level
+        """
         from .core.perf_monitor import perf
         
         # Start new game immediately
-        self.start_new_game()
+        with startup.phase("New game"):
+            self.start_new_game(seed=seed)
+        first_frame = True
         
         while self.running:
             perf.frame_start()
             
             current_time = time.time()
-            frame_time = min(current_time - self.previous_time, 0.25)
+            frame_time = min(current_time - self.previous_time, MAX_FRAME_TIME)
             self.previous_time = current_time
             
             # PHASE 1: INPUT (immediate)
@@ -733,10 +852,16 @@ class Game:
             if self.state in (GameState.PLAYING, GameState.INVENTORY, GameState.SKILL_TREE):
                 self.accumulator += frame_time * self.time_scale
                 
-                while self.accumulator >= FIXED_TIMESTEP:
-                    if self.state == GameState.PLAYING:
-                        self._update(FIXED_TIMESTEP)
-                    self.accumulator -= FIXED_TIMESTEP
+                if self.state == GameState.PLAYING:
+                    self._run_fixed_steps(self._update)
+                else:
+                    # Menus open - time passes but nothing simulates
+                    self.accumulator %= FIXED_TIMESTEP
+                
+                # Draw between the last two steps (paused menus show the latest step)
+                alpha = self.accumulator / FIXED_TIMESTEP if self.state == GameState.PLAYING else 1.0
+                self.interpolator.set_alpha(alpha)
+                self.camera.interpolate(self.interpolator.alpha)
                 
                 # Update notifications and action bar
                 self.notifications.update(frame_time)
@@ -750,31 +875,11 @@ class Game:
             if self.state == GameState.TOWN:
                 self.accumulator += frame_time
                 
-                while self.accumulator >= FIXED_TIMESTEP:
-                    # Swap to town map for all processors that need collision
-                    self.movement_processor.set_dungeon(self.town_scene.town_map)
-                    self.input_processor.set_dungeon(self.town_scene.town_map)
-                    self.position_validator.set_dungeon(self.town_scene.town_map)
-                    self.ai_processor.set_dungeon(self.town_scene.town_map)
-                    self.combat_processor.set_dungeon(self.town_scene.town_map)
-                    self.magic_processor.set_dungeon(self.town_scene.town_map)
-                    # Disable world processor in town (prevents enemy spawning)
-                    self.world_processor.set_dungeon(None)
-                    
-                    # Run ECS - combat/AI will do nothing (no enemies in town)
-                    esper.process(FIXED_TIMESTEP)
-                    self.event_bus.process()
-                    
-                    # Restore dungeon reference for when we leave
-                    self.movement_processor.set_dungeon(self.dungeon)
-                    self.input_processor.set_dungeon(self.dungeon)
-                    self.position_validator.set_dungeon(self.dungeon)
-                    self.ai_processor.set_dungeon(self.dungeon)
-                    self.combat_processor.set_dungeon(self.dungeon)
-                    self.magic_processor.set_dungeon(self.dungeon)
-                    self.world_processor.set_dungeon(self.dungeon)
-                    
-                    self.accumulator -= FIXED_TIMESTEP
+                # Same step budget as the dungeon (catch-up cap, dropped time)
+                self._run_fixed_steps(self._update_town)
+                
+                # Camera is updated per frame in town - only entities blend
+                self.interpolator.set_alpha(self.accumulator / FIXED_TIMESTEP)
                 
                 # Town-specific update (NPC proximity check)
                 self.town_scene.update(frame_time)
@@ -794,6 +899,13 @@ class Game:
             
             # PHASE 4: PRESENT
             pygame.display.flip()
+            self.audio.update()
+            
+            if first_frame:
+                first_frame = False
+                startup.mark("First frame")
+                if self.startup_report:
+                    print(startup.report())
             
             # Cap frame rate
             self.clock.tick(FPS)
@@ -801,6 +913,148 @@ class Game:
             
             perf.frame_end()
     
+    def _run_fixed_steps(self, update: Callable[[float], None]):
+        """Run the fixed steps owed this frame, within the simulation budget.
+        
+        Args:
+            update: Step function (_update in the dungeon, _update_town in town)
+        """
+        from .core.perf_monitor import perf
+        
+        steps = self.sim_budget.steps_for(self.accumulator)
+        for _ in range(steps):
+            self._snapshot_for_interpolation()
+            if self.recording and any(self.input_processor.mouse_clicked):
+                # This step turns a click into a world position
+                self.recording.record_view(self.step_count, self._camera_view())
+            start = time.perf_counter()
+            update(FIXED_TIMESTEP)
+            step_seconds = time.perf_counter() - start
+            self.sim_budget.record_step(step_seconds)
+            perf.record("Sim:Step", step_seconds * 1000)
+            self.accumulator -= FIXED_TIMESTEP
+        
+        # Couldn't catch up - drop the backlog instead of owing it next frame
+        dropped_before = self.sim_budget.dropped_seconds
+        self.accumulator = self.sim_budget.drop_backlog(self.accumulator)
+        if self.sim_budget.dropped_seconds > dropped_before:
+            perf.record("Sim:Dropped", (self.sim_budget.dropped_seconds - dropped_before) * 1000)
+        
+        # Degrade low-priority processors while over budget
+        interval = SIM_DEGRADE_INTERVAL if self.sim_budget.degraded else 1
+        for throttled in self.throttled_processors:
+            throttled.interval = interval
+        if self.recording:
+            self.recording.record_interval(self.step_count, interval)
+    
+    def _camera_view(self) -> tuple:
+        """Camera position used to convert mouse clicks to world positions."""
+        return (self.camera.view_x, self.camera.view_y)
+    
+    def run_headless(
+        self,
+        ticks: int,
+        seed: Optional[int] = None,
+        on_step: Optional[Callable[["Game", float], None]] = None
+    ) -> dict:
+        """Run the simulation for a fixed number of steps as fast as possible.
+        
+        Runs the same processor stack as run() at FIXED_TIMESTEP, with no
+        frame cap, input, rendering or audio.
+        
+        Args:
+            ticks: Number of fixed steps to simulate
+            seed: Optional dungeon seed for a reproducible run
+            on_step: Called after every step with the game and the step's
+                     wall time in seconds (batch runs sample stats here)
+        
+        Returns:
+            Run report (ticks, timings, throughput and outcome counters)
+        """
+        from .core.perf_monitor import perf
+        
+        self.start_new_game(seed=seed)
+        
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if not self.running:
+                break
+            perf.frame_start()
+            if on_step:
+                step_start = time.perf_counter()
+                self._update(FIXED_TIMESTEP)
+                on_step(self, time.perf_counter() - step_start)
+            else:
+                self._update(FIXED_TIMESTEP)
+            perf.frame_end()
+        wall_seconds = time.perf_counter() - start
+        
+        return self._run_report(wall_seconds)
+    
+    def run_replay(self, recording: InputRecording) -> dict:
+        """Replay a recorded session headlessly as fast as possible.
+        
+        Restores the recorded seed, screen size and random state, then
+        feeds each step's input to the InputProcessor before running it.
+        
+        Args:
+            recording: Session recorded with Game.recording
+        
+        Returns:
+            Run report as run_headless(), plus the final world checksum and
+            whether it differs from the recorded one
+        """
+        from .core.perf_monitor import perf
+        
+        self.replaying = True
+        self.camera.screen_width, self.camera.screen_height = recording.screen_size
+        self.start_new_game(seed=recording.seed)
+        random.setstate(recording.random_state)
+        
+        start = time.perf_counter()
+        for _ in range(recording.ticks):
+            if not self.running:
+                break
+            perf.frame_start()
+            step = self.step_count
+            for event, view in recording.events_at(step):
+                self.camera.view_x, self.camera.view_y = view
+                self.input_processor.handle_event(event)
+            if step in recording.views:
+                self.camera.view_x, self.camera.view_y = recording.views[step]
+            if step in recording.intervals:
+                for throttled in self.throttled_processors:
+                    throttled.interval = recording.intervals[step]
+            self._update(FIXED_TIMESTEP)
+            perf.frame_end()
+        wall_seconds = time.perf_counter() - start
+        
+        report = self._run_report(wall_seconds)
+        report["checksum"] = world_checksum()
+        report["diverged"] = report["checksum"] != recording.checksum
+        return report
+    
+    def _run_report(self, wall_seconds: float) -> dict:
+        """Report for a headless or replayed run."""
+        sim_seconds = self.step_count * FIXED_TIMESTEP
+        return {
+            "seed": self.dungeon.seed,
+            "ticks": self.step_count,
+            "sim_seconds": sim_seconds,
+            "wall_seconds": wall_seconds,
+            "ticks_per_sec": self.step_count / wall_seconds if wall_seconds > 0 else 0.0,
+            "speedup": sim_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+            "dungeon_level": self.current_level,
+            "enemies_killed": self.enemies_killed,
+            "party_wipes": self.party_wipes,
+            "entities": len(esper._entities),
+            "skipped_runs": self.scheduler.skipped_runs(),
+            "pools": pool_stats(sim_seconds),
+            "path_cache": self.map_context.pathfinder.cache.stats(),
+            "flow_fields": self.map_context.flow_fields.stats(),
+            "path_requests": self.map_context.path_requests.stats(),
+        }
+    
     def _handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
@@ -845,6 +1099,8 @@ class Game:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if self.hud.handle_click(event.pos):
                         continue
+                if self.recording:
+                    self.recording.record_event(self.step_count, event, self._camera_view())
                 self.input_processor.handle_event(event)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -860,6 +1116,8 @@ class Game:
     
     def _update(self, dt: float):
         """Update game state."""
+        self.step_count += 1
+        
         # Process all ECS systems (each has its own perf timing)
         esper.process(dt)
         
@@ -877,6 +1135,15 @@ class Game:
         
         self.camera.update(dt)
     
+    def _update_town(self, dt: float):
+        """Update the town - the camera follows the party leader per frame instead."""
+        self.step_count += 1
+        
+        # Run ECS on the town map - combat/AI will do nothing (no enemies in town)
+        # and the world processor sees no dungeon (no enemy spawning)
+        esper.process(dt)
+        self.event_bus.process()
+    
     def _render(self, dt: float):
         """Render the game."""
         # Determine what background to render
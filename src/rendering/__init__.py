@@ -3,5 +3,6 @@
 from .camera import Camera
 from .renderer import Renderer
 from .sprites import SpriteManager
+from .interpolation import PositionInterpolator
 
-__all__ = ['Camera', 'Renderer', 'SpriteManager']
+__all__ = ['Camera', 'Renderer', 'SpriteManager', 'PositionInterpolator']
@@ -18,6 +18,13 @@ class Camera:
         self.x = 0.0
         self.y = 0.0
         
+        # Position at the previous fixed step, and the blended position
+        # actually used for drawing (see interpolate())
+        self._prev_x = 0.0
+        self._prev_y = 0.0
+        self.view_x = 0.0
+        self.view_y = 0.0
+        
         # Target position (for smooth following)
         self.target_x = 0.0
         self.target_y = 0.0
@@ -33,6 +40,18 @@ class Camera:
         # Lerp toward target
         self.x += (self.target_x - self.x) * self.smooth_speed * dt
         self.y += (self.target_y - self.y) * self.smooth_speed * dt
+        self.view_x = self.x
+        self.view_y = self.y
+    
+    def snapshot(self):
+        """Remember current position before a fixed step runs."""
+        self._prev_x = self.x
+        self._prev_y = self.y
+    
+    def interpolate(self, alpha: float):
+        """Blend the view between the previous and current fixed step."""
+        self.view_x = self._prev_x + (self.x - self._prev_x) * alpha
+        self.view_y = self._prev_y + (self.y - self._prev_y) * alpha
     
     def follow(self, world_x: float, world_y: float):
         """Set target to follow (usually player position)."""
@@ -45,6 +64,8 @@ class Camera:
         self.y = world_y
         self.target_x = world_x
         self.target_y = world_y
+        self._prev_x = self.view_x = world_x
+        self._prev_y = self.view_y = world_y
     
     def adjust_zoom(self, delta: float):
         """Adjust zoom level."""
@@ -61,8 +82,8 @@ class Camera:
         iso_y *= self.zoom
         
         # Apply camera offset (center on camera position)
-        cam_iso_x = (self.x - self.y) * (TILE_WIDTH / 2) * self.zoom
-        cam_iso_y = (self.x + self.y) * (TILE_HEIGHT / 2) * self.zoom
+        cam_iso_x = (self.view_x - self.view_y) * (TILE_WIDTH / 2) * self.zoom
+        cam_iso_y = (self.view_x + self.view_y) * (TILE_HEIGHT / 2) * self.zoom
         
         screen_x = iso_x - cam_iso_x + self.screen_width / 2
         screen_y = iso_y - cam_iso_y + self.screen_height / 2
@@ -72,8 +93,8 @@ class Camera:
     def screen_to_world(self, screen_x: int, screen_y: int) -> tuple:
         """Convert screen coordinates to world coordinates."""
         # Reverse the camera offset
-        cam_iso_x = (self.x - self.y) * (TILE_WIDTH / 2) * self.zoom
-        cam_iso_y = (self.x + self.y) * (TILE_HEIGHT / 2) * self.zoom
+        cam_iso_x = (self.view_x - self.view_y) * (TILE_WIDTH / 2) * self.zoom
+        cam_iso_y = (self.view_x + self.view_y) * (TILE_HEIGHT / 2) * self.zoom
         
         iso_x = (screen_x - self.screen_width / 2 + cam_iso_x) / self.zoom
         iso_y = (screen_y - self.screen_height / 2 + cam_iso_y) / self.zoom
@@ -94,9 +115,9 @@ class Camera:
         half_tiles_y = (self.screen_height / (TILE_HEIGHT * self.zoom)) + margin
         
         return (
-            self.x - half_tiles_x,
-            self.y - half_tiles_y,
-            self.x + half_tiles_x,
-            self.y + half_tiles_y
+            self.view_x - half_tiles_x,
+            self.view_y - half_tiles_y,
+            self.view_x + half_tiles_x,
+            self.view_y + half_tiles_y
         )
 
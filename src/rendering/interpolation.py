@@ -0,0 +1,57 @@
+"""Render interpolation - smooth drawing between fixed simulation steps.
+
+The simulation advances in FIXED_TIMESTEP steps; frames land somewhere in
+between. Before each step we take one bulk snapshot of every Position,
+then the renderer draws each entity at
+    previous + (current - previous) * alpha
+where alpha = accumulator / FIXED_TIMESTEP. Rendering only - the
+simulation never reads interpolated positions.
+"""
+
+import esper
+from typing import Dict, Tuple
+
+from ..ecs.components import Position
+
+
+# Jumps larger than this (teleports, leaps, respawns) snap instead of sliding
+MAX_INTERPOLATION_DISTANCE = 2.0
+
+
+class PositionInterpolator:
+    """Blends entity positions between the previous and current fixed step."""
+    
+    def __init__(self):
+        self._previous: Dict[int, Tuple[float, float]] = {}
+        self.alpha = 1.0
+    
+    def snapshot(self):
+        """Record all positions before a fixed step runs."""
+        self._previous = {ent: (pos.x, pos.y) for ent, pos in esper.get_component(Position)}
+    
+    def set_alpha(self, alpha: float):
+        """Set blend factor (0 = previous step, 1 = current step)."""
+        self.alpha = max(0.0, min(1.0, alpha))
+    
+    def clear(self):
+        """Forget the snapshot (level change, load) - draw current positions."""
+        self._previous = {}
+        self.alpha = 1.0
+    
+    def forget(self, ent: int):
+        """Drop one entity's snapshot (its ID is being reused) - draw it where it is."""
+        self._previous.pop(ent, None)
+    
+    def position(self, ent: int, pos: Position) -> Tuple[float, float]:
+        """Interpolated world position for an entity."""
+        previous = self._previous.get(ent)
+        if previous is None or self.alpha >= 1.0:
+            return pos.x, pos.y
+        
+        prev_x, prev_y = previous
+        dx = pos.x - prev_x
+        dy = pos.y - prev_y
+        if abs(dx) > MAX_INTERPOLATION_DISTANCE or abs(dy) > MAX_INTERPOLATION_DISTANCE:
+            return pos.x, pos.y
+        
+        return prev_x + dx * self.alpha, prev_y + dy * self.alpha
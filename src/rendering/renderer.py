@@ -19,11 +19,14 @@ from ..ecs.components import (
     Position, Sprite, Animation, AnimationState, Facing, Direction,
     Health, Mana, HealthBar, DamageNumber, RenderOffset,
     PartyMember, Enemy, Selected, Projectile, AreaEffect,
-    DroppedItem, GoldDrop, Dead, Downed, StatusEffects, LightningBolt
+    DroppedItem, GoldDrop, StatusEffects, LightningBolt
 )
 from ..ecs.components.rendering import VisualEffect
+from ..ecs.tag_index import tag_index, DEAD, DOWNED, ENEMY, DROPPED_ITEM, GOLD_DROP
 from ..core.constants import RARITY_COLORS
+from ..core.startup import startup
 from ..world.dungeon import Dungeon
+from .interpolation import PositionInterpolator
 
 
 class Renderer:
@@ -44,15 +47,20 @@ class Renderer:
     # Fog of war colors
     FOG_COLOR = (20, 15, 10, 200)  # Dark with alpha
     
-    def __init__(self, screen: pygame.Surface, camera: Camera):
+    def __init__(self, screen: pygame.Surface, camera: Camera,
+                 interpolator: Optional[PositionInterpolator] = None):
         self.screen = screen
         self.camera = camera
-        self.sprites = SpriteManager()
-        self.sprites.load_all()
+        # Blends moving entities between fixed steps (alpha 1.0 = no blending)
+        self.interpolator = interpolator or PositionInterpolator()
+        with startup.phase("Sprites"):
+            self.sprites = SpriteManager()
+            self.sprites.load_all()
         
         # Pre-render tile surfaces
         self._tile_surfaces = {}
-        self._generate_tile_surfaces()
+        with startup.phase("Tile surfaces"):
+            self._generate_tile_surfaces()
         
         # Fog of war - reference to explored tiles (set by game)
         self.explored_tiles = None  # Set[Tuple[int, int]]
@@ -87,8 +95,9 @@ class Renderer:
         self._external_urns = []
         # Floor
         self._external_rugs = []
-        self._load_external_decorations()
-        self._generate_decoration_surfaces()
+        with startup.phase("Decorations"):
+            self._load_external_decorations()
+            self._generate_decoration_surfaces()
         
         # Font
         pygame.font.init()
@@ -169,45 +178,69 @@ class Renderer:
         
         # Render dungeon tiles
         if dungeon:
+            perf.mark("Render:Tiles")
             self._render_dungeon(dungeon)
+            perf.measure("Render:Tiles")
             
             # Render floor decorations (rugs, patterns) - on top of tiles
+            perf.mark("Render:FloorDecor")
             self._render_floor_decor(dungeon)
+            perf.measure("Render:FloorDecor")
             
             # Render room top walls (wall1, wall3 sprites)
+            perf.mark("Render:RoomWalls")
             self._render_room_walls(dungeon)
+            perf.measure("Render:RoomWalls")
             
             # Render void decorations (palm trees, rocks) behind entities
+            perf.mark("Render:Decorations")
             self._render_decorations(dungeon)
+            perf.measure("Render:Decorations")
             
             # Render room props (barrels, urns) - these need Y-sorting with entities
+            perf.mark("Render:Props")
             self._render_room_props(dungeon)
+            perf.measure("Render:Props")
         
         # Render area effects (below entities)
+        perf.mark("Render:AreaEffects")
         self._render_area_effects()
+        perf.measure("Render:AreaEffects")
         
         # Render dropped items (below entities)
+        perf.mark("Render:DroppedItems")
         self._render_dropped_items()
+        perf.measure("Render:DroppedItems")
         
         # Collect and sort entities by Y position (painter's algorithm)
+        perf.mark("Render:Entities")
         entities = self._collect_renderable_entities()
         entities.sort(key=lambda e: e[1])  # Sort by y position
         
         # Render entities
         for ent_data in entities:
             self._render_entity(ent_data)
+        perf.measure("Render:Entities")
         
         # Render projectiles (above entities)
+        perf.mark("Render:Projectiles")
         self._render_projectiles()
+        perf.measure("Render:Projectiles")
         
         # Render visual effects
+        perf.mark("Render:VisualEffects")
         self._render_visual_effects(dungeon)
+        perf.measure("Render:VisualEffects")
         
         # Render lightning bolts
+        perf.mark("Render:Lightning")
         self._render_lightning_bolts()
+        perf.measure("Render:Lightning")
         
         # Render damage numbers (on top)
+        perf.mark("Render:DamageNumbers")
         self._render_damage_numbers()
+        perf.measure("Render:DamageNumbers")
         
         perf.measure("Renderer")
     
@@ -520,7 +553,7 @@ class Renderer:
                 t = j / 11
                 if j >= len(stem_pts):
                     continue
-                    
+                
                 sx, sy = stem_pts[j]
                 leaflet_len = int(45 * size * (1 - t * 0.5))
                 
@@ -736,7 +769,7 @@ class Renderer:
                         cache_list.append(surf)
                         loaded += 1
                         break
-                        
+            
             except Exception as e:
                 print(f"Error loading {filepath}: {e}")
         
@@ -1539,20 +1572,28 @@ class Renderer:
         """Collect all entities that should be rendered."""
         entities = []
         
+        min_x, min_y, max_x, max_y = self.camera.get_visible_bounds()
+        tags = tag_index.flags
         for ent, (pos, sprite) in esper.get_components(Position, Sprite):
+            # Off-screen entities aren't drawn
+            if not (min_x <= pos.x <= max_x and min_y <= pos.y <= max_y):
+                continue
+            flags = tags.get(ent, 0)
+            
             # Skip dropped items and gold - they're rendered separately
-            if esper.has_component(ent, DroppedItem) or esper.has_component(ent, GoldDrop):
+            if flags & (DROPPED_ITEM | GOLD_DROP):
                 continue
             
             # Fog of war - hide enemies in unexplored areas
-            if esper.has_component(ent, Enemy):
+            if flags & ENEMY:
                 if not self.is_explored(int(pos.x), int(pos.y)):
                     continue
             
+            x, y = self.interpolator.position(ent, pos)
             entities.append((
                 ent,
-                pos.y + pos.x * 0.001,  # Sort key (y position, with x tiebreaker)
-                pos,
+                y + x * 0.001,  # Sort key (y position, with x tiebreaker)
+                (x, y),
                 sprite
             ))
         
@@ -1560,10 +1601,10 @@ class Renderer:
     
     def _render_entity(self, ent_data: Tuple):
         """Render a single entity."""
-        ent, _, pos, sprite = ent_data
+        ent, _, (x, y), sprite = ent_data
         
         # Get screen position (ground position)
-        ground_x, ground_y = self.camera.world_to_screen(pos.x, pos.y)
+        ground_x, ground_y = self.camera.world_to_screen(x, y)
         screen_x, screen_y = ground_x, ground_y
         
         # Track if entity is airborne for shadow
@@ -1604,8 +1645,9 @@ class Renderer:
         scaled = pygame.transform.scale(surf, (scaled_w, scaled_h))
         
         # Check if dead/downed
-        is_dead = esper.has_component(ent, Dead)
-        is_downed = esper.has_component(ent, Downed)
+        flags = tag_index.flags.get(ent, 0)
+        is_dead = bool(flags & DEAD)
+        is_downed = bool(flags & DOWNED)
         
         # Check if stunned
         is_stunned = False
@@ -1685,7 +1727,7 @@ class Renderer:
     def _render_projectiles(self):
         """Render spell projectiles."""
         for ent, (pos, proj) in esper.get_components(Position, Projectile):
-            screen_x, screen_y = self.camera.world_to_screen(pos.x, pos.y)
+            screen_x, screen_y = self.camera.world_to_screen(*self.interpolator.position(ent, pos))
             
             # Choose color based on damage type
             damage_type = proj.damage_type if proj.damage_type else "fire"
@@ -1741,7 +1783,7 @@ class Renderer:
     def _render_visual_effects(self, dungeon: Optional[Dungeon] = None):
         """Render visual effects (explosions, etc.)."""
         for ent, (pos, effect) in esper.get_components(Position, VisualEffect):
-            screen_x, screen_y = self.camera.world_to_screen(pos.x, pos.y)
+            screen_x, screen_y = self.camera.world_to_screen(*self.interpolator.position(ent, pos))
             
             effect_type = effect.effect_type if effect.effect_type else ""
             
@@ -1806,7 +1848,7 @@ class Renderer:
                             
                             self.screen.blit(tsurf, (tx - half_w, ty - half_h))
                 continue
-
+            
             # Standard particle rendering
             size = max(4, int(20 * self.camera.zoom))
             
@@ -1870,7 +1912,7 @@ class Renderer:
     def _render_damage_numbers(self):
         """Render floating damage numbers."""
         for ent, (pos, dmg) in esper.get_components(Position, DamageNumber):
-            screen_x, screen_y = self.camera.world_to_screen(pos.x, pos.y)
+            screen_x, screen_y = self.camera.world_to_screen(*self.interpolator.position(ent, pos))
             
             # Choose color based on damage type
             if dmg.is_heal:
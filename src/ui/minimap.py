@@ -9,6 +9,7 @@ from ..core.constants import (
     TILE_WIDTH, TILE_HEIGHT
 )
 from ..ecs.components import Position, PartyMember, Enemy, Selected, Dead
+from ..ecs.queries import query
 
 
 class Minimap:
@@ -112,7 +113,7 @@ class Minimap:
             return
         
         # Update explored tiles around party members
-        for ent, (pos, _) in esper.get_components(Position, PartyMember):
+        for ent, (pos, _) in query(Position, PartyMember):
             if not esper.has_component(ent, Dead):
                 self.update_explored(int(pos.x), int(pos.y))
         
@@ -168,14 +169,14 @@ class Minimap:
     def _render_entities(self):
         """Render entity markers on minimap (only in explored areas)."""
         # Draw enemies (only if in explored area)
-        for ent, (pos, _) in esper.get_components(Position, Enemy):
+        for ent, (pos, _) in query(Position, Enemy):
             if esper.has_component(ent, Dead):
                 continue
             if self.is_explored(int(pos.x), int(pos.y)):
                 self._draw_entity_marker(pos.x, pos.y, self.color_enemy, 2)
         
         # Draw party members (always visible)
-        for ent, (pos, member) in esper.get_components(Position, PartyMember):
+        for ent, (pos, member) in query(Position, PartyMember):
             is_selected = esper.has_component(ent, Selected)
             color = self.color_player if is_selected else self.color_ally
             size = 4 if is_selected else 3
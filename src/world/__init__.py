@@ -1,6 +1,8 @@
 """World management - dungeon generation and pathfinding."""
 
+from .tile_map import TileMap
 from .dungeon import Dungeon, Room
 from .pathfinding import Pathfinder
+from .map_context import MapContext
 
-__all__ = ['Dungeon', 'Room', 'Pathfinder']
+__all__ = ['TileMap', 'Dungeon', 'Room', 'Pathfinder', 'MapContext']
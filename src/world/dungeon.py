@@ -4,7 +4,10 @@ import random
 from typing import List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from ..core.constants import TileType
+from .tile_map import TileMap
 
 
 @dataclass
@@ -66,13 +69,11 @@ class FloorDecor:
     variant: int = 0
 
 
-class Dungeon:
+class Dungeon(TileMap):
     """Procedurally generated dungeon with rooms and corridors."""
     
     def __init__(self, width: int = 80, height: int = 80):
-        self.width = width
-        self.height = height
-        self.tiles = [[TileType.VOID for _ in range(width)] for _ in range(height)]
+        super().__init__(width, height)
         self.rooms: List[Room] = []
         self.spawn_points: List[Tuple[int, int]] = []
         self.decorations: List[Decoration] = []  # Void space decorations
@@ -109,8 +110,7 @@ class Dungeon:
         self.spawn_points.clear()
         
         # Fill with void
-        self.tiles = [[TileType.VOID for _ in range(self.width)] 
-                      for _ in range(self.height)]
+        self.clear()
         
         target_rooms = random.randint(min_rooms, max_rooms)
         attempts = 0
@@ -151,8 +151,8 @@ class Dungeon:
             self.stairs_up = start_room.center
             self.stairs_down = end_room.center
             
-            self.tiles[self.stairs_up[1]][self.stairs_up[0]] = TileType.STAIRS_UP
-            self.tiles[self.stairs_down[1]][self.stairs_down[0]] = TileType.STAIRS_DOWN
+            self.set_tile(*self.stairs_up, TileType.STAIRS_UP)
+            self.set_tile(*self.stairs_down, TileType.STAIRS_DOWN)
         
         # Generate spawn points (for enemies)
         self._generate_spawn_points()
@@ -166,10 +166,7 @@ class Dungeon:
     
     def _carve_room(self, room: Room):
         """Carve out a room."""
-        for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    self.tiles[y][x] = TileType.FLOOR
+        self.fill_rect(room.x, room.y, room.width, room.height, TileType.FLOOR)
     
     def _connect_rooms(self, room1: Room, room2: Room):
         """Connect two rooms with a corridor."""
@@ -186,15 +183,11 @@ class Dungeon:
     
     def _carve_h_tunnel(self, x1: int, x2: int, y: int):
         """Carve horizontal tunnel."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.tiles[y][x] = TileType.FLOOR
+        self.fill_rect(min(x1, x2), y, abs(x2 - x1) + 1, 1, TileType.FLOOR)
     
     def _carve_v_tunnel(self, y1: int, y2: int, x: int):
         """Carve vertical tunnel."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.tiles[y][x] = TileType.FLOOR
+        self.fill_rect(x, min(y1, y2), 1, abs(y2 - y1) + 1, TileType.FLOOR)
     
     def _generate_spawn_points(self):
         """Generate enemy spawn points per room (for room-based spawning)."""
@@ -411,55 +404,67 @@ class Dungeon:
                         variant=random.randint(0, 2)
                     ))
         
-        # Add some accent tiles to corridors too
-        for y in range(2, self.height - 2):
-            for x in range(2, self.width - 2):
-                if self.tiles[y][x] == TileType.FLOOR:
-                    # Check if in a corridor (narrow passage)
-                    in_room = any(
-                        room.x <= x < room.x + room.width and
-                        room.y <= y < room.y + room.height
-                        for room in self.rooms
-                    )
-                    if not in_room and random.random() < 0.03:
-                        self.floor_decor.append(FloorDecor(
-                            x=x, y=y,
-                            type='accent',
-                            width=1, height=1,
-                            variant=random.randint(0, 4)
-                        ))
+        # Add some accent tiles to corridors too (floor outside every room)
+        corridor = self.tiles == TileType.FLOOR.value
+        for room in self.rooms:
+            corridor[room.y:room.y + room.height, room.x:room.x + room.width] = False
+        inner = corridor[2:self.height - 2, 2:self.width - 2]
+        for x, y in self.positions_where(inner, 2, 2):
+            if random.random() < 0.03:
+                self.floor_decor.append(FloorDecor(
+                    x=x, y=y,
+                    type='accent',
+                    width=1, height=1,
+                    variant=random.randint(0, 4)
+                ))
+    
+    def _walkable_distances(self, radius: int) -> np.ndarray:
+        """Manhattan distance from every tile to the nearest walkable tile.
+        
+        Only walkable tiles within `radius` on both axes count; tiles with
+        none get 999. Done as a row pass then a column pass over shifted
+        copies of the map instead of scanning a window per tile.
+        """
+        far = 999
+        
+        def nearest(grid: np.ndarray, axis: int) -> np.ndarray:
+            """min over |d| <= radius of grid shifted by d along axis, plus |d|."""
+            best = grid.copy()
+            for d in range(1, radius + 1):
+                for shift in (d, -d):
+                    shifted = np.full_like(grid, far)
+                    if axis == 0:
+                        if shift > 0:
+                            shifted[:-shift] = grid[shift:]
+                        else:
+                            shifted[-shift:] = grid[:shift]
+                    else:
+                        if shift > 0:
+                            shifted[:, :-shift] = grid[:, shift:]
+                        else:
+                            shifted[:, -shift:] = grid[:, :shift]
+                    np.minimum(best, shifted + d, out=best)
+            return best
+        
+        dist = nearest(np.where(self.walkable, 0, far), axis=1)
+        dist = nearest(dist, axis=0)
+        dist[dist >= far] = far
+        return dist
     
     def _generate_decorations(self):
         """Generate decorative elements in void spaces around the dungeon."""
         self.decorations.clear()
         
         # Categorize void tiles by distance from walkable areas
-        near_tiles = []      # 2-4 tiles from floor (palms, ruins)
-        mid_tiles = []       # 5-8 tiles from floor (rocks, water)
-        far_tiles = []       # 9+ tiles (background rocks)
-        
-        for y in range(2, self.height - 2):
-            for x in range(2, self.width - 2):
-                if self.tiles[y][x] != TileType.VOID:
-                    continue
-                
-                # Find minimum distance to walkable
-                min_dist = 999
-                for dy in range(-12, 13):
-                    for dx in range(-12, 13):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            if self.tiles[ny][nx] in (TileType.FLOOR, TileType.DOOR,
-                                                      TileType.STAIRS_UP, TileType.STAIRS_DOWN):
-                                dist = abs(dx) + abs(dy)
-                                min_dist = min(min_dist, dist)
-                
-                if 2 <= min_dist <= 4:
-                    near_tiles.append((x, y))
-                elif 5 <= min_dist <= 8:
-                    mid_tiles.append((x, y))
-                elif 9 <= min_dist <= 15:
-                    far_tiles.append((x, y))
+        distances = self._walkable_distances(12)[2:self.height - 2, 2:self.width - 2]
+        void = self.tiles[2:self.height - 2, 2:self.width - 2] == TileType.VOID.value
+        
+        # 2-4 tiles from floor (palms, ruins)
+        near_tiles = self.positions_where(void & (distances >= 2) & (distances <= 4), 2, 2)
+        # 5-8 tiles from floor (rocks, water)
+        mid_tiles = self.positions_where(void & (distances >= 5) & (distances <= 8), 2, 2)
+        # 9+ tiles (background rocks)
+        far_tiles = self.positions_where(void & (distances >= 9) & (distances <= 15), 2, 2)
         
         # === PALM TREES (near walkable areas) ===
         random.shuffle(near_tiles)
@@ -561,15 +566,6 @@ class Dungeon:
                                                random.randint(0, 2)))
             plant_count += 1
     
-    def is_walkable(self, x: int, y: int) -> bool:
-        """Check if a tile is walkable."""
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
-        
-        tile = self.tiles[y][x]
-        return tile in (TileType.FLOOR, TileType.DOOR, 
-                       TileType.STAIRS_DOWN, TileType.STAIRS_UP)
-    
     def get_room_at(self, x: float, y: float) -> Optional[int]:
         """Get the index of the room containing this position, or None."""
         ix, iy = int(x), int(y)
@@ -594,12 +590,6 @@ class Dungeon:
         self.activated_rooms.add(room_index)
         return self.room_spawn_points.get(room_index, [])
     
-    def get_tile(self, x: int, y: int) -> TileType:
-        """Get tile type at position."""
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return TileType.VOID
-        return self.tiles[y][x]
-    
     def get_player_spawn(self) -> Tuple[float, float]:
         """Get the player spawn position (center of first room)."""
         if self.rooms:
@@ -700,10 +690,6 @@ class Dungeon:
         
         return True
     
-    def is_in_bounds(self, x: int, y: int) -> bool:
-        """Check if position is within dungeon bounds."""
-        return 0 <= x < self.width and 0 <= y < self.height
-    
     def clamp_position(self, x: float, y: float) -> Tuple[float, float]:
         """Clamp a position to valid walkable area.
         
@@ -0,0 +1,171 @@
+"""Flow fields - shared routes toward a target for any number of chasers.
+
+A FlowField is a Dijkstra search outward from one tile (same moves and
+costs as the Pathfinder, out to a radius). Every tile it reaches records
+its neighbour one step closer to the source, so a chaser anywhere in
+the field reads its next step with one dict lookup instead of running
+its own A*.
+
+FlowFields keeps one field per chase target (party member), rebuilt
+when the target has moved to another tile and the field is at least
+`interval` seconds old. Twelve enemies spawning into a room and chasing
+the same hero cost one field build, the same as one enemy.
+"""
+
+import heapq
+from typing import Dict, Optional, Tuple
+
+from ..core.constants import FLOW_FIELD_INTERVAL, FLOW_FIELD_RADIUS, FLOW_FIELD_LOOKAHEAD
+from ..core.perf_monitor import perf
+from .pathfinding import Pathfinder
+from .search_grid import SearchGrid, STRAIGHT_COST
+
+
+class FlowField:
+    """Next step toward one source tile from every tile within a radius."""
+    
+    def __init__(self, grid: SearchGrid, source: int, radius: int = FLOW_FIELD_RADIUS):
+        self.grid = grid
+        self.source = source
+        self.cost: Dict[int, int] = {}     # index -> cost to the source
+        self.toward: Dict[int, int] = {}   # index -> next index toward the source (-1 at it)
+        if grid.walk[source]:
+            self._build(radius * STRAIGHT_COST)
+    
+    def _build(self, max_cost: int):
+        """Dijkstra outward from the source (moves are symmetric)."""
+        walk = self.grid.walk
+        steps = self.grid.steps
+        cost = self.cost
+        toward = self.toward
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        cost[self.source] = 0
+        toward[self.source] = -1
+        heap = [(0, self.source)]
+        while heap:
+            base, current = heappop(heap)
+            if base > cost[current]:
+                continue
+            for offset, step_cost, corner_a, corner_b in steps:
+                n = current + offset
+                if not walk[n]:
+                    continue
+                if corner_a and not (walk[current + corner_a] and walk[current + corner_b]):
+                    continue
+                new_cost = base + step_cost
+                if new_cost > max_cost:
+                    continue
+                old = cost.get(n)
+                if old is None or new_cost < old:
+                    cost[n] = new_cost
+                    toward[n] = current
+                    heappush(heap, (new_cost, n))
+    
+    def __len__(self) -> int:
+        """Tiles the field reaches."""
+        return len(self.cost)
+    
+    def distance(self, x: int, y: int) -> Optional[int]:
+        """Path cost from a tile to the source, or None if out of reach."""
+        if not self.grid.contains(x, y):
+            return None
+        return self.cost.get(self.grid.index(x, y))
+    
+    def next_tile(self, x: int, y: int, lookahead: int = 1) -> Optional[Tuple[int, int]]:
+        """Tile to head for from (x, y), or None if out of reach.
+        
+        Follows the field up to `lookahead` steps and returns the farthest
+        tile still in a straight walkable line, so chasers cut across
+        rooms instead of zig-zagging tile by tile.
+        """
+        if not self.grid.contains(x, y):
+            return None
+        grid = self.grid
+        toward = self.toward
+        start = grid.index(x, y)
+        best = toward.get(start)
+        if best is None:
+            return None
+        if best < 0:
+            return (x, y)  # Already on the source tile
+        
+        current = best
+        for _ in range(lookahead - 1):
+            current = toward[current]
+            if current < 0:
+                break
+            cx, cy = grid.position(current)
+            if not grid.line_walkable(x, y, cx, cy):
+                break
+            best = current
+        return grid.position(best)
+
+
+class FlowFields:
+    """Flow fields toward chase targets for one map, rebuilt as targets move."""
+    
+    def __init__(self, pathfinder: Pathfinder, interval: float = FLOW_FIELD_INTERVAL,
+                 radius: int = FLOW_FIELD_RADIUS, lookahead: int = FLOW_FIELD_LOOKAHEAD):
+        self.pathfinder = pathfinder
+        self.interval = interval
+        self.radius = radius
+        self.lookahead = lookahead
+        self._fields: Dict[int, Tuple[FlowField, float]] = {}  # target -> (field, built at)
+        self._last_used: Dict[int, float] = {}                 # target -> last request time
+        
+        # Metrics
+        self.builds = 0
+        self.lookups = 0
+    
+    def field(self, target: int, x: int, y: int, now: float) -> FlowField:
+        """Field toward a target standing on tile (x, y).
+        
+        Reuses the target's field unless the map changed, or the target
+        changed tiles and the field is older than the interval.
+        """
+        grid = self.pathfinder.grid
+        self._last_used[target] = now
+        entry = self._fields.get(target)
+        if entry is not None:
+            field, built_at = entry
+            if field.grid is grid and (
+                field.source == grid.index(x, y) or now - built_at < self.interval
+            ):
+                return field
+        
+        field = FlowField(grid, grid.index(x, y), self.radius)
+        self._fields[target] = (field, now)
+        self.builds += 1
+        perf.count("FlowField:build")
+        self._prune(now)
+        return field
+    
+    def next_step(self, target: int, target_x: float, target_y: float,
+                  x: float, y: float, now: float) -> Optional[Tuple[float, float]]:
+        """Point a chaser at (x, y) should head for, or None if out of reach.
+        
+        Returns the target position itself once the chaser shares its tile.
+        """
+        self.lookups += 1
+        tx, ty = int(target_x), int(target_y)
+        if not self.pathfinder.dungeon.is_walkable(tx, ty):
+            return None
+        tile = self.field(target, tx, ty, now).next_tile(int(x), int(y), self.lookahead)
+        if tile is None:
+            return None
+        if tile == (tx, ty):
+            return (target_x, target_y)
+        return (tile[0] + 0.5, tile[1] + 0.5)
+    
+    def _prune(self, now: float):
+        """Drop fields nobody asked for in a while (dead or departed targets)."""
+        stale = now - self.interval * 10
+        for target in [t for t, used in self._last_used.items() if used < stale]:
+            del self._fields[target]
+            del self._last_used[target]
+    
+    def stats(self) -> dict:
+        """Field builds vs lookups."""
+        return {"builds": self.builds, "lookups": self.lookups, "fields": len(self._fields)}
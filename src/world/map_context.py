@@ -0,0 +1,103 @@
+"""Map context - the one place processors look up which map is active.
+
+The party is either in the current dungeon level or in town. Processors
+hold a reference to a shared MapContext and read `active` instead of
+each keeping its own map reference, so switching maps is one assignment.
+
+Per-map derived data (pathfinders, walkability grids, spatial indexes)
+is cached per map object via derived(). A town visit doesn't throw away
+the dungeon's caches. Entries are dropped automatically once the map
+itself is gone.
+"""
+
+import weakref
+from typing import Any, Callable, Optional
+
+from .flow_field import FlowFields
+from .path_requests import PathRequests
+from .pathfinding import Pathfinder
+
+
+class MapContext:
+    """Shared reference to the current dungeon and the active map."""
+    
+    def __init__(self, dungeon=None):
+        self.dungeon = dungeon  # Current dungeon level
+        self.active = dungeon   # Map the party is on (dungeon or town)
+        self._derived = weakref.WeakKeyDictionary()  # map -> {key: value}
+    
+    @property
+    def in_town(self) -> bool:
+        """True while the party is on a map other than the dungeon."""
+        return self.active is not None and self.active is not self.dungeon
+    
+    def set_dungeon(self, dungeon):
+        """Switch to a new dungeon level (the active map follows unless in town).
+        
+        Also called after regenerating the current dungeon in place, so any
+        data derived from its old layout is dropped.
+        """
+        in_town = self.in_town
+        self.dungeon = dungeon
+        if not in_town:
+            self.active = dungeon
+        if dungeon is not None:
+            self.invalidate(dungeon)
+            # Build the room graph with the level, not on its first long path
+            self.derived("pathfinder", Pathfinder, dungeon).room_graph
+    
+    def enter_town(self, town_map):
+        """Make the town the active map."""
+        self.active = town_map
+    
+    def leave_town(self):
+        """Make the dungeon the active map again."""
+        self.active = self.dungeon
+    
+    def derived(self, key: str, factory: Callable[[Any], Any], game_map=None) -> Any:
+        """Get (or build once) data derived from a map.
+        
+        Args:
+            key: Name of the derived data, e.g. "pathfinder"
+            factory: Called with the map to build the data on first use
+            game_map: Map to look up (defaults to the active map)
+        """
+        game_map = self.active if game_map is None else game_map
+        if game_map is None:
+            return None
+        cache = self._derived.get(game_map)
+        if cache is None:
+            cache = self._derived[game_map] = {}
+        if key not in cache:
+            cache[key] = factory(game_map)
+        return cache[key]
+    
+    def invalidate(self, game_map=None, key: Optional[str] = None):
+        """Drop derived data for a map (after its tiles change)."""
+        game_map = self.active if game_map is None else game_map
+        cache = self._derived.get(game_map)
+        if cache is None:
+            return
+        if key is None:
+            cache.clear()
+        else:
+            cache.pop(key, None)
+    
+    @property
+    def pathfinder(self) -> Optional[Pathfinder]:
+        """Pathfinder for the active map."""
+        return self.derived("pathfinder", Pathfinder)
+    
+    @property
+    def flow_fields(self) -> Optional[FlowFields]:
+        """Flow fields toward chase targets on the active map."""
+        return self.derived("flow_fields", lambda game_map: FlowFields(
+            self.derived("pathfinder", Pathfinder, game_map)
+        ))
+    
+    @property
+    def path_requests(self) -> Optional[PathRequests]:
+        """Time-sliced path requests on the active map."""
+        return self.derived("path_requests", lambda game_map: PathRequests(
+            self.derived("pathfinder", Pathfinder, game_map)
+        ))
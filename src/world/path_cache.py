@@ -0,0 +1,120 @@
+"""Path cache - recent routes by start tile, goal tile and map revision.
+
+Enemies chasing the same hero and allies following the leader ask for
+nearly the same routes every AI decision tick. The cache keeps the most
+recently used routes (LRU, bounded) with their simplified waypoints:
+
+- Same start and goal tile: the waypoints come straight back.
+- Start tile lies on a cached route to the same goal: the rest of that
+  route is a shortest path too, so it's reused without searching (only
+  the simplification is redone).
+
+Routes are keyed by the map revision they were searched on, so writing
+tiles makes every cached route miss. The owning Pathfinder also clears
+the cache when it rebuilds its grid.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..core.constants import PATH_CACHE_SIZE
+from ..core.perf_monitor import perf
+
+
+class _Route:
+    """A cached route: flat tile indexes and simplified waypoints."""
+    
+    __slots__ = ("tiles", "waypoints", "_offsets")
+    
+    def __init__(self, tiles: List[int], waypoints: List[Tuple[float, float]]):
+        self.tiles = tiles
+        self.waypoints = waypoints
+        self._offsets: Optional[Dict[int, int]] = None
+    
+    def offset(self, tile: int) -> Optional[int]:
+        """Position of a tile along the route (index built on first use)."""
+        if self._offsets is None:
+            self._offsets = {t: i for i, t in enumerate(self.tiles)}
+        return self._offsets.get(tile)
+
+
+class PathCache:
+    """Bounded LRU cache of routes with hit/miss counters."""
+    
+    def __init__(self, capacity: int = PATH_CACHE_SIZE):
+        self.capacity = capacity
+        self._routes: "OrderedDict[tuple, _Route]" = OrderedDict()  # (start, goal, revision)
+        self._by_goal: Dict[tuple, Dict[tuple, _Route]] = {}        # (goal, revision) -> routes
+        
+        # Metrics
+        self.hits = 0          # Exact start/goal matches
+        self.subpath_hits = 0  # Served from part of a longer route
+        self.misses = 0        # Needed a search
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._routes)
+    
+    def get(self, start: int, goal: int, revision) -> Optional[List[Tuple[float, float]]]:
+        """Waypoints cached for exactly this start and goal, or None."""
+        key = (start, goal, revision)
+        route = self._routes.get(key)
+        if route is None:
+            return None
+        self._routes.move_to_end(key)
+        self.hits += 1
+        perf.count("PathCache:hit")
+        return route.waypoints
+    
+    def subpath(self, start: int, goal: int, revision) -> Optional[List[int]]:
+        """Rest of a cached route to goal that passes through start, or None.
+        
+        Counts a miss when nothing matches (the caller searches next).
+        """
+        routes = self._by_goal.get((goal, revision))
+        if routes:
+            for key, route in routes.items():
+                offset = route.offset(start)
+                if offset is not None:
+                    self._routes.move_to_end(key)
+                    self.subpath_hits += 1
+                    perf.count("PathCache:subpath")
+                    return route.tiles[offset:]
+        self.misses += 1
+        perf.count("PathCache:miss")
+        return None
+    
+    def put(self, start: int, goal: int, revision, tiles: List[int],
+            waypoints: List[Tuple[float, float]]):
+        """Cache a complete route, evicting the least recently used if full."""
+        key = (start, goal, revision)
+        route = _Route(tiles, waypoints)
+        self._routes[key] = route
+        self._routes.move_to_end(key)
+        self._by_goal.setdefault((goal, revision), {})[key] = route
+        while len(self._routes) > self.capacity:
+            old_key, _ = self._routes.popitem(last=False)
+            goal_key = old_key[1:]
+            routes = self._by_goal[goal_key]
+            del routes[old_key]
+            if not routes:
+                del self._by_goal[goal_key]
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop every route (counters stay)."""
+        self._routes.clear()
+        self._by_goal.clear()
+    
+    def stats(self) -> dict:
+        """Hit/miss counts, hit rate and size."""
+        lookups = self.hits + self.subpath_hits + self.misses
+        return {
+            "lookups": lookups,
+            "hits": self.hits,
+            "subpath_hits": self.subpath_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.subpath_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self._routes),
+        }
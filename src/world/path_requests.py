@@ -0,0 +1,245 @@
+"""Path requests - time-sliced pathfinding with a per-tick node budget.
+
+A synchronous find_path() does its whole search inside the caller's
+step, so one expensive query holds up the fixed step for everyone.
+Callers here submit a request for an entity instead and pick the path
+up on a later tick:
+
+    requests.submit(ent, pos.x, pos.y, goal_x, goal_y)
+    ...
+    requests.update()             # Once per tick - spends the budget
+    path = requests.result(ent)   # Waypoints (possibly []), or None if not ready
+
+update() works through the queue in order, advancing one search at a
+time until `budget` tiles have been expanded this tick; a search that
+runs out of budget carries on from where it stopped next tick. Cache
+hits and goals in another region finish at once for one tile of budget
+each, and far-apart tiles go through the room graph like find_path()
+does, paying for the tiles and graph nodes it expands.
+
+An entity has at most one pending request. Submitting again toward the
+same goal tile keeps the request (and its progress) but moves its start
+to where the entity is now; a finished path then starts from there, at
+the furthest waypoint in sight. A different goal replaces the request
+in place, so a unit changing its mind doesn't lose its spot in the
+queue. A result is kept until the entity collects it, cancels, submits
+again, or PATH_RESULT_TTL ticks pass (units only look on decision
+ticks, and dead ones never do).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from ..core.constants import PATH_REQUEST_BUDGET, PATH_RESULT_TTL
+from ..core.perf_monitor import perf
+from .path_search import PathSearch
+from .pathfinding import Pathfinder
+from .search_grid import SearchGrid
+
+
+class _Request:
+    """One entity's pending path request."""
+    
+    __slots__ = ("start_x", "start_y", "goal_x", "goal_y", "goal_tile", "submitted", "search")
+    
+    def __init__(self, start_x: float, start_y: float, goal_x: float, goal_y: float, tick: int):
+        self.start_x = start_x
+        self.start_y = start_y
+        self.goal_x = goal_x
+        self.goal_y = goal_y
+        self.goal_tile = (int(goal_x), int(goal_y))
+        self.submitted = tick
+        self.search: Optional[PathSearch] = None
+
+
+class PathRequests:
+    """Queue of per-entity path requests served under a node budget per tick."""
+    
+    def __init__(self, pathfinder: Pathfinder, budget: int = PATH_REQUEST_BUDGET,
+                 ttl: int = PATH_RESULT_TTL):
+        self.pathfinder = pathfinder
+        self.budget = budget
+        self.ttl = ttl
+        self.tick = 0
+        self._pending: Dict[int, _Request] = {}  # ent -> request, in queue order
+        self._results: Dict[int, Tuple[List[Tuple[float, float]], int]] = {}  # ent -> (path, tick)
+        
+        # Metrics
+        self.submitted = 0
+        self.replaced = 0       # Pending requests superseded by a new goal
+        self.completed = 0
+        self.expired = 0        # Results nobody collected
+        self.nodes = 0          # Tiles expanded across all searches
+        self.max_depth = 0
+        self.total_latency = 0  # Ticks from submit to result, summed
+        self.max_latency = 0
+    
+    @property
+    def depth(self) -> int:
+        """Requests waiting or in progress."""
+        return len(self._pending)
+    
+    def submit(self, ent: int, start_x: float, start_y: float, goal_x: float, goal_y: float):
+        """Ask for a path for an entity (replaces its pending request if the goal moved)."""
+        if self._results.pop(ent, None) is not None:
+            self.expired += 1
+        request = self._pending.get(ent)
+        if request is not None:
+            if request.goal_tile == (int(goal_x), int(goal_y)):
+                request.start_x, request.start_y = start_x, start_y
+                request.goal_x, request.goal_y = goal_x, goal_y
+                return
+            self.replaced += 1
+        self._pending[ent] = _Request(start_x, start_y, goal_x, goal_y, self.tick)
+        self.submitted += 1
+        self.max_depth = max(self.max_depth, len(self._pending))
+    
+    def pending(self, ent: int) -> bool:
+        """True if the entity has a request waiting or in progress."""
+        return ent in self._pending
+    
+    def cancel(self, ent: int):
+        """Forget an entity's pending request and uncollected result."""
+        self._pending.pop(ent, None)
+        self._results.pop(ent, None)
+    
+    def result(self, ent: int) -> Optional[List[Tuple[float, float]]]:
+        """Collect a finished path: waypoints ([] if unreachable), or None if not ready."""
+        result = self._results.pop(ent, None)
+        return None if result is None else result[0]
+    
+    def update(self):
+        """Advance queued searches until this tick's budget is spent."""
+        self.tick += 1
+        results = self._results
+        if results:
+            oldest = self.tick - self.ttl
+            stale = [ent for ent, (_, tick) in results.items() if tick < oldest]
+            for ent in stale:
+                del results[ent]
+            self.expired += len(stale)
+        
+        budget = self.budget
+        pending = self._pending
+        while pending and budget > 0:
+            ent = next(iter(pending))
+            request = pending[ent]
+            path, used = self._advance(request, budget)
+            budget -= used
+            self.nodes += used
+            perf.count("PathRequests:nodes", used)
+            if path is None:
+                break  # Out of budget mid-search - carry on next tick
+            del pending[ent]
+            results[ent] = (path, self.tick)
+            latency = self.tick - request.submitted
+            self.completed += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+    
+    def _advance(self, request: _Request, budget: int) -> Tuple[Optional[List[Tuple[float, float]]], int]:
+        """Work on a request.
+        
+        Returns:
+            (path once finished or None, tiles expanded)
+        """
+        pathfinder = self.pathfinder
+        grid = pathfinder.grid
+        used = 0
+        if request.search is None or request.search.grid is not grid:
+            # New request, or the map changed under its search
+            path, used = self._start(request, grid)
+            if path is not None:
+                return path, used
+        
+        search = request.search
+        used += search.advance(budget - used)
+        if not search.done:
+            return None, used
+        route = search.route()
+        if not route:
+            return [], used
+        waypoints = pathfinder._waypoints(grid, search.start, search.goal, route)
+        path = self._from_current(request, grid, search.start, waypoints)
+        if path is None:
+            request.search = None  # Wandered out of sight of the route - search again
+            return None, used
+        path[-1] = (request.goal_x, request.goal_y)
+        return path, used
+    
+    def _from_current(self, request: _Request, grid: SearchGrid, start: int,
+                      waypoints: List[Tuple[float, float]]) -> Optional[List[Tuple[float, float]]]:
+        """Waypoints from the entity's latest start tile (it kept moving while the search ran).
+        
+        Skips ahead to the furthest waypoint in a straight line from there,
+        or returns None if none is.
+        """
+        sx, sy = int(request.start_x), int(request.start_y)
+        if not grid.contains(sx, sy):
+            return None
+        if grid.index(sx, sy) == start:
+            return list(waypoints)
+        for i in range(len(waypoints) - 1, 0, -1):
+            wx, wy = waypoints[i]
+            if grid.line_walkable(sx, sy, int(wx), int(wy)):
+                return [(sx + 0.5, sy + 0.5)] + list(waypoints[i:])
+        return None
+    
+    def _start(self, request: _Request,
+               grid: SearchGrid) -> Tuple[Optional[List[Tuple[float, float]]], int]:
+        """Answer a request without a flat search if possible, else set up its search.
+        
+        Answers cost at least one tile of budget, plus whatever the room
+        graph expanded, so a tick of cache hits or long routes is bounded
+        like a tick of searches.
+        
+        Returns:
+            (path if answered or None, tiles expanded)
+        """
+        pathfinder = self.pathfinder
+        sx, sy = int(request.start_x), int(request.start_y)
+        gx, gy = request.goal_tile
+        if not (grid.contains(sx, sy) and grid.contains(gx, gy)) or not grid.walk[grid.index(gx, gy)]:
+            return [], 1
+        if (sx, sy) == (gx, gy):
+            return [(request.goal_x, request.goal_y)], 1
+        
+        start, goal = grid.index(sx, sy), grid.index(gx, gy)
+        if grid.walk[start] and not grid.connected(start, goal):
+            return [], 1
+        revision = pathfinder.revision
+        waypoints = pathfinder.cache.get(start, goal, revision)
+        used = 1
+        if waypoints is None:
+            route = pathfinder.cache.subpath(start, goal, revision)
+            if route is not None:
+                waypoints = pathfinder._waypoints(grid, start, goal, route)
+        if waypoints is None:
+            room_graph = pathfinder.room_graph
+            before = room_graph.expanded if room_graph is not None else 0
+            route = pathfinder._long_route(grid, start, goal)
+            if route is not None:
+                used += room_graph.expanded - before
+                if not route:
+                    return [], used
+                waypoints = pathfinder._waypoints(grid, start, goal, route)
+        if waypoints is not None:
+            path = list(waypoints)
+            path[-1] = (request.goal_x, request.goal_y)
+            return path, used
+        
+        request.search = PathSearch(grid, start, goal)
+        return None, 0
+    
+    def stats(self) -> dict:
+        """Queue depth, latency (in ticks) and work done."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "replaced": self.replaced,
+            "expired": self.expired,
+            "nodes": self.nodes,
+            "mean_latency": self.total_latency / self.completed if self.completed else 0.0,
+            "max_latency": self.max_latency,
+        }
@@ -0,0 +1,99 @@
+"""Path search - an A* search that can be paused and resumed.
+
+Pathfinder._search runs to completion inside one call. PathSearch keeps
+its open list, costs and parents on the instance instead, so a caller
+can expand a few hundred tiles, do something else, and carry on later
+(see path_requests.py, which interleaves many of them under a budget).
+"""
+
+import heapq
+from typing import Dict, List
+
+from .search_grid import SearchGrid, octile
+
+
+class PathSearch:
+    """A* that can stop after any number of expansions and carry on later.
+    
+    Same moves, costs and tie-breaking as Pathfinder._search, with its
+    own state so other searches can run in between.
+    """
+    
+    def __init__(self, grid: SearchGrid, start: int, goal: int):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.done = False
+        self.found = False
+        self.expanded = 0
+        
+        self._goal_y, self._goal_x = divmod(goal, grid.stride)
+        start_y, start_x = divmod(start, grid.stride)
+        h = octile(start_x - self._goal_x, start_y - self._goal_y)
+        self._g: Dict[int, int] = {start: 0}
+        self._parent: Dict[int, int] = {start: -1}
+        self._closed = set()
+        self._open = [(h, h, start)]
+    
+    def advance(self, budget: int) -> int:
+        """Expand up to budget tiles; returns how many were expanded."""
+        walk = self.grid.walk
+        steps = self.grid.steps
+        stride = self.grid.stride
+        goal = self.goal
+        goal_x, goal_y = self._goal_x, self._goal_y
+        g = self._g
+        parent = self._parent
+        closed = self._closed
+        open_heap = self._open
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        used = 0
+        while open_heap and used < budget:
+            _, h, current = heappop(open_heap)
+            if current in closed:
+                continue
+            if current == goal:
+                self.done = self.found = True
+                break
+            used += 1
+            closed.add(current)
+            
+            base = g[current]
+            for offset, cost, corner_a, corner_b in steps:
+                n = current + offset
+                if not walk[n] or n in closed:
+                    continue
+                if corner_a and not (walk[current + corner_a] and walk[current + corner_b]):
+                    continue
+                new_g = base + cost
+                if new_g >= g.get(n, new_g + 1):
+                    continue
+                g[n] = new_g
+                parent[n] = current
+                
+                dy, dx = divmod(n, stride)
+                dx = abs(dx - goal_x)
+                dy = abs(dy - goal_y)
+                h = 10 * dx + 4 * dy if dx > dy else 10 * dy + 4 * dx  # octile()
+                heappush(open_heap, (new_g + h, h, n))
+        else:
+            if not open_heap:
+                self.done = True  # No path
+        
+        self.expanded += used
+        return used
+    
+    def route(self) -> List[int]:
+        """Flat indexes from start to goal (empty unless found)."""
+        if not self.found:
+            return []
+        parent = self._parent
+        route = []
+        index = self.goal
+        while index >= 0:
+            route.append(index)
+            index = parent[index]
+        route.reverse()
+        return route
@@ -1,36 +1,86 @@
-"""A* Pathfinding implementation."""
+"""A* pathfinding on flat tile indexes.
 
-import heapq
-from typing import List, Tuple, Optional, Set
-from dataclasses import dataclass, field
+Searches run on a SearchGrid (see search_grid.py): integer step costs
+and an admissible octile heuristic, so paths are shortest paths.
+Per-tile search state lives in lists sized to the map and reused
+between searches; a search stamp marks which entries belong to the
+current search, so nothing is cleared per call.
+
+A goal in another connected region than the start is rejected without
+searching. An explicit cap (max_iterations) bounds the work; a capped
+search returns the path to the tile it got closest to.
+
+Complete routes are kept in a PathCache (see path_cache.py), and long
+routes across a dungeon go through its RoomGraph (see room_graph.py)
+instead of a flat search. Two flat engines give the same path costs:
+"astar", plain A*, and "jps", Jump Point Search (see jump_point.py).
+"""
 
+import heapq
+from typing import List, Optional, Tuple
 
-@dataclass(order=True)
-class Node:
-    """Pathfinding node."""
-    f_cost: float
-    g_cost: float = field(compare=False)
-    x: int = field(compare=False)
-    y: int = field(compare=False)
-    parent: Optional['Node'] = field(compare=False, default=None)
+from ..core.constants import ROOM_GRAPH_MIN_DISTANCE, PATH_ENGINE
+from ..core.perf_monitor import perf
+from .jump_point import jump_search, expand_jumps
+from .path_cache import PathCache
+from .search_grid import SearchGrid, STRAIGHT_COST, octile
 
 
 class Pathfinder:
     """A* pathfinding for the dungeon."""
     
-    DIRECTIONS = [
-        (0, -1),   # Up
-        (0, 1),    # Down
-        (-1, 0),   # Left
-        (1, 0),    # Right
-        (-1, -1),  # Up-left
-        (1, -1),   # Up-right
-        (-1, 1),   # Down-left
-        (1, 1),    # Down-right
-    ]
+    ENGINES = ("astar", "jps")
     
-    def __init__(self, dungeon):
+    def __init__(self, dungeon, hierarchical: bool = True, engine: str = PATH_ENGINE):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown path engine: {engine}")
         self.dungeon = dungeon
+        self.hierarchical = hierarchical  # Long routes through the room graph
+        self.engine = engine              # Flat search: "astar" or "jps"
+        self._grid: Optional[SearchGrid] = None
+        self._grid_revision = None
+        self._room_graph = None
+        self.cache = PathCache()
+        
+        # Per-index search state, valid where stamp == the current search
+        self._search_id = 0
+        self._g: List[int] = []
+        self._parent: List[int] = []
+        self._stamp: List[int] = []
+        self._closed: List[int] = []
+    
+    @property
+    def grid(self) -> SearchGrid:
+        """Search grid for the map's current layout (rebuilt when tiles change)."""
+        revision = getattr(self.dungeon, "revision", None)
+        if self._grid is None or revision != self._grid_revision:
+            self._grid = SearchGrid(self.dungeon)
+            self._grid_revision = revision
+            size = self._grid.size
+            self._g = [0] * size
+            self._parent = [-1] * size
+            self._stamp = [0] * size
+            self._closed = [0] * size
+            self._search_id = 0
+            self._room_graph = None
+            self.cache.clear()
+        return self._grid
+    
+    @property
+    def revision(self):
+        """Map revision the current grid was built for (rebuilds the grid if stale)."""
+        self.grid
+        return self._grid_revision
+    
+    @property
+    def room_graph(self):
+        """RoomGraph for the current layout, or None if the map has no rooms."""
+        grid = self.grid
+        if self._room_graph is None and getattr(self.dungeon, "rooms", None):
+            from .room_graph import RoomGraph
+            self._room_graph = RoomGraph(grid, self.dungeon.rooms)
+            perf.count("RoomGraph:build")
+        return self._room_graph
     
     def find_path(
         self,
@@ -38,17 +88,19 @@ class Pathfinder:
         start_y: float,
         goal_x: float,
         goal_y: float,
-        max_iterations: int = 1000
+        max_iterations: Optional[int] = None
     ) -> List[Tuple[float, float]]:
         """Find path from start to goal.
         
         Args:
             start_x, start_y: Starting position (float)
             goal_x, goal_y: Goal position (float)
-            max_iterations: Maximum search iterations
+            max_iterations: Maximum nodes to expand - tiles for A*, jump
+                points for JPS (None = no limit)
         
         Returns:
-            List of waypoints as (x, y) tuples, or empty if no path
+            List of waypoints as (x, y) tuples, or empty if no path. If
+            the cap is hit, the path ends at the closest tile reached.
         """
         # Convert to tile coordinates
         sx, sy = int(start_x), int(start_y)
@@ -61,106 +113,164 @@ class Pathfinder:
         if sx == gx and sy == gy:
             return [(goal_x, goal_y)]
         
-        # A* algorithm
-        open_set = []
-        closed_set: Set[Tuple[int, int]] = set()
+        grid = self.grid
+        if not (0 <= sx < self.dungeon.width and 0 <= sy < self.dungeon.height):
+            return []
+        start = grid.index(sx, sy)
+        goal = grid.index(gx, gy)
+        revision = self._grid_revision
+        
+        waypoints = self.cache.get(start, goal, revision)
+        if waypoints is None:
+            route = self.cache.subpath(start, goal, revision)
+            if route is None:
+                route = self._long_route(grid, start, goal)
+            if route is None:
+                route = self._route(grid, start, goal, max_iterations)
+            if not route:
+                return []
+            waypoints = self._waypoints(grid, start, goal, route)
+            if route[-1] != goal:
+                return waypoints  # Capped - ends at the closest tile reached
         
-        start_node = Node(
-            f_cost=self._heuristic(sx, sy, gx, gy),
-            g_cost=0,
-            x=sx,
-            y=sy
-        )
-        heapq.heappush(open_set, start_node)
+        # Exact goal for the last point
+        path = list(waypoints)
+        path[-1] = (goal_x, goal_y)
+        return path
+    
+    def find_tile_path(self, sx: int, sy: int, gx: int, gy: int,
+                       max_iterations: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Shortest tile path from start to goal, both ends included.
         
-        # Track best g_cost to each position
-        g_costs = {(sx, sy): 0}
+        Returns:
+            Tiles in order, or empty if the goal can't be reached
+        """
+        grid = self.grid
+        dungeon = self.dungeon
+        if not (0 <= sx < dungeon.width and 0 <= sy < dungeon.height
+                and dungeon.is_walkable(gx, gy)):
+            return []
+        route = self._route(grid, grid.index(sx, sy), grid.index(gx, gy), max_iterations)
+        return [grid.position(i) for i in route]
+    
+    def _waypoints(self, grid: SearchGrid, start: int, goal: int,
+                   route: List[int]) -> List[Tuple[float, float]]:
+        """Simplified tile-center waypoints for a route, cached if it reaches the goal."""
+        stride = grid.stride
+        waypoints = self._simplify_path([
+            (i % stride - 0.5, i // stride - 0.5) for i in route
+        ])
+        if route[-1] == goal:
+            self.cache.put(start, goal, self._grid_revision, route, waypoints)
+        return waypoints
+    
+    def _long_route(self, grid: SearchGrid, start: int, goal: int) -> Optional[List[int]]:
+        """Route through the room graph for far-apart tiles, else None."""
+        if not self.hierarchical:
+            return None
+        start_y, start_x = divmod(start, grid.stride)
+        goal_y, goal_x = divmod(goal, grid.stride)
+        if octile(start_x - goal_x, start_y - goal_y) < ROOM_GRAPH_MIN_DISTANCE * STRAIGHT_COST:
+            return None
+        room_graph = self.room_graph
+        if room_graph is None:
+            return None
+        route = room_graph.route(start, goal)
+        if route is not None:
+            perf.count("RoomGraph:route")
+        return route
+    
+    def _route(self, grid: SearchGrid, start: int, goal: int,
+               max_iterations: Optional[int]) -> List[int]:
+        """Flat indexes from start to goal (or the closest tile if capped)."""
+        # A start inside a wall can still step out, so only check regions from the floor
+        if grid.walk[start] and not grid.connected(start, goal):
+            return []
         
-        iterations = 0
+        if self.engine == "jps":
+            end = jump_search(self, grid, start, goal, max_iterations)
+        else:
+            end = self._search(grid, start, goal, max_iterations)
+        if end < 0:
+            return []
         
-        while open_set and iterations < max_iterations:
-            iterations += 1
-            
-            current = heapq.heappop(open_set)
-            
-            if current.x == gx and current.y == gy:
-                # Found path!
-                return self._reconstruct_path(current, goal_x, goal_y)
-            
-            if (current.x, current.y) in closed_set:
+        parent = self._parent
+        route = []
+        while end >= 0:
+            route.append(end)
+            end = parent[end]
+        route.reverse()
+        if self.engine == "jps":
+            route = expand_jumps(grid, route)
+        return route
+    
+    def _search(self, grid: SearchGrid, start: int, goal: int,
+                max_iterations: Optional[int]) -> int:
+        """A* from start toward goal.
+        
+        Returns:
+            goal, the closest expanded index if capped, or -1 if no path
+        """
+        self._search_id += 1
+        search_id = self._search_id
+        walk = grid.walk
+        steps = grid.steps
+        stride = grid.stride
+        g = self._g
+        parent = self._parent
+        stamp = self._stamp
+        closed = self._closed
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        goal_y, goal_x = divmod(goal, stride)
+        start_y, start_x = divmod(start, stride)
+        h = octile(start_x - goal_x, start_y - goal_y)
+        g[start] = 0
+        parent[start] = -1
+        stamp[start] = search_id
+        # (f, h, index) - ties go to the entry closer to the goal
+        open_heap = [(h, h, start)]
+        
+        budget = -1 if max_iterations is None else max_iterations
+        closest, closest_h = start, h
+        
+        while open_heap:
+            _, h, current = heappop(open_heap)
+            if closed[current] == search_id:
                 continue
+            if current == goal:
+                return goal
+            if budget == 0:
+                perf.count("Pathfinder:capped")
+                return closest
+            budget -= 1
+            closed[current] = search_id
+            if h < closest_h:
+                closest, closest_h = current, h
             
-            closed_set.add((current.x, current.y))
-            
-            # Check neighbors
-            for dx, dy in self.DIRECTIONS:
-                nx, ny = current.x + dx, current.y + dy
-                
-                if (nx, ny) in closed_set:
+            base = g[current]
+            for offset, cost, corner_a, corner_b in steps:
+                n = current + offset
+                if not walk[n] or closed[n] == search_id:
                     continue
-                
-                if not self.dungeon.is_walkable(nx, ny):
+                if corner_a and not (walk[current + corner_a] and walk[current + corner_b]):
                     continue
-                
-                # Diagonal movement check - make sure we can cut corner
-                if dx != 0 and dy != 0:
-                    if not self.dungeon.is_walkable(current.x + dx, current.y):
-                        continue
-                    if not self.dungeon.is_walkable(current.x, current.y + dy):
-                        continue
-                
-                # Calculate costs
-                move_cost = 1.414 if (dx != 0 and dy != 0) else 1.0
-                new_g = current.g_cost + move_cost
-                
-                # Check if this is a better path
-                if (nx, ny) in g_costs and new_g >= g_costs[(nx, ny)]:
+                new_g = base + cost
+                if stamp[n] == search_id and new_g >= g[n]:
                     continue
+                stamp[n] = search_id
+                g[n] = new_g
+                parent[n] = current
                 
-                g_costs[(nx, ny)] = new_g
-                f_cost = new_g + self._heuristic(nx, ny, gx, gy)
-                
-                neighbor = Node(
-                    f_cost=f_cost,
-                    g_cost=new_g,
-                    x=nx,
-                    y=ny,
-                    parent=current
-                )
-                heapq.heappush(open_set, neighbor)
+                dy, dx = divmod(n, stride)
+                dx = abs(dx - goal_x)
+                dy = abs(dy - goal_y)
+                h = 10 * dx + 4 * dy if dx > dy else 10 * dy + 4 * dx  # octile()
+                heappush(open_heap, (new_g + h, h, n))
         
         # No path found
-        return []
-    
-    def _heuristic(self, x1: int, y1: int, x2: int, y2: int) -> float:
-        """Euclidean distance heuristic."""
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        return ((dx ** 2) + (dy ** 2)) ** 0.5
-    
-    def _reconstruct_path(
-        self,
-        end_node: Node,
-        goal_x: float,
-        goal_y: float
-    ) -> List[Tuple[float, float]]:
-        """Reconstruct path from end node."""
-        path = []
-        current = end_node
-        
-        while current is not None:
-            # Center of tile
-            path.append((float(current.x) + 0.5, float(current.y) + 0.5))
-            current = current.parent
-        
-        path.reverse()
-        
-        # Replace last point with exact goal
-        if path:
-            path[-1] = (goal_x, goal_y)
-        
-        # Simplify path (remove unnecessary waypoints)
-        return self._simplify_path(path)
+        return -1
     
     def _simplify_path(self, path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Remove intermediate waypoints when direct line is possible."""
@@ -185,35 +295,4 @@ class Pathfinder:
     
     def _has_line_of_sight(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> bool:
         """Check if two points have line of sight (Bresenham's line)."""
-        x1, y1 = int(p1[0]), int(p1[1])
-        x2, y2 = int(p2[0]), int(p2[1])
-        
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        x, y = x1, y1
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        
-        if dx > dy:
-            err = dx / 2
-            while x != x2:
-                if not self.dungeon.is_walkable(x, y):
-                    return False
-                err -= dy
-                if err < 0:
-                    y += sy
-                    err += dx
-                x += sx
-        else:
-            err = dy / 2
-            while y != y2:
-                if not self.dungeon.is_walkable(x, y):
-                    return False
-                err -= dx
-                if err < 0:
-                    x += sx
-                    err += dy
-                y += sy
-        
-        return self.dungeon.is_walkable(x2, y2)
-
+        return self.grid.line_walkable(int(p1[0]), int(p1[1]), int(p2[0]), int(p2[1]))
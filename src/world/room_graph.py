@@ -0,0 +1,265 @@
+"""Room graph - hierarchical pathfinding (HPA*) over a dungeon's rooms.
+
+A long route across a level is mostly "leave this room by that door,
+follow the corridor, enter the next room". The room graph precomputes
+that layer once per layout:
+
+- Clusters: each room of Dungeon.rooms is one cluster, and every
+  connected run of floor outside the rooms (corridors) is another. A
+  corridor network is cut into ROOM_GRAPH_SECTOR-sized squares first,
+  so no cluster is large and per-cluster searches stay cheap.
+- Entrances: where two clusters touch, each contiguous stretch of
+  touching tiles gets one transition (its middle pair of tiles). Both
+  tiles become graph nodes, linked by one straight step.
+- Inside each cluster, a Dijkstra search from every node (kept inside
+  the cluster) gives the cost to the cluster's other nodes and the tile
+  route to each of them.
+
+A query searches only the endpoints' own clusters to hook the start and
+goal into the graph, runs A* over the graph's few hundred nodes, and
+stitches the stored tile routes together. Routes are near-shortest
+rather than shortest (they pass through entrance midpoints), which the
+waypoint simplification hides. Queries with both ends in one cluster
+are left to the flat search.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from ..core.constants import ROOM_GRAPH_SECTOR
+from .search_grid import SearchGrid, STRAIGHT_COST, octile
+
+
+class RoomGraph:
+    """Abstract graph of room/corridor clusters and their entrances."""
+    
+    def __init__(self, grid: SearchGrid, rooms, sector: int = ROOM_GRAPH_SECTOR):
+        self.grid = grid
+        self.clusters = self._label_clusters(rooms, sector)  # Cluster per index (0 = not walkable)
+        self.edges: Dict[int, List[Tuple[int, int]]] = {}  # node -> [(node, cost)]
+        self._members: Dict[int, List[int]] = {}           # cluster -> its nodes
+        self._trees: Dict[int, Dict[int, int]] = {}         # node -> parents toward it
+        self.expanded = 0  # Tiles and nodes reached by searches (callers diff it to meter work)
+        self._link_entrances()
+        for cluster, nodes in self._members.items():
+            for node in nodes:
+                cost, parent = self._search_cluster(node, nodes)
+                self._trees[node] = parent
+                self.edges[node].extend((other, cost[other]) for other in nodes
+                                        if other != node and other in cost)
+        self.expanded = 0  # Build work doesn't count
+    
+    def __len__(self) -> int:
+        """Number of graph nodes."""
+        return len(self.edges)
+    
+    # -------------------------------------------------------------------------
+    # Build
+    # -------------------------------------------------------------------------
+    
+    def _label_clusters(self, rooms, sector: int) -> List[int]:
+        """Rooms are clusters 1..len(rooms), corridor runs per sector follow."""
+        grid = self.grid
+        walk = grid.walk
+        stride = grid.stride
+        labels = [0] * grid.size
+        for label, room in enumerate(rooms, 1):
+            x0, y0 = max(room.x, 0), max(room.y, 0)
+            x1, y1 = min(room.x + room.width, grid.width), min(room.y + room.height, grid.height)
+            for y in range(y0, y1):
+                row = (y + 1) * stride + 1
+                for i in range(row + x0, row + x1):
+                    if walk[i]:
+                        labels[i] = label
+        
+        # Flood fill corridors over straight steps (see SearchGrid.regions),
+        # without leaving the start tile's sector
+        column_sector = [x // sector for x in range(stride)]
+        label = len(rooms)
+        for start, walkable in enumerate(walk):
+            if not walkable or labels[start]:
+                continue
+            label += 1
+            labels[start] = label
+            row, col = divmod(start, stride)
+            home = (row // sector, column_sector[col])
+            stack = [start]
+            while stack:
+                current = stack.pop()
+                for n in (current - stride, current + stride, current - 1, current + 1):
+                    if walk[n] and not labels[n]:
+                        row, col = divmod(n, stride)
+                        if (row // sector, column_sector[col]) == home:
+                            labels[n] = label
+                            stack.append(n)
+        return labels
+    
+    def _link_entrances(self):
+        """Add a node pair for each stretch of tiles where two clusters touch."""
+        labels = self.clusters
+        stride = self.grid.stride
+        
+        # Touching pairs across each axis: (index, neighbour) with the neighbour
+        # right of / below the index; a stretch runs perpendicular to it
+        for step, along in ((1, stride), (stride, 1)):
+            pairs = set()
+            for i, label in enumerate(labels):
+                if label and labels[i + step] and labels[i + step] != label:
+                    pairs.add(i)
+            while pairs:
+                first = pairs.pop()
+                key = (labels[first], labels[first + step])
+                stretch = [first]
+                for direction in (along, -along):
+                    i = first + direction
+                    while i in pairs and (labels[i], labels[i + step]) == key:
+                        pairs.discard(i)
+                        stretch.append(i)
+                        i += direction
+                stretch.sort()
+                middle = stretch[len(stretch) // 2]
+                self._link(middle, middle + step)
+    
+    def _link(self, a: int, b: int):
+        """Join two tiles of neighbouring clusters."""
+        for node in (a, b):
+            if node not in self.edges:
+                self.edges[node] = []
+                self._members.setdefault(self.clusters[node], []).append(node)
+        self.edges[a].append((b, STRAIGHT_COST))
+        self.edges[b].append((a, STRAIGHT_COST))
+    
+    def _search_cluster(self, source: int, targets: List[int]) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Dijkstra from source inside its cluster until every target is settled.
+        
+        Returns:
+            (cost, parent) dicts; parents lead back to the source
+        """
+        walk = self.grid.walk
+        steps = self.grid.steps
+        labels = self.clusters
+        cluster = labels[source]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        cost = {source: 0}
+        parent = {source: -1}
+        remaining = set(targets)
+        remaining.discard(source)
+        heap = [(0, source)]
+        while heap and remaining:
+            base, current = heappop(heap)
+            if base > cost[current]:
+                continue
+            remaining.discard(current)
+            for offset, step_cost, corner_a, corner_b in steps:
+                n = current + offset
+                if labels[n] != cluster:
+                    continue
+                if corner_a and not (walk[current + corner_a] and walk[current + corner_b]):
+                    continue
+                new_cost = base + step_cost
+                old = cost.get(n)
+                if old is None or new_cost < old:
+                    cost[n] = new_cost
+                    parent[n] = current
+                    heappush(heap, (new_cost, n))
+        self.expanded += len(cost)
+        return cost, parent
+    
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    
+    def route(self, start: int, goal: int) -> Optional[List[int]]:
+        """Flat indexes from start to goal through the graph.
+        
+        Returns:
+            The route, [] if the goal can't be reached, or None if the
+            graph doesn't apply (both ends in one cluster, or an end off
+            the floor) and a flat search should be used instead
+        """
+        labels = self.clusters
+        start_cluster = labels[start]
+        goal_cluster = labels[goal]
+        if not start_cluster or not goal_cluster or start_cluster == goal_cluster:
+            return None
+        if not self.grid.connected(start, goal):
+            return []
+        
+        # Hook the endpoints into the graph through their own clusters
+        start_nodes = self._members.get(start_cluster, [])
+        goal_nodes = self._members.get(goal_cluster, [])
+        start_cost, start_tree = self._search_cluster(start, start_nodes)
+        goal_cost, goal_tree = self._search_cluster(goal, goal_nodes)
+        to_goal = {node: goal_cost[node] for node in goal_nodes if node in goal_cost}
+        
+        nodes = self._search_graph(start, goal, start_nodes, start_cost, to_goal)
+        if not nodes:
+            return []
+        
+        # Stitch the tile routes between consecutive nodes
+        route = [start]
+        for a, b in zip(nodes, nodes[1:]):
+            if labels[a] != labels[b]:
+                route.append(b)  # Entrance step
+            elif a == start:
+                route.extend(reversed(self._walk(start_tree, b)[:-1]))
+            elif b == goal:
+                route.extend(self._walk(goal_tree, a)[1:])
+            else:
+                route.extend(self._walk(self._trees[b], a)[1:])
+        return route
+    
+    def _search_graph(self, start: int, goal: int, start_nodes: List[int],
+                      start_cost: Dict[int, int], to_goal: Dict[int, int]) -> List[int]:
+        """A* over the graph from start to goal; nodes in order, or [] if none."""
+        stride = self.grid.stride
+        edges = self.edges
+        goal_y, goal_x = divmod(goal, stride)
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        g = {start: 0}
+        parent = {start: -1}
+        closed = set()
+        open_heap = [(0, start)]
+        while open_heap:
+            _, current = heappop(open_heap)
+            if current == goal:
+                self.expanded += len(g)
+                nodes = []
+                while current >= 0:
+                    nodes.append(current)
+                    current = parent[current]
+                nodes.reverse()
+                return nodes
+            if current in closed:
+                continue
+            closed.add(current)
+            
+            base = g[current]
+            neighbours = list(edges.get(current, ()))
+            if current == start:
+                neighbours += [(node, start_cost[node]) for node in start_nodes if node in start_cost]
+            if current in to_goal:
+                neighbours.append((goal, to_goal[current]))
+            for n, cost in neighbours:
+                new_g = base + cost
+                if n in closed or new_g >= g.get(n, new_g + 1):
+                    continue
+                g[n] = new_g
+                parent[n] = current
+                y, x = divmod(n, stride)
+                heappush(open_heap, (new_g + octile(x - goal_x, y - goal_y), n))
+        self.expanded += len(g)
+        return []
+    
+    @staticmethod
+    def _walk(tree: Dict[int, int], index: int) -> List[int]:
+        """Indexes from index back to its tree's root."""
+        path = []
+        while index >= 0:
+            path.append(index)
+            index = tree[index]
+        return path
@@ -0,0 +1,145 @@
+"""Search grid - a map layout flattened for pathfinding.
+
+The map's padded walkability array becomes one flat list, so a tile is
+one int and its neighbours are fixed offsets from it (the blocked
+border means no bounds checks). Costs are integers - 10 per straight
+step, 14 per diagonal - and octile() is the matching distance
+heuristic. The grid also labels connected regions once per layout, so
+searches can reject unreachable goals without expanding anything.
+
+Shared by Pathfinder, the jump point engine, the room graph, flow
+fields and path requests.
+"""
+
+from typing import List, Optional, Tuple
+
+
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14
+
+
+def octile(dx: int, dy: int) -> int:
+    """Octile distance for tile offsets, in step-cost units."""
+    dx, dy = abs(dx), abs(dy)
+    if dx > dy:
+        return STRAIGHT_COST * dx + (DIAGONAL_COST - STRAIGHT_COST) * dy
+    return STRAIGHT_COST * dy + (DIAGONAL_COST - STRAIGHT_COST) * dx
+
+
+class SearchGrid:
+    """One map layout's walkability as a flat list, for searches."""
+    
+    def __init__(self, game_map):
+        self.width = width = game_map.width
+        self.height = height = game_map.height
+        self.stride = stride = width + 2
+        padded = getattr(game_map, "walkable_padded", None)
+        if padded is not None:
+            self.walk: List[bool] = padded.ravel().tolist()
+        else:
+            # Maps without a tile grid (test doubles) - ask tile by tile
+            self.walk = [False] * (stride * (height + 2))
+            for y in range(height):
+                for x in range(width):
+                    self.walk[(y + 1) * stride + x + 1] = bool(game_map.is_walkable(x, y))
+        self.size = len(self.walk)
+        
+        # (offset, cost, corner, corner) - a diagonal step also needs both
+        # tiles it passes between to be walkable (no corner cutting)
+        self.steps = (
+            (-stride, STRAIGHT_COST, 0, 0),            # Up
+            (stride, STRAIGHT_COST, 0, 0),             # Down
+            (-1, STRAIGHT_COST, 0, 0),                 # Left
+            (1, STRAIGHT_COST, 0, 0),                  # Right
+            (-stride - 1, DIAGONAL_COST, -1, -stride), # Up-left
+            (-stride + 1, DIAGONAL_COST, 1, -stride),  # Up-right
+            (stride - 1, DIAGONAL_COST, -1, stride),   # Down-left
+            (stride + 1, DIAGONAL_COST, 1, stride),    # Down-right
+        )
+        self._regions: Optional[List[int]] = None
+    
+    def contains(self, x: int, y: int) -> bool:
+        """True if (x, y) is on the map."""
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def index(self, x: int, y: int) -> int:
+        """Flat index of an in-bounds tile."""
+        return (y + 1) * self.stride + x + 1
+    
+    def position(self, index: int) -> Tuple[int, int]:
+        """Tile (x, y) of a flat index."""
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+    
+    def line_walkable(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """True if every tile on the Bresenham line between two tiles is walkable.
+        
+        Both tiles must be on the map.
+        """
+        walk = self.walk
+        stride = self.stride
+        
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+        x, y = x1, y1
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        
+        if dx > dy:
+            err = dx / 2
+            while x != x2:
+                if not walk[(y + 1) * stride + x + 1]:
+                    return False
+                err -= dy
+                if err < 0:
+                    y += sy
+                    err += dx
+                x += sx
+        else:
+            err = dy / 2
+            while y != y2:
+                if not walk[(y + 1) * stride + x + 1]:
+                    return False
+                err -= dx
+                if err < 0:
+                    x += sx
+                    err += dy
+                y += sy
+        
+        return walk[(y2 + 1) * stride + x2 + 1]
+    
+    @property
+    def regions(self) -> List[int]:
+        """Connected region label per index (0 = not walkable), built on first use."""
+        if self._regions is None:
+            self._regions = self._label_regions()
+        return self._regions
+    
+    def connected(self, a: int, b: int) -> bool:
+        """True if walkable tiles a and b are reachable from each other."""
+        regions = self.regions
+        return regions[a] != 0 and regions[a] == regions[b]
+    
+    def _label_regions(self) -> List[int]:
+        """Flood fill over straight steps.
+        
+        A diagonal step needs both straight neighbours walkable, so it
+        never connects anything straight steps don't.
+        """
+        walk = self.walk
+        stride = self.stride
+        labels = [0] * self.size
+        label = 0
+        for start, walkable in enumerate(walk):
+            if not walkable or labels[start]:
+                continue
+            label += 1
+            labels[start] = label
+            stack = [start]
+            while stack:
+                current = stack.pop()
+                for n in (current - stride, current + stride, current - 1, current + 1):
+                    if walk[n] and not labels[n]:
+                        labels[n] = label
+                        stack.append(n)
+        return labels
@@ -0,0 +1,145 @@
+"""Tile map - the tile grid shared by Dungeon and TownMap.
+
+Tiles are stored as a NumPy uint8 array of TileType values indexed
+[y, x], with a boolean walkability array derived from it whenever tiles
+are written. The walkability array has a one-tile blocked border, so
+code that walks flat indexes (pathfinding) can step to any neighbour
+of an in-bounds tile without checking bounds:
+
+    walk = game_map.walkable_padded    # (height + 2, width + 2)
+    walk[y + 1, x + 1]                 # same as is_walkable(x, y)
+
+get_tile() and is_walkable() are called per tile from Python loops
+(collision, LOS, the renderer), where indexing a NumPy array is slower
+than indexing a list, so they read row lists mirrored from the arrays.
+All writes go through set_tile()/fill_rect()/clear(), which keep the
+arrays, the row lists and `revision` in step.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from ..core.constants import TileType
+
+
+WALKABLE_TILES = (TileType.FLOOR, TileType.DOOR, TileType.STAIRS_DOWN, TileType.STAIRS_UP)
+
+# TileType by uint8 value
+_TILE_TYPES = [None] * 256
+for _tile in TileType:
+    _TILE_TYPES[_tile.value] = _tile
+
+# Walkability by uint8 value
+_WALKABLE_LUT = np.zeros(256, dtype=bool)
+_WALKABLE_LUT[[tile.value for tile in WALKABLE_TILES]] = True
+
+
+class TileMap:
+    """Grid of tiles with precomputed walkability."""
+    
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.tiles = np.zeros((height, width), dtype=np.uint8)  # TileType values
+        self.walkable_padded = np.zeros((height + 2, width + 2), dtype=bool)
+        self.walkable = self.walkable_padded[1:-1, 1:-1]  # View, [y, x]
+        self.revision = 0  # Bumped on every tile write
+        self._tile_rows: List[List[TileType]] = [None] * height  # Mirrors of the arrays
+        self._walkable_rows: List[List[bool]] = [None] * height
+        self.clear()
+    
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+    
+    def clear(self, tile: TileType = TileType.VOID):
+        """Fill the whole map with one tile type."""
+        self.tiles.fill(tile.value)
+        self._refresh_rows(0, self.height)
+    
+    def set_tile(self, x: int, y: int, tile: TileType):
+        """Set one tile (ignored out of bounds)."""
+        self.fill_rect(x, y, 1, 1, tile)
+    
+    def fill_rect(self, x: int, y: int, width: int, height: int, tile: TileType):
+        """Set every tile in a rectangle, clipped to the map."""
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self.tiles[y0:y1, x0:x1] = tile.value
+        self._refresh_rows(y0, y1)
+    
+    def _refresh_rows(self, y0: int, y1: int):
+        """Rederive walkability and the row lists for rows y0..y1-1."""
+        rows = self.tiles[y0:y1]
+        self.walkable[y0:y1] = _WALKABLE_LUT[rows]
+        for y, (values, walk) in enumerate(zip(rows.tolist(), self.walkable[y0:y1].tolist()), y0):
+            self._tile_rows[y] = [_TILE_TYPES[v] for v in values]
+            self._walkable_rows[y] = walk
+        self.revision += 1
+    
+    # -------------------------------------------------------------------------
+    # Per-tile queries
+    # -------------------------------------------------------------------------
+    
+    def get_tile(self, x: int, y: int) -> TileType:
+        """Get tile type at position."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._tile_rows[y][x]
+        return TileType.VOID
+    
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Check if a tile is walkable."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._walkable_rows[y][x]
+        return False
+    
+    def is_in_bounds(self, x: int, y: int) -> bool:
+        """Check if position is within map bounds."""
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    # -------------------------------------------------------------------------
+    # Region queries
+    # -------------------------------------------------------------------------
+    
+    def _clip(self, x: int, y: int, width: int, height: int) -> Tuple[slice, slice]:
+        """Array slices (rows, cols) for a rectangle clipped to the map."""
+        return (slice(max(y, 0), max(min(y + height, self.height), 0)),
+                slice(max(x, 0), max(min(x + width, self.width), 0)))
+    
+    def walkable_in_rect(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """Walkability of a rectangle (clipped to the map), indexed [y, x]."""
+        return self.walkable[self._clip(x, y, width, height)]
+    
+    def count_walkable(self, x: int, y: int, width: int, height: int) -> int:
+        """Number of walkable tiles in a rectangle."""
+        return int(np.count_nonzero(self.walkable_in_rect(x, y, width, height)))
+    
+    def is_area_walkable(self, x: int, y: int, width: int, height: int) -> bool:
+        """True if every tile of the rectangle is on the map and walkable."""
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            return False
+        return bool(self.walkable[y:y + height, x:x + width].all())
+    
+    def positions_where(self, mask: np.ndarray, x: int = 0, y: int = 0) -> List[Tuple[int, int]]:
+        """(x, y) of every true cell of a [y, x] mask, in row order.
+        
+        Args:
+            x, y: Map position of the mask's top-left cell
+        """
+        ys, xs = np.nonzero(mask)
+        return list(zip((xs + x).tolist(), (ys + y).tolist()))
+    
+    def walkable_positions(self, x: int = 0, y: int = 0, width: int = None,
+                           height: int = None) -> List[Tuple[int, int]]:
+        """Walkable (x, y) tiles in a rectangle (default the whole map), in row order."""
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        rows, cols = self._clip(x, y, width, height)
+        return self.positions_where(self.walkable[rows, cols], cols.start, rows.start)
+    
+    def tiles_of_type(self, tile: TileType) -> List[Tuple[int, int]]:
+        """(x, y) of every tile of one type, in row order."""
+        return self.positions_where(self.tiles == tile.value)
@@ -4,6 +4,7 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
 
 from ..core.constants import TileType
+from .tile_map import TileMap
 
 
 @dataclass
@@ -26,16 +27,14 @@ class TownBuilding:
         return (self.x + self.width // 2, self.y + self.height)
 
 
-class TownMap:
+class TownMap(TileMap):
     """Town map using same interface as Dungeon for rendering."""
     
     # Flag to identify this as a town map (not a dungeon)
     is_town_map: bool = True
     
     def __init__(self, width: int = 40, height: int = 30):
-        self.width = width
-        self.height = height
-        self.tiles = [[TileType.VOID for _ in range(width)] for _ in range(height)]
+        super().__init__(width, height)
         self.buildings: List[TownBuilding] = []
         self.spawn_point: Tuple[int, int] = (width // 2, height // 2)
         
@@ -52,23 +51,15 @@ class TownMap:
     def _generate(self):
         """Generate the town layout."""
         # Create grassy floor area
-        for y in range(3, self.height - 3):
-            for x in range(3, self.width - 3):
-                self.tiles[y][x] = TileType.FLOOR
+        self.fill_rect(3, 3, self.width - 6, self.height - 6, TileType.FLOOR)
         
         # Stone path in the middle
         path_y = self.height // 2
-        for x in range(3, self.width - 3):
-            for dy in range(-1, 2):
-                if 0 <= path_y + dy < self.height:
-                    self.tiles[path_y + dy][x] = TileType.FLOOR
+        self.fill_rect(3, path_y - 1, self.width - 6, 3, TileType.FLOOR)
         
         # Vertical path
         path_x = self.width // 2
-        for y in range(3, self.height - 3):
-            for dx in range(-1, 2):
-                if 0 <= path_x + dx < self.width:
-                    self.tiles[y][path_x + dx] = TileType.FLOOR
+        self.fill_rect(path_x - 1, 3, 3, self.height - 6, TileType.FLOOR)
         
         # Place buildings
         self._place_buildings()
@@ -102,42 +93,17 @@ class TownMap:
         
         if btype == 'portal':
             # Portal is just a special floor tile
-            for by in range(y, y + h):
-                for bx in range(x, x + w):
-                    if 0 <= bx < self.width and 0 <= by < self.height:
-                        self.tiles[by][bx] = TileType.STAIRS_UP
+            self.fill_rect(x, y, w, h, TileType.STAIRS_UP)
         else:
             # Draw building footprint as walls
-            for by in range(y, y + h):
-                for bx in range(x, x + w):
-                    if 0 <= bx < self.width and 0 <= by < self.height:
-                        self.tiles[by][bx] = TileType.WALL
+            self.fill_rect(x, y, w, h, TileType.WALL)
             
             # Door tile (walkable, in front of building)
-            door_x, door_y = x + w // 2, y + h
-            if 0 <= door_x < self.width and 0 <= door_y < self.height:
-                self.tiles[door_y][door_x] = TileType.DOOR
+            self.set_tile(x + w // 2, y + h, TileType.DOOR)
     
     def _add_fountain(self, x: int, y: int):
         """Add a small fountain."""
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                fx, fy = x + dx, y + dy
-                if 0 <= fx < self.width and 0 <= fy < self.height:
-                    self.tiles[fy][fx] = TileType.WATER
-    
-    def get_tile(self, x: int, y: int) -> TileType:
-        """Get tile type at position."""
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return TileType.VOID
-        return self.tiles[y][x]
-    
-    def is_walkable(self, x: int, y: int) -> bool:
-        """Check if a tile is walkable."""
-        if x < 0 or x >= self.width or y < 0 or y >= self.height:
-            return False
-        tile = self.tiles[int(y)][int(x)]
-        return tile in (TileType.FLOOR, TileType.DOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN)
+        self.fill_rect(x - 1, y - 1, 3, 3, TileType.WATER)
     
     def get_building_at(self, x: float, y: float) -> Optional[TownBuilding]:
         """Get building at position (checks door area or inside for portal)."""
@@ -0,0 +1,215 @@
+"""Benchmark suite fixtures - timing, baselines and shared worlds.
+
+Benchmarks are skipped in the normal test run. Run them with:
+    python -m pytest tests/benchmarks             # compare against baseline
+    python -m pytest tests/benchmarks --bench-save  # record a new baseline
+    python -m pytest --bench                      # everything, benchmarks included
+
+Each benchmark times several rounds and records the fastest and median
+round. Results are compared against a JSON baseline
+(tests/benchmarks/baseline.json by default, written on the first run).
+A benchmark whose fastest round is slower than the baseline's by more
+than --bench-tolerance fails - the fastest round is the least disturbed
+by other load on the machine. Baselines are per machine: record one
+before a change, then compare after it.
+"""
+
+import json
+import os
+import random
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+# Renderer benchmarks need a display for convert_alpha(), never a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import esper
+
+from src.core.events import EventBus
+from src.ecs.factories import create_party, create_enemy
+from src.world import Dungeon, MapContext
+
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_ROUNDS = 15
+BENCH_SEED = 1234  # Dungeon seed every benchmark world uses
+BENCH_ENEMY = "skeleton"
+
+
+# =============================================================================
+# SELECTION
+# =============================================================================
+
+def _benchmarks_selected(config) -> bool:
+    """True if --bench was given or only benchmark paths were requested."""
+    if config.getoption("--bench"):
+        return True
+    root = config.invocation_params.dir
+    paths = [(root / arg.split("::")[0]).resolve() for arg in config.args]
+    return bool(paths) and all(path == BENCH_DIR or BENCH_DIR in path.parents for path in paths)
+
+
+def pytest_collection_modifyitems(config, items):
+    if _benchmarks_selected(config):
+        return
+    skip = pytest.mark.skip(reason="benchmark - run tests/benchmarks or pass --bench")
+    for item in items:
+        if BENCH_DIR in Path(item.fspath).parents:
+            item.add_marker(skip)
+
+
+# =============================================================================
+# RESULTS AND BASELINE
+# =============================================================================
+
+class BenchResults:
+    """Timings from this run plus the stored baseline to compare with."""
+    
+    def __init__(self, baseline_path: Path, tolerance: float):
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        self.baseline = {}
+        if baseline_path.exists():
+            with open(baseline_path) as f:
+                self.baseline = json.load(f)
+        self.results = {}
+    
+    def add(self, name: str, samples_ms: list) -> dict:
+        result = {
+            "median_ms": statistics.median(samples_ms),
+            "min_ms": min(samples_ms),
+            "rounds": len(samples_ms),
+        }
+        self.results[name] = result
+        return result
+    
+    def regression(self, name: str):
+        """Slowdown ratio of the fastest round if beyond tolerance, else None."""
+        base = self.baseline.get(name)
+        if not base or base["min_ms"] <= 0:
+            return None
+        ratio = self.results[name]["min_ms"] / base["min_ms"]
+        return ratio if ratio > 1 + self.tolerance else None
+    
+    def save(self):
+        """Merge this run into the baseline file (other entries are kept)."""
+        merged = dict(self.baseline)
+        merged.update(self.results)
+        with open(self.baseline_path, 'w') as f:
+            json.dump(dict(sorted(merged.items())), f, indent=2)
+
+
+@pytest.fixture(scope="session")
+def bench_results(request):
+    config = request.config
+    results = BenchResults(Path(config.getoption("--bench-baseline")),
+                           config.getoption("--bench-tolerance"))
+    yield results
+    if results.results and (config.getoption("--bench-save") or not results.baseline):
+        results.save()
+    config._bench_results = results
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = getattr(config, "_bench_results", None)
+    if not results or not results.results:
+        return
+    tr = terminalreporter
+    tr.section("benchmarks (ms)")
+    tr.write_line(f"{'benchmark':<40} {'median':>10} {'min':>10} {'base min':>10} {'change':>8}")
+    for name, result in sorted(results.results.items()):
+        base = results.baseline.get(name)
+        line = f"{name:<40} {result['median_ms']:>10.3f} {result['min_ms']:>10.3f}"
+        if base:
+            change = (result["min_ms"] / base["min_ms"] - 1) * 100 if base["min_ms"] else 0.0
+            flag = "  REGRESSED" if results.regression(name) else ""
+            line += f" {base['min_ms']:>10.3f} {change:>+7.0f}%{flag}"
+        tr.write_line(line)
+    if config.getoption("--bench-save") or not results.baseline:
+        tr.write_line(f"baseline written to {results.baseline_path}")
+
+
+@pytest.fixture
+def benchmark(request, bench_results):
+    """Time a callable over several rounds and check it against the baseline.
+    
+    Usage: benchmark(func, setup=None, rounds=DEFAULT_ROUNDS). setup runs
+    before every round and is not timed. Returns the result dict.
+    """
+    def run(func, setup=None, rounds: int = DEFAULT_ROUNDS) -> dict:
+        samples = []
+        for _ in range(rounds):
+            if setup:
+                setup()
+            start = time.process_time()
+            func()
+            samples.append((time.process_time() - start) * 1000)
+        
+        name = request.node.name
+        result = bench_results.add(name, samples)
+        ratio = bench_results.regression(name)
+        if ratio:
+            pytest.fail(f"{name} regressed: {result['min_ms']:.3f}ms is "
+                        f"{ratio:.2f}x the baseline (tolerance {bench_results.tolerance:.0%})")
+        return result
+    return run
+
+
+# =============================================================================
+# SHARED WORLDS
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def bench_dungeon():
+    """One generated dungeon shared by every benchmark (same seed each run)."""
+    dungeon = Dungeon(80, 80)
+    dungeon.generate(min_rooms=8, max_rooms=12, seed=BENCH_SEED)
+    return dungeon
+
+
+class BenchWorld:
+    """Fresh esper world on the bench dungeon: party plus N enemies."""
+    
+    def __init__(self, dungeon: Dungeon):
+        self.dungeon = dungeon
+        self.map_context = MapContext(dungeon)
+        self.event_bus = EventBus()
+        self.party = []
+        self.enemies = []
+        
+        # Floor tiles nearest the spawn first, so enemies crowd the party
+        sx, sy = dungeon.get_player_spawn()
+        floor = [
+            (x, y) for y in range(dungeon.height) for x in range(dungeon.width)
+            if dungeon.is_walkable(x, y)
+        ]
+        floor.sort(key=lambda tile: (tile[0] - sx) ** 2 + (tile[1] - sy) ** 2)
+        self.floor = floor
+    
+    def reset(self, enemy_count: int, skip: int = 4):
+        """Clear the world and spawn the party and enemy_count enemies.
+        
+        Args:
+            skip: Floor tiles nearest the spawn to leave for the party
+        """
+        esper.clear_database()
+        random.seed(BENCH_SEED)
+        sx, sy = self.dungeon.get_player_spawn()
+        self.party = create_party(sx, sy)
+        tiles = self.floor[skip:]
+        self.enemies = [
+            create_enemy(BENCH_ENEMY, tiles[i % len(tiles)][0] + 0.5, tiles[i % len(tiles)][1] + 0.5)
+            for i in range(enemy_count)
+        ]
+        self.event_bus.process()
+
+
+@pytest.fixture
+def bench_world(bench_dungeon):
+    world = BenchWorld(bench_dungeon)
+    yield world
+    esper.clear_database()
@@ -0,0 +1,170 @@
+"""Benchmarks for the per-step processors.
+
+These benchmarks time one fixed step of each heavy processor with the
+party surrounded by N enemies. If one regresses, fights with that many
+enemies cost more frame time than before.
+"""
+
+import esper
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.constants import FIXED_TIMESTEP
+from src.data.loader import data_loader
+from src.ecs.components import (
+    Position, TargetPosition, AttackIntent, AttackCooldown, Health, CastIntent
+)
+from src.ecs.factories.effects import (
+    create_damage_number, create_visual_effect, damage_numbers, visual_effects
+)
+from src.ecs.processors import (
+    MovementProcessor, AIProcessor, CombatProcessor, MagicProcessor,
+    AnimationProcessor, CleanupProcessor
+)
+
+
+ENTITY_COUNTS = [25, 100, 400]
+EFFECT_EXPIRY_DT = 2.0  # Longer than any damage number or effect lives
+
+
+# =============================================================================
+# MOVEMENT / AI / COMBAT BENCHMARKS
+# Gameplay Impact: Frame time while crowds chase and fight the party
+# =============================================================================
+
+@pytest.mark.parametrize("enemies", ENTITY_COUNTS)
+def test_movement_step(benchmark, bench_world, enemies):
+    """Every enemy walks toward the party spawn with wall collision."""
+    movement = MovementProcessor(bench_world.event_bus, bench_world.map_context)
+    sx, sy = bench_world.dungeon.get_player_spawn()
+    
+    def setup():
+        bench_world.reset(enemies)
+        for ent in bench_world.enemies:
+            esper.add_component(ent, TargetPosition(x=sx, y=sy))
+    
+    benchmark(lambda: movement.process(FIXED_TIMESTEP), setup=setup)
+
+
+@pytest.mark.parametrize("enemies", ENTITY_COUNTS)
+def test_ai_step(benchmark, bench_world, enemies):
+    """Enemy and ally AI decisions with the party in aggro range."""
+    bench_world.reset(enemies)
+    ai = AIProcessor(bench_world.event_bus, bench_world.map_context)
+    
+    def step():
+        ai.process(FIXED_TIMESTEP)
+        bench_world.event_bus.process()
+    
+    benchmark(step)
+
+
+@pytest.mark.parametrize("enemies", ENTITY_COUNTS)
+def test_combat_step(benchmark, bench_world, enemies):
+    """Every enemy attacks a party member the same step."""
+    combat = CombatProcessor(bench_world.event_bus, bench_world.map_context)
+    
+    def setup():
+        bench_world.reset(enemies, skip=0)
+        hero_pos = esper.component_for_entity(bench_world.party[0], Position)
+        for ent in bench_world.enemies:
+            # Pile onto the hero so every attack is in range
+            pos = esper.component_for_entity(ent, Position)
+            pos.x, pos.y = hero_pos.x + 0.5, hero_pos.y
+            esper.add_component(ent, AttackIntent(target_id=bench_world.party[0]))
+            esper.component_for_entity(ent, AttackCooldown).remaining = 0.0
+        esper.component_for_entity(bench_world.party[0], Health).current = 10 ** 9
+    
+    def step():
+        combat.process(FIXED_TIMESTEP)
+        bench_world.event_bus.process()
+    
+    benchmark(step, setup=setup)
+
+
+# =============================================================================
+# MAGIC BENCHMARKS
+# Gameplay Impact: Frame time of AoE, chain and projectile spells in crowds
+# =============================================================================
+
+def _cast(magic, world, spell_id: str):
+    """Hero casts spell_id at the nearest enemy, then events are dispatched."""
+    spell = data_loader.get_spell(spell_id)
+    target = world.enemies[0]
+    pos = esper.component_for_entity(target, Position)
+    intent = CastIntent(spell_id=spell_id, target_id=target, target_x=pos.x, target_y=pos.y)
+    magic._execute_spell(world.party[0], spell_id, spell, intent)
+    world.event_bus.process()
+
+
+@pytest.mark.parametrize("enemies", ENTITY_COUNTS)
+def test_magic_aoe(benchmark, bench_world, enemies):
+    """Frost Wave (radius 8, self-targeted) over the crowd."""
+    magic = MagicProcessor(bench_world.event_bus, bench_world.map_context)
+    benchmark(lambda: _cast(magic, bench_world, "ice_shard"),
+              setup=lambda: bench_world.reset(enemies))
+
+
+@pytest.mark.parametrize("enemies", ENTITY_COUNTS)
+def test_magic_chain(benchmark, bench_world, enemies):
+    """Chain Lightning jumping through the crowd."""
+    magic = MagicProcessor(bench_world.event_bus, bench_world.map_context)
+    benchmark(lambda: _cast(magic, bench_world, "chain_lightning"),
+              setup=lambda: bench_world.reset(enemies))
+
+
+@pytest.mark.parametrize("projectiles", ENTITY_COUNTS)
+def test_magic_projectiles(benchmark, bench_world, projectiles):
+    """One step with N fireballs in flight over 100 enemies."""
+    magic = MagicProcessor(bench_world.event_bus, bench_world.map_context)
+    spell = data_loader.get_spell("fireball")
+    
+    def setup():
+        bench_world.reset(100)
+        caster = bench_world.party[0]
+        caster_pos = esper.component_for_entity(caster, Position)
+        for i in range(projectiles):
+            # Ground-targeted, so each one checks collisions against the crowd
+            tx, ty = bench_world.floor[-1 - i % 50]
+            intent = CastIntent(spell_id="fireball", target_x=tx, target_y=ty)
+            magic._create_projectile(caster, "fireball", spell, intent, caster_pos)
+        bench_world.event_bus.process()
+    
+    def step():
+        magic.process(FIXED_TIMESTEP)
+        bench_world.event_bus.process()
+    
+    benchmark(step, setup=setup)
+
+
+# =============================================================================
+# ENTITY POOL BENCHMARKS
+# Gameplay Impact: Frame time during spell spam (damage numbers, impacts)
+# =============================================================================
+
+@pytest.mark.parametrize("pooled", [True, False], ids=["pooled", "unpooled"])
+def test_effect_churn(benchmark, bench_world, pooled):
+    """200 damage numbers and impact effects spawned, expired and removed."""
+    bench_world.reset(25)
+    animation = AnimationProcessor()
+    cleanup = CleanupProcessor()
+    sx, sy = bench_world.dungeon.get_player_spawn()
+    previous = damage_numbers.enabled, visual_effects.enabled
+    damage_numbers.enabled = visual_effects.enabled = pooled
+    
+    def churn():
+        for _ in range(10):
+            for i in range(20):
+                create_damage_number(sx, sy - 0.5, i, is_crit=i % 5 == 0)
+                create_visual_effect(sx, sy, "hit_fire", timer=0.3)
+            animation.process(EFFECT_EXPIRY_DT)  # Every number and effect expires
+            cleanup.process(FIXED_TIMESTEP)
+            esper.clear_dead_entities()
+    
+    try:
+        benchmark(churn)
+    finally:
+        damage_numbers.enabled, visual_effects.enabled = previous
@@ -0,0 +1,204 @@
+"""Benchmarks for pathfinding, dungeon generation and rendering.
+
+These benchmarks time the map-level work that isn't a per-step
+processor. If one regresses, level loads take longer, enemies react
+later to the party, or frames take longer to draw.
+"""
+
+import pygame
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.formulas import dungeon_size, room_count
+from src.rendering import Camera, Renderer
+from src.world import Dungeon, Pathfinder
+from src.world.flow_field import FlowFields
+from src.world.path_requests import PathRequests
+
+from .conftest import BENCH_SEED
+
+
+ENTITY_COUNTS = [25, 100, 400]
+RENDER_SIZE = (1280, 720)
+
+
+# =============================================================================
+# PATHFINDING / GENERATION BENCHMARKS
+# Gameplay Impact: Enemy reaction time and level load time
+# =============================================================================
+
+@pytest.mark.parametrize("agents", ENTITY_COUNTS)
+def test_find_path(benchmark, bench_dungeon, agents):
+    """N agents each path from across the map to the party spawn."""
+    pathfinder = Pathfinder(bench_dungeon)
+    sx, sy = bench_dungeon.get_player_spawn()
+    floor = [
+        (x + 0.5, y + 0.5) for y in range(bench_dungeon.height) for x in range(bench_dungeon.width)
+        if bench_dungeon.is_walkable(x, y)
+    ]
+    starts = [floor[(i * 7919) % len(floor)] for i in range(agents)]
+    
+    def find_all():
+        for x, y in starts:
+            pathfinder.find_path(x, y, sx, sy)
+    
+    benchmark(find_all, setup=pathfinder.cache.clear, rounds=3)
+
+
+@pytest.mark.parametrize("agents", ENTITY_COUNTS)
+def test_find_path_cached(benchmark, bench_dungeon, agents):
+    """N agents re-request their routes to the party (path cache warm)."""
+    pathfinder = Pathfinder(bench_dungeon)
+    sx, sy = bench_dungeon.get_player_spawn()
+    floor = bench_dungeon.walkable_positions()
+    starts = [floor[(i * 7919) % len(floor)] for i in range(agents)]
+    for x, y in starts:
+        pathfinder.find_path(x + 0.5, y + 0.5, sx, sy)
+    
+    def find_all():
+        for x, y in starts:
+            pathfinder.find_path(x + 0.5, y + 0.5, sx, sy)
+    
+    benchmark(find_all)
+
+
+@pytest.mark.parametrize("agents", ENTITY_COUNTS)
+def test_path_requests_tick(benchmark, bench_dungeon, agents):
+    """One tick of the path request queue with N agents' requests waiting."""
+    pathfinder = Pathfinder(bench_dungeon)
+    sx, sy = bench_dungeon.get_player_spawn()
+    floor = bench_dungeon.walkable_positions()
+    starts = [floor[(i * 7919) % len(floor)] for i in range(agents)]
+    requests = PathRequests(pathfinder)
+    
+    def submit_all():
+        pathfinder.cache.clear()
+        requests._pending.clear()
+        for ent, (x, y) in enumerate(starts):
+            requests.submit(ent, x + 0.5, y + 0.5, sx, sy)
+    
+    benchmark(requests.update, setup=submit_all)
+
+
+@pytest.mark.parametrize("agents", ENTITY_COUNTS)
+def test_flow_field_chase(benchmark, bench_dungeon, agents):
+    """N agents within the field radius step toward the party (one field build)."""
+    pathfinder = Pathfinder(bench_dungeon)
+    sx, sy = bench_dungeon.get_player_spawn()
+    field = FlowFields(pathfinder).field(0, int(sx), int(sy), 0.0)
+    floor = [(x, y) for x, y in bench_dungeon.walkable_positions() if field.distance(x, y)]
+    starts = [floor[(i * 7919) % len(floor)] for i in range(agents)]
+    
+    def chase_all():
+        flow_fields = FlowFields(pathfinder)
+        for x, y in starts:
+            flow_fields.next_step(0, sx, sy, x + 0.5, y + 0.5, 0.0)
+    
+    benchmark(chase_all, rounds=3)
+
+
+@pytest.fixture(scope="module", params=[80, 300])
+def sized_dungeon(request):
+    """Generated dungeon of the given size, rooms scaled with its area."""
+    size = request.param
+    rooms = max(8, size * size // 1200)
+    dungeon = Dungeon(size, size)
+    dungeon.generate(min_rooms=rooms, max_rooms=rooms + 4, seed=BENCH_SEED)
+    return dungeon
+
+
+def test_find_path_across_map(benchmark, sized_dungeon):
+    """Path from the first room to every other room (long routes)."""
+    pathfinder = Pathfinder(sized_dungeon)
+    sx, sy = sized_dungeon.rooms[0].center
+    goals = [room.center for room in sized_dungeon.rooms[1:]]
+    
+    def find_all():
+        for gx, gy in goals:
+            assert pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+    
+    benchmark(find_all, setup=pathfinder.cache.clear, rounds=3)
+
+
+@pytest.mark.parametrize("engine", Pathfinder.ENGINES)
+def test_find_path_engine(benchmark, sized_dungeon, engine):
+    """Flat searches from the first room to every other room, per engine."""
+    pathfinder = Pathfinder(sized_dungeon, hierarchical=False, engine=engine)
+    sx, sy = sized_dungeon.rooms[0].center
+    goals = [room.center for room in sized_dungeon.rooms[1:]]
+    
+    def find_all():
+        for gx, gy in goals:
+            assert pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+    
+    benchmark(find_all, setup=pathfinder.cache.clear, rounds=3)
+
+
+@pytest.fixture(scope="module", params=[3, 9])
+def level_dungeon(request):
+    """Dungeon sized and roomed like the given level (see dungeon_size)."""
+    size, rooms = dungeon_size(request.param), room_count(request.param)
+    dungeon = Dungeon(size, size)
+    dungeon.generate(min_rooms=rooms, max_rooms=rooms + 4, seed=BENCH_SEED)
+    return dungeon
+
+
+@pytest.mark.parametrize("hierarchical", [False, True], ids=["flat", "room_graph"])
+def test_find_path_long(benchmark, level_dungeon, hierarchical):
+    """Routes between every pair of rooms, flat A* vs the room graph."""
+    pathfinder = Pathfinder(level_dungeon, hierarchical=hierarchical)
+    pathfinder.room_graph  # Built with the level, not per query
+    centers = [room.center for room in level_dungeon.rooms]
+    pairs = [(a, b) for a in centers for b in centers if a != b]
+    
+    def find_all():
+        for (sx, sy), (gx, gy) in pairs:
+            pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+    
+    benchmark(find_all, setup=pathfinder.cache.clear, rounds=3)
+
+
+def test_room_graph_build(benchmark, level_dungeon):
+    """Build the room graph for a level (done on level load)."""
+    pathfinder = Pathfinder(level_dungeon)
+    
+    def build():
+        pathfinder._room_graph = None
+        pathfinder.room_graph
+    
+    benchmark(build, rounds=5)
+
+
+@pytest.mark.parametrize("size", [80, 120])
+def test_dungeon_generate(benchmark, size):
+    """Generate a full level with rooms, props and decorations."""
+    def generate():
+        Dungeon(size, size).generate(min_rooms=8, max_rooms=12, seed=BENCH_SEED)
+    
+    benchmark(generate, rounds=3)
+
+
+# =============================================================================
+# RENDER BENCHMARKS
+# Gameplay Impact: Frame time spent drawing a crowded screen
+# =============================================================================
+
+@pytest.fixture(scope="module")
+def renderer(bench_dungeon):
+    """Renderer drawing to an offscreen surface (dummy display for sprites)."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    camera = Camera(*RENDER_SIZE)
+    camera.center_on(*bench_dungeon.get_player_spawn())
+    yield Renderer(pygame.Surface(RENDER_SIZE), camera)
+    pygame.display.quit()
+
+
+@pytest.mark.parametrize("enemies", ENTITY_COUNTS)
+def test_render_frame(benchmark, bench_world, renderer, enemies):
+    """Draw one frame with N enemies around the party."""
+    bench_world.reset(enemies)
+    benchmark(lambda: renderer.render(bench_world.dungeon))
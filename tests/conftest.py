@@ -11,6 +11,29 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
+def pytest_addoption(parser):
+    """Options for the benchmark suite in tests/benchmarks."""
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench", action="store_true",
+                    help="Also run the benchmarks when running the whole test suite")
+    group.addoption("--bench-save", action="store_true",
+                    help="Write this run's timings to the benchmark baseline")
+    group.addoption("--bench-baseline",
+                    default=os.path.join(os.path.dirname(__file__), "benchmarks", "baseline.json"),
+                    help="Baseline JSON file to compare against")
+    group.addoption("--bench-tolerance", type=float, default=0.25,
+                    help="Allowed slowdown vs the baseline before failing (0.25 = 25%%)")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def query_hooks():
+    """Hook esper so query views and the tag index follow world changes (as Game does)."""
+    from src.ecs import queries
+    queries.install()
+    yield
+    queries.uninstall()
+
+
 @pytest.fixture
 def mock_dungeon():
     """Create a simple mock dungeon for testing."""
@@ -66,6 +89,28 @@ def mock_dungeon():
     return MockDungeon()
 
 
+@pytest.fixture
+def walled_map_size():
+    """Side length of walled_map (override in a test module for a bigger map)."""
+    return 20
+
+
+@pytest.fixture
+def walled_map(walled_map_size):
+    """Square floor with a wall down the middle column except a gap at the bottom.
+    
+    At the default size 20: floor from 1 to 18, wall at x=10, gap at y=18.
+    """
+    from src.core.constants import TileType
+    from src.world.tile_map import TileMap
+    
+    size = walled_map_size
+    game_map = TileMap(size, size)
+    game_map.fill_rect(1, 1, size - 2, size - 2, TileType.FLOOR)
+    game_map.fill_rect(size // 2, 1, 1, size - 3, TileType.WALL)
+    return game_map
+
+
 @pytest.fixture
 def mock_entity_with_health():
     """Create a mock entity with health component."""
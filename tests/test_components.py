@@ -0,0 +1,76 @@
+"""Tests for component dataclasses.
+
+These tests ensure every component is a slotted dataclass that still
+round-trips through dataclasses.asdict (used by save/load).
+If broken, each entity carries a per-object dict again, or saves fail.
+"""
+
+import dataclasses
+import inspect
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ecs import components
+from src.ecs.components import Health, Projectile, Inventory, InventoryItem
+
+
+COMPONENT_TYPES = [
+    obj for _, obj in inspect.getmembers(components, inspect.isclass)
+    if dataclasses.is_dataclass(obj)
+]
+
+
+# =============================================================================
+# SLOTS TESTS
+# Gameplay Impact: Large fights stay within memory budget
+# =============================================================================
+
+class TestSlottedComponents:
+    """Test components have no per-instance dict."""
+    
+    @pytest.mark.parametrize("component_type", COMPONENT_TYPES, ids=lambda t: t.__name__)
+    def test_component_is_slotted(self, component_type):
+        """Every component declares __slots__ and has no __dict__.
+        
+        GAMEPLAY: Hundreds of corpses and projectiles cost less memory.
+        """
+        assert "__slots__" in vars(component_type)
+        assert not hasattr(component_type.__new__(component_type), "__dict__")
+    
+    def test_undeclared_attribute_rejected(self):
+        """Setting an undeclared field raises instead of growing the object.
+        
+        GAMEPLAY: Typos in processor code fail loudly, not silently.
+        """
+        with pytest.raises(AttributeError):
+            Health().curent = 5
+    
+    def test_projectile_lifetime_is_a_field(self):
+        """Projectiles carry their lifetime as a declared field.
+        
+        GAMEPLAY: Missed projectiles still fizzle out after a few seconds.
+        """
+        proj = Projectile()
+        proj.lifetime -= 1.0
+        assert proj.lifetime == 4.0
+
+
+# =============================================================================
+# ASDICT TESTS
+# Gameplay Impact: Save files keep the same shape
+# =============================================================================
+
+class TestAsdict:
+    """Test dataclasses.asdict still works on slotted components."""
+    
+    def test_nested_components_serialize(self):
+        """asdict recurses into nested slotted dataclasses.
+        
+        GAMEPLAY: Inventories save with all their items.
+        """
+        inv = Inventory(items=[InventoryItem(item_id="sword", quantity=1)])
+        data = dataclasses.asdict(inv)
+        assert data["items"][0]["item_id"] == "sword"
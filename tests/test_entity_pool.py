@@ -0,0 +1,261 @@
+"""Tests for entity pools.
+
+These tests ensure projectiles, effects and damage numbers are recycled
+without leaking state between uses. If broken, a reused damage number
+shows the old value, a parked projectile keeps hitting, or a stale ID
+clobbers an entity in a new game.
+"""
+
+import esper
+import pytest
+import re
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ecs.components import (
+    Position, DamageNumber, ToRemove, Pooled, PartyMember
+)
+from src.ecs.entity_pool import EntityPool, pools, pool_stats, release
+from src.ecs.processors import AnimationProcessor, CleanupProcessor
+from src.ecs.queries import query
+from src.rendering.interpolation import PositionInterpolator
+
+
+@pytest.fixture
+def pool():
+    """Fresh damage number pool on a fresh world."""
+    esper.clear_database()
+    pool = EntityPool("test_numbers", Position, DamageNumber, max_parked=4)
+    yield pool
+    del pools["test_numbers"]
+    esper.clear_database()
+
+
+# =============================================================================
+# RECYCLING TESTS
+# Gameplay Impact: Spell spam reuses entities instead of churning them
+# =============================================================================
+
+class TestRecycling:
+    """Test spawn and release."""
+    
+    def test_released_entity_is_reused(self, pool):
+        """The next spawn after a release gets the same entity back.
+        
+        GAMEPLAY: Damage numbers during a fight come from the pool.
+        """
+        ent = pool.spawn((1.0, 2.0), (10,))
+        number = esper.component_for_entity(ent, DamageNumber)
+        pool.release(ent)
+        
+        again = pool.spawn((3.0, 4.0), (25, True))
+        assert again == ent
+        assert esper.component_for_entity(again, DamageNumber) is number
+        assert pool.reused == 1 and pool.created == 1
+    
+    def test_reused_components_are_reinitialized(self, pool):
+        """Unlisted fields get their defaults back.
+        
+        GAMEPLAY: A recycled damage number floats for its full time.
+        """
+        ent = pool.spawn((1.0, 2.0), (10, True))
+        number = esper.component_for_entity(ent, DamageNumber)
+        number.timer = -0.1
+        pool.release(ent)
+        
+        pool.spawn((3.0, 4.0), (25,))
+        assert number == DamageNumber(value=25)
+        assert esper.component_for_entity(ent, Position) == Position(x=3.0, y=4.0)
+    
+    def test_released_entity_is_gone(self, pool):
+        """A parked entity doesn't exist and isn't in any query.
+        
+        GAMEPLAY: Expired damage numbers stop being drawn.
+        """
+        ent = pool.spawn((1.0, 2.0), (10,))
+        assert [e for e, _ in query(Position, DamageNumber)] == [ent]
+        pool.release(ent)
+        
+        assert not esper.entity_exists(ent)
+        assert query(Position, DamageNumber) == []
+        assert esper.get_components(Position) == []
+        
+        pool.spawn((1.0, 2.0), (10,))
+        assert [e for e, _ in query(Position, DamageNumber)] == [ent]
+    
+    def test_extra_components_are_dropped(self, pool):
+        """Components added while alive don't come back on reuse.
+        
+        GAMEPLAY: A recycled effect isn't removed again right away.
+        """
+        ent = pool.spawn((1.0, 2.0), (10,))
+        esper.add_component(ent, ToRemove())
+        pool.release(ent)
+        
+        pool.spawn((1.0, 2.0), (10,))
+        assert not esper.has_component(ent, ToRemove)
+        assert esper.get_components(ToRemove) == []
+    
+    def test_release_drops_interpolation(self, pool):
+        """A recycled entity is drawn where it respawns, not slid from its old spot.
+        
+        GAMEPLAY: A damage number reused nearby doesn't streak across the screen.
+        """
+        interpolator = PositionInterpolator()
+        pool.on_release = interpolator.forget
+        ent = pool.spawn((1.0, 2.0), (10,))
+        interpolator.snapshot()
+        pool.release(ent)
+        again = pool.spawn((2.0, 2.5), (25,))
+        interpolator.set_alpha(0.5)
+        
+        assert again == ent
+        assert interpolator.position(again, esper.component_for_entity(again, Position)) == (2.0, 2.5)
+    
+    def test_full_pool_deletes(self, pool):
+        """Releases beyond max_parked delete the entity instead.
+        
+        GAMEPLAY: A huge burst doesn't keep memory forever.
+        """
+        ents = [pool.spawn((0.0, 0.0), (i,)) for i in range(6)]
+        for ent in ents:
+            pool.release(ent)
+        esper.clear_dead_entities()
+        
+        assert len(pool) == 4
+        assert not any(esper.entity_exists(ent) for ent in ents)
+    
+    def test_disabled_pool_deletes(self, pool):
+        """With pooling off, release is a normal delete.
+        
+        GAMEPLAY: Pooling can be switched off to rule it out in a bug hunt.
+        """
+        pool.enabled = False
+        ent = pool.spawn((0.0, 0.0), (1,))
+        pool.release(ent)
+        esper.clear_dead_entities()
+        
+        assert len(pool) == 0
+        assert pool.spawn((0.0, 0.0), (1,)) != ent
+    
+    def test_cleared_database_drops_parked(self, pool):
+        """Parked IDs aren't reused after the world is cleared.
+        
+        GAMEPLAY: Starting a new game can't overwrite the party with an old effect.
+        """
+        ent = pool.spawn((0.0, 0.0), (1,))
+        pool.release(ent)
+        esper.clear_database()
+        
+        party = esper.create_entity(PartyMember())
+        assert party == ent  # IDs restart after a clear
+        number = pool.spawn((0.0, 0.0), (1,))
+        assert number != party
+        assert esper.has_component(party, PartyMember)
+        assert len(pool) == 0
+
+
+# =============================================================================
+# PROCESSOR INTEGRATION TESTS
+# Gameplay Impact: Effects expire and get cleaned up as before
+# =============================================================================
+
+class TestProcessorIntegration:
+    """Test the processors hand pooled entities back."""
+    
+    def test_cleanup_releases_pooled(self, pool):
+        """ToRemove on a pooled entity parks it instead of deleting it.
+        
+        GAMEPLAY: A projectile that hit something is recycled.
+        """
+        ent = pool.spawn((0.0, 0.0), (1,))
+        other = esper.create_entity(Position(), ToRemove())
+        esper.add_component(ent, ToRemove())
+        CleanupProcessor().process(0.016)
+        esper.clear_dead_entities()
+        
+        assert len(pool) == 1
+        assert not esper.entity_exists(ent)
+        assert not esper.entity_exists(other)
+    
+    def test_expired_number_is_released(self, pool):
+        """A damage number past its timer goes straight back to its pool.
+        
+        GAMEPLAY: Floating numbers disappear on time.
+        """
+        ent = pool.spawn((0.0, 0.0), (1,))
+        AnimationProcessor().process(2.0)
+        
+        assert len(pool) == 1
+        assert not esper.entity_exists(ent)
+        assert release(ent) is False
+
+
+# =============================================================================
+# INSTRUMENTATION TESTS
+# Gameplay Impact: Pool hit rates show up in run reports
+# =============================================================================
+
+class TestInstrumentation:
+    """Test pool statistics."""
+    
+    def test_stats_report_hit_rate(self, pool):
+        """Hit rate and allocations avoided are reported per pool.
+        
+        GAMEPLAY: --headless runs show whether pooling is paying off.
+        """
+        for _ in range(4):
+            pool.release(pool.spawn((0.0, 0.0), (1,)))
+        
+        stats = pool_stats(seconds=2.0)["test_numbers"]
+        assert stats["spawns"] == 4
+        assert stats["hit_rate"] == 0.75
+        assert stats["allocations_avoided"] == 3 * 3
+        assert stats["reused_per_sec"] == 1.5
+    
+    def test_pooled_tag_names_pool(self, pool):
+        """Pooled entities carry a tag naming their pool.
+        
+        GAMEPLAY: Cleanup knows where to return each entity.
+        """
+        ent = pool.spawn((0.0, 0.0), (1,))
+        assert esper.component_for_entity(ent, Pooled).pool == "test_numbers"
+
+
+# =============================================================================
+# ESPER INTERNALS TESTS
+# Gameplay Impact: An esper upgrade that moves its database fails here, not mid-fight
+# =============================================================================
+
+class TestEsperInternals:
+    """Test the private esper state the pools read and write."""
+    
+    def test_database_layout(self):
+        """esper still keeps entities and components where the pools expect.
+        
+        GAMEPLAY: Recycled projectiles and damage numbers keep working.
+        """
+        ent = esper.create_entity(Position(1.0, 2.0))
+        
+        assert esper._entities[ent] == {Position: esper.component_for_entity(ent, Position)}
+        assert ent in esper._components[Position]
+        esper.delete_entity(ent)
+        assert ent in esper._dead_entities
+        assert callable(esper.clear_cache)
+        
+        counter = esper._entity_count
+        assert hasattr(counter, "__next__")
+        esper.clear_database()
+        assert esper._entity_count is not counter  # How pools notice a new database
+    
+    def test_version_matches_pin(self):
+        """The installed esper is the minor version requirements.txt pins.
+        
+        GAMEPLAY: Nobody runs the pools against an untested esper.
+        """
+        path = os.path.join(os.path.dirname(__file__), "..", "requirements.txt")
+        with open(path) as f:
+            pinned = re.search(r"^esper>=(\d+\.\d+)", f.read(), re.MULTILINE).group(1)
+        assert esper.__version__.split(".")[:2] == pinned.split(".")
@@ -0,0 +1,240 @@
+"""Tests for the event bus.
+
+These tests ensure events reach subscribers in order and that handler
+tracing only happens when perf monitoring is on.
+If broken, systems stop reacting to each other.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.events import EventBus, Event, EventType
+from src.core.event_payloads import DamageDealt, ProjectileHit
+from src.core.perf_monitor import perf
+
+
+@pytest.fixture
+def traced_perf(monkeypatch):
+    """The global perf monitor (on by default) with no samples yet."""
+    monkeypatch.setattr(perf, "enabled", True)
+    perf.reset()
+    yield perf
+    perf.reset()
+
+
+@pytest.fixture
+def untraced_perf(monkeypatch):
+    """The global perf monitor switched off for one test."""
+    monkeypatch.setattr(perf, "enabled", False)
+    perf.reset()
+    yield perf
+
+
+# =============================================================================
+# DISPATCH TESTS
+# Gameplay Impact: Damage, deaths and loot all flow through events
+# =============================================================================
+
+class TestDispatch:
+    """Test queued event dispatch."""
+    
+    def test_events_processed_in_order(self):
+        """Queued events reach handlers in emit order.
+        
+        GAMEPLAY: Damage is applied before the death it causes.
+        """
+        bus = EventBus()
+        seen = []
+        bus.subscribe(EventType.DAMAGE_DEALT, lambda e: seen.append(e.data["amount"]))
+        for amount in range(5):
+            bus.emit(EventType.DAMAGE_DEALT, amount=amount)
+        bus.process()
+        assert seen == [0, 1, 2, 3, 4]
+    
+    def test_events_emitted_during_processing(self):
+        """Events emitted by a handler are handled in the same process() call.
+        
+        GAMEPLAY: A kill emitted from a damage handler still drops loot this frame.
+        """
+        bus = EventBus()
+        died = []
+        bus.subscribe(EventType.DAMAGE_DEALT, lambda e: bus.emit(EventType.ENTITY_DIED, entity=1))
+        bus.subscribe(EventType.ENTITY_DIED, lambda e: died.append(e.data["entity"]))
+        bus.emit(Event(EventType.DAMAGE_DEALT, {"amount": 99}))
+        bus.process()
+        assert died == [1]
+    
+    def test_unsubscribe_stops_delivery(self):
+        """Unsubscribed handlers no longer receive events.
+        
+        GAMEPLAY: Closed UI panels stop reacting.
+        """
+        bus = EventBus()
+        calls = []
+        
+        def first(event):
+            calls.append("first")
+        
+        def second(event):
+            calls.append("second")
+        
+        bus.subscribe(EventType.LEVEL_UP, first)
+        bus.subscribe(EventType.LEVEL_UP, second)
+        bus.unsubscribe(EventType.LEVEL_UP, first)
+        bus.emit(EventType.LEVEL_UP)
+        bus.process()
+        assert calls == ["second"]
+
+
+# =============================================================================
+# TRACING TESTS
+# Gameplay Impact: Slow handlers can be found without slowing normal play
+# =============================================================================
+
+class TestTracing:
+    """Test per-handler perf tracing."""
+    
+    def test_untraced_records_nothing(self, untraced_perf):
+        """With perf disabled no handler timings are recorded.
+        
+        GAMEPLAY: Normal play pays nothing for tracing.
+        """
+        bus = EventBus()
+        bus.subscribe(EventType.DAMAGE_DEALT, lambda e: None)
+        bus.emit(EventType.DAMAGE_DEALT, amount=1)
+        bus.process()
+        assert perf.sections() == []
+    
+    def test_untraced_never_touches_perf(self, untraced_perf, monkeypatch):
+        """With perf disabled neither handlers nor batch handlers call into it.
+        
+        GAMEPLAY: A frame full of hits costs no tracing calls at all.
+        """
+        def fail(label):
+            raise AssertionError(f"perf called for {label}")
+        
+        monkeypatch.setattr(perf, "mark", fail)
+        monkeypatch.setattr(perf, "measure", fail)
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.DAMAGE_DEALT, lambda e: None)
+        bus.subscribe_batch(EventType.DAMAGE_DEALT, received.append)
+        bus.emit(EventType.DAMAGE_DEALT, amount=1)
+        bus.process()
+        assert len(received) == 1
+    
+    def test_traced_uses_handler_labels(self, traced_perf):
+        """With perf enabled each handler is timed under its own label.
+        
+        GAMEPLAY: Perf reports name the slow handler.
+        """
+        bus = EventBus()
+        
+        def on_damage(event):
+            pass
+        
+        bus.subscribe(EventType.DAMAGE_DEALT, on_damage)
+        for _ in range(3):
+            bus.emit(EventType.DAMAGE_DEALT, amount=1)
+        bus.process()
+        assert traced_perf.stats("Event:DAMAGE_DEALT:on_damage")["calls"] == 3
+
+
+# =============================================================================
+# TYPED PAYLOAD TESTS
+# Gameplay Impact: Hot combat events stay cheap without breaking handlers
+# =============================================================================
+
+class TestTypedPayloads:
+    """Test slotted payload classes."""
+    
+    def test_payload_reads_like_dict(self):
+        """Typed payloads answer the same .get() calls as dict payloads.
+        
+        GAMEPLAY: Existing damage handlers keep working.
+        """
+        payload = DamageDealt(attacker=1, target=2, amount=15, is_crit=True)
+        assert payload.get("amount") == 15
+        assert payload["target"] == 2
+        assert payload.get("weapon_type", "melee") == "melee"
+        assert "is_crit" in payload
+        with pytest.raises(KeyError):
+            payload["missing"]
+    
+    def test_payload_has_no_instance_dict(self):
+        """Payloads are slotted - no per-event dict allocation.
+        
+        GAMEPLAY: Spell-heavy fights don't churn memory.
+        """
+        payload = ProjectileHit(projectile=5, target=9)
+        assert not hasattr(payload, "__dict__")
+        assert payload.to_dict() == {"projectile": 5, "target": 9}
+
+
+# =============================================================================
+# BATCH SUBSCRIBER TESTS
+# Gameplay Impact: Audio and HUD react once per frame, not once per hit
+# =============================================================================
+
+class TestBatchSubscribers:
+    """Test per-frame batched delivery."""
+    
+    def test_batch_receives_all_events_once(self):
+        """A batch subscriber gets every event of its type in one call.
+        
+        GAMEPLAY: Ten whirlwind hits play one hit sound.
+        """
+        bus = EventBus()
+        batches = []
+        per_event = []
+        bus.subscribe_batch(EventType.DAMAGE_DEALT, batches.append)
+        bus.subscribe(EventType.DAMAGE_DEALT, per_event.append)
+        for target in range(10):
+            bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(attacker=1, target=target, amount=3)))
+        bus.process()
+        assert len(batches) == 1
+        assert [e.data.target for e in batches[0]] == list(range(10))
+        assert len(per_event) == 10
+    
+    def test_no_events_no_batch_call(self):
+        """Batch subscribers aren't called on quiet frames.
+        
+        GAMEPLAY: No phantom hit sounds.
+        """
+        bus = EventBus()
+        batches = []
+        bus.subscribe_batch(EventType.DAMAGE_DEALT, batches.append)
+        bus.emit(EventType.LEVEL_UP)
+        bus.process()
+        assert batches == []
+    
+    def test_events_emitted_by_batch_handler_are_processed(self):
+        """Events emitted from a batch handler are handled in the same process().
+        
+        GAMEPLAY: Follow-up events from aggregated hits aren't delayed a frame.
+        """
+        bus = EventBus()
+        notified = []
+        bus.subscribe_batch(EventType.DAMAGE_DEALT,
+                            lambda events: bus.emit(EventType.NOTIFICATION, text=f"{len(events)} hits"))
+        bus.subscribe(EventType.NOTIFICATION, lambda e: notified.append(e.data["text"]))
+        bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(attacker=1, target=2, amount=3)))
+        bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(attacker=1, target=3, amount=3)))
+        bus.process()
+        assert notified == ["2 hits"]
+    
+    def test_unsubscribe_batch(self):
+        """Removed batch subscribers stop receiving batches.
+        
+        GAMEPLAY: Torn-down UI stops reacting.
+        """
+        bus = EventBus()
+        batches = []
+        bus.subscribe_batch(EventType.DAMAGE_DEALT, batches.append)
+        bus.unsubscribe_batch(EventType.DAMAGE_DEALT, batches.append)
+        bus.emit(Event(EventType.DAMAGE_DEALT, DamageDealt(attacker=1, target=2, amount=3)))
+        bus.process()
+        assert batches == []
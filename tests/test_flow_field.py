@@ -0,0 +1,170 @@
+"""Tests for flow fields.
+
+These tests ensure chasers following a target's flow field reach it
+along walkable tiles and that one field serves every chaser until the
+target moves or the map changes. If broken, enemy packs walk into
+walls, stop short of the party, or each enemy pays for its own search.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.constants import TileType
+from src.world.flow_field import FlowField, FlowFields
+from src.world.map_context import MapContext
+from src.world.pathfinding import Pathfinder
+from src.world.search_grid import SearchGrid
+from src.world.tile_map import TileMap
+
+
+def follow(field, x, y, limit=200):
+    """Tiles visited stepping along a field one tile at a time."""
+    tiles = [(x, y)]
+    for _ in range(limit):
+        step = field.next_tile(x, y)
+        if step is None or step == (x, y):
+            break
+        x, y = step
+        tiles.append(step)
+    return tiles
+
+
+# =============================================================================
+# FIELD TESTS
+# Gameplay Impact: Chasers take walkable, shortest routes to their target
+# =============================================================================
+
+class TestFlowField:
+    """Test single field builds and lookups."""
+    
+    def test_steps_lead_to_source(self, walled_map):
+        """Following the field from behind the wall ends on the source.
+        
+        GAMEPLAY: Enemies walk around the wall through the gap.
+        """
+        grid = SearchGrid(walled_map)
+        field = FlowField(grid, grid.index(15, 5))
+        tiles = follow(field, 5, 5)
+        
+        assert tiles[-1] == (15, 5)
+        assert (10, 18) in tiles
+        assert all(walled_map.is_walkable(x, y) for x, y in tiles)
+    
+    def test_distance_matches_astar(self, walled_map):
+        """Field costs equal shortest path costs.
+        
+        GAMEPLAY: Shared fields don't send enemies the long way round.
+        """
+        pathfinder = Pathfinder(walled_map)
+        grid = pathfinder.grid
+        field = FlowField(grid, grid.index(15, 5), radius=100)
+        tiles = pathfinder.find_tile_path(5, 5, 15, 5)
+        
+        assert len(follow(field, 5, 5)) == len(tiles)
+        assert field.distance(15, 5) == 0
+    
+    def test_no_corner_cutting(self):
+        """Diagonal steps never squeeze between two walls.
+        
+        GAMEPLAY: Enemies don't clip through wall corners.
+        """
+        game_map = TileMap(10, 10)
+        game_map.fill_rect(1, 1, 8, 8, TileType.FLOOR)
+        game_map.set_tile(5, 4, TileType.WALL)
+        game_map.set_tile(4, 5, TileType.WALL)
+        grid = SearchGrid(game_map)
+        field = FlowField(grid, grid.index(5, 5))
+        
+        assert field.next_tile(4, 4) != (5, 5)
+    
+    def test_out_of_radius(self, walled_map):
+        """Tiles beyond the radius have no step.
+        
+        GAMEPLAY: Far-off enemies fall back to their own pathfinding.
+        """
+        grid = SearchGrid(walled_map)
+        field = FlowField(grid, grid.index(2, 2), radius=5)
+        
+        assert field.next_tile(17, 17) is None
+        assert field.distance(17, 17) is None
+        assert field.next_tile(-1, 3) is None
+    
+    def test_lookahead_cuts_across_open_floor(self, walled_map):
+        """Lookahead heads for a farther tile in a straight line.
+        
+        GAMEPLAY: Enemies cross rooms smoothly instead of zig-zagging.
+        """
+        grid = SearchGrid(walled_map)
+        field = FlowField(grid, grid.index(2, 2))
+        x, y = field.next_tile(7, 5, lookahead=4)
+        
+        assert max(abs(x - 7), abs(y - 5)) > 1
+        assert grid.line_walkable(7, 5, x, y)
+
+
+# =============================================================================
+# SHARED FIELD TESTS
+# Gameplay Impact: A whole pack costs one search per target
+# =============================================================================
+
+class TestFlowFields:
+    """Test field reuse and rebuilds."""
+    
+    def test_many_chasers_one_build(self, walled_map):
+        """Every chaser of one target shares its field.
+        
+        GAMEPLAY: Twelve spawned enemies cost the same as one.
+        """
+        flow_fields = FlowFields(Pathfinder(walled_map))
+        for y in range(2, 14):
+            assert flow_fields.next_step(1, 15.5, 5.5, 12.5, y + 0.5, 0.0) is not None
+        
+        assert flow_fields.builds == 1
+        assert flow_fields.lookups == 12
+    
+    def test_rebuild_after_interval(self, walled_map):
+        """A moved target gets a new field once the interval has passed.
+        
+        GAMEPLAY: Enemies keep up with a running hero.
+        """
+        flow_fields = FlowFields(Pathfinder(walled_map), interval=0.2)
+        flow_fields.next_step(1, 15.5, 5.5, 12.5, 5.5, 0.0)
+        flow_fields.next_step(1, 16.5, 5.5, 12.5, 5.5, 0.1)
+        assert flow_fields.builds == 1
+        
+        flow_fields.next_step(1, 16.5, 5.5, 12.5, 5.5, 0.3)
+        assert flow_fields.builds == 2
+        flow_fields.next_step(1, 16.5, 5.5, 12.5, 5.5, 1.0)
+        assert flow_fields.builds == 2  # Target stayed on its tile
+    
+    def test_map_change_rebuilds(self, walled_map):
+        """Writing tiles rebuilds the field on the next lookup.
+        
+        GAMEPLAY: A closed gap isn't walked through.
+        """
+        flow_fields = FlowFields(Pathfinder(walled_map))
+        assert flow_fields.next_step(1, 15.5, 5.5, 5.5, 5.5, 0.0) is not None
+        
+        walled_map.set_tile(10, 18, TileType.WALL)
+        assert flow_fields.next_step(1, 15.5, 5.5, 5.5, 5.5, 0.0) is None
+        assert flow_fields.builds == 2
+    
+    def test_target_on_chaser_tile(self, walled_map):
+        """A chaser on the target's tile heads for its exact position.
+        
+        GAMEPLAY: Enemies close the last half tile to attack range.
+        """
+        flow_fields = FlowFields(Pathfinder(walled_map))
+        assert flow_fields.next_step(1, 15.3, 5.7, 15.5, 5.5, 0.0) == (15.3, 5.7)
+    
+    def test_map_context_shares_fields(self, walled_map):
+        """The map context keeps one set of fields per map.
+        
+        GAMEPLAY: All enemy AI on a level reads the same fields.
+        """
+        context = MapContext(walled_map)
+        assert context.flow_fields is context.flow_fields
+        assert context.flow_fields.pathfinder is context.pathfinder
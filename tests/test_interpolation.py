@@ -0,0 +1,125 @@
+"""Tests for render interpolation.
+
+These tests ensure entities and the camera are drawn between the last
+two fixed simulation steps. If broken, movement stutters at low
+simulation rates.
+"""
+
+import esper
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ecs.components import Position
+from src.rendering.camera import Camera
+from src.rendering.interpolation import PositionInterpolator, MAX_INTERPOLATION_DISTANCE
+
+
+@pytest.fixture
+def world():
+    """Fresh esper world."""
+    esper.clear_database()
+    yield
+    esper.clear_database()
+
+
+# =============================================================================
+# ENTITY INTERPOLATION TESTS
+# Gameplay Impact: Smooth movement between simulation steps
+# =============================================================================
+
+class TestPositionInterpolator:
+    """Test blending entity positions."""
+    
+    def test_blends_between_steps(self, world):
+        """Entities are drawn part way between previous and current step.
+        
+        GAMEPLAY: Walking looks smooth at any frame rate.
+        """
+        ent = esper.create_entity(Position(x=10.0, y=5.0))
+        interp = PositionInterpolator()
+        interp.snapshot()
+        
+        pos = esper.component_for_entity(ent, Position)
+        pos.x = 11.0
+        interp.set_alpha(0.25)
+        
+        assert interp.position(ent, pos) == pytest.approx((10.25, 5.0))
+    
+    def test_new_entity_uses_current_position(self, world):
+        """Entities spawned during the step have nothing to blend from.
+        
+        GAMEPLAY: New projectiles appear where they were created.
+        """
+        interp = PositionInterpolator()
+        interp.snapshot()
+        ent = esper.create_entity(Position(x=3.0, y=4.0))
+        interp.set_alpha(0.5)
+        
+        assert interp.position(ent, esper.component_for_entity(ent, Position)) == (3.0, 4.0)
+    
+    def test_teleport_snaps(self, world):
+        """Large jumps snap instead of sliding across the map.
+        
+        GAMEPLAY: Leaps and respawns don't streak across the screen.
+        """
+        ent = esper.create_entity(Position(x=0.0, y=0.0))
+        interp = PositionInterpolator()
+        interp.snapshot()
+        
+        pos = esper.component_for_entity(ent, Position)
+        pos.x = MAX_INTERPOLATION_DISTANCE + 5.0
+        interp.set_alpha(0.5)
+        
+        assert interp.position(ent, pos) == (pos.x, 0.0)
+    
+    def test_clear_disables_blending(self, world):
+        """After clear() entities draw at their current position.
+        
+        GAMEPLAY: New levels don't blend from the old level's positions.
+        """
+        ent = esper.create_entity(Position(x=1.0, y=1.0))
+        interp = PositionInterpolator()
+        interp.snapshot()
+        pos = esper.component_for_entity(ent, Position)
+        pos.x = 1.5
+        interp.clear()
+        
+        assert interp.position(ent, pos) == (1.5, 1.0)
+
+
+# =============================================================================
+# CAMERA INTERPOLATION TESTS
+# Gameplay Impact: The view follows the party without judder
+# =============================================================================
+
+class TestCameraInterpolation:
+    """Test blending the camera view."""
+    
+    def test_view_blends_between_steps(self):
+        """Camera draws part way between previous and current step.
+        
+        GAMEPLAY: Scrolling is as smooth as character movement.
+        """
+        camera = Camera(800, 600)
+        camera.center_on(0.0, 0.0)
+        camera.snapshot()
+        camera.follow(10.0, 0.0)
+        camera.update(0.1)
+        camera.interpolate(0.5)
+        
+        assert camera.view_x == pytest.approx(camera.x / 2)
+    
+    def test_center_on_snaps_view(self):
+        """center_on() moves the view immediately.
+        
+        GAMEPLAY: Level changes don't scroll in from the old spot.
+        """
+        camera = Camera(800, 600)
+        camera.snapshot()
+        camera.center_on(20.0, 30.0)
+        camera.interpolate(0.0)
+        
+        assert (camera.view_x, camera.view_y) == (20.0, 30.0)
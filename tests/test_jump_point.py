@@ -0,0 +1,161 @@
+"""Equivalence tests for the Jump Point Search engine.
+
+These tests ensure the "jps" engine finds paths exactly as short as
+plain A* on seeded dungeons and cluttered maps, with the same tile
+route shape and the same edge-case behaviour. If broken, switching
+engines sends units on longer routes, through wall corners, or leaves
+them standing when A* would have found a way.
+"""
+
+import random
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.constants import TileType
+from src.world.dungeon import Dungeon
+from src.world.pathfinding import Pathfinder
+from src.world.search_grid import STRAIGHT_COST, DIAGONAL_COST
+from src.world.tile_map import TileMap
+
+
+def legal_cost(game_map, tiles):
+    """Cost of a tile path, checking every step is one legal move."""
+    total = 0
+    for (x1, y1), (x2, y2) in zip(tiles, tiles[1:]):
+        assert max(abs(x2 - x1), abs(y2 - y1)) == 1
+        assert game_map.is_walkable(x2, y2)
+        if x1 != x2 and y1 != y2:
+            assert game_map.is_walkable(x2, y1) and game_map.is_walkable(x1, y2)
+            total += DIAGONAL_COST
+        else:
+            total += STRAIGHT_COST
+    return total
+
+
+def engines(game_map):
+    """A* and JPS pathfinders for one map."""
+    return (Pathfinder(game_map, hierarchical=False, engine="astar"),
+            Pathfinder(game_map, hierarchical=False, engine="jps"))
+
+
+def cluttered_map(seed):
+    """Open floor with randomly scattered walls."""
+    rng = random.Random(seed)
+    size = rng.randint(6, 30)
+    game_map = TileMap(size, size)
+    game_map.fill_rect(0, 0, size, size, TileType.FLOOR)
+    for _ in range(int(size * size * rng.uniform(0.1, 0.45))):
+        game_map.set_tile(rng.randrange(size), rng.randrange(size), TileType.WALL)
+    return game_map, rng
+
+
+# =============================================================================
+# EQUIVALENCE TESTS
+# Gameplay Impact: Swapping engines never changes how far units walk
+# =============================================================================
+
+class TestEquivalence:
+    """Test JPS against A* on a corpus of maps."""
+    
+    @pytest.mark.parametrize("seed", range(8))
+    def test_seeded_dungeons(self, seed):
+        """Tile paths cost the same as A* on generated levels.
+        
+        GAMEPLAY: Enemies take equally short routes with either engine.
+        """
+        dungeon = Dungeon(80, 80)
+        dungeon.generate(seed=seed)
+        astar, jps = engines(dungeon)
+        rng = random.Random(seed)
+        floor = dungeon.walkable_positions()
+        for _ in range(25):
+            start, goal = rng.choice(floor), rng.choice(floor)
+            expected = astar.find_tile_path(*start, *goal)
+            tiles = jps.find_tile_path(*start, *goal)
+            
+            assert tiles[0] == start and tiles[-1] == goal
+            assert legal_cost(dungeon, tiles) == legal_cost(dungeon, expected)
+    
+    def test_cluttered_maps(self):
+        """Same costs and reachability on maps full of stray walls.
+        
+        GAMEPLAY: Rubble and pillars don't trip up the faster engine.
+        """
+        for seed in range(60):
+            game_map, rng = cluttered_map(seed)
+            astar, jps = engines(game_map)
+            for _ in range(10):
+                start = (rng.randrange(game_map.width), rng.randrange(game_map.height))
+                goal = (rng.randrange(game_map.width), rng.randrange(game_map.height))
+                expected = astar.find_tile_path(*start, *goal)
+                tiles = jps.find_tile_path(*start, *goal)
+                
+                assert bool(tiles) == bool(expected)
+                if tiles:
+                    assert legal_cost(game_map, tiles) == legal_cost(game_map, expected)
+    
+    def test_waypoints_match_simplified_quality(self):
+        """find_path waypoints come from the same simplification.
+        
+        GAMEPLAY: Units walk the same smooth lines with either engine.
+        """
+        dungeon = Dungeon(80, 80)
+        dungeon.generate(seed=11)
+        astar, jps = engines(dungeon)
+        sx, sy = dungeon.rooms[0].center
+        for room in dungeon.rooms[1:]:
+            gx, gy = room.center
+            expected = astar.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+            path = jps.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+            
+            assert path[0] == expected[0] and path[-1] == expected[-1]
+            for (x1, y1), (x2, y2) in zip(path, path[1:]):
+                assert jps.grid.line_walkable(int(x1), int(y1), int(x2), int(y2))
+
+
+# =============================================================================
+# EDGE CASE TESTS
+# Gameplay Impact: Stuck units and bad goals behave the same either way
+# =============================================================================
+
+class TestEdgeCases:
+    """Test walls, caps and engine selection."""
+    
+    def test_start_inside_wall(self):
+        """A start inside a wall steps out like A* does.
+        
+        GAMEPLAY: Knocked-back units still find their way.
+        """
+        game_map, _ = cluttered_map(3)
+        game_map.fill_rect(4, 4, 3, 3, TileType.WALL)
+        game_map.set_tile(7, 5, TileType.FLOOR)
+        game_map.set_tile(9, 5, TileType.FLOOR)
+        astar, jps = engines(game_map)
+        
+        assert bool(jps.find_tile_path(6, 5, 9, 5)) == bool(astar.find_tile_path(6, 5, 9, 5))
+    
+    def test_capped_search(self):
+        """A capped search returns a partial route from the start.
+        
+        GAMEPLAY: Capped chases still close in on the party.
+        """
+        game_map = TileMap(60, 20)
+        game_map.fill_rect(1, 1, 58, 18, TileType.FLOOR)
+        for x in range(5, 55, 4):
+            game_map.fill_rect(x, 1 if x % 8 else 2, 1, 17, TileType.WALL)
+        jps = Pathfinder(game_map, hierarchical=False, engine="jps")
+        
+        tiles = jps.find_tile_path(2, 10, 57, 10, max_iterations=3)
+        assert tiles and tiles[0] == (2, 10) and tiles[-1] != (57, 10)
+        legal_cost(game_map, tiles)
+    
+    def test_unknown_engine(self):
+        """Only the known engines can be selected.
+        
+        GAMEPLAY: A typo in settings fails at startup, not mid-level.
+        """
+        with pytest.raises(ValueError):
+            Pathfinder(TileMap(5, 5), engine="dijkstra")
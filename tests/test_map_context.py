@@ -0,0 +1,178 @@
+"""Tests for the shared map context.
+
+These tests ensure processors follow the active map (dungeon or town)
+through one shared context. If broken, collision and line of sight use
+the wrong map after a town visit.
+"""
+
+import esper
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.events import EventBus
+from src.ecs.components import Position, PartyMember
+from src.ecs.processors import MovementProcessor, WorldProcessor, PositionValidator, AIProcessor
+from src.world import Dungeon, MapContext
+from src.world.town_map import TownMap
+
+
+@pytest.fixture
+def dungeon():
+    """Small generated dungeon."""
+    d = Dungeon(40, 40)
+    d.generate(min_rooms=3, max_rooms=5, seed=1)
+    return d
+
+
+@pytest.fixture
+def town():
+    """Town map."""
+    return TownMap()
+
+
+# =============================================================================
+# ACTIVE MAP TESTS
+# Gameplay Impact: Collision and line of sight use the map the party is on
+# =============================================================================
+
+class TestActiveMap:
+    """Test switching between dungeon and town."""
+    
+    def test_town_visit_swaps_active_map(self, dungeon, town):
+        """Entering town makes the town active, leaving restores the dungeon.
+        
+        GAMEPLAY: Party walks on town tiles in town and dungeon tiles below.
+        """
+        context = MapContext(dungeon)
+        assert context.active is dungeon
+        assert not context.in_town
+        
+        context.enter_town(town)
+        assert context.active is town
+        assert context.in_town
+        
+        context.leave_town()
+        assert context.active is dungeon
+        assert not context.in_town
+    
+    def test_new_level_while_in_town_keeps_town_active(self, dungeon, town):
+        """Loading a new dungeon while in town doesn't leave town.
+        
+        GAMEPLAY: Leaving town lands the party in the right dungeon.
+        """
+        context = MapContext(dungeon)
+        context.enter_town(town)
+        
+        next_level = Dungeon(40, 40)
+        context.set_dungeon(next_level)
+        assert context.active is town
+        
+        context.leave_town()
+        assert context.active is next_level
+    
+    def test_processors_follow_shared_context(self, dungeon, town):
+        """Processors read the map from the context, not their own copy.
+        
+        GAMEPLAY: One switch moves every system to the town map.
+        """
+        bus = EventBus()
+        context = MapContext(dungeon)
+        movement = MovementProcessor(bus, context)
+        ai = AIProcessor(bus, context)
+        world = WorldProcessor(bus, context)
+        
+        context.enter_town(town)
+        assert movement.dungeon is town
+        assert ai.dungeon is town
+        # No stairs or enemy spawning in town
+        assert world.dungeon is None
+        
+        context.leave_town()
+        assert movement.dungeon is dungeon
+        assert world.dungeon is dungeon
+    
+    def test_validator_forgets_positions_from_other_map(self, dungeon, town):
+        """Last valid positions are dropped when the active map changes.
+        
+        GAMEPLAY: Party isn't snapped back to dungeon spots while in town.
+        """
+        esper.clear_database()
+        context = MapContext(dungeon)
+        validator = PositionValidator(EventBus(), context)
+        
+        x, y = dungeon.get_player_spawn()
+        esper.create_entity(Position(x=x, y=y), PartyMember(party_index=0))
+        validator.process(1 / 60)
+        assert validator._last_valid_positions
+        
+        context.enter_town(town)
+        validator.process(1 / 60)
+        assert validator._validated_map is town
+        esper.clear_database()
+
+
+# =============================================================================
+# DERIVED DATA TESTS
+# Gameplay Impact: Per-map caches survive town visits
+# =============================================================================
+
+class TestDerivedData:
+    """Test per-map cached data."""
+    
+    def test_derived_built_once_per_map(self, dungeon, town):
+        """Derived data is built on first use and reused after a town visit.
+        
+        GAMEPLAY: Returning from town doesn't rebuild pathfinding data.
+        """
+        context = MapContext(dungeon)
+        built = []
+        
+        def factory(game_map):
+            built.append(game_map)
+            return object()
+        
+        first = context.derived("grid", factory)
+        context.enter_town(town)
+        town_grid = context.derived("grid", factory)
+        context.leave_town()
+        
+        assert context.derived("grid", factory) is first
+        assert town_grid is not first
+        assert built == [dungeon, town]
+    
+    def test_pathfinder_cached_per_map(self, dungeon, town):
+        """Each map gets its own pathfinder.
+        
+        GAMEPLAY: Enemies path around dungeon walls, not town walls.
+        """
+        context = MapContext(dungeon)
+        dungeon_pathfinder = context.pathfinder
+        assert dungeon_pathfinder.dungeon is dungeon
+        assert context.pathfinder is dungeon_pathfinder
+        
+        context.enter_town(town)
+        assert context.pathfinder.dungeon is town
+    
+    def test_set_dungeon_drops_stale_data(self, dungeon):
+        """Regenerating a dungeon in place drops its derived data.
+        
+        GAMEPLAY: A new game never paths through the old layout.
+        """
+        context = MapContext(dungeon)
+        first = context.pathfinder
+        
+        dungeon.generate(min_rooms=3, max_rooms=5, seed=2)
+        context.set_dungeon(dungeon)
+        assert context.pathfinder is not first
+    
+    def test_no_map_no_data(self):
+        """Without a map there is nothing to derive.
+        
+        GAMEPLAY: Processors created before the first level don't crash.
+        """
+        context = MapContext()
+        assert context.pathfinder is None
+        assert context.derived("grid", lambda m: 1) is None
@@ -0,0 +1,138 @@
+"""Tests for the path cache.
+
+These tests ensure repeated route requests are served from the cache
+and never return a route for an outdated layout. If broken, enemies
+walk into walls of a regenerated level or pathfinding cost returns
+with every chasing enemy.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.constants import TileType
+from src.world.dungeon import Dungeon
+from src.world.map_context import MapContext
+from src.world.path_cache import PathCache
+from src.world.pathfinding import Pathfinder
+from src.world.town_map import TownMap
+
+
+# =============================================================================
+# LOOKUP TESTS
+# Gameplay Impact: A pack chasing one hero searches once, not per enemy
+# =============================================================================
+
+class TestLookups:
+    """Test exact and subpath hits."""
+    
+    def test_repeat_request_hits(self, walled_map):
+        """The same tiles twice search once.
+        
+        GAMEPLAY: Re-deciding every 0.2 s doesn't redo the search.
+        """
+        pathfinder = Pathfinder(walled_map)
+        first = pathfinder.find_path(5.5, 5.5, 15.5, 5.5)
+        second = pathfinder.find_path(5.2, 5.8, 15.3, 5.1)
+        
+        assert pathfinder.cache.hits == 1 and pathfinder.cache.misses == 1
+        assert second[:-1] == first[:-1]
+        assert second[-1] == (15.3, 5.1)  # Exact goal, not the cached one
+    
+    def test_start_on_cached_route(self, walled_map):
+        """A start tile on a cached route reuses the rest of it.
+        
+        GAMEPLAY: Enemies following each other share one route.
+        """
+        pathfinder = Pathfinder(walled_map)
+        pathfinder.find_path(5.5, 5.5, 15.5, 5.5)
+        tiles = pathfinder.find_tile_path(5, 5, 15, 5)
+        mid_x, mid_y = tiles[len(tiles) // 2]
+        
+        path = pathfinder.find_path(mid_x + 0.5, mid_y + 0.5, 15.5, 5.5)
+        assert pathfinder.cache.subpath_hits == 1
+        assert path[0] == (mid_x + 0.5, mid_y + 0.5)
+        assert path[-1] == (15.5, 5.5)
+    
+    def test_cached_path_is_a_copy(self, walled_map):
+        """Callers can't corrupt the cached waypoints.
+        
+        GAMEPLAY: One enemy's path edits don't leak into another's.
+        """
+        pathfinder = Pathfinder(walled_map)
+        pathfinder.find_path(5.5, 5.5, 15.5, 5.5).clear()
+        assert pathfinder.find_path(5.5, 5.5, 15.5, 5.5)
+    
+    def test_capped_paths_not_cached(self, walled_map):
+        """Partial routes from a capped search aren't stored.
+        
+        GAMEPLAY: A later uncapped request still gets the full route.
+        """
+        pathfinder = Pathfinder(walled_map)
+        partial = pathfinder.find_path(2.5, 2.5, 15.5, 2.5, max_iterations=10)
+        full = pathfinder.find_path(2.5, 2.5, 15.5, 2.5)
+        
+        assert partial[-1] != (15.5, 2.5)
+        assert full[-1] == (15.5, 2.5)
+        assert len(pathfinder.cache) == 1
+
+
+# =============================================================================
+# EVICTION / INVALIDATION TESTS
+# Gameplay Impact: Memory stays bounded and routes match the map
+# =============================================================================
+
+class TestInvalidation:
+    """Test LRU eviction and map changes."""
+    
+    def test_lru_eviction(self):
+        """The least recently used route goes first.
+        
+        GAMEPLAY: Routes still in use by the current fight stay cached.
+        """
+        cache = PathCache(capacity=2)
+        cache.put(1, 10, 0, [1, 10], [(0.5, 0.5)])
+        cache.put(2, 10, 0, [2, 10], [(1.5, 0.5)])
+        cache.get(1, 10, 0)
+        cache.put(3, 10, 0, [3, 10], [(2.5, 0.5)])
+        
+        assert cache.get(2, 10, 0) is None
+        assert cache.get(1, 10, 0) is not None
+        assert cache.evictions == 1
+        assert cache.subpath(2, 10, 0) is None  # Evicted routes don't serve subpaths
+    
+    def test_tile_change_invalidates(self, walled_map):
+        """Writing tiles makes cached routes miss.
+        
+        GAMEPLAY: A closed gap isn't walked through from memory.
+        """
+        pathfinder = Pathfinder(walled_map)
+        assert pathfinder.find_path(5.5, 5.5, 15.5, 5.5)
+        
+        walled_map.set_tile(10, 18, TileType.WALL)
+        assert pathfinder.find_path(5.5, 5.5, 15.5, 5.5) == []
+        assert len(pathfinder.cache) == 0
+    
+    def test_level_and_town_get_own_caches(self):
+        """New levels and the town never see another map's routes.
+        
+        GAMEPLAY: Descending stairs doesn't reuse last level's paths.
+        """
+        dungeon = Dungeon(40, 40)
+        dungeon.generate(min_rooms=3, max_rooms=5, seed=1)
+        context = MapContext(dungeon)
+        sx, sy = dungeon.rooms[0].center
+        gx, gy = dungeon.rooms[-1].center
+        context.pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+        dungeon_cache = context.pathfinder.cache
+        
+        context.enter_town(TownMap())
+        assert context.pathfinder.cache is not dungeon_cache
+        context.leave_town()
+        assert context.pathfinder.cache is dungeon_cache
+        
+        dungeon.generate(min_rooms=3, max_rooms=5, seed=2)
+        context.set_dungeon(dungeon)
+        assert len(context.pathfinder.cache) == 0
@@ -0,0 +1,321 @@
+"""Tests for time-sliced path requests.
+
+These tests ensure queued path searches stay inside the per-tick node
+budget, finish on a later tick with the same paths as find_path, keep
+one request per entity, and report their queue metrics. If broken, a
+single bad query stalls the fixed step again, units wait forever for
+paths, or a crowd floods the queue with duplicate searches.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import esper
+
+from src.core.constants import TileType, AIState, FIXED_TIMESTEP
+from src.core.events import EventBus
+from src.ecs.components import Position, MoveIntent, Path, AIController, EnemyAI
+from src.ecs.processors import AIProcessor
+from src.world.dungeon import Dungeon
+from src.world.map_context import MapContext
+from src.world.path_requests import PathRequests
+from src.world.path_search import PathSearch
+from src.world.pathfinding import Pathfinder
+
+
+@pytest.fixture
+def walled_map_size():
+    """The budget tests need searches longer than one tick's budget."""
+    return 40
+
+
+def run_until_done(requests, ent, limit=100):
+    """Tick until the entity's result arrives; (path, ticks taken)."""
+    for tick in range(1, limit + 1):
+        requests.update()
+        path = requests.result(ent)
+        if path is not None:
+            return path, tick
+    raise AssertionError("request never finished")
+
+
+# =============================================================================
+# BUDGET TESTS
+# Gameplay Impact: No single search can stall the fixed step
+# =============================================================================
+
+class TestBudget:
+    """Test incremental searches under the node budget."""
+    
+    def test_search_resumes_to_same_route(self, walled_map):
+        """A search split into slices finds the same route as one call.
+        
+        GAMEPLAY: Time-slicing doesn't make paths any longer.
+        """
+        pathfinder = Pathfinder(walled_map, hierarchical=False)
+        grid = pathfinder.grid
+        search = PathSearch(grid, grid.index(5, 5), grid.index(35, 5))
+        while not search.done:
+            assert search.advance(7) <= 7
+        
+        assert search.route() == pathfinder._route(grid, grid.index(5, 5), grid.index(35, 5), None)
+    
+    def test_budget_spread_over_ticks(self, walled_map):
+        """A long search finishes on a later tick within the budget each tick.
+        
+        GAMEPLAY: A unit behind a long wall gets its path without a hitch.
+        """
+        requests = PathRequests(Pathfinder(walled_map, hierarchical=False), budget=50)
+        requests.submit(1, 5.5, 5.5, 35.5, 5.5)
+        nodes = []
+        path = None
+        while path is None:
+            before = requests.nodes
+            requests.update()
+            nodes.append(requests.nodes - before)
+            path = requests.result(1)
+        
+        assert len(nodes) > 1 and max(nodes) <= 50
+        assert path == Pathfinder(walled_map, hierarchical=False).find_path(5.5, 5.5, 35.5, 5.5)
+    
+    def test_unreachable_answered_without_search(self, walled_map):
+        """Goals in a sealed-off area are answered for one tile of budget.
+        
+        GAMEPLAY: Chasing a hero across a chasm doesn't eat the budget.
+        """
+        walled_map.set_tile(20, 38, TileType.WALL)
+        requests = PathRequests(Pathfinder(walled_map), budget=50)
+        requests.submit(1, 5.5, 5.5, 35.5, 5.5)
+        requests.update()
+        
+        assert requests.result(1) == []
+        assert requests.nodes == 1
+    
+    def test_instant_answers_share_budget(self, walled_map):
+        """Cache hits still spend budget, so a tick answers a bounded number.
+        
+        GAMEPLAY: A whole pack re-pathing at once doesn't stall one step.
+        """
+        pathfinder = Pathfinder(walled_map)
+        pathfinder.find_path(5.5, 5.5, 35.5, 5.5)
+        requests = PathRequests(pathfinder, budget=10)
+        for ent in range(30):
+            requests.submit(ent, 5.5, 5.5, 35.5, 5.5)
+        requests.update()
+        
+        assert requests.completed == 10
+        assert requests.depth == 20
+    
+    def test_long_request_uses_room_graph(self):
+        """Far-apart tiles are answered through the room graph, not a flat search.
+        
+        GAMEPLAY: RETURN-to-home across a level doesn't crawl through the budget.
+        """
+        dungeon = Dungeon(100, 100)
+        dungeon.generate(min_rooms=12, max_rooms=16, seed=3)
+        pathfinder = Pathfinder(dungeon)
+        calls = []
+        original = pathfinder.room_graph.route
+        pathfinder.room_graph.route = lambda start, goal: calls.append(goal) or original(start, goal)
+        sx, sy = dungeon.rooms[0].center
+        gx, gy = max(dungeon.rooms, key=lambda r: abs(r.x - sx) + abs(r.y - sy)).center
+        requests = PathRequests(pathfinder, budget=50)
+        requests.submit(1, sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+        requests.update()
+        
+        assert calls and requests.nodes == 1 + pathfinder.room_graph.expanded
+        assert requests.result(1)[-1] == (gx + 0.5, gy + 0.5)
+    
+    def test_room_graph_work_bounded_per_tick(self):
+        """Room graph routes are paid for, so many far requests spread over ticks.
+        
+        GAMEPLAY: A level's worth of enemies heading home doesn't stall one step.
+        """
+        dungeon = Dungeon(100, 100)
+        dungeon.generate(min_rooms=12, max_rooms=16, seed=3)
+        pathfinder = Pathfinder(dungeon)
+        gx, gy = dungeon.get_player_spawn()
+        floor = dungeon.walkable_positions()
+        requests = PathRequests(pathfinder, budget=400)
+        for ent in range(100):
+            x, y = floor[(ent * 7919) % len(floor)]
+            requests.submit(ent, x + 0.5, y + 0.5, gx, gy)
+        
+        room_graph = pathfinder.room_graph
+        spent, graph_work = [], []
+        while requests.depth:
+            before, graph_before = requests.nodes, room_graph.expanded
+            requests.update()
+            spent.append(requests.nodes - before)
+            graph_work.append(room_graph.expanded - graph_before)
+        
+        assert len(spent) > 3
+        assert max(spent) < 2 * requests.budget
+        assert max(graph_work) < 2 * requests.budget
+    
+    def test_map_change_restarts_search(self, walled_map):
+        """A search in progress restarts on the new layout.
+        
+        GAMEPLAY: A closed gap isn't walked through.
+        """
+        requests = PathRequests(Pathfinder(walled_map), budget=20)
+        requests.submit(1, 5.5, 5.5, 35.5, 5.5)
+        requests.update()
+        walled_map.set_tile(20, 38, TileType.WALL)
+        
+        path, _ = run_until_done(requests, 1)
+        assert path == []
+
+
+# =============================================================================
+# QUEUE TESTS
+# Gameplay Impact: Each unit waits for one path, in fair order
+# =============================================================================
+
+class TestQueue:
+    """Test per-entity dedupe, expiry and metrics."""
+    
+    def test_same_goal_deduplicated(self, walled_map):
+        """Re-submitting toward the same tile keeps one request.
+        
+        GAMEPLAY: A unit re-deciding every tick doesn't restart its search.
+        """
+        requests = PathRequests(Pathfinder(walled_map), budget=20)
+        requests.submit(1, 5.5, 5.5, 35.5, 5.5)
+        requests.update()
+        requests.submit(1, 5.6, 5.4, 35.2, 5.8)
+        
+        assert requests.depth == 1 and requests.submitted == 1
+        path, _ = run_until_done(requests, 1)
+        assert path[-1] == (35.2, 5.8)  # Latest exact goal
+    
+    def test_moved_start_skips_behind(self, walled_map):
+        """A unit that moved while its search ran gets a path from where it is.
+        
+        GAMEPLAY: Units don't walk back to where they first got stuck.
+        """
+        requests = PathRequests(Pathfinder(walled_map), budget=20)
+        requests.submit(1, 19.5, 5.5, 25.5, 5.5)
+        requests.update()
+        requests.submit(1, 15.5, 30.5, 25.5, 5.5)  # Slid down the wall meanwhile
+        
+        path, _ = run_until_done(requests, 1)
+        assert path[0] == (15.5, 30.5)
+        assert all(y > 30 for _, y in path[1:-1])  # Nothing back up at y=5
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            assert requests.pathfinder.grid.line_walkable(int(x1), int(y1), int(x2), int(y2))
+    
+    def test_new_goal_replaces_in_place(self, walled_map):
+        """A new goal replaces the request without losing its queue spot.
+        
+        GAMEPLAY: Switching targets doesn't send a unit to the back of the line.
+        """
+        requests = PathRequests(Pathfinder(walled_map), budget=5000)
+        requests.submit(1, 5.5, 5.5, 35.5, 5.5)
+        requests.submit(2, 6.5, 5.5, 35.5, 6.5)
+        requests.submit(1, 5.5, 5.5, 30.5, 30.5)
+        requests.update()
+        
+        assert requests.replaced == 1
+        assert requests.result(1)[-1] == (30.5, 30.5)
+        assert requests.result(2)[-1] == (35.5, 6.5)
+    
+    def test_results_wait_for_collection(self, walled_map):
+        """Results are kept across ticks until the unit picks them up.
+        
+        GAMEPLAY: Units deciding every few ticks still get their paths.
+        """
+        requests = PathRequests(Pathfinder(walled_map), ttl=20)
+        requests.submit(1, 5.5, 5.5, 8.5, 5.5)
+        for _ in range(15):
+            requests.update()
+        
+        assert requests.result(1)[-1] == (8.5, 5.5)
+        assert requests.expired == 0
+    
+    def test_uncollected_results_expire(self, walled_map):
+        """Results nobody collects within the TTL are dropped.
+        
+        GAMEPLAY: Dead units' paths don't pile up.
+        """
+        requests = PathRequests(Pathfinder(walled_map), ttl=20)
+        requests.submit(1, 5.5, 5.5, 8.5, 5.5)
+        for _ in range(22):
+            requests.update()
+        
+        assert requests.result(1) is None
+        assert requests.expired == 1
+    
+    def test_metrics(self, walled_map):
+        """Depth and latency are reported.
+        
+        GAMEPLAY: Slow path service shows up in the run report.
+        """
+        requests = PathRequests(Pathfinder(walled_map, hierarchical=False), budget=30)
+        for ent in range(3):
+            requests.submit(ent, 5.5, 5.5 + ent, 35.5, 5.5)
+        assert requests.depth == 3
+        for _ in range(200):
+            requests.update()
+        
+        stats = requests.stats()
+        assert stats["depth"] == 0 and stats["max_depth"] == 3
+        assert stats["completed"] == 3
+        assert stats["max_latency"] > 1 and stats["mean_latency"] >= 1
+
+
+# =============================================================================
+# AI TESTS
+# Gameplay Impact: Units keep moving while their path is worked out
+# =============================================================================
+
+class TestAIRequests:
+    """Test the AI's use of path requests."""
+    
+    @pytest.fixture(autouse=True)
+    def clean_world(self):
+        esper.clear_database()
+        yield
+        esper.clear_database()
+    
+    def test_moves_directly_while_pending(self, walled_map):
+        """Blocked units head straight for the target until the path arrives.
+        
+        GAMEPLAY: Enemies never freeze while waiting for a path.
+        """
+        ai = AIProcessor(EventBus(), MapContext(walled_map))
+        ent = esper.create_entity(Position(19.5, 5.5), MoveIntent())
+        pos = esper.component_for_entity(ent, Position)
+        
+        ai._move_toward_point(ent, pos, 25.5, 5.5)
+        assert ai.path_requests.pending(ent)
+        assert esper.component_for_entity(ent, MoveIntent).dx > 0
+        assert not esper.has_component(ent, Path)
+        
+        ai.path_requests.budget = 5000  # Whole search in one tick
+        ai.path_requests.update()
+        ai._move_toward_point(ent, pos, 25.5, 5.5)
+        path = esper.component_for_entity(ent, Path)
+        assert path.waypoints[-1] == (25.5, 5.5)
+    
+    def test_path_attached_through_decision_timer(self, walled_map):
+        """A unit returning home behind a wall gets its path on a later decision.
+        
+        GAMEPLAY: Blocked enemies walk around walls instead of into them.
+        """
+        ai = AIProcessor(EventBus(), MapContext(walled_map))
+        ent = esper.create_entity(
+            Position(19.5, 5.5), MoveIntent(), EnemyAI(),
+            AIController(state=AIState.RETURN, home_x=25.5, home_y=5.5),
+        )
+        
+        for _ in range(60):
+            ai.process(FIXED_TIMESTEP)
+        
+        assert esper.has_component(ent, Path)
+        path = esper.component_for_entity(ent, Path)
+        assert path.waypoints[-1] == (25.5, 5.5)
+        assert ai.path_requests.expired == 0
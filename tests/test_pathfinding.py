@@ -0,0 +1,171 @@
+"""Tests for A* pathfinding.
+
+These tests ensure paths are shortest, never cut corners and are found
+on any map size. If broken, enemies stop chasing through corridors,
+click-to-move does nothing on big levels, or heroes clip wall corners.
+"""
+
+import heapq
+import random
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.constants import TileType
+from src.world.dungeon import Dungeon
+from src.world.pathfinding import Pathfinder
+from src.world.search_grid import octile, STRAIGHT_COST, DIAGONAL_COST
+
+
+def step_cost(tiles):
+    """Cost of a tile path in pathfinder units."""
+    return sum(
+        DIAGONAL_COST if a[0] != b[0] and a[1] != b[1] else STRAIGHT_COST
+        for a, b in zip(tiles, tiles[1:])
+    )
+
+
+def reference_cost(game_map, start, goal):
+    """Dijkstra over the same moves, for comparison."""
+    best = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        cost, (x, y) = heapq.heappop(heap)
+        if (x, y) == goal:
+            return cost
+        if cost > best[(x, y)]:
+            continue
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx, ny = x + dx, y + dy
+                if (dx or dy) and game_map.is_walkable(nx, ny):
+                    if dx and dy and not (game_map.is_walkable(x + dx, y) and game_map.is_walkable(x, y + dy)):
+                        continue
+                    new = cost + (DIAGONAL_COST if dx and dy else STRAIGHT_COST)
+                    if new < best.get((nx, ny), new + 1):
+                        best[(nx, ny)] = new
+                        heapq.heappush(heap, (new, (nx, ny)))
+    return None
+
+
+# =============================================================================
+# PATH TESTS
+# Gameplay Impact: Units walk the shortest way around walls
+# =============================================================================
+
+class TestPaths:
+    """Test path shape and cost."""
+    
+    def test_paths_are_shortest(self):
+        """Tile paths cost the same as a full Dijkstra search.
+        
+        GAMEPLAY: Enemies take the short way to the party.
+        """
+        for seed in range(4):
+            dungeon = Dungeon(60, 60)
+            dungeon.generate(seed=seed)
+            pathfinder = Pathfinder(dungeon)
+            rng = random.Random(seed)
+            floor = dungeon.walkable_positions()
+            for _ in range(10):
+                start, goal = rng.choice(floor), rng.choice(floor)
+                tiles = pathfinder.find_tile_path(*start, *goal)
+                assert tiles[0] == start and tiles[-1] == goal
+                assert step_cost(tiles) == reference_cost(dungeon, start, goal)
+    
+    def test_no_corner_cutting(self, walled_map):
+        """Diagonal steps never squeeze past a wall corner.
+        
+        GAMEPLAY: Heroes don't clip through the end of a wall.
+        """
+        tiles = Pathfinder(walled_map).find_tile_path(5, 5, 15, 5)
+        for (x1, y1), (x2, y2) in zip(tiles, tiles[1:]):
+            assert walled_map.is_walkable(x2, y2)
+            if x1 != x2 and y1 != y2:
+                assert walled_map.is_walkable(x2, y1) and walled_map.is_walkable(x1, y2)
+    
+    def test_waypoints_end_at_exact_goal(self, walled_map):
+        """Simplified waypoints start at a tile center and end on the goal.
+        
+        GAMEPLAY: Click-to-move stops where you clicked.
+        """
+        path = Pathfinder(walled_map).find_path(5.5, 5.5, 15.2, 5.7)
+        assert path[0] == (5.5, 5.5)
+        assert path[-1] == (15.2, 5.7)
+        assert len(path) >= 3  # Has to bend through the gap
+    
+    def test_octile_heuristic(self):
+        """Octile distance is exact on an open grid.
+        
+        GAMEPLAY: Search heads straight for the goal in open rooms.
+        """
+        assert octile(3, 0) == 3 * STRAIGHT_COST
+        assert octile(-2, 2) == 2 * DIAGONAL_COST
+        assert octile(5, -2) == 2 * DIAGONAL_COST + 3 * STRAIGHT_COST
+
+
+# =============================================================================
+# REACHABILITY TESTS
+# Gameplay Impact: Big maps and bad goals never stall a step
+# =============================================================================
+
+class TestReachability:
+    """Test unreachable goals, caps and map changes."""
+    
+    def test_unreachable_goal(self, walled_map):
+        """A sealed-off goal returns no path.
+        
+        GAMEPLAY: Clicking into a closed room does nothing instead of hanging.
+        """
+        walled_map.set_tile(10, 18, TileType.WALL)
+        pathfinder = Pathfinder(walled_map)
+        
+        assert pathfinder.find_path(5.5, 5.5, 15.5, 5.5) == []
+        assert not pathfinder.grid.connected(pathfinder.grid.index(5, 5), pathfinder.grid.index(15, 5))
+    
+    def test_long_paths_on_large_maps(self):
+        """Paths across a big level are found without any iteration cap.
+        
+        GAMEPLAY: Click-to-move works across the whole map.
+        """
+        dungeon = Dungeon(200, 200)
+        dungeon.generate(min_rooms=30, max_rooms=35, seed=3)
+        pathfinder = Pathfinder(dungeon)
+        sx, sy = dungeon.rooms[0].center
+        
+        for room in dungeon.rooms[1:]:
+            gx, gy = room.center
+            assert pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+    
+    def test_capped_search_returns_partial_path(self, walled_map):
+        """Hitting the cap gives the way to the closest tile reached.
+        
+        GAMEPLAY: A chasing enemy still closes in when the search is cut short.
+        """
+        pathfinder = Pathfinder(walled_map)
+        tiles = pathfinder.find_tile_path(2, 2, 15, 2, max_iterations=20)
+        
+        assert tiles and tiles[0] == (2, 2)
+        assert tiles[-1] != (15, 2)
+        assert octile(tiles[-1][0] - 15, tiles[-1][1] - 2) < octile(2 - 15, 0)
+    
+    def test_grid_follows_tile_changes(self, walled_map):
+        """Writing tiles rebuilds the search grid.
+        
+        GAMEPLAY: Paths use the current layout, not a stale one.
+        """
+        pathfinder = Pathfinder(walled_map)
+        assert pathfinder.find_path(5.5, 5.5, 15.5, 5.5)
+        
+        walled_map.set_tile(10, 18, TileType.WALL)
+        assert pathfinder.find_path(5.5, 5.5, 15.5, 5.5) == []
+    
+    def test_start_inside_wall(self, walled_map):
+        """A unit pushed into a wall can still path out.
+        
+        GAMEPLAY: Knocked-back enemies don't freeze in the wall.
+        """
+        tiles = Pathfinder(walled_map).find_tile_path(10, 5, 5, 5)
+        assert tiles[0] == (10, 5) and tiles[-1] == (5, 5)
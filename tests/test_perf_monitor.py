@@ -0,0 +1,163 @@
+"""Tests for the performance monitor.
+
+These tests ensure timing histograms are recorded and exported.
+If broken, we can't see where steady-state frame time goes.
+"""
+
+import csv
+import json
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.perf_monitor import PerfMonitor, FRAME_SECTION
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    """Enabled monitor that logs into a temp directory."""
+    return PerfMonitor(enabled=True, log_path=str(tmp_path / "perf_log.txt"))
+
+
+def _record(monitor, name, samples):
+    """Feed known durations straight into a section histogram."""
+    for ms in samples:
+        monitor._record(name, ms)
+
+
+# =============================================================================
+# HISTOGRAM TESTS
+# Gameplay Impact: Steady-state costs show up, not just slow frames
+# =============================================================================
+
+class TestHistograms:
+    """Test rolling per-section histograms."""
+    
+    def test_percentiles_from_samples(self, monitor):
+        """p50/p95/p99/max summarize the rolling window.
+        
+        GAMEPLAY: Spot which processor eats the frame budget.
+        """
+        _record(monitor, "MovementProcessor", [float(i) for i in range(1, 101)])
+        stats = monitor.stats("MovementProcessor")
+        assert stats["calls"] == 100
+        assert stats["p50"] == pytest.approx(51.0)
+        assert stats["p95"] == pytest.approx(95.0)
+        assert stats["p99"] == pytest.approx(99.0)
+        assert stats["max"] == pytest.approx(100.0)
+        assert stats["mean"] == pytest.approx(50.5)
+    
+    def test_window_is_bounded(self, monitor):
+        """Old samples fall out of the window but calls keep counting.
+        
+        GAMEPLAY: Long sessions don't grow memory.
+        """
+        _record(monitor, "AIProcessor", [1.0] * (PerfMonitor.HISTOGRAM_SAMPLES + 50))
+        stats = monitor.stats("AIProcessor")
+        assert stats["samples"] == PerfMonitor.HISTOGRAM_SAMPLES
+        assert stats["calls"] == PerfMonitor.HISTOGRAM_SAMPLES + 50
+    
+    def test_mark_measure_records_sample(self, monitor):
+        """Every mark/measure pair adds one sample.
+        
+        GAMEPLAY: Processors and handlers are timed without extra wiring.
+        """
+        monitor.frame_start()
+        for _ in range(3):
+            monitor.mark("Event:DAMAGE_DEALT:_on_damage")
+            monitor.measure("Event:DAMAGE_DEALT:_on_damage")
+        monitor.frame_end()
+        assert monitor.stats("Event:DAMAGE_DEALT:_on_damage")["calls"] == 3
+        assert monitor.stats(FRAME_SECTION)["calls"] == 1
+    
+    def test_disabled_records_nothing(self, tmp_path):
+        """Disabled monitor keeps no samples.
+        
+        GAMEPLAY: Shipping builds pay nothing for instrumentation.
+        """
+        monitor = PerfMonitor(enabled=False, log_path=str(tmp_path / "perf_log.txt"))
+        monitor.mark("Renderer")
+        monitor.measure("Renderer")
+        assert monitor.sections() == []
+        assert monitor.stats("Renderer") is None
+
+
+# =============================================================================
+# GLOBAL MONITOR TESTS
+# Gameplay Impact: Any run can be asked where its frame time went
+# =============================================================================
+
+class TestGlobalMonitor:
+    """Test the shared perf instance's defaults."""
+    
+    def test_samples_by_default_without_logging(self):
+        """The global monitor records histograms but writes no log.
+        
+        GAMEPLAY: Normal play collects timings with no console spam.
+        """
+        from src.core.perf_monitor import perf
+        assert perf.enabled
+        assert not perf.log_slow_frames
+    
+    def test_slow_frames_counted_not_logged(self, tmp_path, monkeypatch):
+        """With logging off a slow frame is counted but not written out.
+        
+        GAMEPLAY: A hitch shows up in stats without printing to the console.
+        """
+        log_path = tmp_path / "perf_log.txt"
+        monitor = PerfMonitor(log_path=str(log_path), log_slow_frames=False)
+        monkeypatch.setattr(monitor, "SLOW_FRAME_MS", 0)
+        monitor.frame_start()
+        monitor.frame_end()
+        
+        assert monitor._slow_count == 1
+        assert monitor.stats(FRAME_SECTION)["calls"] == 1
+        assert not log_path.exists()
+
+
+# =============================================================================
+# EXPORT TESTS
+# Gameplay Impact: Perf data can be compared between runs
+# =============================================================================
+
+class TestExport:
+    """Test JSON/CSV export."""
+    
+    def test_json_export(self, monitor, tmp_path):
+        """JSON export holds every section's stats.
+        
+        GAMEPLAY: Soak runs leave a perf report behind.
+        """
+        _record(monitor, "Render:Tiles", [2.0, 4.0])
+        path = monitor.export(tmp_path / "perf.json")
+        data = json.loads(path.read_text())
+        assert data["sections"]["Render:Tiles"]["max"] == pytest.approx(4.0)
+    
+    def test_csv_export(self, monitor, tmp_path):
+        """CSV export has one row per section.
+        
+        GAMEPLAY: Perf data opens in a spreadsheet.
+        """
+        _record(monitor, "CombatProcessor", [1.0])
+        _record(monitor, "MagicProcessor", [3.0])
+        path = monitor.export(tmp_path / "perf.csv")
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        assert [row["section"] for row in rows] == ["CombatProcessor", "MagicProcessor"]
+        assert float(rows[1]["p99"]) == pytest.approx(3.0)
+    
+    def test_counters_exported(self, monitor, tmp_path):
+        """Counters appear in both export formats.
+        
+        GAMEPLAY: Runs skipped by the scheduler show up in perf reports.
+        """
+        monitor.count("Skipped:RegenProcessor")
+        monitor.count("Skipped:RegenProcessor", 4)
+        data = json.loads(monitor.export(tmp_path / "perf.json").read_text())
+        assert data["counters"] == {"Skipped:RegenProcessor": 5}
+        with open(monitor.export(tmp_path / "perf.csv")) as f:
+            rows = list(csv.DictReader(f))
+        assert rows[-1]["section"] == "Skipped:RegenProcessor"
+        assert rows[-1]["calls"] == "5"
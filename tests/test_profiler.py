@@ -0,0 +1,109 @@
+"""Tests for the sampling profiler.
+
+These tests ensure the profiler samples the game thread and writes
+flamegraph-ready collapsed stacks. If broken, we can't find the hot
+lines inside a slow fight.
+"""
+
+import time
+import pygame
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.events import EventBus, EventType
+from src.core.profiler import SamplingProfiler
+from src.ecs.processors import InputProcessor
+
+
+def busy_fight_loop(seconds):
+    """Stand-in for an expensive processor."""
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return SamplingProfiler(interval=0.001, output_dir=str(tmp_path / "profiles"))
+
+
+# =============================================================================
+# SAMPLING TESTS
+# Gameplay Impact: Hot lines in a real fight can be found
+# =============================================================================
+
+class TestSampling:
+    """Test stack sampling and collapsed-stack output."""
+    
+    def test_samples_hot_function(self, profiler):
+        """The busy function shows up with its file and line.
+        
+        GAMEPLAY: A slow spell shows up as the widest flame.
+        """
+        profiler.start(dungeon_level=3, entity_count=120)
+        busy_fight_loop(0.1)
+        path = profiler.stop()
+        
+        assert profiler.samples > 0
+        assert path.name.startswith("profile_L3_E120_")
+        assert path.suffix == ".folded"
+        lines = path.read_text().splitlines()
+        assert any("busy_fight_loop (tests/test_profiler.py:" in line for line in lines)
+    
+    def test_collapsed_format(self, profiler):
+        """Each line is root-first frames joined by ';' then a count.
+        
+        GAMEPLAY: Output opens directly in flamegraph.pl / speedscope.
+        """
+        profiler.start()
+        busy_fight_loop(0.05)
+        path = profiler.stop()
+        for line in path.read_text().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert stack.split(";")[-1]
+    
+    def test_toggle_starts_then_stops(self, profiler):
+        """Toggle flips between sampling and writing a profile.
+        
+        GAMEPLAY: One hotkey starts and stops profiling.
+        """
+        assert profiler.toggle() is None
+        assert profiler.running
+        busy_fight_loop(0.02)
+        assert profiler.toggle() is not None
+        assert not profiler.running
+    
+    def test_stop_when_idle_writes_nothing(self, profiler):
+        """Stopping a profiler that never ran is a no-op.
+        
+        GAMEPLAY: Stray key presses don't leave empty files around.
+        """
+        assert profiler.stop() is None
+        assert not profiler.output_dir.exists()
+
+
+# =============================================================================
+# HOTKEY TESTS
+# Gameplay Impact: Profiling can be started mid-fight
+# =============================================================================
+
+class TestHotkey:
+    """Test the F10 profiler toggle."""
+    
+    def test_f10_emits_toggle(self):
+        """F10 asks the game to toggle the profiler.
+        
+        GAMEPLAY: Press F10, fight, press F10 again.
+        """
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.PROFILER_TOGGLED, received.append)
+        InputProcessor(bus)._handle_key_press(pygame.K_F10)
+        bus.process()
+        assert len(received) == 1
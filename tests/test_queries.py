@@ -0,0 +1,173 @@
+"""Tests for cached component query views.
+
+These tests ensure query() returns the same entities as
+esper.get_components() while components come and go. If broken,
+processors skip or double-process entities.
+"""
+
+import esper
+import pytest
+import subprocess
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ecs.components import Position, Health, Enemy, PartyMember, TargetPosition
+from src.ecs.queries import query, register
+
+
+@pytest.fixture
+def world():
+    """Fresh esper world."""
+    esper.clear_database()
+    yield
+    esper.clear_database()
+
+
+def _same_as_esper(*types):
+    return sorted(e for e, _ in query(*types)) == sorted(e for e, _ in esper.get_components(*types))
+
+
+# =============================================================================
+# MEMBERSHIP TESTS
+# Gameplay Impact: Processors see exactly the entities they should
+# =============================================================================
+
+class TestQueryMembership:
+    """Test views track adds, removes and deletes."""
+    
+    def test_matches_esper_after_create(self, world):
+        """Entities created before and after the first query are included.
+        
+        GAMEPLAY: Newly spawned enemies get targeted by spells.
+        """
+        esper.create_entity(Position(x=1, y=1), Health())
+        query(Position, Health)
+        ent = esper.create_entity(Position(x=2, y=2), Health(), Enemy())
+        esper.create_entity(Position(x=3, y=3))
+        
+        assert ent in [e for e, _ in query(Position, Health)]
+        assert _same_as_esper(Position, Health)
+    
+    def test_add_and_remove_component(self, world):
+        """Gaining the last missing type joins the view, losing one leaves it.
+        
+        GAMEPLAY: A revived party member shows up for enemy targeting again.
+        """
+        ent = esper.create_entity(Position(x=0, y=0))
+        assert query(Position, Health) == []
+        
+        esper.add_component(ent, Health())
+        assert [e for e, _ in query(Position, Health)] == [ent]
+        
+        esper.remove_component(ent, Health)
+        assert query(Position, Health) == []
+    
+    def test_replaced_component_is_returned(self, world):
+        """Re-adding a component type returns the new instance.
+        
+        GAMEPLAY: Processors never act on a stale component.
+        """
+        ent = esper.create_entity(Position(x=0, y=0), Health(current=10))
+        query(Position, Health)
+        new_health = Health(current=99)
+        esper.add_component(ent, new_health)
+        
+        [(_, (_, health))] = query(Position, Health)
+        assert health is new_health
+    
+    def test_deleted_entity_leaves_after_clear(self, world):
+        """Deferred deletes disappear once dead entities are cleared.
+        
+        GAMEPLAY: Killed enemies stop taking damage after cleanup.
+        """
+        ent = esper.create_entity(Position(x=0, y=0), Enemy())
+        query(Position, Enemy)
+        
+        esper.delete_entity(ent)
+        assert _same_as_esper(Position, Enemy)
+        esper.clear_dead_entities()
+        assert query(Position, Enemy) == []
+        
+        other = esper.create_entity(Position(x=0, y=0), Enemy())
+        esper.delete_entity(other, immediate=True)
+        assert query(Position, Enemy) == []
+    
+    def test_clear_database_empties_views(self, world):
+        """Clearing the world empties every view.
+        
+        GAMEPLAY: A new game doesn't inherit the old party.
+        """
+        esper.create_entity(Position(x=0, y=0), PartyMember())
+        query(Position, PartyMember)
+        esper.clear_database()
+        assert query(Position, PartyMember) == []
+
+
+# =============================================================================
+# CACHING TESTS
+# Gameplay Impact: Hot queries stay cheap while intents churn
+# =============================================================================
+
+class TestQueryCaching:
+    """Test results are reused until membership changes."""
+    
+    def test_unrelated_churn_keeps_result(self, world):
+        """Adding components outside the signature reuses the cached list.
+        
+        GAMEPLAY: Click-to-move doesn't slow down spell targeting.
+        """
+        ent = esper.create_entity(Position(x=0, y=0), Health())
+        first = query(Position, Health)
+        esper.add_component(ent, TargetPosition(x=1, y=1))
+        esper.remove_component(ent, TargetPosition)
+        assert query(Position, Health) is first
+    
+    def test_result_safe_to_mutate_world_during_iteration(self, world):
+        """Removing components while iterating doesn't break the loop.
+        
+        GAMEPLAY: Killing enemies inside an AoE loop hits every target.
+        """
+        for i in range(5):
+            esper.create_entity(Position(x=i, y=0), Health())
+        
+        visited = 0
+        for ent, _ in query(Position, Health):
+            esper.remove_component(ent, Health)
+            visited += 1
+        
+        assert visited == 5
+        assert query(Position, Health) == []
+    
+    def test_register_returns_same_view(self, world):
+        """One view per signature.
+        
+        GAMEPLAY: All processors share the same cached set.
+        """
+        assert register(Position, Enemy) is register(Position, Enemy)
+
+
+# =============================================================================
+# INSTALL TESTS
+# Gameplay Impact: Tools and tests only get patched esper when they ask for it
+# =============================================================================
+
+class TestInstall:
+    """Test the esper hooks are opt-in."""
+    
+    def test_import_leaves_esper_alone(self):
+        """Importing processors doesn't patch esper; install() does.
+        
+        GAMEPLAY: Tools importing game code see plain esper.
+        """
+        code = (
+            "import esper; original = esper.add_component\n"
+            "import src.ecs.processors\n"
+            "from src.ecs import queries\n"
+            "assert esper.add_component is original\n"
+            "queries.install()\n"
+            "assert esper.add_component is not original\n"
+        )
+        root = os.path.join(os.path.dirname(__file__), '..')
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -0,0 +1,129 @@
+"""Tests for input recording and replay.
+
+These tests ensure a recorded session can be saved, loaded and replayed
+headlessly to the same end state. If broken, perf comparisons across
+builds no longer run identical workloads.
+"""
+
+import pygame
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game import Game
+from src.core.constants import FIXED_TIMESTEP
+from src.core.replay import InputRecording
+
+
+def _record_session(ticks: int, script: dict) -> InputRecording:
+    """Drive a headless game like the real loop does and record it.
+    
+    Args:
+        ticks: Fixed steps to run
+        script: step -> list of pygame events delivered before that step
+    """
+    game = Game(headless=True)
+    game.replaying = True  # A player drives this session, not the autopilot
+    game.recording = InputRecording()
+    game.start_new_game(seed=11)
+    view = (game.camera.view_x, game.camera.view_y)
+    for _ in range(ticks):
+        for event in script.get(game.step_count, ()):
+            game.recording.record_event(game.step_count, event, view)
+            game.input_processor.handle_event(event)
+        game._update(FIXED_TIMESTEP)
+    game.recording.finish(game.step_count)
+    return game.recording
+
+
+WALK_RIGHT = {
+    5: [pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RIGHT})],
+    40: [pygame.event.Event(pygame.KEYUP, {"key": pygame.K_RIGHT}),
+         pygame.event.Event(pygame.MOUSEMOTION, {"pos": (640, 360)})],
+}
+
+
+# =============================================================================
+# RECORDING FILE TESTS
+# Gameplay Impact: Recorded worst-case sessions stay usable
+# =============================================================================
+
+class TestRecordingFile:
+    """Test saving and loading recordings."""
+    
+    def test_save_load_round_trip(self, tmp_path):
+        """Everything needed for replay survives a save and load.
+        
+        GAMEPLAY: A recorded fight replays the same on another machine.
+        """
+        recording = _record_session(60, WALK_RIGHT)
+        recording.record_view(45, (1.5, 2.5))
+        recording.record_interval(50, 4)
+        
+        loaded = InputRecording.load(recording.save(tmp_path / "session.json"))
+        
+        assert loaded.seed == recording.seed == 11
+        assert loaded.random_state == recording.random_state
+        assert (loaded.ticks, loaded.checksum) == (60, recording.checksum)
+        assert loaded.inputs == recording.inputs
+        assert loaded.views == {45: (1.5, 2.5)}
+        assert loaded.intervals == {50: 4}
+        event, _ = loaded.events_at(40)[1]
+        assert event.type == pygame.MOUSEMOTION and event.pos == (640, 360)
+    
+    def test_interval_changes_only(self):
+        """Only changes of the throttle interval are stored.
+        
+        GAMEPLAY: Long sessions don't bloat the recording.
+        """
+        recording = InputRecording()
+        for step, interval in [(0, 1), (10, 4), (11, 4), (30, 1), (31, 1)]:
+            recording.record_interval(step, interval)
+        assert recording.intervals == {10: 4, 30: 1}
+    
+    def test_unknown_version_rejected(self, tmp_path):
+        """Recordings from another format version fail loudly.
+        
+        GAMEPLAY: A stale library file can't silently replay wrong input.
+        """
+        path = tmp_path / "old.json"
+        path.write_text('{"version": 0}')
+        with pytest.raises(ValueError):
+            InputRecording.load(path)
+
+
+# =============================================================================
+# REPLAY TESTS
+# Gameplay Impact: Perf comparisons run the exact same fight
+# =============================================================================
+
+class TestReplay:
+    """Test headless replay of recorded input."""
+    
+    def test_replay_reaches_recorded_state(self):
+        """Replaying the input reproduces the recorded end state.
+        
+        GAMEPLAY: The same heavy fight can be timed on every build.
+        """
+        recording = _record_session(90, WALK_RIGHT)
+        
+        game = Game(headless=True)
+        report = game.run_replay(recording)
+        
+        assert game.autopilot_processor is None
+        assert report["ticks"] == 90
+        assert report["checksum"] == recording.checksum
+        assert not report["diverged"]
+    
+    def test_missing_input_reported_as_divergence(self):
+        """A replay that doesn't match the recording is flagged.
+        
+        GAMEPLAY: Timing comparisons never silently use different workloads.
+        """
+        recording = _record_session(90, WALK_RIGHT)
+        recording.inputs.clear()
+        
+        report = Game(headless=True).run_replay(recording)
+        assert report["diverged"]
@@ -0,0 +1,182 @@
+"""Tests for the room graph (hierarchical pathfinding).
+
+These tests ensure long routes through the room graph are walkable,
+close to the shortest route, and only used where they apply. If broken,
+click-to-move and allies regrouping across a level walk through walls,
+take long detours, or fall back to slow full-map searches.
+"""
+
+import random
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.constants import TileType
+from src.core.formulas import dungeon_size, room_count
+from src.world.dungeon import Dungeon, Room
+from src.world.map_context import MapContext
+from src.world.pathfinding import Pathfinder
+from src.world.room_graph import RoomGraph
+from src.world.tile_map import TileMap
+
+
+def route_cost(grid, route):
+    """Step cost of a flat route, checking every step is a legal move."""
+    steps = {offset: (cost, a, b) for offset, cost, a, b in grid.steps}
+    total = 0
+    for a, b in zip(route, route[1:]):
+        cost, corner_a, corner_b = steps[b - a]
+        assert grid.walk[b]
+        if corner_a:
+            assert grid.walk[a + corner_a] and grid.walk[a + corner_b]
+        total += cost
+    return total
+
+
+@pytest.fixture(scope="module")
+def large_dungeon():
+    """Deepest-level sized dungeon."""
+    size = dungeon_size(9)
+    dungeon = Dungeon(size, size)
+    dungeon.generate(min_rooms=room_count(9), max_rooms=room_count(9) + 4, seed=5)
+    return dungeon
+
+
+# =============================================================================
+# ROUTE TESTS
+# Gameplay Impact: Long moves across the level follow rooms and corridors
+# =============================================================================
+
+class TestRoutes:
+    """Test routes through the graph."""
+    
+    def test_routes_walkable_and_near_shortest(self):
+        """Graph routes are legal moves and at most 1.5x the shortest cost.
+        
+        GAMEPLAY: Allies regrouping don't clip walls or wander off.
+        """
+        for seed in range(4):
+            dungeon = Dungeon(100, 100)
+            dungeon.generate(min_rooms=12, max_rooms=16, seed=seed)
+            pathfinder = Pathfinder(dungeon)
+            grid = pathfinder.grid
+            rng = random.Random(seed)
+            floor = dungeon.walkable_positions()
+            for _ in range(20):
+                start = grid.index(*rng.choice(floor))
+                goal = grid.index(*rng.choice(floor))
+                route = pathfinder.room_graph.route(start, goal)
+                if not route:
+                    continue
+                assert route[0] == start and route[-1] == goal
+                shortest = route_cost(grid, pathfinder._route(grid, start, goal, None))
+                assert route_cost(grid, route) <= shortest * 1.5
+    
+    def test_same_cluster_left_to_flat_search(self):
+        """Both ends in one room returns None (use the flat search).
+        
+        GAMEPLAY: Short moves inside a room stay exactly shortest.
+        """
+        dungeon = Dungeon(60, 60)
+        dungeon.generate(seed=1)
+        pathfinder = Pathfinder(dungeon)
+        grid = pathfinder.grid
+        x, y, w, h = dungeon.rooms[0].inner
+        
+        assert pathfinder.room_graph.route(grid.index(x, y), grid.index(x + w - 1, y + h - 1)) is None
+    
+    def test_unreachable_goal(self):
+        """A room with no corridor can't be reached through the graph.
+        
+        GAMEPLAY: Unreachable click targets are rejected at once.
+        """
+        game_map = TileMap(40, 20)
+        game_map.fill_rect(1, 1, 8, 8, TileType.FLOOR)
+        game_map.fill_rect(30, 10, 8, 8, TileType.FLOOR)
+        graph = RoomGraph(Pathfinder(game_map).grid, [Room(1, 1, 8, 8), Room(30, 10, 8, 8)])
+        
+        assert graph.route(graph.grid.index(2, 2), graph.grid.index(33, 13)) == []
+    
+    def test_clusters_bounded(self, large_dungeon):
+        """Corridor clusters never span more than one sector.
+        
+        GAMEPLAY: Hooking a position into the graph stays cheap anywhere.
+        """
+        graph = Pathfinder(large_dungeon).room_graph
+        sizes = {}
+        for label in graph.clusters:
+            if label > len(large_dungeon.rooms):
+                sizes[label] = sizes.get(label, 0) + 1
+        
+        assert sizes and max(sizes.values()) <= 16 * 16
+
+
+# =============================================================================
+# PATHFINDER TESTS
+# Gameplay Impact: Callers get graph routes without asking for them
+# =============================================================================
+
+class TestPathfinderIntegration:
+    """Test how find_path uses the graph."""
+    
+    def test_long_paths_use_graph(self, large_dungeon):
+        """Paths between far-apart rooms come from the graph.
+        
+        GAMEPLAY: RETURN-to-home and click-to-move across the map are cheap.
+        """
+        pathfinder = Pathfinder(large_dungeon)
+        calls = []
+        graph = pathfinder.room_graph
+        original = graph.route
+        graph.route = lambda start, goal: calls.append(goal) or original(start, goal)
+        sx, sy = large_dungeon.rooms[0].center
+        gx, gy = max(large_dungeon.rooms, key=lambda r: abs(r.x - sx) + abs(r.y - sy)).center
+        
+        path = pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+        assert calls and path[-1] == (gx + 0.5, gy + 0.5)
+        
+        calls.clear()
+        pathfinder.find_path(sx + 0.5, sy + 0.5, sx + 2.5, sy + 0.5)
+        assert not calls  # Short paths stay flat
+    
+    def test_hierarchical_off(self, large_dungeon):
+        """hierarchical=False never builds the graph.
+        
+        GAMEPLAY: Exact paths are still available where they matter.
+        """
+        pathfinder = Pathfinder(large_dungeon, hierarchical=False)
+        sx, sy = large_dungeon.rooms[0].center
+        gx, gy = large_dungeon.rooms[-1].center
+        
+        assert pathfinder.find_path(sx + 0.5, sy + 0.5, gx + 0.5, gy + 0.5)
+        assert pathfinder._room_graph is None
+    
+    def test_graph_built_with_level(self):
+        """Switching levels builds the graph up front; tile changes rebuild it.
+        
+        GAMEPLAY: The first long path on a new level doesn't hitch.
+        """
+        dungeon = Dungeon(60, 60)
+        dungeon.generate(seed=2)
+        context = MapContext()
+        context.set_dungeon(dungeon)
+        graph = context.pathfinder._room_graph
+        assert graph is not None
+        
+        x, y = dungeon.rooms[0].center
+        dungeon.set_tile(x, y, TileType.WALL)
+        assert context.pathfinder.room_graph is not graph
+    
+    def test_maps_without_rooms(self):
+        """Plain tile maps have no graph.
+        
+        GAMEPLAY: The town keeps using flat pathfinding.
+        """
+        game_map = TileMap(40, 40)
+        game_map.fill_rect(1, 1, 38, 38, TileType.FLOOR)
+        pathfinder = Pathfinder(game_map)
+        
+        assert pathfinder.room_graph is None
+        assert pathfinder.find_path(2.5, 2.5, 37.5, 37.5)
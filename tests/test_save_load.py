@@ -187,7 +187,23 @@ class TestLoadValidation:
         GAMEPLAY: F9 in town properly exits town before loading.
         Prevents enemies spawning in town.
         """
-        pass
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        import pygame
+        from src.core.constants import GameState
+        from src.core.events import Event, EventType
+        from src.game import Game
+        
+        pygame.init()
+        game = Game()
+        game.start_new_game(seed=3)
+        game._on_town_entered(Event(EventType.TOWN_ENTERED))
+        assert game.map_context.in_town
+        
+        game._on_game_loaded(Event(EventType.GAME_LOADED, {"dungeon_level": 2, "dungeon_seed": 7}))
+        assert game.state == GameState.PLAYING
+        assert game.map_context.active is game.dungeon
+        assert game.minimap.fog_of_war_enabled and game.renderer.fog_enabled
     
     def test_load_sets_correct_game_state(self):
         """Game state correct after load.
@@ -0,0 +1,135 @@
+"""Tests for the processor scheduler.
+
+These tests ensure processors run at their declared tick rates without
+losing time or reordering. If broken, regen heals the wrong amount,
+saves are never written, or processors run out of order.
+"""
+
+import esper
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.events import EventBus, EventType
+from src.ecs.processors import ProcessorScheduler, ThrottledProcessor
+
+STEP = 1.0 / 60.0
+
+
+class RecordingProcessor(esper.Processor):
+    """Stand-in processor that records the dt it was given."""
+    
+    def __init__(self, log=None):
+        self.calls = []
+        self.log = log
+    
+    def process(self, dt):
+        self.calls.append(dt)
+        if self.log is not None:
+            self.log.append(self)
+
+
+class SlowProcessor(RecordingProcessor):
+    tick_interval = 3
+
+
+class SaveLikeProcessor(RecordingProcessor):
+    tick_interval = None
+    wake_events = (EventType.GAME_SAVE_REQUESTED,)
+
+
+@pytest.fixture
+def scheduler():
+    esper.clear_database()
+    esper._processors.clear()
+    yield ProcessorScheduler(EventBus())
+    esper._processors.clear()
+
+
+# =============================================================================
+# TICK RATE TESTS
+# Gameplay Impact: Rarely-busy processors stop costing time every step
+# =============================================================================
+
+class TestTickRates:
+    """Test declared tick intervals and event-driven processors."""
+    
+    def test_every_step_processors_are_not_wrapped(self, scheduler):
+        """Processors without declarations go straight to esper.
+        
+        GAMEPLAY: No overhead for movement/combat/AI.
+        """
+        inner = RecordingProcessor()
+        assert scheduler.add(inner, priority=10) is inner
+        assert scheduler.scheduled == []
+    
+    def test_tick_interval_passes_summed_dt(self, scheduler):
+        """A processor ticking every 3rd step gets 3 steps of dt.
+        
+        GAMEPLAY: Regen heals the same total amount in fewer ticks.
+        """
+        inner = SlowProcessor()
+        scheduler.add(inner)
+        for _ in range(6):
+            esper.process(STEP)
+        assert inner.calls == pytest.approx([STEP * 3, STEP * 3])
+        assert scheduler.stats()["SlowProcessor"] == {"tick_interval": 3, "runs": 2, "skips": 4}
+    
+    def test_event_driven_runs_only_after_wake(self, scheduler):
+        """Event-driven processors run on the step after their event.
+        
+        GAMEPLAY: Saving still happens, without polling every step.
+        """
+        inner = SaveLikeProcessor()
+        scheduler.add(inner)
+        for _ in range(5):
+            esper.process(STEP)
+        assert inner.calls == []
+        
+        scheduler.event_bus.emit(EventType.GAME_SAVE_REQUESTED)
+        scheduler.event_bus.process()
+        esper.process(STEP)
+        esper.process(STEP)
+        assert inner.calls == pytest.approx([STEP * 6])
+        assert scheduler.skipped_runs() == 6
+    
+    def test_priority_order_is_kept(self, scheduler):
+        """Wrapped and unwrapped processors still run by priority.
+        
+        GAMEPLAY: Cleanup stays last, input stays first.
+        """
+        log = []
+        first, middle, last = RecordingProcessor(log), SlowProcessor(log), RecordingProcessor(log)
+        scheduler.add(last, priority=0)
+        scheduler.add(first, priority=100)
+        scheduler.add(middle, priority=50, throttle=True)
+        for _ in range(3):
+            esper.process(STEP)
+        assert log[-3:] == [first, middle, last]
+    
+    def test_degrade_never_speeds_up_a_slow_processor(self):
+        """Degrade interval only applies when slower than the tick rate.
+        
+        GAMEPLAY: Under load, regen ticks no more often than normal.
+        """
+        inner = RecordingProcessor()
+        throttled = ThrottledProcessor(inner, interval=2, tick_interval=3)
+        for _ in range(6):
+            throttled.process(STEP)
+        assert len(inner.calls) == 2
+        throttled.interval = 4
+        for _ in range(8):
+            throttled.process(STEP)
+        assert len(inner.calls) == 4
+    
+    def test_clear_drops_wake_subscriptions(self, scheduler):
+        """Rebuilt processors don't leave stale wake subscriptions behind.
+        
+        GAMEPLAY: New games don't pile up handlers on the event bus.
+        """
+        scheduler.add(SaveLikeProcessor())
+        scheduler.clear()
+        assert scheduler.event_bus._subscribers[EventType.GAME_SAVE_REQUESTED] == []
+        assert scheduler.scheduled == []
@@ -0,0 +1,172 @@
+"""Tests for the simulation budget.
+
+These tests ensure slow steps can't snowball into a frozen game.
+If broken, a room full of enemies drops the game to a crawl.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.sim_budget import SimulationBudget
+from src.ecs.processors import ThrottledProcessor
+
+STEP = 1.0 / 60.0
+
+
+class RecordingProcessor:
+    """Stand-in processor that records the dt it was given."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def process(self, dt):
+        self.calls.append(dt)
+
+
+# =============================================================================
+# CATCH-UP TESTS
+# Gameplay Impact: Frame rate stays stable under load
+# =============================================================================
+
+class TestCatchUp:
+    """Test limiting steps per frame."""
+    
+    def test_runs_owed_steps_when_cheap(self):
+        """Cheap steps run everything owed.
+        
+        GAMEPLAY: Normal play simulates in real time.
+        """
+        budget = SimulationBudget(timestep=STEP, max_steps=5, budget_ms=12.0)
+        assert budget.steps_for(STEP * 3.5) == 3
+    
+    def test_caps_steps_per_frame(self):
+        """Never more than max_steps in one frame.
+        
+        GAMEPLAY: A hitch doesn't cause a burst of catch-up steps.
+        """
+        budget = SimulationBudget(timestep=STEP, max_steps=5, budget_ms=12.0)
+        assert budget.steps_for(STEP * 15) == 5
+    
+    def test_slow_steps_reduce_allowance(self):
+        """Expensive steps get fewer runs per frame, but at least one.
+        
+        GAMEPLAY: The game slows down instead of freezing.
+        """
+        budget = SimulationBudget(timestep=STEP, max_steps=5, budget_ms=12.0)
+        budget.record_step(0.005)  # 5ms per step -> 2 fit in 12ms
+        assert budget.steps_for(STEP * 10) == 2
+        budget.record_step(1.0)
+        assert budget.steps_for(STEP * 10) == 1
+    
+    def test_backlog_is_dropped_and_counted(self):
+        """Time still owed after the frame's steps is dropped and reported.
+        
+        GAMEPLAY: Lag doesn't pile up frame after frame.
+        """
+        budget = SimulationBudget(timestep=STEP)
+        carry = budget.drop_backlog(STEP * 3.25)
+        assert carry == pytest.approx(STEP * 0.25)
+        assert budget.dropped_seconds == pytest.approx(STEP * 3)
+        assert budget.dropped_frames == 1
+    
+    def test_partial_step_is_kept(self):
+        """Less than one step owed carries over untouched.
+        
+        GAMEPLAY: No time is lost in normal play.
+        """
+        budget = SimulationBudget(timestep=STEP)
+        assert budget.drop_backlog(STEP * 0.5) == pytest.approx(STEP * 0.5)
+        assert budget.dropped_seconds == 0.0
+
+
+# =============================================================================
+# DEGRADE TESTS
+# Gameplay Impact: Regen/loot/progression yield time to combat under load
+# =============================================================================
+
+class TestDegrade:
+    """Test degraded mode and throttled processors."""
+    
+    def test_degrades_under_load_and_recovers(self):
+        """Degraded mode switches on above threshold, off well below it.
+        
+        GAMEPLAY: Throttling doesn't flicker on and off.
+        """
+        budget = SimulationBudget(timestep=STEP, degrade_step_ms=6.0)
+        budget.record_step(0.010)
+        assert budget.degraded
+        budget.step_ms = 4.0
+        budget.record_step(0.004)
+        assert budget.degraded  # Still above half the threshold
+        budget.step_ms = 1.0
+        budget.record_step(0.001)
+        assert not budget.degraded
+    
+    def test_degrade_can_be_disabled(self):
+        """With degrading off the budget never throttles.
+        
+        GAMEPLAY: Option to keep full-rate regen at the cost of frame rate.
+        """
+        budget = SimulationBudget(timestep=STEP, degrade_enabled=False, degrade_step_ms=1.0)
+        budget.record_step(0.050)
+        assert not budget.degraded
+    
+    def test_throttled_processor_accumulates_dt(self):
+        """Throttled processors run every Nth step with the summed dt.
+        
+        GAMEPLAY: Regen heals the same total amount, just in bigger ticks.
+        """
+        inner = RecordingProcessor()
+        throttled = ThrottledProcessor(inner, interval=4)
+        for _ in range(8):
+            throttled.process(STEP)
+        assert inner.calls == pytest.approx([STEP * 4, STEP * 4])
+    
+    def test_interval_one_runs_every_step(self):
+        """Interval 1 passes every step straight through.
+        
+        GAMEPLAY: No behavior change when within budget.
+        """
+        inner = RecordingProcessor()
+        throttled = ThrottledProcessor(inner)
+        for _ in range(3):
+            throttled.process(STEP)
+        assert inner.calls == pytest.approx([STEP] * 3)
+
+
+# =============================================================================
+# GAME LOOP TESTS
+# Gameplay Impact: A slow frame in town can't pile up catch-up steps either
+# =============================================================================
+
+class TestGameLoop:
+    """Test every simulated state goes through the budget."""
+    
+    def test_town_steps_use_budget(self):
+        """Town steps are capped and counted like dungeon steps.
+        
+        GAMEPLAY: Alt-tabbing back into town doesn't freeze on a backlog.
+        """
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        import pygame
+        from src.core.constants import FIXED_TIMESTEP
+        from src.core.events import Event, EventType
+        from src.game import Game
+        
+        pygame.init()
+        game = Game()
+        game.start_new_game(seed=3)
+        game._on_town_entered(Event(EventType.TOWN_ENTERED))
+        steps_before = game.step_count
+        game.accumulator = 100 * FIXED_TIMESTEP
+        
+        game._run_fixed_steps(game._update_town)
+        
+        assert game.step_count - steps_before == game.sim_budget.max_steps
+        assert game.sim_budget.dropped_seconds > 0
+        assert game.accumulator < FIXED_TIMESTEP
+        assert game.map_context.in_town
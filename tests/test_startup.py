@@ -0,0 +1,85 @@
+"""Tests for the startup timeline.
+
+These tests ensure init phases are timed, nested and reported in start
+order. If broken, --startup-report can't show what delays the first frame.
+"""
+
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.startup import StartupTimeline
+
+
+# =============================================================================
+# TIMELINE TESTS
+# Gameplay Impact: Slow startup phases can be found
+# =============================================================================
+
+class TestStartupTimeline:
+    """Test phase timing and the report."""
+    
+    def test_phase_records_duration(self):
+        """A phase records its start and end.
+        
+        GAMEPLAY: The report shows how long loading sprites took.
+        """
+        timeline = StartupTimeline()
+        with timeline.phase("Sprites"):
+            time.sleep(0.01)
+        
+        entry = timeline.entries[0]
+        assert entry["name"] == "Sprites"
+        assert entry["end"] - entry["start"] >= 0.009
+        assert timeline.elapsed("Sprites") == entry["end"]
+    
+    def test_nested_phases_have_depth(self):
+        """Phases opened inside another phase are one level deeper.
+        
+        GAMEPLAY: Renderer time is broken down into its parts.
+        """
+        timeline = StartupTimeline()
+        with timeline.phase("Renderer"):
+            with timeline.phase("Sprites"):
+                pass
+        with timeline.phase("UI"):
+            pass
+        
+        depths = [(entry["name"], entry["depth"]) for entry in timeline.entries]
+        assert depths == [("Renderer", 0), ("Sprites", 1), ("UI", 0)]
+    
+    def test_phase_ends_on_exception(self):
+        """A failing phase still closes and restores the depth.
+        
+        GAMEPLAY: A crash during init doesn't garble the report.
+        """
+        timeline = StartupTimeline()
+        try:
+            with timeline.phase("Audio"):
+                raise RuntimeError("no mixer")
+        except RuntimeError:
+            pass
+        timeline.mark("First frame")
+        
+        assert timeline.entries[0]["end"] is not None
+        assert timeline.entries[1]["depth"] == 0
+    
+    def test_report_lists_phases_in_order(self):
+        """The report has one indented line per phase and mark.
+        
+        GAMEPLAY: The first frame time is visible at a glance.
+        """
+        timeline = StartupTimeline()
+        with timeline.phase("Game"):
+            with timeline.phase("Window"):
+                pass
+        timeline.mark("First frame")
+        
+        lines = timeline.report().splitlines()
+        assert len(lines) == 4
+        assert lines[1].endswith("  Game")
+        assert lines[2].endswith("    Window")
+        assert lines[3].endswith("  First frame")
+        assert timeline.elapsed("Missing") is None
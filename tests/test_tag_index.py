@@ -0,0 +1,187 @@
+"""Tests for the tag bitset index.
+
+These tests ensure the per-entity tag bits always agree with
+esper.has_component(). If broken, dead enemies keep attacking, downed
+heroes keep walking, or the renderer hides the wrong sprites.
+"""
+
+import esper
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ecs.components import (
+    Position, Dead, Downed, Enemy, PartyMember, Projectile
+)
+from src.ecs.entity_pool import EntityPool, pools
+from src.ecs.tag_index import (
+    tag_index, DOWNED, ENEMY, PARTY_MEMBER, PROJECTILE, INACTIVE
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_world():
+    esper.clear_database()
+    yield
+    esper.clear_database()
+
+
+# =============================================================================
+# SYNC TESTS
+# Gameplay Impact: Dead/Downed checks in the hot loops see every change
+# =============================================================================
+
+class TestSync:
+    """Test that bits follow component changes."""
+    
+    def test_create_sets_bits(self):
+        """Tags given at creation are indexed.
+        
+        GAMEPLAY: A freshly spawned enemy is targetable.
+        """
+        ent = esper.create_entity(Position(x=1, y=1), Enemy())
+        
+        assert tag_index.flags[ent] == ENEMY
+        assert tag_index.has_tag(ent, Enemy)
+        assert not tag_index.has_tag(ent, Dead)
+    
+    def test_add_and_remove(self):
+        """Adding and removing a tag sets and clears its bit.
+        
+        GAMEPLAY: A revived hero moves again.
+        """
+        ent = esper.create_entity(Position(x=1, y=1), PartyMember())
+        esper.add_component(ent, Downed(timer=0.0))
+        assert tag_index.flags[ent] == PARTY_MEMBER | DOWNED
+        assert tag_index.has_any(ent, INACTIVE)
+        
+        esper.remove_component(ent, Downed)
+        assert tag_index.flags[ent] == PARTY_MEMBER
+        assert not tag_index.has_any(ent, INACTIVE)
+    
+    def test_delete_clears_bits(self):
+        """Deleted entities drop out of the index.
+        
+        GAMEPLAY: A reused entity ID doesn't inherit a dead enemy's tags.
+        """
+        ent = esper.create_entity(Enemy(), Dead())
+        esper.delete_entity(ent)
+        esper.clear_dead_entities()
+        
+        assert ent not in tag_index.flags
+    
+    def test_untagged_entities_not_stored(self):
+        """Entities without indexed tags cost nothing.
+        
+        GAMEPLAY: Walls of damage numbers don't grow the index.
+        """
+        ent = esper.create_entity(Position(x=1, y=1))
+        assert ent not in tag_index.flags
+        assert not tag_index.has_any(ent, INACTIVE)
+    
+    def test_clear_database_resets(self):
+        """Clearing the database empties the index.
+        
+        GAMEPLAY: A new game doesn't see the last game's corpses.
+        """
+        esper.create_entity(Enemy(), Dead())
+        esper.clear_database()
+        assert tag_index.flags == {}
+    
+    def test_pool_release_and_spawn(self):
+        """Pooled entities leave the index when parked and return on reuse.
+        
+        GAMEPLAY: A parked projectile isn't seen by movement.
+        """
+        pool = EntityPool("test_tagged", Position, Projectile)
+        try:
+            ent = pool.spawn((0.0, 0.0), ())
+            assert tag_index.flags[ent] == PROJECTILE
+            pool.release(ent)
+            assert ent not in tag_index.flags
+            assert pool.spawn((1.0, 1.0), ()) == ent
+            assert tag_index.flags[ent] == PROJECTILE
+        finally:
+            del pools["test_tagged"]
+
+
+# =============================================================================
+# QUERY TESTS
+# Gameplay Impact: Masks pick out living enemies and party members
+# =============================================================================
+
+class TestQueries:
+    """Test masks and entity lookup."""
+    
+    def test_mask_combines_bits(self):
+        """mask() is the OR of the tag bits.
+        
+        GAMEPLAY: INACTIVE means dead or downed.
+        """
+        assert tag_index.mask(Dead, Downed) == INACTIVE
+        assert tag_index.mask() == 0
+    
+    def test_entities_with_tags(self):
+        """Lookup by required and excluded tags.
+        
+        GAMEPLAY: Only living enemies are candidates for targeting.
+        """
+        alive = esper.create_entity(Enemy())
+        dead = esper.create_entity(Enemy(), Dead())
+        esper.create_entity(PartyMember())
+        
+        assert tag_index.entities_with_tags(ENEMY, exclude=INACTIVE) == [alive]
+        assert sorted(tag_index.entities_with_tags(ENEMY)) == [alive, dead]
+
+
+
+# =============================================================================
+# WITHOUT HOOKS TESTS
+# Gameplay Impact: Tools and scripts that never call queries.install() still
+# see dead and downed entities as inactive
+# =============================================================================
+
+@pytest.fixture
+def no_hooks():
+    """Run with esper unhooked (as code outside Game does), then re-hook."""
+    from src.ecs import queries
+    queries.uninstall()
+    yield
+    queries.install()
+
+
+class TestWithoutHooks:
+    """Test the esper fallback and re-installation."""
+    
+    def test_processor_skips_dead_without_hooks(self, no_hooks):
+        """A processor run before install() still sees the Dead tag.
+        
+        GAMEPLAY: A corpse doesn't slide across the floor.
+        """
+        from src.core.events import EventBus
+        from src.ecs.components import Velocity
+        from src.ecs.processors.movement_processor import MovementProcessor
+        
+        ent = esper.create_entity(Position(5.0, 5.0), Velocity(1.0, 0.0), Dead())
+        MovementProcessor(EventBus())._apply_velocities(1.0)
+        
+        pos = esper.component_for_entity(ent, Position)
+        assert (pos.x, pos.y) == (5.0, 5.0)
+        assert tag_index.has_tag(ent, Dead)
+        assert tag_index.has_any(ent, INACTIVE)
+    
+    def test_bits_catch_up_on_reinstall(self, no_hooks):
+        """Changes made while unhooked show up once the hooks return.
+        
+        GAMEPLAY: A fight set up by a tool script plays out correctly in game.
+        """
+        from src.ecs import queries
+        ent = esper.create_entity(Enemy(), Downed())
+        
+        queries.install()
+        assert tag_index.flags[ent] == ENEMY | DOWNED
+        
+        esper.remove_component(ent, Downed)
+        assert tag_index.flags[ent] == ENEMY
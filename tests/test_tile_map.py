@@ -0,0 +1,188 @@
+"""Tests for the NumPy-backed tile map.
+
+These tests ensure tile writes, walkability and region queries agree.
+If broken, heroes walk through walls, pathfinding plans through void,
+or a regenerated level keeps the old layout's walkability.
+"""
+
+import numpy as np
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.constants import TileType
+from src.world.dungeon import Dungeon
+from src.world.tile_map import TileMap, WALKABLE_TILES
+from src.world.town_map import TownMap
+
+
+@pytest.fixture
+def tile_map():
+    """10x8 map with a 4x3 floor room at (2, 2)."""
+    game_map = TileMap(10, 8)
+    game_map.fill_rect(2, 2, 4, 3, TileType.FLOOR)
+    return game_map
+
+
+# =============================================================================
+# WALKABILITY TESTS
+# Gameplay Impact: Collision and pathfinding see the real layout
+# =============================================================================
+
+class TestWalkability:
+    """Test per-tile queries after writes."""
+    
+    def test_writes_update_walkability(self, tile_map):
+        """Floor is walkable, a wall placed on it isn't.
+        
+        GAMEPLAY: Units stop at walls.
+        """
+        assert tile_map.is_walkable(2, 2)
+        assert not tile_map.is_walkable(1, 2)
+        
+        tile_map.set_tile(3, 3, TileType.WALL)
+        assert tile_map.get_tile(3, 3) == TileType.WALL
+        assert not tile_map.is_walkable(3, 3)
+        assert not tile_map.walkable[3, 3]
+    
+    def test_every_walkable_type(self, tile_map):
+        """Floor, doors and both stairs are walkable; others aren't.
+        
+        GAMEPLAY: Stairs and doors can be stepped on, water can't.
+        """
+        for tile in TileType:
+            tile_map.set_tile(0, 0, tile)
+            assert tile_map.is_walkable(0, 0) == (tile in WALKABLE_TILES)
+    
+    def test_out_of_bounds(self, tile_map):
+        """Off-map tiles are void and blocked.
+        
+        GAMEPLAY: Nobody walks off the edge of the level.
+        """
+        for x, y in [(-1, 0), (0, -1), (10, 0), (0, 8), (-20, -20)]:
+            assert not tile_map.is_walkable(x, y)
+            assert tile_map.get_tile(x, y) == TileType.VOID
+    
+    def test_padded_border_is_blocked(self, tile_map):
+        """The padded array matches is_walkable with a blocked border.
+        
+        GAMEPLAY: Pathfinding never steps off the map.
+        """
+        tile_map.fill_rect(0, 0, 10, 8, TileType.FLOOR)
+        padded = tile_map.walkable_padded
+        
+        assert padded.shape == (10, 12)
+        assert not padded[0].any() and not padded[-1].any()
+        assert not padded[:, 0].any() and not padded[:, -1].any()
+        assert padded[1:-1, 1:-1].all()
+    
+    def test_writes_are_clipped(self, tile_map):
+        """Rectangles hanging off the map only write the on-map part.
+        
+        GAMEPLAY: Edge rooms don't wrap around to the other side.
+        """
+        tile_map.fill_rect(-2, -2, 4, 4, TileType.FLOOR)
+        tile_map.set_tile(50, 50, TileType.FLOOR)
+        
+        assert tile_map.count_walkable(0, 0, 2, 2) == 4
+        assert not tile_map.is_walkable(9, 7)
+    
+    def test_revision_bumps_on_write(self, tile_map):
+        """Every write changes the revision.
+        
+        GAMEPLAY: Cached paths notice a changed layout.
+        """
+        before = tile_map.revision
+        tile_map.set_tile(0, 0, TileType.FLOOR)
+        assert tile_map.revision > before
+
+
+# =============================================================================
+# REGION QUERY TESTS
+# Gameplay Impact: Spawning and decoration read whole areas at once
+# =============================================================================
+
+class TestRegionQueries:
+    """Test vectorized region queries."""
+    
+    def test_count_and_area(self, tile_map):
+        """Counting and all-walkable checks over rectangles.
+        
+        GAMEPLAY: A big enemy only spawns where it fits.
+        """
+        assert tile_map.count_walkable(0, 0, 10, 8) == 12
+        assert tile_map.is_area_walkable(2, 2, 4, 3)
+        assert not tile_map.is_area_walkable(1, 2, 4, 3)
+        assert not tile_map.is_area_walkable(8, 6, 4, 4)
+    
+    def test_positions_in_row_order(self, tile_map):
+        """Positions come back as (x, y) ints, row by row.
+        
+        GAMEPLAY: Seeded generation that walks these lists stays reproducible.
+        """
+        positions = tile_map.walkable_positions(3, 3, 10, 10)
+        
+        assert positions == [(3, 3), (4, 3), (5, 3), (3, 4), (4, 4), (5, 4)]
+        assert all(type(x) is int and type(y) is int for x, y in positions)
+    
+    def test_tiles_of_type(self, tile_map):
+        """Lookup of every tile of one type.
+        
+        GAMEPLAY: Stairs can be found without scanning in Python.
+        """
+        tile_map.set_tile(4, 3, TileType.STAIRS_DOWN)
+        assert tile_map.tiles_of_type(TileType.STAIRS_DOWN) == [(4, 3)]
+
+
+# =============================================================================
+# MAP TESTS
+# Gameplay Impact: Dungeon and town share the same fast grid
+# =============================================================================
+
+class TestMaps:
+    """Test Dungeon and TownMap on the shared grid."""
+    
+    def test_dungeon_arrays_match_tiles(self):
+        """The uint8 grid and walkability agree with get_tile.
+        
+        GAMEPLAY: What's drawn is what can be walked on.
+        """
+        dungeon = Dungeon(60, 50)
+        dungeon.generate(seed=7)
+        
+        expected = np.array([
+            [dungeon.get_tile(x, y) in WALKABLE_TILES for x in range(60)]
+            for y in range(50)
+        ])
+        assert dungeon.tiles.shape == (50, 60)
+        assert dungeon.tiles.dtype == np.uint8
+        assert (dungeon.walkable == expected).all()
+        assert dungeon.get_tile(*dungeon.stairs_down) == TileType.STAIRS_DOWN
+    
+    def test_regenerate_resets_layout(self):
+        """Generating again replaces the old layout entirely.
+        
+        GAMEPLAY: The next level has no leftover corridors.
+        """
+        dungeon = Dungeon(60, 50)
+        dungeon.generate(seed=1)
+        dungeon.generate(seed=2)
+        
+        fresh = Dungeon(60, 50)
+        fresh.generate(seed=2)
+        assert (dungeon.tiles == fresh.tiles).all()
+    
+    def test_town_walkability(self):
+        """Buildings block, doors and the portal don't.
+        
+        GAMEPLAY: Walk to the shop door, not through the shop.
+        """
+        town = TownMap()
+        for building in town.buildings:
+            if building.building_type == 'portal':
+                assert town.is_walkable(building.x, building.y)
+            else:
+                assert not town.is_walkable(building.x, building.y)
+                assert town.is_walkable(*building.door)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Run many headless games in parallel for balance and soak testing.
+
+esper keeps one global world per process, so each run gets its own
+worker process (a fresh interpreter state for every run). Every run is
+a full headless Game - same processors, create_party() for the party and
+room activation for enemies - with its own dungeon seed and random state.
+
+Each run reports kills, party downs and wipes, gold, an XP curve
+(party totals sampled every --sample-every ticks) and tick-time stats.
+Runs that crash are reported with their traceback instead of stopping
+the batch. Everything goes into one JSON file.
+
+Usage:
+    python tools/batch_sim.py --runs 200 --ticks 36000 --out batch.json
+    python tools/batch_sim.py --seeds 7 42 1234 --workers 3
+    python tools/batch_sim.py --runs 50 --prespawn   # every room populated up front
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+import traceback
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def tick_stats(tick_ms: list) -> dict:
+    """Mean, p50/p95/p99 and max of per-tick wall times (ms)."""
+    if len(tick_ms) < 2:
+        value = tick_ms[0] if tick_ms else 0.0
+        return {"mean": value, "p50": value, "p95": value, "p99": value, "max": value}
+    cuts = statistics.quantiles(tick_ms, n=100)
+    return {
+        "mean": statistics.fmean(tick_ms),
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "max": max(tick_ms),
+    }
+
+
+def party_snapshot(tick: int) -> dict:
+    """Party XP, level and gold totals at one tick (one XP curve point)."""
+    import esper
+    from src.ecs.components import PartyMember, SkillXP, CharacterLevel, Gold
+    
+    xp = 0
+    level = 0
+    gold = 0
+    for ent, (_,) in esper.get_components(PartyMember):
+        if esper.has_component(ent, SkillXP):
+            skill_xp = esper.component_for_entity(ent, SkillXP)
+            xp += skill_xp.melee + skill_xp.ranged + skill_xp.combat_magic + skill_xp.nature_magic
+        if esper.has_component(ent, CharacterLevel):
+            level = max(level, esper.component_for_entity(ent, CharacterLevel).level)
+        if esper.has_component(ent, Gold):
+            gold += esper.component_for_entity(ent, Gold).amount
+    return {"tick": tick, "xp": xp, "level": level, "gold": gold}
+
+
+def prespawn_enemies(game) -> int:
+    """Activate every room but the spawn room and fill it with enemies.
+    
+    Returns:
+        Number of enemies created
+    """
+    from src.data.loader import data_loader
+    from src.ecs.factories import create_enemies_for_level
+    
+    dungeon = game.dungeon
+    spawn_room = dungeon.get_room_at(*dungeon.get_player_spawn())
+    spawn_points = []
+    for room_idx in range(len(dungeon.rooms)):
+        if room_idx != spawn_room:
+            spawn_points.extend(dungeon.activate_room(room_idx))
+    config = data_loader.get_dungeon_config() or {}
+    return len(create_enemies_for_level(spawn_points, game.current_level, config))
+
+
+def simulate(job: dict) -> dict:
+    """Run one headless game (in a worker process) and return its results."""
+    seed = job["seed"]
+    try:
+        from src.game import Game
+        from src.core.events import EventType
+        
+        random.seed(seed)
+        game = Game(headless=True)
+        
+        downs = []
+        game.event_bus.subscribe(EventType.ENTITY_DOWNED, downs.append)
+        
+        tick_ms = []
+        xp_curve = []
+        sample_every = job["sample_every"]
+        prespawned = []
+        
+        def on_step(game, seconds):
+            tick_ms.append(seconds * 1000)
+            if job["prespawn"] and not prespawned:
+                # Rooms exist once start_new_game() has run - fill them on the first step
+                prespawned.append(prespawn_enemies(game))
+            if game.step_count % sample_every == 0:
+                xp_curve.append(party_snapshot(game.step_count))
+        
+        report = game.run_headless(job["ticks"], seed=seed, on_step=on_step)
+        final = party_snapshot(game.step_count)
+        return {
+            **report,
+            "prespawned": prespawned[0] if prespawned else 0,
+            "party_downs": len(downs),
+            "gold": final["gold"],
+            "xp": final["xp"],
+            "character_level": final["level"],
+            "xp_curve": xp_curve,
+            "tick_ms": tick_stats(tick_ms),
+        }
+    except Exception:
+        return {"seed": seed, "error": traceback.format_exc()}
+
+
+def summarize(runs: list) -> dict:
+    """Aggregate per-run results into batch-wide min/mean/max figures."""
+    ok = [run for run in runs if "error" not in run]
+    summary = {"runs": len(runs), "failed": len(runs) - len(ok)}
+    if not ok:
+        return summary
+    
+    for key in ("enemies_killed", "party_downs", "party_wipes", "gold", "xp",
+                "character_level", "dungeon_level", "ticks_per_sec"):
+        values = [run[key] for run in ok]
+        summary[key] = {"min": min(values), "mean": statistics.fmean(values), "max": max(values)}
+    
+    summary["tick_ms"] = {
+        "mean_p50": statistics.fmean(run["tick_ms"]["p50"] for run in ok),
+        "mean_p95": statistics.fmean(run["tick_ms"]["p95"] for run in ok),
+        "worst_p99": max(run["tick_ms"]["p99"] for run in ok),
+        "worst_max": max(run["tick_ms"]["max"] for run in ok),
+    }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many headless games in parallel")
+    parser.add_argument("--runs", type=int, default=os.cpu_count() or 1,
+                        help="Number of games (seeds base-seed .. base-seed+runs-1)")
+    parser.add_argument("--base-seed", type=int, default=1,
+                        help="First seed when --seeds isn't given")
+    parser.add_argument("--seeds", type=int, nargs="+", default=None,
+                        help="Explicit seeds, one game each (overrides --runs)")
+    parser.add_argument("--ticks", type=int, default=36000,
+                        help="Fixed steps per game (default: 36000 = 10 minutes)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: all cores)")
+    parser.add_argument("--sample-every", type=int, default=600,
+                        help="Ticks between XP curve samples (default: 600 = 10s)")
+    parser.add_argument("--prespawn", action="store_true",
+                        help="Populate every room at the start instead of on entry")
+    parser.add_argument("--out", default="batch_results.json",
+                        help="Where to write the JSON results")
+    args = parser.parse_args(argv)
+    
+    seeds = args.seeds or list(range(args.base_seed, args.base_seed + args.runs))
+    jobs = [
+        {"seed": seed, "ticks": args.ticks, "sample_every": args.sample_every,
+         "prespawn": args.prespawn}
+        for seed in seeds
+    ]
+    
+    start = time.perf_counter()
+    runs = []
+    # One task per worker process - no esper state leaks between runs
+    with multiprocessing.Pool(args.workers, maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(simulate, jobs):
+            runs.append(result)
+            status = "FAILED" if "error" in result else (
+                f"kills={result['enemies_killed']} wipes={result['party_wipes']} "
+                f"{result['ticks_per_sec']:.0f} ticks/sec"
+            )
+            print(f"[{len(runs)}/{len(jobs)}] seed={result['seed']} {status}")
+    wall_seconds = time.perf_counter() - start
+    
+    runs.sort(key=lambda run: run["seed"])
+    summary = summarize(runs)
+    with open(args.out, 'w') as f:
+        json.dump({
+            "config": {**vars(args), "seeds": seeds},
+            "wall_seconds": wall_seconds,
+            "summary": summary,
+            "runs": runs,
+        }, f, indent=2)
+    
+    print(f"{len(runs)} runs in {wall_seconds:.1f}s ({summary['failed']} failed) -> {args.out}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
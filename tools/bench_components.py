@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark component memory and attribute access.
+
+Measures what per-object overhead costs when a fight leaves hundreds of
+corpses, projectiles and damage numbers alive:
+- bytes per enemy entity (all its components, via tracemalloc)
+- bytes per damage number / projectile entity
+- attribute access time on Position/Health (read + write per entity)
+- headless simulation cost in ms per fixed step
+
+Save a run and compare a later one against it:
+    python tools/bench_components.py --output before.json
+    python tools/bench_components.py --compare before.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import esper
+
+from src.ecs.components import Position, Health, Projectile, Velocity
+from src.ecs.components.rendering import DamageNumber
+from src.ecs.factories.enemies import create_enemy
+
+
+def bytes_per_entity(create, count: int) -> float:
+    """Average traced allocation per entity made by create(i)."""
+    esper.clear_database()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        create(i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    esper.clear_database()
+    return (after - before) / count
+
+
+def access_ns(count: int, repeat: int) -> float:
+    """Nanoseconds per entity for a read-modify-write of Position and Health."""
+    esper.clear_database()
+    for i in range(count):
+        create_enemy("skeleton", float(i % 80), float(i // 80))
+    pairs = [(pos, health) for _, (pos, health) in esper.get_components(Position, Health)]
+    
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for pos, health in pairs:
+            pos.x = pos.x + 0.0
+            health.current = health.current - 0
+    elapsed = time.perf_counter() - start
+    
+    esper.clear_database()
+    return elapsed / (repeat * len(pairs)) * 1e9
+
+
+def step_ms(ticks: int) -> float:
+    """Milliseconds per headless fixed step."""
+    from src.game import Game
+    report = Game(headless=True).run_headless(ticks, seed=1)
+    return report["wall_seconds"] / report["ticks"] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark component memory and access")
+    parser.add_argument("--entities", type=int, default=2000,
+                        help="Entities created per memory/access measurement")
+    parser.add_argument("--ticks", type=int, default=1800,
+                        help="Headless steps for the tick measurement")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Show change against a previous JSON result")
+    args = parser.parse_args()
+    
+    results = {
+        "enemy_bytes": bytes_per_entity(
+            lambda i: create_enemy("skeleton", float(i % 80), float(i // 80)), args.entities),
+        "damage_number_bytes": bytes_per_entity(
+            lambda i: esper.create_entity(Position(x=i, y=0), DamageNumber(value=i)), args.entities),
+        "projectile_bytes": bytes_per_entity(
+            lambda i: esper.create_entity(Position(x=i, y=0), Velocity(dx=1.0), Projectile(damage=i)),
+            args.entities),
+        "access_ns": access_ns(args.entities, repeat=20),
+        "step_ms": step_ms(args.ticks),
+    }
+    
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    
+    for name, value in results.items():
+        line = f"{name:>20}: {value:10.1f}"
+        if previous and name in previous and previous[name]:
+            change = (value - previous[name]) / previous[name] * 100
+            line += f"   (was {previous[name]:.1f}, {change:+.0f}%)"
+        print(line)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
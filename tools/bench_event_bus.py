@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark EventBus dispatch throughput.
+
+Queues a burst of DAMAGE_DEALT/STATUS_TICK events (what a spell-heavy
+fight produces) and times EventBus.process() with tracing off and on,
+next to the old list.pop(0) + per-callback f-string dispatch loop.
+
+Usage:
+    python tools/bench_event_bus.py
+    python tools/bench_event_bus.py --events 10000 50000 --subscribers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.events import EventBus, Event, EventType
+from src.core.perf_monitor import perf
+
+
+class LegacyEventBus(EventBus):
+    """EventBus with the original list queue and per-event label building."""
+    
+    def __init__(self):
+        super().__init__()
+        self._queue = []
+    
+    def process(self):
+        while self._queue:
+            event = self._queue.pop(0)
+            if event.type in self._subscribers:
+                for callback in self._subscribers[event.type]:
+                    handler_name = f"Event:{event.type.name}:{callback.__name__}"
+                    perf.mark(handler_name)
+                    callback(event)
+                    perf.measure(handler_name)
+
+
+def _on_event(event):
+    """Minimal handler - reads the payload like real handlers do."""
+    event.data.get("amount", 0)
+
+
+def bench(bus_class, event_count: int, subscribers: int, traced: bool) -> float:
+    """Dispatch event_count queued events and return events/sec."""
+    bus = bus_class()
+    for _ in range(subscribers):
+        bus.subscribe(EventType.DAMAGE_DEALT, _on_event)
+        bus.subscribe(EventType.STATUS_TICK, _on_event)
+    
+    for i in range(event_count):
+        event_type = EventType.DAMAGE_DEALT if i % 2 else EventType.STATUS_TICK
+        bus.emit(Event(event_type, {"target": i, "amount": 5}))
+    
+    was_enabled = perf.enabled
+    perf.enabled = traced
+    try:
+        start = time.perf_counter()
+        bus.process()
+        elapsed = time.perf_counter() - start
+    finally:
+        perf.enabled = was_enabled
+        perf.reset()
+    
+    return event_count / elapsed if elapsed > 0 else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EventBus dispatch")
+    parser.add_argument("--events", type=int, nargs="+", default=[10000, 50000, 100000],
+                        help="Queued event counts to dispatch")
+    parser.add_argument("--subscribers", type=int, default=2,
+                        help="Subscribers per event type")
+    args = parser.parse_args()
+    
+    print(f"{'events':>8} {'legacy':>12} {'untraced':>12} {'traced':>12}   (events/sec)")
+    for count in args.events:
+        legacy = bench(LegacyEventBus, count, args.subscribers, traced=False)
+        untraced = bench(EventBus, count, args.subscribers, traced=False)
+        traced = bench(EventBus, count, args.subscribers, traced=True)
+        print(f"{count:>8} {legacy:>12,.0f} {untraced:>12,.0f} {traced:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark cached query views against esper.get_components().
+
+Builds a world of enemies plus a 4-member party, then runs simulated
+steps. Each step does what a real fixed step does: a few intent
+components come and go, and the hot signatures ((Position, Health),
+(Position, PartyMember), (Position, Enemy)) are iterated several times.
+
+Usage:
+    python tools/bench_queries.py
+    python tools/bench_queries.py --entities 50 500 5000 --steps 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import esper
+
+from src.ecs import queries
+from src.ecs.components import Position, Health, Enemy, PartyMember, TargetPosition
+
+
+HOT_QUERIES = [
+    (Position, Health),
+    (Position, Health),
+    (Position, Health),
+    (Position, PartyMember),
+    (Position, PartyMember),
+    (Position, Enemy),
+]
+CHURN_PER_STEP = 8  # Intent components added/removed each step
+
+
+def build_world(enemy_count: int):
+    """Fresh world with a party and enemy_count enemies."""
+    esper.clear_database()
+    for i in range(4):
+        esper.create_entity(Position(x=i, y=0), Health(current=100, maximum=100),
+                            PartyMember(party_index=i))
+    return [
+        esper.create_entity(Position(x=i % 80, y=i // 80), Health(current=50, maximum=50), Enemy())
+        for i in range(enemy_count)
+    ]
+
+
+def bench(get, enemy_count: int, steps: int) -> float:
+    """Run steps with the given query function and return ms per step."""
+    enemies = build_world(enemy_count)
+    
+    start = time.perf_counter()
+    for step in range(steps):
+        # Intents churn every step (AI targets, clicks, paths)
+        for i in range(CHURN_PER_STEP):
+            ent = enemies[(step * CHURN_PER_STEP + i) % len(enemies)]
+            if esper.has_component(ent, TargetPosition):
+                esper.remove_component(ent, TargetPosition)
+            else:
+                esper.add_component(ent, TargetPosition(x=1.0, y=1.0))
+        
+        for signature in HOT_QUERIES:
+            for _, components in get(*signature):
+                pass
+    elapsed = time.perf_counter() - start
+    
+    esper.clear_database()
+    return elapsed / steps * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cached component queries")
+    parser.add_argument("--entities", type=int, nargs="+", default=[50, 500, 5000],
+                        help="Enemy counts to test")
+    parser.add_argument("--steps", type=int, default=200,
+                        help="Simulated steps per run")
+    args = parser.parse_args()
+    queries.install()
+    
+    print(f"{'entities':>8} {'esper':>10} {'views':>10} {'speedup':>8}   (ms/step)")
+    for count in args.entities:
+        esper_ms = bench(esper.get_components, count, args.steps)
+        queries.clear_views()
+        view_ms = bench(queries.query, count, args.steps)
+        speedup = esper_ms / view_ms if view_ms > 0 else float("inf")
+        print(f"{count:>8} {esper_ms:>10.3f} {view_ms:>10.3f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()